@@ -0,0 +1,114 @@
+"""
+Benchmarks converting OpenAPI specs into tools, the work done by `orchestrate tools import -k openapi`.
+
+Converts synthetic specs of increasing size, whose operations share parameters and schemas through $refs like
+real world specs do, and reports the time per operation. The time per operation should stay flat as the spec grows,
+a growing one means the conversion of an operation depends on the size of the spec.
+
+    python benchmarks/openapi_import.py                           # synthetic specs of SPEC_SIZES operations
+    python benchmarks/openapi_import.py --sizes 100 1000 5000
+    python benchmarks/openapi_import.py --spec path/or/url.json   # also convert a real spec
+    python benchmarks/openapi_import.py --workers 1               # convert in this process only
+"""
+import argparse
+import asyncio
+import sys
+import time
+
+from ibm_watsonx_orchestrate.agent_builder.tools.openapi_tool import create_openapi_json_tools, \
+    _get_openapi_spec_from_uri
+
+SPEC_SIZES = [100, 400, 1600]
+SHARED_SCHEMAS = 20
+METHODS = ["get", "post", "put", "delete"]
+DEFAULT_RUNS = 3
+
+
+def make_spec(operations: int) -> dict:
+    """
+    Builds a spec of `operations` operations, spread over paths of the 4 methods, referencing SHARED_SCHEMAS schemas
+    """
+    schemas = {}
+    for i in range(SHARED_SCHEMAS):
+        schemas[f"Model{i}"] = {
+            "type": "object",
+            "properties": {
+                "id": {"type": "string"},
+                "name": {"type": "string", "description": "The name of the model"},
+                "tags": {"type": "array", "items": {"type": "string"}},
+                "child": {"$ref": f"#/components/schemas/Leaf{i}"},
+            },
+            "required": ["id"],
+        }
+        schemas[f"Leaf{i}"] = {"type": "object", "properties": {"value": {"type": "number"}, "unit": {"type": "string"}}}
+
+    paths = {}
+    for i in range(operations):
+        method = METHODS[i % len(METHODS)]
+        operation = {
+            "operationId": f"operation{i}",
+            "description": f"Operation {i}",
+            "tags": [f"tag{i % 10}"],
+            "parameters": [
+                {"$ref": "#/components/parameters/Id"},
+                {"in": "query", "name": "q", "schema": {"type": "string"}},
+            ],
+            "responses": {"200": {"description": "OK", "content": {
+                "application/json": {"schema": {"$ref": f"#/components/schemas/Model{i % SHARED_SCHEMAS}"}}}}},
+        }
+        if method in ("post", "put"):
+            operation["requestBody"] = {"content": {
+                "application/json": {"schema": {"$ref": f"#/components/schemas/Model{(i + 1) % SHARED_SCHEMAS}"}}}}
+        paths.setdefault(f"/resource{i // len(METHODS)}/{{id}}", {})[method] = operation
+
+    return {
+        "openapi": "3.0.3",
+        "info": {"title": "Benchmark", "version": "1.0.0"},
+        "servers": [{"url": "https://example.com"}],
+        "paths": paths,
+        "components": {
+            "schemas": schemas,
+            "parameters": {"Id": {"in": "path", "name": "id", "required": True, "schema": {"type": "string"}}},
+            "securitySchemes": {"apiKey": {"type": "apiKey", "in": "header", "name": "X-API-Key"}},
+        },
+        "security": [{"apiKey": []}],
+    }
+
+
+def measure(spec: dict, runs: int = DEFAULT_RUNS, max_workers: int | None = None) -> tuple[int, float]:
+    """
+    Returns the number of tools created from spec and the best time taken to create them
+    """
+    best, tools = None, []
+    for _ in range(runs):
+        start = time.perf_counter()
+        tools = create_openapi_json_tools(spec, max_workers=max_workers)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return len(tools), best
+
+
+def print_result(name: str, operations: int, elapsed: float) -> None:
+    per_operation = elapsed / operations * 1000 if operations else 0.0
+    print(f"{name:<56} {operations:>8} {elapsed:>9.2f} s {per_operation:>8.2f} ms")
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=SPEC_SIZES, help="Operations of the synthetic specs")
+    parser.add_argument("--spec", action="append", default=[], help="Path or url of a spec to convert as well")
+    parser.add_argument("--runs", type=int, default=DEFAULT_RUNS, help="Runs per spec, the best one is kept")
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes, defaults to the number of CPUs")
+    args = parser.parse_args(argv)
+
+    print(f"{'spec':<56} {'tools':>8} {'total':>11} {'per tool':>11}")
+    for size in args.sizes:
+        print_result(f"synthetic ({size} operations)", *measure(make_spec(size), args.runs, args.workers))
+    for uri in args.spec:
+        spec = asyncio.run(_get_openapi_spec_from_uri(uri))
+        print_result(uri, *measure(spec, args.runs, args.workers))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,296 @@
+"""
+Startup and import-time benchmarks of the orchestrate CLI and the ibm_watsonx_orchestrate package.
+
+Timings and memory depend on the machine, so every run first measures a bare interpreter (`python -c pass`) and
+records the other measurements relative to it. For every top-level command, and for the package imports used by
+agent and tool definitions, records:
+  - startup:   time to import the CLI and load the command (or to import the module), best of several runs,
+               in multiples of the bare interpreter's wall-clock time
+  - wall:      wall-clock time of the whole `orchestrate <command> --help` process (or of the import), best of
+               several runs, in multiples of the bare interpreter's wall-clock time
+  - peak_rss:  peak resident memory of that process above the bare interpreter's, in MiB
+  - modules:   the ibm_watsonx_orchestrate modules it imports
+
+    python benchmarks/startup.py                    # run and compare against the checked-in baseline
+    python benchmarks/startup.py --check            # also exit with an error on regressions or blown budgets
+    python benchmarks/startup.py --update-baseline  # record the current results as the new baseline
+
+A metric regresses when it exceeds its baseline by more than REGRESSION_TOLERANCE plus a small slack absorbing
+noise, and a command regresses when it imports package modules its baseline did not. Third party packages are
+left to the import checks of tests/cli/test_main.py. Trivial commands must additionally start within
+STARTUP_BUDGET bare interpreter startups. Every measurement runs in a fresh interpreter with an empty config
+directory. Peak memory is read with the resource module, so the benchmarks run on Linux and macOS.
+"""
+import argparse
+import json
+import os
+import re
+import subprocess
+import sys
+import tempfile
+import time
+
+BASELINE_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "startup_baseline.json")
+
+PACKAGE = "ibm_watsonx_orchestrate"
+
+# Time allowed for importing the CLI and loading a trivial subcommand, in bare interpreter startups
+STARTUP_BUDGET = 6.0
+DEFAULT_RUNS = 3
+
+REGRESSION_TOLERANCE = 0.25
+# Slack of the time ratios, in bare interpreter startups, and of the peak memory, in MiB
+TIME_SLACK = 0.5
+RSS_SLACK = 5.0
+
+# Commands expected to start within the budget, the others load the agent builder and its dependencies
+TRIVIAL_COMMANDS = [
+    [],
+    ["login"],
+    ["env"],
+    ["env", "list"],
+    ["env", "activate"],
+]
+
+TOP_LEVEL_COMMANDS = [
+    [],
+    ["login"],
+    ["env"],
+    ["agents"],
+    ["tools"],
+    ["toolkits"],
+    ["knowledge-bases"],
+    ["connections"],
+    ["server"],
+    ["chat"],
+    ["models"],
+    ["channels"],
+    ["settings"],
+]
+
+LIBRARY_IMPORTS = [
+    "ibm_watsonx_orchestrate",
+    "ibm_watsonx_orchestrate.agent_builder.agents",
+    "ibm_watsonx_orchestrate.agent_builder.tools",
+    "ibm_watsonx_orchestrate.client.client",
+]
+
+_LOAD_COMMAND = """
+import sys
+import time
+start = time.perf_counter()
+import click
+import typer
+from ibm_watsonx_orchestrate.cli.main import app
+command = typer.main.get_command(app)
+for name in sys.argv[1:]:
+    command = command.get_command(click.Context(command), name)
+print(time.perf_counter() - start)
+"""
+
+_IMPORT_MODULE = """
+import importlib
+import sys
+import time
+start = time.perf_counter()
+importlib.import_module(sys.argv[1])
+print(time.perf_counter() - start)
+"""
+
+_RUN_COMMAND = """
+import resource
+import sys
+from ibm_watsonx_orchestrate.cli.main import app
+sys.argv = ["orchestrate", *sys.argv[1:], "--help"]
+try:
+    app()
+except SystemExit:
+    pass
+print(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss, file=sys.stderr)
+"""
+
+_RUN_IMPORT = """
+import importlib
+import resource
+import sys
+importlib.import_module(sys.argv[1])
+print(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss, file=sys.stderr)
+"""
+
+_RUN_BARE = """
+import resource
+import sys
+print(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss, file=sys.stderr)
+"""
+
+_IMPORTTIME_PATTERN = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|\s+(.+)$")
+
+
+def get_benchmark_env(root: str) -> dict:
+    return {
+        **os.environ,
+        "ORCHESTRATE_CONFIG_DIR": os.path.join(root, "config"),
+        "ORCHESTRATE_CACHE_DIR": os.path.join(root, "cache"),
+    }
+
+
+def _run_python(args: list[str], env: dict) -> subprocess.CompletedProcess:
+    return subprocess.run([sys.executable, *args], capture_output=True, text=True, check=True, env=env)
+
+
+def _max_rss_to_mib(max_rss: int) -> float:
+    # ru_maxrss is in KiB on Linux and in bytes on macOS
+    return max_rss / (1024 * 1024) if sys.platform == "darwin" else max_rss / 1024
+
+
+def parse_importtime(stderr: str) -> list[str]:
+    """
+    The PACKAGE modules listed in `python -X importtime` output, sorted by name
+    """
+    modules = set()
+    for line in stderr.splitlines():
+        match = _IMPORTTIME_PATTERN.match(line)
+        if not match:
+            continue
+        module = match.group(3).strip()
+        if module == PACKAGE or module.startswith(f"{PACKAGE}."):
+            modules.add(module)
+    return sorted(modules)
+
+
+def _run_timed(args: list[str], env: dict, runs: int) -> tuple[float, float]:
+    """
+    Best wall-clock time in seconds and peak memory in MiB of a process printing its ru_maxrss to stderr
+    """
+    wall, peak_rss = None, None
+    for _ in range(runs):
+        start = time.perf_counter()
+        result = _run_python(args, env)
+        elapsed = time.perf_counter() - start
+        wall = elapsed if wall is None else min(wall, elapsed)
+        peak_rss = _max_rss_to_mib(int(result.stderr.splitlines()[-1]))
+    return wall, peak_rss
+
+
+def measure_bare(env: dict, runs: int = DEFAULT_RUNS) -> dict:
+    """
+    Measures the interpreter on its own, the reference of the other measurements
+    """
+    wall, peak_rss = _run_timed(["-c", _RUN_BARE], env, runs)
+    return {"wall": wall, "peak_rss": peak_rss}
+
+
+def measure(entry: str, env: dict, bare: dict, runs: int = DEFAULT_RUNS) -> dict:
+    """
+    Measures a benchmark entry, either a command ("orchestrate env") or a module ("import ibm_watsonx_orchestrate"),
+    relative to the bare interpreter measurements
+    """
+    if entry.startswith("import "):
+        module = entry.split(" ", 1)[1]
+        startup_args, run_args = ["-c", _IMPORT_MODULE, module], ["-c", _RUN_IMPORT, module]
+    else:
+        command = entry.split()[1:]
+        startup_args, run_args = ["-c", _LOAD_COMMAND, *command], ["-c", _RUN_COMMAND, *command]
+
+    startup = min(float(_run_python(startup_args, env).stdout.splitlines()[-1]) for _ in range(runs))
+    wall, peak_rss = _run_timed(run_args, env, runs)
+    modules = parse_importtime(_run_python(["-X", "importtime", *startup_args], env).stderr)
+
+    return {
+        "startup": round(startup / bare["wall"], 2),
+        "wall": round(wall / bare["wall"], 2),
+        "peak_rss": round(peak_rss - bare["peak_rss"], 1),
+        "modules": modules,
+    }
+
+
+def get_entries() -> list[str]:
+    return [" ".join(["orchestrate", *command]) for command in TOP_LEVEL_COMMANDS] + \
+        [f"import {module}" for module in LIBRARY_IMPORTS]
+
+
+def compare(results: dict, baseline: dict) -> list[str]:
+    """
+    Returns a description of every regression of results against baseline
+    """
+    regressions = []
+    for entry, current in results.items():
+        base = baseline.get(entry)
+        if base is None:
+            continue
+
+        for metric, slack, unit in (("startup", TIME_SLACK, "x"), ("wall", TIME_SLACK, "x"), ("peak_rss", RSS_SLACK, " MiB")):
+            limit = base[metric] * (1 + REGRESSION_TOLERANCE) + slack
+            if current[metric] > limit:
+                regressions.append(f"{entry}: {metric} {current[metric]}{unit} exceeds baseline {base[metric]}{unit}")
+
+        new_modules = [module for module in current["modules"] if module not in base.get("modules", [])]
+        if new_modules:
+            regressions.append(f"{entry}: now imports {len(new_modules)} more modules: {', '.join(new_modules[:5])}"
+                               + (", ..." if len(new_modules) > 5 else ""))
+    return regressions
+
+
+def check_budget(results: dict, env: dict, bare: dict, runs: int, budget: float = STARTUP_BUDGET) -> list[str]:
+    over_budget = []
+    for command in TRIVIAL_COMMANDS:
+        entry = " ".join(["orchestrate", *command])
+        startup = results[entry]["startup"] if entry in results else round(min(
+            float(_run_python(["-c", _LOAD_COMMAND, *command], env).stdout.splitlines()[-1]) for _ in range(runs)
+        ) / bare["wall"], 2)
+        if startup >= budget:
+            over_budget.append(f"{entry}: startup of {startup}x the bare interpreter exceeds the budget of {budget}x")
+    return over_budget
+
+
+def print_results(results: dict, baseline: dict, bare: dict) -> None:
+    print(f"Bare interpreter: {bare['wall'] * 1000:.0f} ms, {bare['peak_rss']:.1f} MiB. "
+          f"Times are multiples of its wall-clock time, memory is on top of it")
+    print(f"{'':<56} {'startup':>15} {'wall':>7} {'peak rss':>10} {'modules':>8}")
+    for entry, current in results.items():
+        base = baseline.get(entry)
+        startup = f"{current['startup']:.2f}x"
+        if base:
+            startup += f" ({current['startup'] - base['startup']:+.2f})"
+        print(f"{entry:<56} {startup:>15} {current['wall']:>6.2f}x {current['peak_rss']:>6.1f} MiB {len(current['modules']):>8}")
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--check", action="store_true", help="Exit with an error on regressions or blown budgets")
+    parser.add_argument("--update-baseline", action="store_true", help=f"Write the results to {BASELINE_FILE}")
+    parser.add_argument("--runs", type=int, default=DEFAULT_RUNS, help="Runs per measurement, the best one is kept")
+    parser.add_argument("--output", help="Also write the results as JSON to this file")
+    args = parser.parse_args(argv)
+
+    baseline = {}
+    if os.path.exists(BASELINE_FILE):
+        with open(BASELINE_FILE) as f:
+            baseline = json.load(f)
+
+    with tempfile.TemporaryDirectory() as root:
+        env = get_benchmark_env(root)
+        bare = measure_bare(env, args.runs)
+        results = {entry: measure(entry, env, bare, args.runs) for entry in get_entries()}
+        problems = check_budget(results, env, bare, args.runs)
+
+    print_results(results, baseline, bare)
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2)
+    if args.update_baseline:
+        with open(BASELINE_FILE, "w") as f:
+            json.dump(results, f, indent=2)
+            f.write("\n")
+        print(f"Baseline written to {BASELINE_FILE}")
+    else:
+        problems += compare(results, baseline)
+
+    for problem in problems:
+        print(problem, file=sys.stderr)
+    return 1 if args.check and problems else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
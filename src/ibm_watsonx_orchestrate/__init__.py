@@ -9,7 +9,7 @@ __version__ = "1.3.0"
 
 
 
-from ibm_watsonx_orchestrate.utils.logging.logger import setup_logging
+from ibm_watsonx_orchestrate.utils.logging.logger import setup_logging_lazily
 
-setup_logging()
+setup_logging_lazily()
 
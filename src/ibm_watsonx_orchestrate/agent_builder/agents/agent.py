@@ -1,5 +1,5 @@
 import json
-from ibm_watsonx_orchestrate.utils.utils import yaml_safe_load
+from ibm_watsonx_orchestrate.utils import yaml_codec
 from .types import AgentSpec
 
 
@@ -9,7 +9,7 @@ class Agent(AgentSpec):
     def from_spec(file: str) -> 'Agent':
         with open(file, 'r') as f:
             if file.endswith('.yaml') or file.endswith('.yml'):
-                content = yaml_safe_load(f)
+                content = yaml_codec.safe_load(f)
             elif file.endswith('.json'):
                 content = json.load(f)
             else:
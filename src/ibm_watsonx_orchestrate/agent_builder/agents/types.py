@@ -1,5 +1,5 @@
 import json
-import yaml
+from ibm_watsonx_orchestrate.utils import yaml_codec
 from enum import Enum
 from typing import List, Optional, Dict
 from pydantic import BaseModel, model_validator, ConfigDict
@@ -52,15 +52,17 @@ class BaseAgentSpec(BaseModel):
         dumped = self.model_dump(mode='json', exclude_unset=True, exclude_none=True)
         with open(file, 'w') as f:
             if file.endswith('.yaml') or file.endswith('.yml'):
-                yaml.dump(dumped, f, sort_keys=False)
+                yaml_codec.dump(dumped, f, sort_keys=False)
             elif file.endswith('.json'):
                 json.dump(dumped, f, indent=2)
             else:
                 raise ValueError('file must end in .json, .yaml, or .yml')
 
     def dumps_spec(self) -> str:
-        dumped = self.model_dump(mode='json', exclude_none=True)
-        return json.dumps(dumped, indent=2)
+        return json.dumps(self.to_spec_dict(), indent=2)
+
+    def to_spec_dict(self) -> dict:
+        return self.model_dump(mode='json', exclude_none=True)
 
 # ===============================
 #      NATIVE AGENT TYPES
@@ -1,5 +1,5 @@
 import json
-from ibm_watsonx_orchestrate.utils.utils import yaml_safe_load
+from ibm_watsonx_orchestrate.utils import yaml_codec
 from .types import KnowledgeBaseSpec, PatchKnowledgeBase, KnowledgeBaseKind
 
 
@@ -9,7 +9,7 @@ class KnowledgeBaseCreateRequest(KnowledgeBaseSpec):
     def from_spec(file: str) -> 'KnowledgeBaseSpec':
         with open(file, 'r') as f:
             if file.endswith('.yaml') or file.endswith('.yml'):
-                content = yaml_safe_load(f)
+                content = yaml_codec.safe_load(f)
             elif file.endswith('.json'):
                 content = json.load(f)
             else:
@@ -29,7 +29,7 @@ class KnowledgeBaseUpdateRequest(PatchKnowledgeBase):
     def from_spec(file: str) -> 'PatchKnowledgeBase':
         with open(file, 'r') as f:
             if file.endswith('.yaml') or file.endswith('.yml'):
-                content = yaml_safe_load(f)
+                content = yaml_codec.safe_load(f)
             elif file.endswith('.json'):
                 content = json.load(f)
             else:
@@ -1,4 +1,5 @@
 from .base_tool import BaseTool
 from .python_tool import tool, PythonTool, get_all_python_tools
-from .openapi_tool import create_openapi_json_tool, create_openapi_json_tool_from_uri, create_openapi_json_tools_from_uri, OpenAPITool, HTTPException
+from .openapi_tool import create_openapi_json_tool, create_openapi_json_tools, create_openapi_json_tool_from_uri, create_openapi_json_tools_from_uri, OpenAPITool, OpenAPIToolCompiler, HTTPException
+from .openapi_filter import OpenAPIOperationFilter
 from .types import ToolPermission, JsonSchemaObject, ToolRequestBody, ToolResponseBody, OpenApiSecurityScheme, OpenApiToolBinding, PythonToolBinding, WxFlowsToolBinding, SkillToolBinding, ClientSideToolBinding, ToolBinding, ToolSpec
@@ -1,6 +1,6 @@
 import json
 
-import yaml
+from ibm_watsonx_orchestrate.utils import yaml_codec
 
 from .types import ToolSpec
 
@@ -18,15 +18,17 @@ class BaseTool:
         dumped = self.__tool_spec__.model_dump(mode='json', exclude_unset=True, exclude_none=True, by_alias=True)
         with open(file, 'w') as f:
             if file.endswith('.yaml') or file.endswith('.yml'):
-                yaml.dump(dumped, f)
+                yaml_codec.dump(dumped, f)
             elif file.endswith('.json'):
                 json.dump(dumped, f, indent=2)
             else:
                 raise ValueError('file must end in .json, .yaml, or .yml')
 
     def dumps_spec(self) -> str:
-        dumped = self.__tool_spec__.model_dump(mode='json', exclude_unset=True, exclude_none=True, by_alias=True)
-        return json.dumps(dumped, indent=2)
+        return json.dumps(self.to_spec_dict(), indent=2)
+
+    def to_spec_dict(self) -> dict:
+        return self.__tool_spec__.model_dump(mode='json', exclude_unset=True, exclude_none=True, by_alias=True)
 
     def to_langchain_tool(self):
         from .integrations.langchain import as_langchain_tool
@@ -0,0 +1,94 @@
+import re
+from dataclasses import dataclass, field
+from fnmatch import fnmatchcase
+from typing import Any, List, Mapping
+
+# The keys of a path item that are operations, the others (parameters, servers, summary, ...) apply to all of them
+OPENAPI_METHODS = ('get', 'put', 'post', 'delete', 'options', 'head', 'patch', 'trace')
+
+_FILTER_FIELDS = {
+    'tag': 'tags',
+    'path': 'paths',
+    'operation-id': 'operation_ids',
+    'method': 'methods',
+}
+
+
+@dataclass
+class OpenAPIOperationFilter:
+    """
+    Selects which operations of a spec are converted into tools.
+
+    An operation is selected when it matches at least one value of every include criterion given and no value of
+    any exclude criterion. Tags match exactly, methods case-insensitively, paths are shell-style globs (`*` also
+    matches `/`) and operation ids are regular expressions searched for in the operationId.
+    """
+    include_tags: List[str] = field(default_factory=list)
+    exclude_tags: List[str] = field(default_factory=list)
+    include_paths: List[str] = field(default_factory=list)
+    exclude_paths: List[str] = field(default_factory=list)
+    include_operation_ids: List[str] = field(default_factory=list)
+    exclude_operation_ids: List[str] = field(default_factory=list)
+    include_methods: List[str] = field(default_factory=list)
+    exclude_methods: List[str] = field(default_factory=list)
+
+    def __post_init__(self):
+        try:
+            self._include_operation_ids = [re.compile(pattern) for pattern in self.include_operation_ids]
+            self._exclude_operation_ids = [re.compile(pattern) for pattern in self.exclude_operation_ids]
+        except re.error as e:
+            raise ValueError(f"Invalid operation id pattern '{e.pattern}': {e}")
+
+    @classmethod
+    def from_options(cls, include: List[str] = None, exclude: List[str] = None) -> 'OpenAPIOperationFilter | None':
+        """
+        Builds a filter from repeated kind=value strings such as tag=pets, path=/pets/*, operation-id=^list or
+        method=get. Returns None when there are none
+        """
+        if not include and not exclude:
+            return None
+        criteria = {}
+        for prefix, options in (('include', include or []), ('exclude', exclude or [])):
+            for option in options:
+                kind, separator, value = option.partition('=')
+                kind = kind.strip().lower()
+                if not separator or kind not in _FILTER_FIELDS or not value.strip():
+                    raise ValueError(
+                        f"Invalid {prefix} filter '{option}', expected kind=value with kind one of {list(_FILTER_FIELDS)}"
+                    )
+                criteria.setdefault(f'{prefix}_{_FILTER_FIELDS[kind]}', []).append(value.strip())
+        return cls(**criteria)
+
+    @property
+    def needs_operation(self) -> bool:
+        """
+        Whether matches() needs the operation itself, or only its path and method
+        """
+        return bool(self.include_tags or self.exclude_tags or self.include_operation_ids or self.exclude_operation_ids)
+
+    def matches(self, path: str, method: str, operation: Mapping[str, Any] = None) -> bool:
+        method = method.lower()
+        if self.include_methods and method not in (m.lower() for m in self.include_methods):
+            return False
+        if method in (m.lower() for m in self.exclude_methods):
+            return False
+        if self.include_paths and not any(fnmatchcase(path, pattern) for pattern in self.include_paths):
+            return False
+        if any(fnmatchcase(path, pattern) for pattern in self.exclude_paths):
+            return False
+        if not self.needs_operation:
+            return True
+
+        operation = operation if isinstance(operation, Mapping) else {}
+        tags = operation.get('tags') or []
+        if self.include_tags and not any(tag in tags for tag in self.include_tags):
+            return False
+        if any(tag in tags for tag in self.exclude_tags):
+            return False
+        operation_id = operation.get('operationId')
+        if not isinstance(operation_id, str):
+            # No pattern can match an operation without an operationId
+            return not self.include_operation_ids
+        if self.include_operation_ids and not any(p.search(operation_id) for p in self._include_operation_ids):
+            return False
+        return not any(p.search(operation_id) for p in self._exclude_operation_ids)
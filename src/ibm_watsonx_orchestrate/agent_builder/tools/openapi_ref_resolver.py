@@ -0,0 +1,156 @@
+import re
+from typing import Any, Dict, List, Tuple
+from urllib.parse import unquote
+
+# Levels of nested schema $refs inlined into a tool's input and output schemas, deeper ones are emitted in $defs
+DEFAULT_MAX_INLINE_DEPTH = 5
+# Objects and arrays copied into one input or output schema before nested $refs are emitted in $defs instead, a
+# schema shared by many properties on every level would otherwise grow as fan-out^depth
+DEFAULT_MAX_INLINED_NODES = 5000
+
+_SCHEMA_CONTAINERS = {('components', 'schemas'), ('definitions',)}
+_DEF_NAME_PATTERN = re.compile(r'[^A-Za-z0-9._-]+')
+
+
+def get_json_pointer(document: Any, ref: str) -> Any:
+    """
+    The value of document at the local $ref `#/a/b~1c`, raises a ValueError when there is none
+    """
+    node = document
+    for token in ref[2:].split('/') if ref not in ('#', '#/') else []:
+        token = unquote(token).replace('~1', '/').replace('~0', '~')
+        try:
+            node = node[int(token)] if isinstance(node, list) else node[token]
+        except (KeyError, IndexError, ValueError, TypeError):
+            raise ValueError(f"Invalid openapi spec, could not resolve $ref {ref}")
+    return node
+
+
+def _is_local_ref(ref: Any) -> bool:
+    return isinstance(ref, str) and ref.startswith('#')
+
+
+class OpenAPIRefResolver:
+    """
+    Resolves the $refs of an openapi spec lazily, without ever expanding the whole spec.
+
+    resolve_document() replaces the $refs to parameters, request bodies, responses and other non-schema objects by
+    their target, but keeps every $ref made from a schema as is, so the resolved spec is no larger than the original
+    and circular schemas remain representable. The schemas of each tool are then expanded by a SchemaRefInliner.
+    """
+
+    def __init__(self, document: dict):
+        self.document = document
+        self._resolved_refs: Dict[str, Any] = {}
+
+    def resolve_document(self) -> dict:
+        resolved = {}
+        for key, value in self.document.items():
+            key = str(key)
+            if key == 'components' and isinstance(value, dict):
+                resolved[key] = {
+                    str(name): self._copy_schema(components) if ('components', str(name)) in _SCHEMA_CONTAINERS
+                    else self._resolve(components, ())
+                    for name, components in value.items()
+                }
+            elif (key,) in _SCHEMA_CONTAINERS:
+                resolved[key] = self._copy_schema(value)
+            else:
+                resolved[key] = self._resolve(value, ())
+        return resolved
+
+    def resolve(self, node: Any) -> Any:
+        """
+        A copy of node, a part of the document such as a path item, with its non-schema $refs resolved
+        """
+        return self._resolve(node, ())
+
+    def _resolve(self, node: Any, refs: Tuple[str, ...]) -> Any:
+        if isinstance(node, dict):
+            ref = node.get('$ref')
+            if _is_local_ref(ref):
+                if ref in refs:
+                    raise ValueError(f"Invalid openapi spec, $ref {ref} refers to itself through {' -> '.join(refs)}")
+                if ref not in self._resolved_refs:
+                    self._resolved_refs[ref] = self._resolve(get_json_pointer(self.document, ref), refs + (ref,))
+                return self._resolved_refs[ref]
+            return {
+                str(key): self._copy_schema(value) if key == 'schema' else self._resolve(value, refs)
+                for key, value in node.items()
+            }
+        if isinstance(node, list):
+            return [self._resolve(value, refs) for value in node]
+        return node
+
+    def _copy_schema(self, node: Any) -> Any:
+        # yaml parses keys such as numeric property names into ints, json only has string keys
+        if isinstance(node, dict):
+            return {str(key): self._copy_schema(value) for key, value in node.items()}
+        if isinstance(node, list):
+            return [self._copy_schema(value) for value in node]
+        return node
+
+
+class SchemaRefInliner:
+    """
+    Expands the schema $refs of one root schema, such as a tool's input or output schema, against a resolved spec.
+
+    Referenced schemas are inlined up to max_inline_depth levels of nesting. A $ref to a schema that is being
+    inlined already (a cycle), that is nested deeper, or that is nested once max_inlined_nodes objects and arrays
+    were copied into the root is rewritten to point to `#/$defs/<name>`, and the schema is emitted once under that
+    name by get_defs(), so recursive and widely shared schemas convert in bounded time and memory. A $ref making up
+    a whole schema passed to inline() is always expanded, unless max_inline_depth is 0.
+    """
+
+    def __init__(self, document: dict, max_inline_depth: int = DEFAULT_MAX_INLINE_DEPTH,
+                 max_inlined_nodes: int = DEFAULT_MAX_INLINED_NODES):
+        self.document = document
+        self.max_inline_depth = max_inline_depth
+        self.max_inlined_nodes = max_inlined_nodes
+        self._def_names: Dict[str, str] = {}
+        self._pending_defs: List[str] = []
+        self._inlined_nodes = 0
+
+    def inline(self, schema: Any) -> Any:
+        """
+        A copy of schema with its $refs expanded, schema itself is not modified
+        """
+        return self._inline(schema, (), schema)
+
+    def get_defs(self) -> Dict[str, Any]:
+        """
+        The schemas referenced through `#/$defs/<name>` by the schemas inlined so far
+        """
+        defs = {}
+        while self._pending_defs:
+            ref = self._pending_defs.pop(0)
+            schema = get_json_pointer(self.document, ref)
+            defs[self._def_names[ref]] = self._inline(schema, (ref,), schema)
+        return defs
+
+    def _inline(self, node: Any, refs: Tuple[str, ...], root: Any = None) -> Any:
+        if isinstance(node, dict):
+            ref = node.get('$ref')
+            if _is_local_ref(ref):
+                if ref in refs or len(refs) >= self.max_inline_depth or \
+                        (node is not root and self._inlined_nodes >= self.max_inlined_nodes):
+                    return {'$ref': f'#/$defs/{self._get_def_name(ref)}'}
+                return self._inline(get_json_pointer(self.document, ref), refs + (ref,))
+            self._inlined_nodes += 1
+            return {key: self._inline(value, refs) for key, value in node.items()}
+        if isinstance(node, list):
+            self._inlined_nodes += 1
+            return [self._inline(value, refs) for value in node]
+        return node
+
+    def _get_def_name(self, ref: str) -> str:
+        name = self._def_names.get(ref)
+        if name is None:
+            base_name = _DEF_NAME_PATTERN.sub('_', unquote(ref.rsplit('/', 1)[-1]).replace('~1', '/').replace('~0', '~')) \
+                or 'schema'
+            name, suffix = base_name, 2
+            while name in self._def_names.values():
+                name, suffix = f'{base_name}_{suffix}', suffix + 1
+            self._def_names[ref] = name
+            self._pending_defs.append(ref)
+        return name
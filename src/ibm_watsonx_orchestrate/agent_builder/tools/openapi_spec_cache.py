@@ -0,0 +1,199 @@
+import hashlib
+import logging
+import os
+import re
+import shutil
+import time
+from dataclasses import dataclass, asdict
+from typing import Any
+
+from ibm_watsonx_orchestrate.utils import json_codec
+from ibm_watsonx_orchestrate.utils.file_lock import atomic_write, file_lock
+
+logger = logging.getLogger(__name__)
+
+# Set to "0" to always fetch and resolve specs again
+OPENAPI_SPEC_CACHE_ENV_VAR = "WXO_OPENAPI_SPEC_CACHE"
+OPENAPI_SPEC_CACHE_FOLDER = "openapi_specs"
+# Bumped whenever the way specs are resolved changes, resolved documents of other versions are ignored
+RESOLVED_FORMAT_VERSION = 2
+
+_MAX_AGE_PATTERN = re.compile(r"max-age\s*=\s*(\d+)")
+
+
+def is_openapi_spec_cache_enabled() -> bool:
+    return os.environ.get(OPENAPI_SPEC_CACHE_ENV_VAR, "").lower() not in ("0", "false", "no")
+
+
+def get_content_hash(content: bytes) -> str:
+    return hashlib.sha256(content).hexdigest()
+
+
+def get_max_age(cache_control: str | None) -> int | None:
+    """
+    The freshness lifetime in seconds granted by a Cache-Control header, None when the response must be revalidated
+    """
+    if not cache_control or "no-cache" in cache_control or "no-store" in cache_control:
+        return None
+    match = _MAX_AGE_PATTERN.search(cache_control)
+    return int(match.group(1)) if match else None
+
+
+@dataclass
+class CachedSpecEntry:
+    url: str
+    content_hash: str
+    fetched_at: float
+    etag: str | None = None
+    last_modified: str | None = None
+    expires_at: float | None = None
+
+    def is_fresh(self) -> bool:
+        return self.expires_at is not None and time.time() < self.expires_at
+
+    def get_validator_headers(self) -> dict:
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class OpenAPISpecCache:
+    """
+    Cache of the OpenAPI specs imported as tools, stored under the orchestrate cache directory.
+
+    Fetched documents are stored as is with their ETag / Last-Modified validators, one entry per url, so a
+    re-import only needs a conditional request, or none at all while the server's max-age holds or when it cannot
+    be reached. Documents are addressed by the hash of their content, next to which the fully resolved spec is
+    kept so importing the same content again skips parsing and $ref resolution, whether it came from a url or a file.
+    Local files get an entry per path too, so the resolved spec of a file's previous content is removed once the
+    file changes, as the content previously fetched from a url is.
+    """
+
+    def __init__(self, cache_dir: str | None = None):
+        if cache_dir is None:
+            from ibm_watsonx_orchestrate.cli.config import AUTH_CONFIG_FILE_FOLDER
+            cache_dir = AUTH_CONFIG_FILE_FOLDER
+        self.directory = os.path.join(cache_dir, OPENAPI_SPEC_CACHE_FOLDER)
+        self.lock_path = os.path.join(self.directory, ".lock")
+
+    def _get_entry_path(self, url: str) -> str:
+        return os.path.join(self.directory, f"{hashlib.sha256(url.encode()).hexdigest()}.entry.json")
+
+    def _get_file_entry_path(self, path: str) -> str:
+        return os.path.join(self.directory, f"{hashlib.sha256(os.path.abspath(path).encode()).hexdigest()}.file.json")
+
+    def _get_raw_path(self, content_hash: str) -> str:
+        return os.path.join(self.directory, f"{content_hash}.raw")
+
+    def _get_resolved_path(self, content_hash: str) -> str:
+        return os.path.join(self.directory, f"{content_hash}.resolved.v{RESOLVED_FORMAT_VERSION}.json")
+
+    @staticmethod
+    def _read(path: str) -> bytes | None:
+        try:
+            with open(path, "rb") as f:
+                return f.read()
+        except OSError:
+            return None
+
+    def _write(self, path: str, content: bytes) -> None:
+        try:
+            atomic_write(path, content)
+        except OSError as e:
+            logger.debug(f"Failed to write openapi spec cache '{path}': {e}")
+
+    def get_entry(self, url: str) -> CachedSpecEntry | None:
+        content = self._read(self._get_entry_path(url))
+        if content is None:
+            return None
+        try:
+            return CachedSpecEntry(**json_codec.loads(content))
+        except (ValueError, TypeError):
+            return None
+
+    def get_content(self, content_hash: str) -> bytes | None:
+        content = self._read(self._get_raw_path(content_hash))
+        if content is None or get_content_hash(content) != content_hash:
+            return None
+        return content
+
+    def get_resolved(self, content_hash: str) -> Any | None:
+        content = self._read(self._get_resolved_path(content_hash))
+        if content is None:
+            return None
+        try:
+            return json_codec.loads(content)
+        except ValueError:
+            return None
+
+    def save(self, url: str, content: bytes, etag: str | None = None, last_modified: str | None = None,
+             max_age: int | None = None) -> CachedSpecEntry:
+        now = time.time()
+        entry = CachedSpecEntry(
+            url=url,
+            content_hash=get_content_hash(content),
+            fetched_at=now,
+            etag=etag,
+            last_modified=last_modified,
+            expires_at=now + max_age if max_age is not None else None
+        )
+        with file_lock(self.lock_path):
+            previous = self.get_entry(url)
+            self._write(self._get_raw_path(entry.content_hash), content)
+            self._write(self._get_entry_path(url), json_codec.dumps(asdict(entry)))
+            if previous is not None and previous.content_hash != entry.content_hash:
+                self._remove_content(previous.content_hash)
+        return entry
+
+    def refresh(self, entry: CachedSpecEntry, max_age: int | None = None) -> CachedSpecEntry:
+        """
+        Records that the server confirmed the cached content of entry is still current
+        """
+        now = time.time()
+        entry = CachedSpecEntry(**{**asdict(entry), "fetched_at": now,
+                                   "expires_at": now + max_age if max_age is not None else None})
+        with file_lock(self.lock_path):
+            self._write(self._get_entry_path(entry.url), json_codec.dumps(asdict(entry)))
+        return entry
+
+    def save_resolved(self, content_hash: str, resolved: Any, path: str | None = None) -> None:
+        """
+        Stores the resolved spec of the content with content_hash, path is the local file the content was read from
+        """
+        try:
+            content = json_codec.dumps(resolved)
+        except (TypeError, ValueError, RecursionError) as e:
+            logger.debug(f"Resolved openapi spec {content_hash} cannot be cached: {e}")
+            return
+        if path is None:
+            self._write(self._get_resolved_path(content_hash), content)
+            return
+
+        entry_path = self._get_file_entry_path(path)
+        with file_lock(self.lock_path):
+            previous = self._read(entry_path)
+            self._write(self._get_resolved_path(content_hash), content)
+            self._write(entry_path, json_codec.dumps({"path": os.path.abspath(path), "content_hash": content_hash}))
+            try:
+                previous_hash = json_codec.loads(previous).get("content_hash") if previous is not None else None
+            except (ValueError, AttributeError):
+                previous_hash = None
+            if previous_hash and previous_hash != content_hash:
+                self._remove(self._get_resolved_path(previous_hash))
+
+    def _remove_content(self, content_hash: str) -> None:
+        self._remove(self._get_raw_path(content_hash))
+        self._remove(self._get_resolved_path(content_hash))
+
+    @staticmethod
+    def _remove(path: str) -> None:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+    def clear(self) -> None:
+        shutil.rmtree(self.directory, ignore_errors=True)
@@ -0,0 +1,310 @@
+import bisect
+import codecs
+import mmap
+import os
+import re
+from collections import OrderedDict
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterator, List, Tuple
+
+import yaml
+
+from ibm_watsonx_orchestrate.utils import json_codec, yaml_codec
+
+# Local specs at least this large are imported by streaming them instead of loading them whole
+DEFAULT_STREAMING_THRESHOLD = 32 * 1024 * 1024
+# Components kept loaded while operations are converted, the others are read from the file again when needed
+DEFAULT_COMPONENT_CACHE_SIZE = 256
+
+_UTF8_BOM = codecs.BOM_UTF8
+_CHECKPOINT_SIZE = 4096
+
+_JSON_WHITESPACE = re.compile(rb'[ \t\n\r]*')
+_JSON_STRING = re.compile(rb'"(?:[^"\\]|\\.)*"', re.DOTALL)
+_JSON_STRUCTURE = re.compile(rb'"(?:[^"\\]|\\.)*"|[{}\[\]]', re.DOTALL)
+_JSON_LITERAL = re.compile(rb'[^ \t\n\r,\]}]+')
+
+
+@dataclass(frozen=True)
+class Span:
+    # Byte offsets of a value in the spec file, and the column it starts at (needed to load a yaml block alone)
+    start: int
+    end: int
+    column: int = 0
+
+
+@dataclass
+class OpenAPIDocumentIndex:
+    """
+    Where the top level sections, path items and components of a spec file are, by byte offset.
+
+    Built in a single pass over the file without loading it, any of them can then be loaded on its own, so a
+    spec too large to hold in memory is only ever materialized one operation at a time.
+    """
+    path: str
+    format: str
+    sections: Dict[str, Span] = field(default_factory=dict)
+    path_items: Dict[str, Span] = field(default_factory=dict)
+    methods: Dict[str, List[str]] = field(default_factory=dict)
+    components: Dict[str, Dict[str, Span]] = field(default_factory=dict)
+
+    @classmethod
+    def build(cls, path: str) -> 'OpenAPIDocumentIndex':
+        if path.endswith('.json'):
+            index = cls(path=path, format='json')
+            index._index_json()
+        elif path.endswith('.yaml') or path.endswith('.yml'):
+            index = cls(path=path, format='yaml')
+            index._index_yaml()
+        else:
+            raise ValueError(f"Unexpected file extension for file {path}, expected one of [.json, .yaml, .yml]")
+        return index
+
+    def load(self, span: Span) -> Any:
+        with open(self.path, 'rb') as f:
+            f.seek(span.start)
+            content = f.read(span.end - span.start)
+        if self.format == 'json':
+            return json_codec.loads(content)
+        # Indenting the first line like the others lets a nested yaml block be loaded as a document of its own
+        return yaml_codec.safe_load(' ' * span.column + content.decode('utf-8'))
+
+    def _add(self, location: Tuple[str, ...], span: Span) -> None:
+        if len(location) == 1 and location[0] not in ('paths', 'components'):
+            self.sections[location[0]] = span
+        elif len(location) == 2 and location[0] == 'paths':
+            self.path_items[location[1]] = span
+        elif len(location) == 3 and location[0] == 'components':
+            self.components.setdefault(location[1], {})[location[2]] = span
+
+    def _index_json(self) -> None:
+        with open(self.path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buf:
+            def on_path_item(path: str, start: int) -> int:
+                self.methods[path] = methods = []
+
+                def on_method(method: str, method_start: int) -> int:
+                    methods.append(method)
+                    return _skip_json_value(buf, method_start)
+
+                end = _scan_json_object(buf, start, on_method)
+                self._add(('paths', path), Span(start, end))
+                return end
+
+            def on_component_type(component_type: str, start: int) -> int:
+                def on_component(name: str, component_start: int) -> int:
+                    end = _skip_json_value(buf, component_start)
+                    self._add(('components', component_type, name), Span(component_start, end))
+                    return end
+
+                return _scan_json_object(buf, start, on_component)
+
+            def on_section(key: str, start: int) -> int:
+                if key == 'paths':
+                    return _scan_json_object(buf, start, on_path_item)
+                if key == 'components':
+                    return _scan_json_object(buf, start, on_component_type)
+                end = _skip_json_value(buf, start)
+                self._add((key,), Span(start, end))
+                return end
+
+            start = len(_UTF8_BOM) if buf[:len(_UTF8_BOM)] == _UTF8_BOM else 0
+            _scan_json_object(buf, _JSON_WHITESPACE.match(buf, start).end(), on_section)
+
+    def _index_yaml(self) -> None:
+        offsets = _CharOffsets(self.path)
+        # frames of the open mappings and sequences: location, is a mapping, expects a key, current key, start mark
+        stack: List[list] = []
+        with open(self.path, 'rb') as f:
+            f.seek(offsets.base)
+            for event in yaml_codec.parse(f):
+                if isinstance(event, (yaml.MappingEndEvent, yaml.SequenceEndEvent)):
+                    location, _, _, _, start_mark = stack.pop()
+                    self._add(location, offsets.get_span(start_mark, event.end_mark))
+                    continue
+                if not isinstance(event, yaml.NodeEvent):
+                    continue
+                if isinstance(event, yaml.AliasEvent) or event.anchor is not None:
+                    raise ValueError(f"{self.path} uses yaml anchors or aliases, which cannot be loaded by part")
+
+                location: Tuple = ()
+                if stack:
+                    parent = stack[-1]
+                    if parent[1] and parent[2]:
+                        if not isinstance(event, yaml.ScalarEvent):
+                            raise ValueError(f"{self.path} uses complex yaml keys, which cannot be loaded by part")
+                        parent[2], parent[3] = False, event.value
+                        if len(parent[0]) == 2 and parent[0][0] == 'paths':
+                            self.methods[parent[0][1]].append(event.value)
+                        continue
+                    location = parent[0] + (parent[3] if parent[1] else None,)
+                    parent[2] = parent[1]
+
+                if isinstance(event, yaml.ScalarEvent):
+                    self._add(location, offsets.get_span(event.start_mark, event.end_mark))
+                else:
+                    if len(location) == 2 and location[0] == 'paths':
+                        self.methods[location[1]] = []
+                    stack.append([location, isinstance(event, yaml.MappingStartEvent), True, None, event.start_mark])
+
+
+def _skip_json_value(buf, pos: int) -> int:
+    """
+    The offset right after the json value starting at pos, found without decoding it
+    """
+    first = buf[pos]
+    if first == ord('"'):
+        return _JSON_STRING.match(buf, pos).end()
+    if first not in (ord('{'), ord('[')):
+        return _JSON_LITERAL.match(buf, pos).end()
+
+    depth = 0
+    for match in _JSON_STRUCTURE.finditer(buf, pos):
+        token = buf[match.start()]
+        if token in (ord('{'), ord('[')):
+            depth += 1
+        elif token in (ord('}'), ord(']')):
+            depth -= 1
+            if depth == 0:
+                return match.end()
+    raise ValueError(f"Invalid json, unterminated value at offset {pos}")
+
+
+def _scan_json_object(buf, pos: int, on_member: Callable[[str, int], int]) -> int:
+    """
+    Calls on_member with the key and value offset of every member of the json object at pos, on_member returns
+    the offset right after the value. Returns the offset right after the object
+    """
+    if buf[pos] != ord('{'):
+        return _skip_json_value(buf, pos)
+    pos = _JSON_WHITESPACE.match(buf, pos + 1).end()
+    if buf[pos] == ord('}'):
+        return pos + 1
+
+    while True:
+        key_match = _JSON_STRING.match(buf, pos)
+        pos = _JSON_WHITESPACE.match(buf, key_match.end()).end() if key_match else pos
+        if key_match is None or buf[pos] != ord(':'):
+            raise ValueError(f"Invalid json, expected an object key at offset {pos}")
+        key = json_codec.loads(key_match.group())
+
+        pos = on_member(key, _JSON_WHITESPACE.match(buf, pos + 1).end())
+        pos = _JSON_WHITESPACE.match(buf, pos).end()
+        if buf[pos] == ord(','):
+            pos = _JSON_WHITESPACE.match(buf, pos + 1).end()
+        elif buf[pos] == ord('}'):
+            return pos + 1
+        else:
+            raise ValueError(f"Invalid json, expected ',' or '}}' at offset {pos}")
+
+
+class _CharOffsets:
+    """
+    Converts the character offsets of yaml marks into byte offsets of a utf-8 file, from checkpoints taken every
+    few kilobytes while reading the file once. Files that are plain ascii need no conversion
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.base = 0
+        self._chars: List[int] = []
+        self._bytes: List[int] = []
+
+        decoder = codecs.getincrementaldecoder('utf-8')()
+        chars, offset, is_ascii = 0, 0, True
+        with open(path, 'rb') as f:
+            if f.read(len(_UTF8_BOM)) == _UTF8_BOM:
+                self.base = offset = len(_UTF8_BOM)
+            f.seek(self.base)
+            for block in iter(lambda: f.read(_CHECKPOINT_SIZE), b''):
+                self._chars.append(chars)
+                self._bytes.append(offset - len(decoder.getstate()[0]))
+                is_ascii = is_ascii and block.isascii()
+                chars += len(decoder.decode(block))
+                offset += len(block)
+        if is_ascii:
+            self._chars, self._bytes = [], []
+
+    def get_offset(self, index: int) -> int:
+        if not self._chars:
+            return self.base + index
+        checkpoint = bisect.bisect_right(self._chars, index) - 1
+        chars, offset = self._chars[checkpoint], self._bytes[checkpoint]
+        if index == chars:
+            return offset
+        with open(self.path, 'rb') as f:
+            f.seek(offset)
+            text = f.read(4 * (index - chars)).decode('utf-8', errors='ignore')
+        return offset + len(text[:index - chars].encode('utf-8'))
+
+    def get_span(self, start_mark: yaml.Mark, end_mark: yaml.Mark) -> Span:
+        return Span(self.get_offset(start_mark.index), self.get_offset(end_mark.index), start_mark.column)
+
+
+class _LazyMapping(Mapping):
+    def __init__(self, keys: Iterator[str], load: Callable[[str], Any]):
+        self._keys = list(keys)
+        self._key_set = set(self._keys)
+        self._load = load
+
+    def __getitem__(self, key: str) -> Any:
+        if key not in self._key_set:
+            raise KeyError(key)
+        return self._load(key)
+
+    def __iter__(self):
+        return iter(self._keys)
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+
+class LazyOpenAPIDocument(Mapping):
+    """
+    Read-only view of an indexed spec file that loads its parts when they are accessed. Path items are loaded on
+    every access, the most recently used components are kept up to component_cache_size
+    """
+
+    def __init__(self, index: OpenAPIDocumentIndex, component_cache_size: int = DEFAULT_COMPONENT_CACHE_SIZE):
+        self.index = index
+        self.component_cache_size = component_cache_size
+        self._sections: Dict[str, Any] = {}
+        self._components: "OrderedDict[Tuple[str, str], Any]" = OrderedDict()
+
+    def _get_section(self, key: str) -> Any:
+        if key not in self._sections:
+            self._sections[key] = self.index.load(self.index.sections[key])
+        return self._sections[key]
+
+    def _get_component(self, component_type: str, name: str) -> Any:
+        key = (component_type, name)
+        if key in self._components:
+            self._components.move_to_end(key)
+            return self._components[key]
+        component = self._components[key] = self.index.load(self.index.components[component_type][name])
+        while len(self._components) > self.component_cache_size:
+            self._components.popitem(last=False)
+        return component
+
+    def __getitem__(self, key: str) -> Any:
+        if key == 'paths' and self.index.path_items:
+            return _LazyMapping(self.index.path_items, lambda path: self.index.load(self.index.path_items[path]))
+        if key == 'components' and self.index.components:
+            return _LazyMapping(self.index.components, lambda component_type: _LazyMapping(
+                self.index.components[component_type],
+                lambda name: self._get_component(component_type, name)
+            ))
+        if key not in self.index.sections:
+            raise KeyError(key)
+        return self._get_section(key)
+
+    def __iter__(self):
+        keys = list(self.index.sections)
+        if self.index.path_items:
+            keys.append('paths')
+        if self.index.components:
+            keys.append('components')
+        return iter(keys)
+
+    def __len__(self) -> int:
+        return len(list(iter(self)))
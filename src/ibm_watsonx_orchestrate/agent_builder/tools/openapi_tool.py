@@ -1,15 +1,21 @@
-import copy
+import concurrent.futures
 import json
+import math
 import os.path
 import logging
-from typing import Dict, Any, List
+import time
+from collections.abc import Mapping
+from typing import Dict, Any, List, Tuple
 
-import yaml
-import yaml.constructor
 import re
 import httpx
-import jsonref
-from ibm_watsonx_orchestrate.utils.utils import yaml_safe_load
+from ibm_watsonx_orchestrate.utils import json_codec
+from ibm_watsonx_orchestrate.utils import yaml_codec
+from .openapi_filter import OpenAPIOperationFilter, OPENAPI_METHODS
+from .openapi_ref_resolver import OpenAPIRefResolver, SchemaRefInliner, DEFAULT_MAX_INLINE_DEPTH, get_json_pointer
+from .openapi_stream import OpenAPIDocumentIndex, LazyOpenAPIDocument, DEFAULT_COMPONENT_CACHE_SIZE, \
+    DEFAULT_STREAMING_THRESHOLD
+from .openapi_spec_cache import OpenAPISpecCache, get_content_hash, get_max_age, is_openapi_spec_cache_enabled
 from .types import ToolSpec
 from .base_tool import BaseTool
 from .types import HTTP_METHOD, ToolPermission, ToolRequestBody, ToolResponseBody, \
@@ -20,10 +26,9 @@ import json
 
 logger = logging.getLogger(__name__)
 
-# disables the automatic conversion of date-time objects to datetime objects and leaves them as strings
-yaml.constructor.SafeConstructor.yaml_constructors[u'tag:yaml.org,2002:timestamp'] = \
-    yaml.constructor.SafeConstructor.yaml_constructors[u'tag:yaml.org,2002:str']
-
+# Specs with fewer operations per available worker are converted in the calling process, starting workers costs more
+DEFAULT_OPERATIONS_PER_WORKER = 250
+DEFAULT_SPEC_FETCH_TIMEOUT = 30.0
 
 class HTTPException(Exception):
     def __init__(self, status_code: int, message: str):
@@ -50,7 +55,7 @@ class OpenAPITool(BaseTool):
     def from_spec(file: str) -> 'OpenAPITool':
         with open(file, 'r') as f:
             if file.endswith('.yaml') or file.endswith('.yml'):
-                spec = ToolSpec.model_validate(yaml_safe_load(f))
+                spec = ToolSpec.model_validate(yaml_codec.safe_load(f))
             elif file.endswith('.json'):
                 spec = ToolSpec.model_validate(json.load(f))
             else:
@@ -83,7 +88,8 @@ def create_openapi_json_tool(
         permission: ToolPermission = None,
         input_schema: ToolRequestBody = None,
         output_schema: ToolResponseBody = None,
-        connection_id: str = None
+        connection_id: str = None,
+        max_inline_depth: int = DEFAULT_MAX_INLINE_DEPTH
 ) -> OpenAPITool:
     """
     Creates a tool from an openapi spec
@@ -99,148 +105,436 @@ def create_openapi_json_tool(
     :param input_schema: The JSONSchema of the inputs to the http request
     :param output_schema: The expected JSON schema of the outputs of the http response
     :param connection_id: The connection id of the application containing the credentials needed to authenticate against this api
+    :param max_inline_depth: How many levels of nested schema $refs are inlined, deeper and circular ones are kept as $refs to the schema's $defs
     :return: An OpenAPITool that can be used by an agent
     """
-
-    # limitation does not support circular $refs
-    openapi_contents = jsonref.replace_refs(openapi_spec, jsonschema=True)
-
-    paths = openapi_contents.get('paths', {})
-    route = paths.get(http_path)
-    if route is None:
-        raise ValueError(f"Path {http_path} not found in paths. Available endpoints are: {list(paths.keys())}")
-
-    route_spec = route.get(http_method.lower(), route.get(http_method.upper()))
-    if route_spec is None:
-        raise ValueError(
-            f"Path {http_path} did not have an http_method {http_method}. Available methods are {list(route.keys())}")
-
-    operation_id = re.sub( r'(\W|_)+', '_', route_spec.get('operationId') ) \
-                     if route_spec.get('operationId', None) else None
-
-    spec_name = name or operation_id
-    spec_permission = permission or _action_to_perm(route_spec.get('x-ibm-operation', {}).get('action'))
-    if spec_name is None:
-        raise ValueError(
-            f"No name provided for tool. {http_method}: {http_path} did not specify an operationId, and no name was provided")
-
-    spec_description = description or route_spec.get('description')
-    if spec_description is None:
-        raise ValueError(
-            f"No description provided for tool. {http_method}: {http_path} did not specify a description field, and no description was provided")
-
-    spec = ToolSpec(
-        name=spec_name,
-        description=spec_description,
-        permission=spec_permission
+    return OpenAPIToolCompiler(openapi_spec, max_inline_depth=max_inline_depth).compile_operation(
+        http_path=http_path,
+        http_method=http_method,
+        http_success_response_code=http_success_response_code,
+        http_response_content_type=http_response_content_type,
+        name=name,
+        description=description,
+        permission=permission,
+        input_schema=input_schema,
+        output_schema=output_schema,
+        connection_id=connection_id
     )
 
-    spec.input_schema = input_schema or ToolRequestBody(
-        type='object',
-        properties={},
-        required=[]
-    )
-    spec.output_schema = output_schema or ToolResponseBody(properties={}, required=[])
-
-    parameters = route_spec.get('parameters') or []
-    for parameter in parameters:
-        name = f"{parameter['in']}_{parameter['name']}"
-        if parameter.get('required'):
-            spec.input_schema.required.append(name)
-        parameter['schema']['title'] = parameter['name']
-        parameter['schema']['description'] = parameter.get('description', None)
-        spec.input_schema.properties[name] = JsonSchemaObject.model_validate(parameter['schema'])
-        spec.input_schema.properties[name].in_field = parameter['in']
-        spec.input_schema.properties[name].aliasName = parameter['name']
-
-    # special case in runtime where __requestBody__ will be directly translated to the request body without translation
-    request_body_params = route_spec.get('requestBody', {}).get('content', {}).get(http_response_content_type, {}).get(
-        'schema', None)
-    if request_body_params is not None:
-        spec.input_schema.required.append('__requestBody__')
-        request_body_params = copy.deepcopy(request_body_params)
-        request_body_params['in'] = 'body'
-        if request_body_params.get('title') is None:
-            request_body_params['title'] = 'RequestBody'
-        if request_body_params.get('description') is None:
-            request_body_params['description'] = 'The html request body used to satisfy this user utterance.'
-
-        spec.input_schema.properties['__requestBody__'] = JsonSchemaObject.model_validate(request_body_params)
-
-    responses = route_spec.get('responses', {})
-    response = responses.get(str(http_success_response_code), {})
-    response_description = response.get('description')
-    response_schema = response.get('content', {}).get(http_response_content_type, {}).get('schema', {})
-
-    response_schema['required'] = []
-    spec.output_schema = ToolResponseBody.model_validate(response_schema)
-    spec.output_schema.description = response_description
-
-    servers = list(map(lambda x: x if isinstance(x, str) else x['url'],
-                       openapi_contents.get('servers', openapi_contents.get('x-servers', []))))
-
-    raw_open_api_security_schemes = openapi_contents.get('components', {}).get('securitySchemes', {})
-    security_schemes_map = {}
-    for key, security_scheme in raw_open_api_security_schemes.items():
-        security_schemes_map[key] = OpenApiSecurityScheme(
-            type=security_scheme['type'],
-            scheme=security_scheme.get('scheme'),
-            flows=security_scheme.get('flows'),
-            name=security_scheme.get('name'),
-            open_id_connect_url=security_scheme.get('openId', {}).get('openIdConnectUrl'),
-            in_field=security_scheme.get('in', security_scheme.get('in_field'))
+
+def create_openapi_json_tools(
+        openapi_spec: dict,
+        connection_id: str = None,
+        max_workers: int = None,
+        max_inline_depth: int = DEFAULT_MAX_INLINE_DEPTH,
+        operation_filter: OpenAPIOperationFilter = None
+) -> List[OpenAPITool]:
+    """
+    Creates a tool for every operation of an openapi spec, except HEAD ones
+
+    :param openapi_spec: The parsed dictionary representation of an openapi spec
+    :param connection_id: The connection id of the application containing the credentials needed to authenticate against this api
+    :param max_workers: How many processes convert the operations of large specs (defaults to the number of CPUs, 1 converts in this process)
+    :param max_inline_depth: How many levels of nested schema $refs are inlined, deeper and circular ones are kept as $refs to the schema's $defs
+    :param operation_filter: Which operations to create tools for, by tag, path, operationId and method (defaults to all of them)
+    :return: The OpenAPITools in the order of the spec's paths and methods
+    """
+    compiler = OpenAPIToolCompiler(openapi_spec, max_inline_depth=max_inline_depth, operation_filter=operation_filter)
+    return compiler.compile(connection_id=connection_id, max_workers=max_workers)
+
+
+class OpenAPIToolCompiler:
+    """
+    Converts the operations of an openapi spec into OpenAPITools. The spec's $refs are resolved and its servers and
+    security schemes indexed once, then shared by every operation converted. openapi_contents is the spec already
+    resolved by an OpenAPIRefResolver, as kept by the OpenAPISpecCache.
+
+    The schema $refs of each operation are inlined up to max_inline_depth levels. Circular and deeper ones, and
+    nested ones once a schema grew past DEFAULT_MAX_INLINED_NODES, are kept as $refs to the $defs of the tool's
+    input or output schema. Operations left out by operation_filter are dropped before the spec is resolved, so
+    they are never processed.
+    """
+
+    def __init__(self, openapi_spec: dict, openapi_contents: dict = None, max_inline_depth: int = DEFAULT_MAX_INLINE_DEPTH,
+                 operation_filter: OpenAPIOperationFilter = None):
+        self.openapi_spec = openapi_spec
+        self.operation_filter = operation_filter
+        if openapi_contents is None:
+            if operation_filter is not None:
+                self.openapi_spec = openapi_spec = self._select_operations(self.get_operations())
+            openapi_contents = OpenAPIRefResolver(openapi_spec).resolve_document()
+        self.openapi_contents = openapi_contents
+        self.max_inline_depth = max_inline_depth
+
+        self.servers = list(map(lambda x: x if isinstance(x, str) else x['url'],
+                                self.openapi_contents.get('servers', self.openapi_contents.get('x-servers', []))))
+
+        raw_open_api_security_schemes = self.openapi_contents.get('components', {}).get('securitySchemes', {})
+        self.security_schemes = {}
+        for key, security_scheme in raw_open_api_security_schemes.items():
+            self.security_schemes[key] = OpenApiSecurityScheme(
+                type=security_scheme['type'],
+                scheme=security_scheme.get('scheme'),
+                flows=security_scheme.get('flows'),
+                name=security_scheme.get('name'),
+                open_id_connect_url=security_scheme.get('openId', {}).get('openIdConnectUrl'),
+                in_field=security_scheme.get('in', security_scheme.get('in_field'))
+            )
+
+    def get_operations(self) -> List[Tuple[str, str]]:
+        """
+        The (path, method) of every operation of the spec a tool can be created for and operation_filter selects.
+        Only the operations themselves are read, none of their $refs are resolved
+        """
+        operations = []
+        for path in self.openapi_spec.get('paths', {}):
+            path_item = None
+            for method in self._get_path_methods(path):
+                if method.lower() not in OPENAPI_METHODS or method.lower() == 'head':
+                    continue
+                operation = None
+                if self.operation_filter is not None and self.operation_filter.needs_operation:
+                    path_item = path_item if path_item is not None else self._get_raw_path_item(path)
+                    operation = path_item.get(method)
+                if self.operation_filter is None or self.operation_filter.matches(path, method, operation):
+                    operations.append((path, method))
+        return operations
+
+    def _get_raw_path_item(self, http_path: str) -> dict:
+        path_item = self.openapi_spec.get('paths', {}).get(http_path)
+        if isinstance(path_item, Mapping) and isinstance(path_item.get('$ref'), str) and path_item['$ref'].startswith('#'):
+            path_item = get_json_pointer(self.openapi_spec, path_item['$ref'])
+        return path_item if isinstance(path_item, Mapping) else {}
+
+    def _get_path_methods(self, http_path: str) -> List[str]:
+        return list(self._get_raw_path_item(http_path))
+
+    def _select_operations(self, operations: List[Tuple[str, str]]) -> dict:
+        # A copy of the spec whose path items only keep the given operations, along with what they share
+        paths = {}
+        for path, method in operations:
+            if path not in paths:
+                paths[path] = {
+                    key: value for key, value in self._get_raw_path_item(path).items()
+                    if str(key).lower() not in OPENAPI_METHODS
+                }
+            paths[path][method] = self._get_raw_path_item(path)[method]
+        return {**self.openapi_spec, 'paths': paths}
+
+    def compile(self, connection_id: str = None, max_workers: int = None) -> List[OpenAPITool]:
+        operations = self.get_operations()
+        if max_workers is None:
+            max_workers = os.cpu_count() or 1
+        max_workers = min(max_workers, len(operations) // DEFAULT_OPERATIONS_PER_WORKER)
+
+        if max_workers <= 1:
+            return [self._compile_spec_operation(path, method, connection_id) for path, method in operations]
+
+        # Converting is CPU bound, so large specs are split across processes sharing the resolved spec
+        chunk_size = math.ceil(len(operations) / max_workers)
+        chunks = [operations[i:i + chunk_size] for i in range(0, len(operations), chunk_size)]
+        with concurrent.futures.ProcessPoolExecutor(
+                max_workers=max_workers,
+                initializer=_init_compiler_worker,
+                initargs=(self.openapi_spec, self.openapi_contents, self.max_inline_depth)
+        ) as executor:
+            specs = executor.map(_compile_in_worker, chunks, [connection_id] * len(chunks))
+            return [OpenAPITool(spec=spec) for chunk_specs in specs for spec in chunk_specs]
+
+    def _get_path_item(self, http_path: str) -> dict | None:
+        return self.openapi_contents.get('paths', {}).get(http_path)
+
+    def _compile_spec_operation(self, path: str, method: str, connection_id: str = None) -> OpenAPITool:
+        spec = self._get_path_item(path)[method]
+        success_codes = list(filter(lambda code: 200 <= int(code) < 300, spec['responses'].keys()))
+        if len(success_codes) > 1:
+            logger.warning(
+                f"There were multiple candidate success codes for {method} {path}, using {success_codes[0]} to generate output schema")
+
+        return self.compile_operation(
+            http_path=path,
+            http_method=method.upper(),
+            http_success_response_code=success_codes[0] if len(success_codes) > 0 else None,
+            connection_id=connection_id
         )
 
-    # - Note it's possible for security to be configured per route or globally
-    # - Note we have no concept of scope because to a user their auth cred either has access or it doesn't
-    #   unless we ask them for a scope they don't know to validate it provides no value
-    security = []
-    for needed_security in route_spec.get('security', []) + openapi_spec.get('security', []):
-        name = next(iter(needed_security.keys()), None)
-        if name is None or name not in security_schemes_map:
-            raise ValueError(f"Invalid openapi spec, {HTTP_METHOD} {http_path} asks for a security scheme of {name}, "
-                             f"but no such security scheme was configured in the .security section of the spec")
+    def compile_operation(
+            self,
+            http_path: str,
+            http_method: HTTP_METHOD,
+            http_success_response_code: int = 200,
+            http_response_content_type='application/json',
+            name: str = None,
+            description: str = None,
+            permission: ToolPermission = None,
+            input_schema: ToolRequestBody = None,
+            output_schema: ToolResponseBody = None,
+            connection_id: str = None
+    ) -> OpenAPITool:
+        """
+        Creates a tool for one operation of the spec, see create_openapi_json_tool
+        """
+        route = self._get_path_item(http_path)
+        if route is None:
+            raise ValueError(f"Path {http_path} not found in paths. Available endpoints are: {list(self.openapi_contents.get('paths', {}).keys())}")
+
+        route_spec = route.get(http_method.lower(), route.get(http_method.upper()))
+        if route_spec is None:
+            raise ValueError(
+                f"Path {http_path} did not have an http_method {http_method}. Available methods are {list(route.keys())}")
+
+        operation_id = re.sub( r'(\W|_)+', '_', route_spec.get('operationId') ) \
+                         if route_spec.get('operationId', None) else None
+
+        spec_name = name or operation_id
+        spec_permission = permission or _action_to_perm(route_spec.get('x-ibm-operation', {}).get('action'))
+        if spec_name is None:
+            raise ValueError(
+                f"No name provided for tool. {http_method}: {http_path} did not specify an operationId, and no name was provided")
+
+        spec_description = description or route_spec.get('description')
+        if spec_description is None:
+            raise ValueError(
+                f"No description provided for tool. {http_method}: {http_path} did not specify a description field, and no description was provided")
+
+        spec = ToolSpec(
+            name=spec_name,
+            description=spec_description,
+            permission=spec_permission
+        )
 
-        security.append(security_schemes_map[name])
+        spec.input_schema = input_schema or ToolRequestBody(
+            type='object',
+            properties={},
+            required=[]
+        )
+        spec.output_schema = output_schema or ToolResponseBody(properties={}, required=[])
+
+        # The resolved spec is shared by every operation, inlining copies schemas before they are modified
+        input_refs = SchemaRefInliner(self.openapi_contents, self.max_inline_depth)
+        output_refs = SchemaRefInliner(self.openapi_contents, self.max_inline_depth)
+
+        parameters = route_spec.get('parameters') or []
+        for parameter in parameters:
+            name = f"{parameter['in']}_{parameter['name']}"
+            if parameter.get('required'):
+                spec.input_schema.required.append(name)
+            parameter_schema = {**input_refs.inline(parameter['schema']), 'title': parameter['name'], 'description': parameter.get('description', None)}
+            spec.input_schema.properties[name] = JsonSchemaObject.model_validate(parameter_schema)
+            spec.input_schema.properties[name].in_field = parameter['in']
+            spec.input_schema.properties[name].aliasName = parameter['name']
+
+        # special case in runtime where __requestBody__ will be directly translated to the request body without translation
+        request_body_params = route_spec.get('requestBody', {}).get('content', {}).get(http_response_content_type, {}).get(
+            'schema', None)
+        if request_body_params is not None:
+            spec.input_schema.required.append('__requestBody__')
+            request_body_params = input_refs.inline(request_body_params)
+            request_body_params['in'] = 'body'
+            if request_body_params.get('title') is None:
+                request_body_params['title'] = 'RequestBody'
+            if request_body_params.get('description') is None:
+                request_body_params['description'] = 'The html request body used to satisfy this user utterance.'
+
+            spec.input_schema.properties['__requestBody__'] = JsonSchemaObject.model_validate(request_body_params)
+
+        responses = route_spec.get('responses', {})
+        response = responses.get(str(http_success_response_code), {})
+        response_description = response.get('description')
+        response_schema = response.get('content', {}).get(http_response_content_type, {}).get('schema', {})
+
+        response_schema = {**output_refs.inline(response_schema), 'required': []}
+        spec.output_schema = ToolResponseBody.model_validate(response_schema)
+        spec.output_schema.description = response_description
+
+        input_defs = input_refs.get_defs()
+        if input_defs:
+            setattr(spec.input_schema, '$defs', input_defs)
+        output_defs = output_refs.get_defs()
+        if output_defs:
+            setattr(spec.output_schema, '$defs', output_defs)
+
+        # - Note it's possible for security to be configured per route or globally
+        # - Note we have no concept of scope because to a user their auth cred either has access or it doesn't
+        #   unless we ask them for a scope they don't know to validate it provides no value
+        security = []
+        for needed_security in route_spec.get('security', []) + self.openapi_spec.get('security', []):
+            name = next(iter(needed_security.keys()), None)
+            if name is None or name not in self.security_schemes:
+                raise ValueError(f"Invalid openapi spec, {http_method} {http_path} asks for a security scheme of {name}, "
+                                 f"but no such security scheme was configured in the .security section of the spec")
+
+            security.append(self.security_schemes[name])
+
+        spec.binding = ToolBinding(openapi=OpenApiToolBinding(
+            http_path=http_path,
+            http_method=http_method,
+            security=security,
+            servers=self.servers,
+            connection_id=connection_id
+        ))
+
+        return OpenAPITool(spec=spec)
 
-    spec.binding = ToolBinding(openapi=OpenApiToolBinding(
-        http_path=http_path,
-        http_method=http_method,
-        security=security,
-        servers=servers,
-        connection_id=connection_id
-    ))
 
-    return OpenAPITool(spec=spec)
+class StreamingOpenAPIToolCompiler(OpenAPIToolCompiler):
+    """
+    Converts the operations of a spec file indexed by an OpenAPIDocumentIndex, for specs too large to be loaded whole.
+    Only the top level sections stay loaded, each path item and the components its operations refer to are read
+    from the file when converted, so peak memory follows the largest operation rather than the whole spec.
+    """
+
+    def __init__(self, index: OpenAPIDocumentIndex, max_inline_depth: int = DEFAULT_MAX_INLINE_DEPTH,
+                 component_cache_size: int = DEFAULT_COMPONENT_CACHE_SIZE,
+                 operation_filter: OpenAPIOperationFilter = None):
+        self.index = index
+        self._path_item: Tuple[str | None, dict | None] = (None, None)
+        document = LazyOpenAPIDocument(index, component_cache_size=component_cache_size)
+        super().__init__(document, openapi_contents=document, max_inline_depth=max_inline_depth,
+                         operation_filter=operation_filter)
+
+    def _get_path_methods(self, http_path: str) -> List[str]:
+        # Filtering by path and method needs no part of the file loaded, the keys of each path item are indexed
+        methods = self.index.methods.get(http_path, [])
+        return super()._get_path_methods(http_path) if '$ref' in methods else methods
+
+    def compile(self, connection_id: str = None, max_workers: int = None) -> List[OpenAPITool]:
+        # Converting in this process keeps a single part of the spec loaded at a time
+        return [self._compile_spec_operation(path, method, connection_id) for path, method in self.get_operations()]
+
+    def _get_path_item(self, http_path: str) -> dict | None:
+        # The operations of a path are converted one after the other, its path item is only loaded once for all
+        if self._path_item[0] != http_path:
+            path_item = super()._get_path_item(http_path)
+            if path_item is not None:
+                path_item = OpenAPIRefResolver(self.openapi_contents).resolve(path_item)
+            self._path_item = (http_path, path_item)
+        return self._path_item[1]
+
+
+_worker_compiler: OpenAPIToolCompiler | None = None
+
+
+def _init_compiler_worker(openapi_spec: dict, openapi_contents: dict = None,
+                          max_inline_depth: int = DEFAULT_MAX_INLINE_DEPTH) -> None:
+    global _worker_compiler
+    _worker_compiler = OpenAPIToolCompiler(openapi_spec, openapi_contents=openapi_contents,
+                                           max_inline_depth=max_inline_depth)
+
+
+def _compile_in_worker(operations: List[Tuple[str, str]], connection_id: str | None) -> List[ToolSpec]:
+    return [
+        _worker_compiler._compile_spec_operation(path, method, connection_id).__tool_spec__
+        for path, method in operations
+    ]
+
+
+def _parse_openapi_spec(content: bytes, openapi_uri: str) -> Dict[str, Any]:
+    if openapi_uri.endswith('.json'):
+        return json_codec.loads(content)
+    elif openapi_uri.endswith('.yaml') or openapi_uri.endswith('.yml'):
+        return yaml_codec.safe_load(content)
+    raise ValueError(f"Unexpected file extension for {openapi_uri}, expected one of [.json, .yaml, .yml]")
+
+
+async def _fetch_openapi_spec(openapi_uri: str, cache: OpenAPISpecCache = None) -> bytes:
+    """
+    Fetches a spec, revalidating the copy in cache when there is one. The cached copy is used without a request
+    while the max-age of the server holds, and when the server cannot be reached
+    """
+    entry = cache.get_entry(openapi_uri) if cache else None
+    cached_content = cache.get_content(entry.content_hash) if entry else None
+    if cached_content is not None and entry.is_fresh():
+        return cached_content
+
+    headers = entry.get_validator_headers() if cached_content is not None else {}
+    try:
+        async with httpx.AsyncClient(timeout=DEFAULT_SPEC_FETCH_TIMEOUT) as client:
+            r = await client.get(openapi_uri, headers=headers)
+    except httpx.TransportError as e:
+        if cached_content is None:
+            raise ValueError(f"Failed to fetch an openapi spec from {openapi_uri}: {e}")
+        fetched_at = time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(entry.fetched_at))
+        logger.warning(f"Failed to fetch an openapi spec from {openapi_uri}, using the copy cached on {fetched_at}")
+        return cached_content
+
+    cache_control = r.headers.get('Cache-Control')
+    if r.status_code == 304 and cached_content is not None:
+        cache.refresh(entry, max_age=get_max_age(cache_control))
+        return cached_content
+    if r.status_code != 200:
+        raise ValueError(f"Failed to fetch an openapi spec from {openapi_uri}, status code: {r.status_code}")
+
+    if cache and 'no-store' not in (cache_control or ''):
+        cache.save(
+            openapi_uri,
+            r.content,
+            etag=r.headers.get('ETag'),
+            last_modified=r.headers.get('Last-Modified'),
+            max_age=get_max_age(cache_control)
+        )
+    return r.content
+
+
+def _get_local_path(openapi_uri: str) -> str | None:
+    path = openapi_uri[len('file://'):] if openapi_uri.startswith('file://') else openapi_uri
+    return path if os.path.exists(path) else None
+
+
+async def _read_openapi_spec(openapi_uri: str, cache: OpenAPISpecCache = None) -> bytes:
+    path = _get_local_path(openapi_uri)
+    if path is not None:
+        with open(path, 'rb') as fp:
+            return fp.read()
+    elif openapi_uri.startswith('http://') or openapi_uri.startswith('https://'):
+        return await _fetch_openapi_spec(openapi_uri, cache)
+    raise ValueError(f"Unrecognized path or uri {openapi_uri}")
+
+
+def _get_openapi_spec_cache() -> OpenAPISpecCache | None:
+    return OpenAPISpecCache() if is_openapi_spec_cache_enabled() else None
 
 
 async def _get_openapi_spec_from_uri(openapi_uri: str) -> Dict[str, Any]:
-    if os.path.exists(openapi_uri) or openapi_uri.startswith('file://'):
-        with open(openapi_uri, 'r') as fp:
-            if openapi_uri.endswith('.json'):
-                openapi_contents = json.load(fp)
-            elif openapi_uri.endswith('.yaml') or openapi_uri.endswith('.yml'):
-                openapi_contents = yaml_safe_load(fp)
-            else:
-                raise ValueError(
-                    f"Unexpected file extension for file {openapi_uri}, expected one of [.json, .yaml, .yml]")
-    elif openapi_uri.endswith('.json'):
-        async with httpx.AsyncClient() as client:
-            r = await client.get(openapi_uri)
-            if r.status_code != 200:
-                raise ValueError(f"Failed to fetch an openapi spec from {openapi_uri}, status code: {r.status_code}")
-            openapi_contents = r.json()
-    elif openapi_uri.endswith('.yaml'):
-        async with httpx.AsyncClient() as client:
-            r = await client.get(openapi_uri)
-            if r.status_code != 200:
-                raise ValueError(f"Failed to fetch an openapi spec from {openapi_uri}, status code: {r.status_code}")
-            openapi_contents = yaml_safe_load(r.text)
-
-    if openapi_contents is None:
-        raise ValueError(f"Unrecognized path or uri {openapi_uri}")
-
-    return openapi_contents
+    content = await _read_openapi_spec(openapi_uri, _get_openapi_spec_cache())
+    return _parse_openapi_spec(content, openapi_uri)
+
+
+async def _get_openapi_compiler_from_uri(
+        openapi_uri: str,
+        max_inline_depth: int = DEFAULT_MAX_INLINE_DEPTH,
+        streaming: bool = None,
+        operation_filter: OpenAPIOperationFilter = None
+) -> OpenAPIToolCompiler:
+    """
+    Loads the spec at openapi_uri, reusing the resolved spec cached for the same content by a previous import.
+    Local files are streamed instead when streaming is set, or when it is None and they are larger than
+    DEFAULT_STREAMING_THRESHOLD. A spec resolved for the operations of an operation_filter only is not cached
+    """
+    path = _get_local_path(openapi_uri)
+    if path is not None and (streaming or (streaming is None and os.path.getsize(path) >= DEFAULT_STREAMING_THRESHOLD)):
+        try:
+            return StreamingOpenAPIToolCompiler(OpenAPIDocumentIndex.build(path), max_inline_depth=max_inline_depth,
+                                                operation_filter=operation_filter)
+        except ValueError as e:
+            if streaming:
+                raise
+            logger.warning(f"Failed to stream the openapi spec {openapi_uri}, loading it whole instead: {e}")
+
+    cache = _get_openapi_spec_cache()
+    content = await _read_openapi_spec(openapi_uri, cache)
+    content_hash = get_content_hash(content)
+
+    openapi_contents = cache.get_resolved(content_hash) if cache else None
+    if openapi_contents is not None:
+        return OpenAPIToolCompiler(openapi_contents, openapi_contents=openapi_contents, max_inline_depth=max_inline_depth,
+                                   operation_filter=operation_filter)
+
+    compiler = OpenAPIToolCompiler(_parse_openapi_spec(content, openapi_uri), max_inline_depth=max_inline_depth,
+                                   operation_filter=operation_filter)
+    if cache and operation_filter is None:
+        cache.save_resolved(content_hash, compiler.openapi_contents, path=path)
+    return compiler
 
 
 def _action_to_perm(action: str) -> str:
@@ -299,26 +593,15 @@ async def create_openapi_json_tool_from_uri(
 
 async def create_openapi_json_tools_from_uri(
         openapi_uri: str,
-        connection_id: str = None
+        connection_id: str = None,
+        max_inline_depth: int = DEFAULT_MAX_INLINE_DEPTH,
+        streaming: bool = None,
+        operation_filter: OpenAPIOperationFilter = None
 ) -> List[OpenAPITool]:
-    openapi_contents = await _get_openapi_spec_from_uri(openapi_uri)
-    tools: List[OpenAPITool] = []
-
-    for path, methods in openapi_contents.get('paths', {}).items():
-        for method, spec in methods.items():
-            if method.lower() == 'head':
-                continue
-            success_codes = list(filter(lambda code: 200 <= int(code) < 300, spec['responses'].keys()))
-            if len(success_codes) > 1:
-                logger.warning(
-                    f"There were multiple candidate success codes for {method} {path}, using {success_codes[0]} to generate output schema")
-
-            tools.append(create_openapi_json_tool(
-                openapi_contents,
-                http_path=path,
-                http_method=method.upper(),
-                http_success_response_code=success_codes[0] if len(success_codes) > 0 else None,
-                connection_id=connection_id
-            ))
-
-    return tools
+    compiler = await _get_openapi_compiler_from_uri(
+        openapi_uri,
+        max_inline_depth=max_inline_depth,
+        streaming=streaming,
+        operation_filter=operation_filter
+    )
+    return compiler.compile(connection_id=connection_id)
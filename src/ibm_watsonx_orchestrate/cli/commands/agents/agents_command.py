@@ -1,6 +1,7 @@
 import typer
 from typing_extensions import Annotated, List
 from ibm_watsonx_orchestrate.cli.commands.agents.agents_controller import AgentsController
+from ibm_watsonx_orchestrate.cli.init_helper import filter_callback
 from ibm_watsonx_orchestrate.agent_builder.agents.types import DEFAULT_LLM, AgentKind, AgentStyle, ExternalAgentAuthScheme, AgentProvider
 import json
 
@@ -173,9 +174,21 @@ def list_agents(
         bool,
         typer.Option("--verbose", "-v", help="List full details of all agents in json format"),
     ] = False,
+    limit: Annotated[
+        int,
+        typer.Option("--limit", help="Maximum number of agents to list"),
+    ] = None,
+    filter: Annotated[
+        List[str],
+        typer.Option("--filter", help="Only list agents whose field equals a value, given as key=value (e.g. name=my_name). Can be repeated", callback=filter_callback),
+    ] = None,
+    sort: Annotated[
+        str,
+        typer.Option("--sort", help="Field to sort agents by, prefix it with '-' for descending order"),
+    ] = None,
 ):  
     agents_controller = AgentsController()
-    agents_controller.list_agents(kind=kind, verbose=verbose)
+    agents_controller.list_agents(kind=kind, verbose=verbose, limit=limit, filter=filter, sort=sort)
 
 @agents_app.command(name="remove", help='Remove an agent from the active env')
 def remove_agent(
@@ -1,6 +1,6 @@
-import yaml
 import json
 import rich
+import rich.table
 import requests
 import importlib
 import inspect
@@ -10,7 +10,7 @@ from pathlib import Path
 from copy import deepcopy
 
 from typing import Iterable, List
-from ibm_watsonx_orchestrate.cli.commands.tools.tools_controller import import_python_tool
+from ibm_watsonx_orchestrate.cli.commands.tools.tools_controller import import_python_tool, LIST_BATCH_SIZE
 from ibm_watsonx_orchestrate.cli.commands.knowledge_bases.knowledge_bases_controller import import_python_knowledge_base
 
 from ibm_watsonx_orchestrate.agent_builder.agents import (
@@ -28,6 +28,10 @@ from ibm_watsonx_orchestrate.client.connections import get_connections_client
 from ibm_watsonx_orchestrate.client.knowledge_bases.knowledge_base_client import KnowledgeBaseClient
 
 from ibm_watsonx_orchestrate.client.utils import instantiate_client
+from ibm_watsonx_orchestrate.client.batch_loader import fetch_each
+from ibm_watsonx_orchestrate.utils.json_codec import print_json
+from ibm_watsonx_orchestrate.utils import yaml_codec
+from ibm_watsonx_orchestrate.utils.utils import batched, TablePrinter
 
 logger = logging.getLogger(__name__)
 
@@ -71,7 +75,7 @@ def parse_file(file: str) -> List[Agent | ExternalAgent | AssistantAgent]:
             if file.endswith(".json"):
                 content = json.load(f)
             else:
-                content = yaml.load(f, Loader=yaml.SafeLoader)
+                content = yaml_codec.safe_load(f)
         agent = create_agent_from_spec(file=file, kind=content.get("kind"))
         return [agent]
     elif file.endswith('.py'):
@@ -153,6 +157,8 @@ class AgentsController:
         self.assistant_client = None
         self.tool_client = None
         self.knowledge_base_client = None
+        # Names of the tools, collaborators and knowledge bases looked up so far, by (kind, id)
+        self._names = {}
 
     def get_native_client(self):
         if not self.native_client:
@@ -331,19 +337,27 @@ class AgentsController:
     def publish_or_update_agents(
         self, agents: Iterable[Agent]
     ):
-        for agent in agents:
-            agent_name = agent.name
+        agents = list(agents)
+        native_client = self.get_native_client()
+        external_client = self.get_external_client()
+        assistant_client = self.get_assistant_client()
 
-            native_client = self.get_native_client()
-            external_client = self.get_external_client()
-            assistant_client = self.get_assistant_client()
+        # Queue every lookup before resolving any so each client fetches all the names in one batch
+        pending = [
+            (
+                native_client.name_loader.load(agent.name),
+                external_client.name_loader.load(agent.name),
+                assistant_client.name_loader.load(agent.name)
+            )
+            for agent in agents
+        ]
+
+        for agent, (native_drafts, external_drafts, assistant_drafts) in zip(agents, pending):
+            agent_name = agent.name
 
-            existing_native_agents = native_client.get_draft_by_name(agent_name)
-            existing_native_agents = [Agent.model_validate(agent) for agent in existing_native_agents]
-            existing_external_clients = external_client.get_draft_by_name(agent_name)
-            existing_external_clients = [ExternalAgent.model_validate(agent) for agent in existing_external_clients]
-            existing_assistant_clients = assistant_client.get_draft_by_name(agent_name)
-            existing_assistant_clients = [AssistantAgent.model_validate(agent) for agent in existing_assistant_clients]
+            existing_native_agents = [Agent.model_validate(agent) for agent in native_drafts.result()]
+            existing_external_clients = [ExternalAgent.model_validate(agent) for agent in external_drafts.result()]
+            existing_assistant_clients = [AssistantAgent.model_validate(agent) for agent in assistant_drafts.result()]
 
             all_existing_agents = existing_external_clients + existing_native_agents + existing_assistant_clients
             agent = self.dereference_agent_dependencies(agent)
@@ -399,84 +413,86 @@ class AgentsController:
             agent.spec_version = SpecVersion.V1
             agent.dump_spec(kwargs["output_file"])
 
+    def _resolve_names(self, kind: str, ids: List[str], fetchers: List) -> None:
+        """
+        Looks up the names of the ids not resolved yet with one GET by id each, in parallel. Each fetcher is only
+        asked for the ids the ones before it did not find
+        """
+        unresolved = [id for id in dict.fromkeys(ids or []) if (kind, id) not in self._names]
+        for fetch in fetchers:
+            if not unresolved:
+                break
+            for id, item in fetch_each(fetch, unresolved).items():
+                if isinstance(item, dict) and item.get("name"):
+                    self._names[(kind, id)] = item["name"]
+            unresolved = [id for id in unresolved if (kind, id) not in self._names]
+        for id in unresolved:
+            self._names[(kind, id)] = None
+
+    def _get_names(self, kind: str, ids: List[str], label: str) -> List[str]:
+        names = []
+        for id in ids or []:
+            name = self._names.get((kind, id))
+            if not name:
+                logger.warning(f"{label} with ID {id} not found. Returning {label} ID")
+                name = id
+            names.append(name)
+        return names
+
+    def resolve_agent_names(self, agents: List[Agent]) -> None:
+        """
+        Looks up the tool, collaborator and knowledge base names of several agents at once, ids shared by
+        the agents are only requested once
+        """
+        self._resolve_names("tool", [id for agent in agents for id in agent.tools or []],
+                            [self.get_tool_client().get_draft_by_id])
+        self._resolve_names("collaborator", [id for agent in agents for id in agent.collaborators or []], [
+            self.get_native_client().get_draft_by_id,
+            self.get_external_client().get_draft_by_id,
+            self.get_assistant_client().get_draft_by_id
+        ])
+        self._resolve_names("knowledge_base", [id for agent in agents for id in agent.knowledge_base or []],
+                            [self.get_knowledge_base_client().get_by_id])
+
     def get_agent_tool_names(self, tool_ids: List[str]) -> List[str]:
         """Retrieve tool names for a given agent based on tool IDs."""
-        tool_client = self.get_tool_client()
-        tools = []
-        for tool_id in tool_ids:
-            try:
-                tool = tool_client.get_draft_by_id(tool_id)
-                tools.append(tool["name"])
-            except Exception as e:
-                logger.warning(f"Tool with ID {tool_id} not found. Returning Tool ID")
-                tools.append(tool_id)
-        return tools
+        self._resolve_names("tool", tool_ids, [self.get_tool_client().get_draft_by_id])
+        return self._get_names("tool", tool_ids, "Tool")
 
     def get_agent_collaborator_names(self, agent_ids: List[str]) -> List[str]:
         """Retrieve collaborator names for a given agent based on collaborator IDs."""
-        collaborator_client = self.get_native_client()
-        external_client = self.get_external_client()
-        assistant_client = self.get_assistant_client()
-        collaborators = []
-        
-        for agent_id in agent_ids:
-            try:
-                # First try resolving from native agents
-                collaborator = collaborator_client.get_draft_by_id(agent_id)
-                if collaborator:
-                    collaborators.append(collaborator["name"])
-                    continue
-            except Exception:
-                pass
+        # Resolve from native agents first, then look for the remaining ids in external and assistant agents
+        self._resolve_names("collaborator", agent_ids, [
+            self.get_native_client().get_draft_by_id,
+            self.get_external_client().get_draft_by_id,
+            self.get_assistant_client().get_draft_by_id
+        ])
+        return self._get_names("collaborator", agent_ids, "Collaborator")
 
-            try:
-                # If not found in native, check external agents
-                external_collaborator = external_client.get_draft_by_id(agent_id)
-                if external_collaborator:
-                    collaborators.append(external_collaborator["name"])
-                    continue
-            except Exception:
-                pass
+    def get_agent_knowledge_base_names(self, knowlede_base_ids: List[str]) -> List[str]:
+        """Retrieve knowledge base names for a given agent based on knowledge base IDs."""
+        self._resolve_names("knowledge_base", knowlede_base_ids, [self.get_knowledge_base_client().get_by_id])
+        return self._get_names("knowledge_base", knowlede_base_ids, "Knowledge base")
 
-            try:
-                # If not found in native or external, check assistant agents
-                assistant_collaborator = assistant_client.get_draft_by_id(agent_id)
-                if assistant_collaborator:
-                    collaborators.append(assistant_collaborator["name"])
-                    continue
-            except Exception:
-                pass
+    def list_agents(self, kind: AgentKind=None, verbose: bool=False, limit: int=None, filter: dict=None, sort: str=None):
+        # The limit applies to all kinds together, each kind only gets what the previous ones left
+        listed = 0
 
-            logger.warning(f"Collaborator with ID {agent_id} not found. Returning Collaborator ID")
-            collaborators.append(agent_id)
+        def iter_agents(client):
+            nonlocal listed
+            remaining = None if limit is None else limit - listed
+            for agent in client.iter_agents(limit=remaining, filter=filter, sort=sort):
+                listed += 1
+                yield agent
 
-        return collaborators
+        def has_remaining():
+            return limit is None or listed < limit
 
-    def get_agent_knowledge_base_names(self, knowlede_base_ids: List[str]) -> List[str]:
-        """Retrieve knowledge base names for a given agent based on knowledge base IDs."""
-        client = self.get_knowledge_base_client()
-        knowledge_bases = []
-        for id in knowlede_base_ids:
-            try:
-                kb = client.get_by_id(id)
-                knowledge_bases.append(kb["name"])
-            except Exception as e:
-                logger.warning(f"Knowledge base with ID {id} not found. Returning Tool ID")
-                knowledge_bases.append(id)
-        return knowledge_bases
-
-    def list_agents(self, kind: AgentKind=None, verbose: bool=False):
         if kind == AgentKind.NATIVE or kind is None:
-            response = self.get_native_client().get()
-            native_agents = [Agent.model_validate(agent) for agent in response]
+            native_agents = (Agent.model_validate(agent) for agent in iter_agents(self.get_native_client()))
 
             if verbose:
-                agents_list = []
-                for agent in native_agents:
-
-                    agents_list.append(json.loads(agent.dumps_spec()))
-
-                rich.print(rich.json.JSON(json.dumps(agents_list, indent=4)))
+                print_json([agent.to_spec_dict() for agent in native_agents])
             else:
                 native_table = rich.table.Table(
                     show_header=True, 
@@ -496,44 +512,41 @@ class AgentsController:
                 }
                 for column in column_args:
                     native_table.add_column(column, **column_args[column])
-
-                for agent in native_agents:
-                    tool_names = self.get_agent_tool_names(agent.tools)
-                    knowledge_base_names = self.get_agent_knowledge_base_names(agent.knowledge_base)
-                    collaborator_names = self.get_agent_collaborator_names(agent.collaborators)
-
-                    native_table.add_row(
-                        agent.name,
-                        agent.description,
-                        agent.llm,
-                        agent.style,
-                        ", ".join(collaborator_names),
-                        ", ".join(tool_names),
-                        ", ".join(knowledge_base_names),
-                        agent.id,
-                    )
-                rich.print(native_table)
+                native_printer = TablePrinter(native_table)
+
+                for agents_batch in batched(native_agents, LIST_BATCH_SIZE):
+                    self.resolve_agent_names(agents_batch)
+                    for agent in agents_batch:
+                        tool_names = self.get_agent_tool_names(agent.tools)
+                        knowledge_base_names = self.get_agent_knowledge_base_names(agent.knowledge_base)
+                        collaborator_names = self.get_agent_collaborator_names(agent.collaborators)
+
+                        native_printer.add_row(
+                            agent.name,
+                            agent.description,
+                            agent.llm,
+                            agent.style,
+                            ", ".join(collaborator_names),
+                            ", ".join(tool_names),
+                            ", ".join(knowledge_base_names),
+                            agent.id,
+                        )
+                native_printer.flush()
 
       
-        if kind == AgentKind.EXTERNAL or kind is None:
-            response = self.get_external_client().get()
-
-            external_agents = [ExternalAgent.model_validate(agent) for agent in response]
-
-            response_dict = {agent["id"]: agent for agent in response}
-
-            # Insert config values into config as config object is not retruned from api
-            for external_agent in external_agents:
-                if external_agent.id in response_dict:
-                    response_data = response_dict[external_agent.id]
+        if kind == AgentKind.EXTERNAL or (kind is None and has_remaining()):
+            def get_external_agents():
+                for response_data in iter_agents(self.get_external_client()):
+                    external_agent = ExternalAgent.model_validate(response_data)
+                    # Insert config values into config as config object is not retruned from api
                     external_agent.config.enable_cot = response_data.get("enable_cot", external_agent.config.enable_cot)
                     external_agent.config.hidden = response_data.get("hidden", external_agent.config.hidden)
+                    yield external_agent
+
+            external_agents = get_external_agents()
 
-            external_agents_list = []
             if verbose:
-                for agent in external_agents:
-                    external_agents_list.append(json.loads(agent.dumps_spec()))
-                rich.print(rich.json.JSON(json.dumps(external_agents_list, indent=4)))
+                print_json([agent.to_spec_dict() for agent in external_agents])
             else:
                 external_table = rich.table.Table(
                     show_header=True, 
@@ -556,12 +569,13 @@ class AgentsController:
                 
                 for column in column_args:
                     external_table.add_column(column, **column_args[column])
+                external_printer = TablePrinter(external_table)
                 
                 for agent in external_agents:
                     connections_client =  get_connections_client()
                     app_id = connections_client.get_draft_by_id(agent.connection_id)
 
-                    external_table.add_row(
+                    external_printer.add_row(
                         agent.name,
                         agent.title,
                         agent.description,
@@ -573,25 +587,22 @@ class AgentsController:
                         app_id,
                         agent.id
                     )
-                rich.print(external_table)
+                external_printer.flush()
         
-        if kind == AgentKind.ASSISTANT or kind is None:
-            response = self.get_assistant_client().get()
-
-            assistant_agents = [AssistantAgent.model_validate(agent) for agent in response]
-
-            response_dict = {agent["id"]: agent for agent in response}
-
-            # Insert config values into config as config object is not retruned from api
-            for assistant_agent in assistant_agents:
-                if assistant_agent.id in response_dict:
-                    response_data = response_dict[assistant_agent.id]
+        if kind == AgentKind.ASSISTANT or (kind is None and has_remaining()):
+            def get_assistant_agents():
+                for response_data in iter_agents(self.get_assistant_client()):
+                    assistant_agent = AssistantAgent.model_validate(response_data)
+                    # Insert config values into config as config object is not retruned from api
                     assistant_agent.config.api_version = response_data.get("api_version", assistant_agent.config.api_version)
                     assistant_agent.config.assistant_id = response_data.get("assistant_id", assistant_agent.config.assistant_id)
                     assistant_agent.config.crn = response_data.get("crn", assistant_agent.config.crn)
                     assistant_agent.config.service_instance_url = response_data.get("service_instance_url", assistant_agent.config.service_instance_url)
                     assistant_agent.config.environment_id = response_data.get("environment_id", assistant_agent.config.environment_id)
                     assistant_agent.config.authorization_url = response_data.get("authorization_url", assistant_agent.config.authorization_url)
+                    yield assistant_agent
+
+            assistant_agents = get_assistant_agents()
 
             if verbose:
                 for agent in assistant_agents:
@@ -617,9 +628,10 @@ class AgentsController:
                 
                 for column in column_args:
                     assistants_table.add_column(column, **column_args[column])
+                assistant_printer = TablePrinter(assistants_table)
                 
                 for agent in assistant_agents:
-                    assistants_table.add_row(
+                    assistant_printer.add_row(
                         agent.name,
                         agent.title,
                         agent.description,
@@ -631,7 +643,7 @@ class AgentsController:
                         agent.config.environment_id,
                         agent.id
                     )
-                rich.print(assistants_table)
+                assistant_printer.flush()
 
     def remove_agent(self, name: str, kind: AgentKind):
             try:
@@ -1,6 +1,7 @@
 from ibm_watsonx_orchestrate.cli.commands.channels.types import ChannelType
 import rich
 import rich.table
+import rich.console
 
 def list_channels():
     table = rich.table.Table(show_header=True, header_style="bold white", show_lines=True)
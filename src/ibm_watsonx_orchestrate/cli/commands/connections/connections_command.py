@@ -1,6 +1,7 @@
 import typer
 from typing_extensions import Annotated, List
 from ibm_watsonx_orchestrate.agent_builder.connections.types import ConnectionEnvironment, ConnectionPreference, ConnectionKind
+from ibm_watsonx_orchestrate.cli.init_helper import filter_callback
 from ibm_watsonx_orchestrate.cli.commands.connections.connections_controller import (
     add_connection,
     remove_connection,
@@ -48,9 +49,21 @@ def list_connections_command(
             '--verbose', '-v',
             help='List the connections in json format without table styling'
         )
-    ] = None
+    ] = None,
+    limit: Annotated[
+        int,
+        typer.Option("--limit", help="Maximum number of connections to list"),
+    ] = None,
+    filter: Annotated[
+        List[str],
+        typer.Option("--filter", help="Only list connections whose field equals a value, given as key=value (e.g. name=my_name). Can be repeated", callback=filter_callback),
+    ] = None,
+    sort: Annotated[
+        str,
+        typer.Option("--sort", help="Field to sort connections by, prefix it with '-' for descending order"),
+    ] = None,
 ):
-    list_connections(environment=environment, verbose=verbose)
+    list_connections(environment=environment, verbose=verbose, limit=limit, filter=filter, sort=sort)
 
 @connections_app.command(name="import")
 def import_connection_command(
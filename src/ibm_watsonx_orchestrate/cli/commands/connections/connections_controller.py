@@ -2,7 +2,7 @@ import logging
 import requests
 import json
 import rich
-import yaml
+import rich.table
 import sys
 import typer
 
@@ -32,6 +32,8 @@ from ibm_watsonx_orchestrate.agent_builder.connections.types import (
 )
 
 from ibm_watsonx_orchestrate.client.connections import get_connections_client, get_connection_type
+from ibm_watsonx_orchestrate.utils.json_codec import print_json
+from ibm_watsonx_orchestrate.utils import yaml_codec
 
 logger = logging.getLogger(__name__)
 
@@ -90,7 +92,7 @@ def _parse_file(file: str) -> None:
             if file.endswith(".json"):
                 content = json.load(f)
             else:
-                content = yaml.load(f, Loader=yaml.SafeLoader)
+                content = yaml_codec.safe_load(f)
         _create_connection_from_spec(content=content)
     else:
         raise ValueError("file must end in .json, .yaml or .yml")
@@ -373,17 +375,13 @@ def remove_connection(app_id: str) -> None:
         logger.error(response_text)
         exit(1)
 
-def list_connections(environment: ConnectionEnvironment | None, verbose: bool = False) -> None:
+def list_connections(environment: ConnectionEnvironment | None, verbose: bool = False, limit: int = None, filter: dict = None, sort: str = None) -> None:
     client = get_connections_client()
 
-    connections = client.list()
+    connections = client.iter_connections(limit=limit, filter=filter, sort=sort)
     
     if verbose:
-        connections_list = []
-        for conn in connections:
-            connections_list.append(json.loads(conn.model_dump_json()))
-
-        rich.print_json(json.dumps(connections_list, indent=4))
+        print_json([conn.model_dump(mode='json') for conn in connections])
     else:
         non_configured_table = rich.table.Table(show_header=True, header_style="bold white", show_lines=True, title="*Non-Configured")
         draft_table = rich.table.Table(show_header=True, header_style="bold white", show_lines=True, title="Draft")
@@ -1,6 +1,4 @@
 import logging
-import rich
-import jwt
 import getpass
 
 from ibm_watsonx_orchestrate.cli.commands.tools.types import RegistryType
@@ -24,7 +22,7 @@ from ibm_watsonx_orchestrate.client.client import Client
 from ibm_watsonx_orchestrate.client.client_errors import ClientError
 from ibm_watsonx_orchestrate.client.credentials import Credentials
 from threading import Lock
-from ibm_watsonx_orchestrate.client.utils import is_local_dev, check_token_validity
+from ibm_watsonx_orchestrate.client.utils import is_local_dev, check_token_validity, clear_client_registry
 from ibm_watsonx_orchestrate.cli.commands.environment.types import EnvironmentAuthType
 
 logger = logging.getLogger(__name__)
@@ -32,6 +30,8 @@ logger = logging.getLogger(__name__)
 lock = Lock()
 
 def _decode_token(token: str, is_local: bool = False) -> dict:
+    import jwt
+
     try:
         claimset = jwt.decode(token, options={"verify_signature": False})
         data = {AUTH_MCSP_TOKEN_OPT: token}
@@ -61,9 +61,9 @@ def _login(name: str, apikey: str = None) -> None:
 
     try:
         creds = Credentials(url=url, api_key=apikey, iam_url=iam_url, auth_type=auth_type)
-        client = Client(creds)
+        client = Client(creds, shared_token_cache=True)
         token = _decode_token(client.token, is_local)
-        with lock:
+        with lock, auth_cfg.lock():
             auth_cfg.save(
                 {
                     AUTH_SECTION_HEADER: {
@@ -94,7 +94,7 @@ def activate(name: str, apikey: str=None, registry: RegistryType=None, test_pack
     if not check_token_validity(existing_token) or is_local:
         _login(name=name, apikey=apikey)
 
-    with lock:
+    with lock, cfg.transaction():
         cfg.write(CONTEXT_SECTION_HEADER, CONTEXT_ACTIVE_ENV_OPT, name)
         if registry is not None:
             cfg.write(PYTHON_REGISTRY_HEADER, PYTHON_REGISTRY_TYPE_OPT, str(registry))
@@ -103,6 +103,7 @@ def activate(name: str, apikey: str=None, registry: RegistryType=None, test_pack
             cfg.write(PYTHON_REGISTRY_HEADER, PYTHON_REGISTRY_TYPE_OPT, DEFAULT_CONFIG_FILE_CONTENT[PYTHON_REGISTRY_HEADER][PYTHON_REGISTRY_TYPE_OPT])
             cfg.write(PYTHON_REGISTRY_HEADER, PYTHON_REGISTRY_TEST_PACKAGE_VERSION_OVERRIDE_OPT, test_package_version_override)
 
+    clear_client_registry()
     logger.info(f"Environment '{name}' is now active")
 
 def add(name: str, url: str, should_activate: bool=False, iam_url: str=None, type: EnvironmentAuthType=None) -> None:
@@ -118,7 +119,7 @@ def add(name: str, url: str, should_activate: bool=False, iam_url: str=None, typ
         if update_response.lower() == "n":
             logger.info(f"No changes made to environments")
             return
-    with lock:
+    with lock, cfg.transaction():
         cfg.write(ENVIRONMENTS_SECTION_HEADER, name, {ENV_WXO_URL_OPT: url})
         if iam_url:
             cfg.write(ENVIRONMENTS_SECTION_HEADER, name, {ENV_IAM_URL_OPT: iam_url})
@@ -150,14 +151,21 @@ def remove(name: str) -> None:
         if remove_confirmation.lower() != 'y':
             logger.info("No changes made to environments")
             return
-        cfg.write(CONTEXT_SECTION_HEADER, CONTEXT_ACTIVE_ENV_OPT, None)
 
-    cfg.delete(ENVIRONMENTS_SECTION_HEADER, name)
+    with cfg.transaction():
+        if name == active_env:
+            cfg.write(CONTEXT_SECTION_HEADER, CONTEXT_ACTIVE_ENV_OPT, None)
+        cfg.delete(ENVIRONMENTS_SECTION_HEADER, name)
     if existing_auth_env_cfg:
         auth_cfg.delete(AUTH_SECTION_HEADER, name)
+    clear_client_registry()
     logger.info(f"Successfully removed environment '{name}'")
 
 def list_envs() -> None:
+    # Imported here so the env commands that print no table start faster
+    import rich.console
+    import rich.table
+
     cfg = Config()
     active_env = cfg.read(CONTEXT_SECTION_HEADER, CONTEXT_ACTIVE_ENV_OPT)
     envs = cfg.get(ENVIRONMENTS_SECTION_HEADER)
@@ -1,6 +1,7 @@
 import typer
-from typing_extensions import Annotated
+from typing_extensions import Annotated, List
 from ibm_watsonx_orchestrate.cli.commands.knowledge_bases.knowledge_bases_controller import KnowledgeBaseController
+from ibm_watsonx_orchestrate.cli.init_helper import filter_callback
 
 knowledge_bases_app = typer.Typer(no_args_is_help=True)
 
@@ -46,9 +47,21 @@ def list_knowledge_bases(
         bool,
         typer.Option("--verbose", "-v", help="List full details of all knowledge bases in json format"),
     ] = False,
+    limit: Annotated[
+        int,
+        typer.Option("--limit", help="Maximum number of knowledge bases to list"),
+    ] = None,
+    filter: Annotated[
+        List[str],
+        typer.Option("--filter", help="Only list knowledge bases whose field equals a value, given as key=value (e.g. name=my_name). Can be repeated", callback=filter_callback),
+    ] = None,
+    sort: Annotated[
+        str,
+        typer.Option("--sort", help="Field to sort knowledge bases by, prefix it with '-' for descending order"),
+    ] = None,
 ):  
     controller = KnowledgeBaseController()
-    controller.list_knowledge_bases(verbose=verbose)
+    controller.list_knowledge_bases(verbose=verbose, limit=limit, filter=filter, sort=sort)
 
 @knowledge_bases_app.command(name="remove", help="Delete a knowlege base and all ingested documents")
 def remove_knowledge_base(
@@ -1,6 +1,7 @@
 import sys
 import json
 import rich
+import rich.table
 import requests
 import logging
 import importlib
@@ -14,6 +15,8 @@ from ibm_watsonx_orchestrate.client.knowledge_bases.knowledge_base_client import
 from ibm_watsonx_orchestrate.client.base_api_client import ClientAPIException
 from ibm_watsonx_orchestrate.client.connections import get_connections_client
 from ibm_watsonx_orchestrate.client.utils import instantiate_client
+from ibm_watsonx_orchestrate.utils.json_codec import print_json
+from ibm_watsonx_orchestrate.utils.utils import TablePrinter
 
 logger = logging.getLogger(__name__)
 
@@ -165,15 +168,11 @@ class KnowledgeBaseController:
         rich.print(table)
 
 
-    def list_knowledge_bases(self, verbose: bool=False):
-        response = self.get_client().get()
-        knowledge_bases = [KnowledgeBase.model_validate(knowledge_base) for knowledge_base in response]
+    def list_knowledge_bases(self, verbose: bool=False, limit: int=None, filter: dict=None, sort: str=None):
+        knowledge_bases = (KnowledgeBase.model_validate(knowledge_base) for knowledge_base in self.get_client().iter_knowledge_bases(limit=limit, filter=filter, sort=sort))
 
-        knowledge_base_list = []
         if verbose:
-            for kb in knowledge_bases:
-                knowledge_base_list.append(json.loads(kb.model_dump_json(exclude_none=True)))
-            rich.print(rich.json.JSON(json.dumps(knowledge_base_list, indent=4)))
+            print_json([kb.model_dump(mode='json', exclude_none=True) for kb in knowledge_bases])
         else:
             table = rich.table.Table(
                 show_header=True, 
@@ -190,6 +189,7 @@ class KnowledgeBaseController:
             
             for column in column_args:
                 table.add_column(column, **column_args[column])
+            printer = TablePrinter(table)
             
             for kb in knowledge_bases:
                 app_id = ""
@@ -201,14 +201,14 @@ class KnowledgeBaseController:
                     connections_client = get_connections_client()
                     app_id = str(connections_client.get_draft_by_id(kb.conversational_search_tool.index_config[0].connection_id))
 
-                table.add_row(
+                printer.add_row(
                     kb.name,
                     kb.description,
                     app_id,
                     str(kb.id)
                 )
 
-            rich.print(table)
+            printer.flush()
         
 
     def remove_knowledge_base(self, id: str, name: str):
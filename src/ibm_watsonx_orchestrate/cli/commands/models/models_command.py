@@ -5,6 +5,8 @@ import sys
 import rich.highlighter
 import typer
 import rich
+import rich.table
+import rich.console
 import typer
 from typing_extensions import Annotated
 from ibm_watsonx_orchestrate.cli.commands.server.server_command import get_default_env_file, merge_env
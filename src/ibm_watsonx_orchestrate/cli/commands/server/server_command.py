@@ -14,6 +14,7 @@ import typer
 from dotenv import dotenv_values
 
 from ibm_watsonx_orchestrate.client.utils import instantiate_client, check_token_validity, is_local_dev
+from ibm_watsonx_orchestrate.client.local_service_instance import clear_local_tenant_cache
 from ibm_watsonx_orchestrate.cli.commands.environment.environment_controller import _login
 from ibm_watsonx_orchestrate.cli.config import LICENSE_HEADER, \
     ENV_ACCEPT_LICENSE
@@ -358,7 +359,8 @@ def run_compose_lite_ui(user_env_file: Path) -> bool:
     merged_env_dict['REACT_APP_TENANT_ID'] = tenant_id
 
     agent_client = instantiate_client(AgentClient)
-    agents = agent_client.get()
+    # A single agent is enough to start the chat, only ask for one
+    agents = list(agent_client.iter_agents(page_size=1, limit=1))
     if not agents:
         logger.error("No agents found for the current environment. Please create an agent before starting the chat.")
         sys.exit(1)
@@ -472,6 +474,8 @@ def run_compose_lite_down(final_env_file: Path, is_reset: bool = False) -> None:
 
     if is_reset:
         command.append("--volumes")
+        # The tenant cached for the developer edition is dropped along with its database
+        clear_local_tenant_cache()
         logger.info("Stopping docker-compose services and resetting volumes...")
     else:
         logger.info("Stopping docker-compose services...")
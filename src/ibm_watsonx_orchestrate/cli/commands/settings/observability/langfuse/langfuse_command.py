@@ -1,18 +1,17 @@
-import yaml
 import json
 import logging
 from typing import Annotated
 from json import loads
 
 import typer
-from yaml.representer import Representer
 
 from ibm_watsonx_orchestrate.agent_builder.agents import SpecVersion
 from ibm_watsonx_orchestrate.client.analytics.llm.analytics_llm_client import AnalyticsLLMClient, AnalyticsLLMConfig, \
     AnalyticsLLMResponse
 from ibm_watsonx_orchestrate.client.base_api_client import ClientAPIException
 from ibm_watsonx_orchestrate.client.utils import instantiate_client
-from ibm_watsonx_orchestrate.utils.utils import yaml_safe_load
+from ibm_watsonx_orchestrate.utils import yaml_codec
+
 
 settings_observability_langfuse_app = typer.Typer(no_args_is_help=True)
 
@@ -24,7 +23,7 @@ def _validate_langfuse_input(**kwargs) -> AnalyticsLLMConfig:
         file = kwargs['config_file']
         with open(file, 'r') as fp:
             if file.endswith('.yaml') or file.endswith('.yml'):
-                content = yaml_safe_load(fp)
+                content = yaml_codec.safe_load(fp)
             elif file.endswith('.json'):
                 content = json.load(fp)
             else:
@@ -93,7 +92,7 @@ def get_langfuse(
     if output:
         with open(output, 'w') as f:
             if output.endswith('.yaml') or output.endswith('.yml'):
-                yaml.safe_dump(config, f, sort_keys=False)
+                yaml_codec.safe_dump(config, f, sort_keys=False)
                 logger.info(f"Langfuse configuration written to {output}")
             elif output.endswith('.json'):
                 json.dump(config, f, indent=2)
@@ -101,7 +100,7 @@ def get_langfuse(
             else:
                 raise ValueError('--output file must end in .json, .yaml, or .yml')
     else:
-        print(yaml.safe_dump(config, sort_keys=False))
+        print(yaml_codec.safe_dump(config, sort_keys=False))
 
 
 
@@ -2,6 +2,7 @@ import typer
 from typing import List
 from typing_extensions import Annotated
 from ibm_watsonx_orchestrate.cli.commands.tools.tools_controller import ToolsController, ToolKind
+from ibm_watsonx_orchestrate.cli.init_helper import filter_callback
 tools_app= typer.Typer(no_args_is_help=True)
 
 @tools_app.command(name="import", help='Import a tool into the active environment')
@@ -49,6 +50,20 @@ included in this folder will be included within the uploaded package. Local depe
 relative to this package root folder or imported using relative imports from the --file. This only applies when the 
 --kind=python. If not specified it is assumed only a single python file is being uploaded."""),
     ] = None,
+    include: Annotated[
+        List[str],
+        typer.Option(
+            "--include",
+            help="Only import the operations matching kind=value, where kind is tag, path (a glob such as /pets/*), operation-id (a regex) or method. Can be repeated. Only applies when --kind=openapi",
+        ),
+    ] = None,
+    exclude: Annotated[
+        List[str],
+        typer.Option(
+            "--exclude",
+            help="Skip the operations matching kind=value, with the same kinds as --include. Can be repeated. Only applies when --kind=openapi",
+        ),
+    ] = None,
 ):
     tools_controller = ToolsController(kind, file, requirements_file)
     tools = tools_controller.import_tool(
@@ -59,7 +74,9 @@ relative to this package root folder or imported using relative imports from the
         # skill_operation_path=skill_operation_path,
         app_id=app_id,
         requirements_file=requirements_file,
-        package_root=package_root
+        package_root=package_root,
+        include=include,
+        exclude=exclude
     )
     
     tools_controller.publish_or_update_tools(tools, package_root=package_root)
@@ -70,9 +87,21 @@ def list_tools(
         bool,
         typer.Option("--verbose", "-v", help="List full details of all tools as json"),
     ] = False,
+    limit: Annotated[
+        int,
+        typer.Option("--limit", help="Maximum number of tools to list"),
+    ] = None,
+    filter: Annotated[
+        List[str],
+        typer.Option("--filter", help="Only list tools whose field equals a value, given as key=value (e.g. name=my_name). Can be repeated", callback=filter_callback),
+    ] = None,
+    sort: Annotated[
+        str,
+        typer.Option("--sort", help="Field to sort tools by, prefix it with '-' for descending order"),
+    ] = None,
 ):  
     tools_controller = ToolsController()
-    tools_controller.list_tools(verbose=verbose)
+    tools_controller.list_tools(verbose=verbose, limit=limit, filter=filter, sort=sort)
 
 @tools_app.command(name="remove", help='Remove a tool from the active environment')
 def remove_tool(
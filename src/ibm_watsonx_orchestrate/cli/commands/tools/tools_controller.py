@@ -12,14 +12,13 @@ from os import path
 from pathlib import Path
 from typing import Iterable, List
 import rich
-import json
-from rich.json import JSON
 import glob
 
 import rich.table
 import typer
 
 from ibm_watsonx_orchestrate.agent_builder.tools import BaseTool, ToolSpec
+from ibm_watsonx_orchestrate.agent_builder.tools.openapi_filter import OpenAPIOperationFilter
 from ibm_watsonx_orchestrate.agent_builder.tools.openapi_tool import create_openapi_json_tools_from_uri
 from ibm_watsonx_orchestrate.cli.commands.tools.types import RegistryType
 from ibm_watsonx_orchestrate.cli.config import Config, CONTEXT_SECTION_HEADER, CONTEXT_ACTIVE_ENV_OPT, \
@@ -30,12 +29,17 @@ from ibm_watsonx_orchestrate.client.tools.tool_client import ToolClient
 from ibm_watsonx_orchestrate.client.toolkit.toolkit_client import ToolKitClient
 from ibm_watsonx_orchestrate.client.connections import get_connections_client, get_connection_type
 from ibm_watsonx_orchestrate.client.utils import instantiate_client, is_local_dev
-from ibm_watsonx_orchestrate.utils.utils import sanatize_app_id
+from ibm_watsonx_orchestrate.client.batch_loader import fetch_each
+from ibm_watsonx_orchestrate.utils.utils import sanatize_app_id, batched, TablePrinter
+from ibm_watsonx_orchestrate.utils.json_codec import print_json
 
 from  ibm_watsonx_orchestrate import __version__
 
 logger = logging.getLogger(__name__)
 
+# Number of streamed tools whose toolkit names are resolved together when listing
+LIST_BATCH_SIZE = 500
+
 __supported_characters_pattern = re.compile("^(\\w|_)+$")
 
 
@@ -99,8 +103,18 @@ def validate_params(kind: ToolKind, **args) -> None:
             raise typer.BadParameter(
                 f"Missing flags {missing_params} required for kind skill"
             )
+    if kind != "openapi" and (args.get("include") or args.get("exclude")):
+        raise typer.BadParameter(
+            "--include and --exclude can only be used when kind is set to openapi"
+        )
     validate_app_ids(kind=kind, **args)
 
+def get_operation_filter(include: List[str] = None, exclude: List[str] = None) -> OpenAPIOperationFilter | None:
+    try:
+        return OpenAPIOperationFilter.from_options(include=include, exclude=exclude)
+    except ValueError as e:
+        raise typer.BadParameter(str(e))
+
 def get_connection_id(app_id: str) -> str:
     connections_client = get_connections_client()
     connection_id = None
@@ -314,8 +328,10 @@ def import_python_tool(file: str, requirements_file: str = None, app_id: List[st
 
     return tools
 
-async def import_openapi_tool(file: str, connection_id: str) -> List[BaseTool]:
-    tools = await create_openapi_json_tools_from_uri(file, connection_id)
+async def import_openapi_tool(file: str, connection_id: str, operation_filter: OpenAPIOperationFilter = None) -> List[BaseTool]:
+    tools = await create_openapi_json_tools_from_uri(file, connection_id, operation_filter=operation_filter)
+    if operation_filter is not None and not tools:
+        logger.warning(f"No operations of the openapi spec {file} matched the given --include and --exclude filters")
     return tools
 
 class ToolsController:
@@ -348,6 +364,7 @@ class ToolsController:
                 )
 
             case "openapi":
+                operation_filter = get_operation_filter(args.get("include"), args.get("exclude"))
                 connections_client = get_connections_client()
                 app_id = args.get('app_id', None)
                 connection_id = None
@@ -355,7 +372,11 @@ class ToolsController:
                     app_id = app_id[0]
                     connection = connections_client.get_draft_by_app_id(app_id=app_id)
                     connection_id = connection.connection_id
-                tools = asyncio.run(import_openapi_tool(file=args["file"], connection_id=connection_id))
+                tools = asyncio.run(import_openapi_tool(
+                    file=args["file"],
+                    connection_id=connection_id,
+                    operation_filter=operation_filter
+                ))
             case "skill":
                 tools = []
                 logger.warning("Skill Import not implemented yet")
@@ -366,85 +387,85 @@ class ToolsController:
             yield tool
 
 
-    def list_tools(self, verbose=False):
-        response = self.get_client().get()
-        tool_specs = [ToolSpec.model_validate(tool) for tool in response]
-        tools = [BaseTool(spec=spec) for spec in tool_specs]
+    def list_tools(self, verbose=False, limit: int = None, filter: dict = None, sort: str = None):
+        # Tools are decoded one at a time while the response streams in instead of loading the whole list
+        tools = (BaseTool(spec=ToolSpec.model_validate(tool)) for tool in self.get_client().iter_tools(limit=limit, filter=filter, sort=sort))
 
         if verbose:
-            tools_list = []
-            for tool in tools:
-                tools_list.append(json.loads(tool.dumps_spec()))
-
-            rich.print(JSON(json.dumps(tools_list, indent=4)))
+            print_json([tool.to_spec_dict() for tool in tools])
         else:
             table = rich.table.Table(show_header=True, header_style="bold white", show_lines=True)
             columns = ["Name", "Description", "Permission", "Type", "Toolkit", "App ID"]
             for column in columns:
                 table.add_column(column)
+            printer = TablePrinter(table)
 
             connections_client = get_connections_client()
             connections = connections_client.list()
 
             connections_dict = {conn.connection_id: conn for conn in connections}
 
-            for tool in tools:
-                tool_binding = tool.__tool_spec__.binding
-
-                connection_ids = []
-
-                if tool_binding is not None:
-                    if tool_binding.openapi is not None and hasattr(tool_binding.openapi, "connection_id"):
-                        connection_ids = [tool_binding.openapi.connection_id]
-                    elif tool_binding.python is not None and hasattr(tool_binding.python, "connections") and tool_binding.python.connections is not None:
-                        for conn in tool_binding.python.connections:
-                            connection_ids.append(tool_binding.python.connections[conn])
-                    elif tool_binding.mcp is not None and hasattr(tool_binding.mcp, "connections"):
-                        for conn in tool_binding.mcp.connections:
-                            connection_ids.append(tool_binding.mcp.connections[conn])
-
-                app_ids = []
-                for connection_id in connection_ids:
-                    connection = connections_dict.get(connection_id)
-                    if connection:
-                        app_id = str(connection.app_id or connection.connection_id)
-                    elif connection_id:
-                        app_id = str(connection_id)
+            toolkit_names = {}
+            for tools_batch in batched(tools, LIST_BATCH_SIZE):
+                toolkit_ids = [
+                    tool.__tool_spec__.toolkit_id for tool in tools_batch
+                    if tool.__tool_spec__.toolkit_id and tool.__tool_spec__.toolkit_id not in toolkit_names
+                ]
+                if is_local_dev() and toolkit_ids:
+                    toolkit_client = instantiate_client(ToolKitClient)
+                    for toolkit_id, toolkit in fetch_each(toolkit_client.get_draft_by_id, toolkit_ids).items():
+                        if isinstance(toolkit, dict):
+                            toolkit_names[toolkit_id] = toolkit.get("name")
+                        else:
+                            toolkit_names[toolkit_id] = str(toolkit) if toolkit else ""
+
+                for tool in tools_batch:
+                    tool_binding = tool.__tool_spec__.binding
+
+                    connection_ids = []
+
+                    if tool_binding is not None:
+                        if tool_binding.openapi is not None and hasattr(tool_binding.openapi, "connection_id"):
+                            connection_ids = [tool_binding.openapi.connection_id]
+                        elif tool_binding.python is not None and hasattr(tool_binding.python, "connections") and tool_binding.python.connections is not None:
+                            for conn in tool_binding.python.connections:
+                                connection_ids.append(tool_binding.python.connections[conn])
+                        elif tool_binding.mcp is not None and hasattr(tool_binding.mcp, "connections"):
+                            for conn in tool_binding.mcp.connections:
+                                connection_ids.append(tool_binding.mcp.connections[conn])
+
+                    app_ids = []
+                    for connection_id in connection_ids:
+                        connection = connections_dict.get(connection_id)
+                        if connection:
+                            app_id = str(connection.app_id or connection.connection_id)
+                        elif connection_id:
+                            app_id = str(connection_id)
+                        else:
+                            app_id = ""
+                        app_ids.append(app_id)
+
+                    if tool_binding.python is not None:
+                            tool_type=ToolKind.python
+                    elif tool_binding.openapi is not None:
+                            tool_type=ToolKind.openapi
+                    elif tool_binding.mcp is not None:
+                            tool_type=ToolKind.mcp
                     else:
-                        app_id = ""
-                    app_ids.append(app_id)
-
-                if tool_binding.python is not None:
-                        tool_type=ToolKind.python
-                elif tool_binding.openapi is not None:
-                        tool_type=ToolKind.openapi
-                elif tool_binding.mcp is not None:
-                        tool_type=ToolKind.mcp
-                else:
-                        tool_type="Unknown"
+                            tool_type="Unknown"
                 
-                toolkit_name = ""
-
-                if is_local_dev():
-                    toolkit_client = instantiate_client(ToolKitClient)
-                    if tool.__tool_spec__.toolkit_id:
-                        toolkit = toolkit_client.get_draft_by_id(tool.__tool_spec__.toolkit_id)
-                        if isinstance(toolkit, dict) and "name" in toolkit:
-                            toolkit_name = toolkit["name"]
-                        elif toolkit:
-                            toolkit_name = str(toolkit)
+                    toolkit_name = toolkit_names.get(tool.__tool_spec__.toolkit_id) or ""
 
-                
-                table.add_row(
-                    tool.__tool_spec__.name,
-                    tool.__tool_spec__.description,
-                    tool.__tool_spec__.permission,
-                    tool_type,
-                    toolkit_name,
-                    ", ".join(app_ids),
-                )
+                    printer.add_row(
+                        tool.__tool_spec__.name,
+                        tool.__tool_spec__.description,
+                        tool.__tool_spec__.permission,
+                        tool_type,
+                        toolkit_name,
+                        ", ".join(app_ids),
+                    )
 
-            rich.print(table)
+            printer.flush()
 
     def get_all_tools(self) -> dict:
         return {entry["name"]: entry["id"] for entry in self.get_client().get()}
@@ -454,11 +475,15 @@ class ToolsController:
 
         # Zip the tool's supporting artifacts for python tools
         with tempfile.TemporaryDirectory() as tmpdir:
-            for tool in tools:
+            tools = list(tools)
+            # Queue every lookup before resolving any so all the names are fetched in one batch
+            pending = [self.get_client().name_loader.load(tool.__tool_spec__.name) for tool in tools]
+
+            for tool, existing_tools in zip(tools, pending):
                 exist = False
                 tool_id = None
 
-                existing_tools = self.get_client().get_draft_by_name(tool.__tool_spec__.name)
+                existing_tools = existing_tools.result()
                 if len(existing_tools) > 1:
                     logger.error(f"Multiple existing tools found with name '{tool.__tool_spec__.name}'. Failed to update tool")
                     sys.exit(1)
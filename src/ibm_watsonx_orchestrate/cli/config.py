@@ -1,10 +1,13 @@
 import os
 import logging
-import yaml
+import threading
+from ibm_watsonx_orchestrate.utils import yaml_codec
+from contextlib import contextmanager
 from copy import deepcopy
 
 from ibm_watsonx_orchestrate.cli.commands.tools.types import RegistryType
-from ibm_watsonx_orchestrate.utils.utils import yaml_safe_load
+
+from ibm_watsonx_orchestrate.utils.file_lock import atomic_write, file_lock
 from enum import Enum
 
 # Section Headers
@@ -31,7 +34,11 @@ ENV_ACCEPT_LICENSE = 'accepts_license_agreements'
 DEFAULT_LOCAL_SERVICE_URL = "http://localhost:4321"
 CHAT_UI_PORT = "3000"
 
-DEFAULT_CONFIG_FILE_FOLDER = f"{os.path.expanduser('~')}/.config/orchestrate"
+# Point these at separate directories to run independent orchestrate sessions side by side, e.g. one per CI shard
+CONFIG_DIR_ENV_VAR = "ORCHESTRATE_CONFIG_DIR"
+CACHE_DIR_ENV_VAR = "ORCHESTRATE_CACHE_DIR"
+
+DEFAULT_CONFIG_FILE_FOLDER = os.environ.get(CONFIG_DIR_ENV_VAR) or f"{os.path.expanduser('~')}/.config/orchestrate"
 DEFAULT_CONFIG_FILE = "config.yaml"
 DEFAULT_CONFIG_FILE_CONTENT = {
     CONTEXT_SECTION_HEADER: {CONTEXT_ACTIVE_ENV_OPT: None},
@@ -47,7 +54,7 @@ DEFAULT_CONFIG_FILE_CONTENT = {
     USER_ENV_CACHE_HEADER: {}
 }
 
-AUTH_CONFIG_FILE_FOLDER = f"{os.path.expanduser('~')}/.cache/orchestrate"
+AUTH_CONFIG_FILE_FOLDER = os.environ.get(CACHE_DIR_ENV_VAR) or f"{os.path.expanduser('~')}/.cache/orchestrate"
 AUTH_CONFIG_FILE = "credentials.yaml"
 AUTH_CONFIG_FILE_CONTENT = {
     AUTH_SECTION_HEADER: {
@@ -58,6 +65,25 @@ AUTH_CONFIG_FILE_CONTENT = {
 logger = logging.getLogger(__name__)
 
 
+# Parsed config files shared by every Config instance, keyed by path together with the (mtime, size, inode)
+# they were parsed at. Entries are replaced whole, never mutated
+_FILE_CACHE: dict[str, tuple[tuple, dict]] = {}
+_FILE_CACHE_LOCK = threading.Lock()
+
+
+def _get_file_version(path: str) -> tuple | None:
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+
+
+def clear_config_cache() -> None:
+    with _FILE_CACHE_LOCK:
+        _FILE_CACHE.clear()
+
+
 def merge_configs(source: dict, destination: dict) -> dict:
     if source:
         merged_object = deepcopy(source)
@@ -102,6 +128,9 @@ class Config:
         self.config_file = config_file
         self.config_file_path = os.path.join(self.config_file_folder, self.config_file)
         self.file_type = None
+        # Pending content while a transaction is open
+        self._transaction_data: dict | None = None
+        self._transaction_dirty = False
 
         if _check_if_default_config_file(folder=self.config_file_folder, file=self.config_file):
             self.file_type = ConfigFileTypes.CONFIG
@@ -113,22 +142,77 @@ class Config:
             self.create_config_file()
 
         # Check if file has defaults
+        config_data = self._load()
+        if self.file_type == ConfigFileTypes.CONFIG:
+            if not config_data.get(ENVIRONMENTS_SECTION_HEADER, {}).get(PROTECTED_ENV_NAME, False):
+                logger.debug("Setting default config data")
+                self.create_defaults(DEFAULT_CONFIG_FILE_CONTENT)
+                config_data = self._load()
+
+            if not config_data.get(PYTHON_REGISTRY_HEADER, {}).get(PYTHON_REGISTRY_TYPE_OPT, False):
+                self.create_defaults({
+                    PYTHON_REGISTRY_HEADER: DEFAULT_CONFIG_FILE_CONTENT.get(PYTHON_REGISTRY_HEADER, {})
+                })
+
+        elif self.file_type == ConfigFileTypes.AUTH:
+            if PROTECTED_ENV_NAME not in set((config_data.get(AUTH_SECTION_HEADER) or {}).keys()):
+                logger.debug("Setting default credentials data")
+                self.create_defaults(AUTH_CONFIG_FILE_CONTENT)
+
+    def _load(self) -> dict:
+        """
+        Returns the parsed config file, only reading it again when it changed on disk.
+        The returned dict is shared and must not be modified
+        """
+        if self._transaction_data is not None:
+            return self._transaction_data
+
+        version = _get_file_version(self.config_file_path)
+        if version is None:
+            return {}
+        cached = _FILE_CACHE.get(self.config_file_path)
+        if cached is not None and cached[0] == version:
+            return cached[1]
+
         with open(self.config_file_path, 'r') as conf_file:
-            config_data = yaml_safe_load(conf_file) or {}
-            if self.file_type == ConfigFileTypes.CONFIG:
-                if not config_data.get(ENVIRONMENTS_SECTION_HEADER, {}).get(PROTECTED_ENV_NAME, False):
-                    logger.debug("Setting default config data")
-                    self.create_defaults(DEFAULT_CONFIG_FILE_CONTENT)
-
-                if not config_data.get(PYTHON_REGISTRY_HEADER, {}).get(PYTHON_REGISTRY_TYPE_OPT, False):
-                    self.create_defaults({
-                        PYTHON_REGISTRY_HEADER: DEFAULT_CONFIG_FILE_CONTENT.get(PYTHON_REGISTRY_HEADER, {})
-                    })
-
-            elif self.file_type == ConfigFileTypes.AUTH:
-                if PROTECTED_ENV_NAME not in set(config_data.get(AUTH_SECTION_HEADER, {}).keys()):
-                    logger.debug("Setting default credentials data")
-                    self.create_defaults(AUTH_CONFIG_FILE_CONTENT)
+            config_data = yaml_codec.safe_load(conf_file) or {}
+        with _FILE_CACHE_LOCK:
+            _FILE_CACHE[self.config_file_path] = (version, config_data)
+        return config_data
+
+    def _dump(self, config_data: dict) -> None:
+        if self._transaction_data is not None:
+            self._transaction_data = config_data
+            self._transaction_dirty = True
+            return
+
+        # Readers without the lock see either the old or the new file, never a partially written one
+        with self.lock():
+            atomic_write(self.config_file_path, yaml_codec.dump(config_data, allow_unicode=True))
+        with _FILE_CACHE_LOCK:
+            _FILE_CACHE[self.config_file_path] = (_get_file_version(self.config_file_path), config_data)
+
+    @contextmanager
+    def transaction(self):
+        """
+        Batches the writes, saves and deletes made in the block into a single write of the file at the end of it.
+        Reads in the block see the pending changes. Nothing is written if the block raises
+        """
+        if self._transaction_data is not None:
+            yield self
+            return
+
+        with self.lock():
+            self._transaction_data = deepcopy(self._load())
+            self._transaction_dirty = False
+            try:
+                yield self
+                config_data, dirty = self._transaction_data, self._transaction_dirty
+            finally:
+                self._transaction_data = None
+                self._transaction_dirty = False
+            if dirty:
+                self._dump(config_data)
 
     def create_config_file(self) -> None:
         logger.info(f'Creating config file at location "{self.config_file_path}"')
@@ -139,6 +223,13 @@ class Config:
     def create_defaults(self, default_content):
         self.save(default_content)
 
+    def lock(self):
+        """
+        Context manager holding an exclusive lock on the config file shared with other orchestrate processes,
+        use it around read-modify-write sequences
+        """
+        return file_lock(f"{self.config_file_path}.lock")
+
     def get_active_env(self):
         return self.read(CONTEXT_SECTION_HEADER, CONTEXT_ACTIVE_ENV_OPT)
 
@@ -147,12 +238,11 @@ class Config:
 
     def read(self, section: str, option: str) -> any:
         try:
-            with open(self.config_file_path, "r") as conf_file:
-                config_data = yaml.load(conf_file, Loader=yaml.SafeLoader)
-                if config_data is None:
-                    return None
-                return config_data[section][option]
-        except KeyError:
+            config_data = self._load()
+            if not config_data:
+                return None
+            return deepcopy(config_data[section][option])
+        except (KeyError, TypeError):
             return None
 
     def write(self, section: str, option: str, value: any) -> None:
@@ -162,17 +252,9 @@ class Config:
         self.save(obj)
 
     def save(self, object: dict) -> None:
-        config_data = {}
-        try:
-            with open(self.config_file_path, 'r') as conf_file:
-                config_data = yaml_safe_load(conf_file) or {}
-        except FileNotFoundError:
-            pass
-
-        config_data = merge_configs(config_data, object)
-
-        with open(self.config_file_path, 'w') as conf_file:
-            yaml.dump(config_data, conf_file, allow_unicode=True)
+        with self.transaction():
+            config_data = merge_configs(self._load(), object)
+            self._dump(config_data)
 
     def get(self, *args):
         """
@@ -181,22 +263,17 @@ class Config:
         as keys to access deeper sections of the config and then returning the last specified key.
         """
 
-        config_data = {}
-        try:
-            with open(self.config_file_path, 'r') as conf_file:
-                config_data = yaml_safe_load(conf_file) or {}
-        except FileNotFoundError:
-            pass
+        config_data = self._load()
 
         if len(args) < 1:
-            return config_data
+            return deepcopy(config_data)
 
         try:
             nested_dict = config_data
             for key in args[:-1]:
                 nested_dict = nested_dict[key]
 
-            return nested_dict[args[-1]]
+            return deepcopy(nested_dict[args[-1]])
         except KeyError as e:
             raise KeyError(f"Failed to get data from config. Key {e} not in {list(nested_dict.keys())}")
 
@@ -209,22 +286,17 @@ class Config:
         if len(args) < 1:
             raise ValueError("Config.delete() requires at least one positional argument")
 
-        config_data = {}
-        try:
-            with open(self.config_file_path, 'r') as conf_file:
-                config_data = yaml_safe_load(conf_file) or {}
-        except FileNotFoundError:
-            pass
+        with self.transaction():
+            config_data = self._load()
 
-        try:
-            deletion_data = deepcopy(config_data)
-            nested_dict = deletion_data
-            for key in args[:-1]:
-                nested_dict = nested_dict[key]
+            try:
+                deletion_data = deepcopy(config_data)
+                nested_dict = deletion_data
+                for key in args[:-1]:
+                    nested_dict = nested_dict[key]
 
-            del (nested_dict[args[-1]])
-        except KeyError as e:
-            raise KeyError(f"Failed to delete from config. Key {e} not in {list(nested_dict.keys())}")
+                del (nested_dict[args[-1]])
+            except KeyError as e:
+                raise KeyError(f"Failed to delete from config. Key {e} not in {list(nested_dict.keys())}")
 
-        with open(self.config_file_path, 'w') as conf_file:
-            yaml.dump(deletion_data, conf_file, allow_unicode=True)
+            self._dump(deletion_data)
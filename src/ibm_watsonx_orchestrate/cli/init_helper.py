@@ -1,16 +1,18 @@
-import importlib.metadata
-from importlib import resources
-from typing import Optional
+from typing import List, Optional
 from rich import print as pprint
-from dotenv import dotenv_values
 import typer
 
-from ibm_watsonx_orchestrate.cli.config import Config, PYTHON_REGISTRY_HEADER, \
-    PYTHON_REGISTRY_TEST_PACKAGE_VERSION_OVERRIDE_OPT
+# The root callback runs for every command, so what it needs is only imported once an option asks for it
 
 
 def version_callback(checkVersion: bool=True):
     if checkVersion:
+        import importlib.metadata
+        from importlib import resources
+        from dotenv import dotenv_values
+        from ibm_watsonx_orchestrate.cli.config import Config, PYTHON_REGISTRY_HEADER, \
+            PYTHON_REGISTRY_TEST_PACKAGE_VERSION_OVERRIDE_OPT
+
         __version__ = importlib.metadata.version('ibm-watsonx-orchestrate')
         default_env = dotenv_values(resources.files("ibm_watsonx_orchestrate.docker").joinpath("default.env"))
         cfg = Config()
@@ -38,6 +40,25 @@ def init_callback(
       "--version",
       help="Show the installed version of the ADK and Developer Edition Tags",
       callback=version_callback
+    ),
+    timings: Optional[bool] = typer.Option(
+      False,
+      "--timings",
+      help="Print p50/p95/p99 latencies of the API requests made, per endpoint and per client, once the command completes"
     )
 ):
-    pass
+    if timings:
+        from ibm_watsonx_orchestrate.client.metrics import MetricsRecorder, add_request_hook
+
+        recorder = MetricsRecorder()
+        add_request_hook(recorder)
+        ctx.call_on_close(recorder.print_summary)
+
+
+def filter_callback(filters: Optional[List[str]]) -> Optional[dict]:
+    from ibm_watsonx_orchestrate.client.pagination import parse_filters
+
+    try:
+        return parse_filters(filters)
+    except ValueError as e:
+        raise typer.BadParameter(str(e))
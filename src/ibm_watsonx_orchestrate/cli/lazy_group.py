@@ -0,0 +1,58 @@
+import importlib
+from typing import NamedTuple
+
+import click
+import typer
+from typer.core import TyperGroup
+
+
+class LazySubcommand(NamedTuple):
+    # "package.module:attribute" of the typer.Typer app implementing the subcommand
+    import_path: str
+    help: str | None = None
+
+
+class LazyTyperGroup(TyperGroup):
+    """
+    Group whose subcommands declared in lazy_subcommands are only imported when invoked, so starting the CLI
+    does not pay for the dependencies of every command. Listing the commands in the help output uses the
+    declared help without importing anything
+    """
+    lazy_subcommands: dict[str, LazySubcommand] = {}
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._formatting_help = False
+
+    def list_commands(self, ctx: click.Context) -> list[str]:
+        return [*super().list_commands(ctx), *(name for name in self.lazy_subcommands if name not in self.commands)]
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> click.Command | None:
+        command = super().get_command(ctx, cmd_name)
+        if command is not None or cmd_name not in self.lazy_subcommands:
+            return command
+
+        subcommand = self.lazy_subcommands[cmd_name]
+        if self._formatting_help:
+            return click.Command(name=cmd_name, help=subcommand.help)
+
+        command = self._load(cmd_name, subcommand)
+        self.add_command(command, cmd_name)
+        return command
+
+    def format_help(self, ctx: click.Context, formatter: click.HelpFormatter) -> None:
+        self._formatting_help = True
+        try:
+            super().format_help(ctx, formatter)
+        finally:
+            self._formatting_help = False
+
+    @staticmethod
+    def _load(cmd_name: str, subcommand: LazySubcommand) -> click.Command:
+        module_name, attribute = subcommand.import_path.split(":")
+        sub_app: typer.Typer = getattr(importlib.import_module(module_name), attribute)
+        command = typer.main.get_group(sub_app)
+        command.name = cmd_name
+        if subcommand.help:
+            command.help = subcommand.help
+        return command
@@ -1,5 +1,9 @@
 from ibm_watsonx_orchestrate.client.base_api_client import BaseAPIClient, ClientAPIException
-from typing_extensions import List
+from ibm_watsonx_orchestrate.client.async_base_api_client import AsyncBaseAPIClient
+from typing_extensions import AsyncIterator, Iterator, List
+from functools import cached_property
+from ibm_watsonx_orchestrate.client.batch_loader import BatchLoader
+from ibm_watsonx_orchestrate.client.pagination import DEFAULT_PAGE_SIZE
 from ibm_watsonx_orchestrate.client.utils import is_local_dev
 
 
@@ -11,6 +15,9 @@ class AgentClient(BaseAPIClient):
         super().__init__(*args, **kwargs)
         self.base_endpoint = "/orchestrate/agents" if is_local_dev(self.base_url) else "/agents"
 
+    @cached_property
+    def name_loader(self) -> BatchLoader:
+        return BatchLoader(self.get_drafts_by_names, key_fn=lambda agent: agent.get("name"))
 
     def create(self, payload: dict) -> dict:
         return self._post(self.base_endpoint, data=payload)
@@ -18,6 +25,9 @@ class AgentClient(BaseAPIClient):
     def get(self) -> dict:
         return self._get(self.base_endpoint)
 
+    def iter_agents(self, page_size: int = DEFAULT_PAGE_SIZE, filter: dict = None, sort: str = None, limit: int = None) -> Iterator[dict]:
+        return self._iter_pages(self.base_endpoint, page_size=page_size, filter=filter, sort=sort, limit=limit)
+
     def update(self, agent_id: str, data: dict) -> dict:
         return self._patch(f"{self.base_endpoint}/{agent_id}", data=data)
 
@@ -25,11 +35,10 @@ class AgentClient(BaseAPIClient):
         return self._delete(f"{self.base_endpoint}/{agent_id}")
     
     def get_draft_by_name(self, agent_name: str) -> List[dict]:
-        return self.get_drafts_by_names([agent_name])
+        return self.name_loader.load(agent_name).result()
 
     def get_drafts_by_names(self, agent_names: List[str]) -> List[dict]:
-        formatted_agent_names = [f"names={x}" for x  in agent_names]
-        return self._get(f"{self.base_endpoint}?{'&'.join(formatted_agent_names)}")
+        return self._get_chunked(self.base_endpoint, "names", agent_names)
     
     def get_draft_by_id(self, agent_id: str) -> List[dict]:
         if agent_id is None:
@@ -43,4 +52,44 @@ class AgentClient(BaseAPIClient):
                     return ""
                 raise(e)
 
-    
+
+class AsyncAgentClient(AsyncBaseAPIClient):
+    """
+    Async client to handle CRUD operations for Native Agent endpoint
+    """
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.base_endpoint = "/orchestrate/agents" if is_local_dev(self.base_url) else "/agents"
+
+    async def create(self, payload: dict) -> dict:
+        return await self._post(self.base_endpoint, data=payload)
+
+    async def get(self) -> dict:
+        return await self._get(self.base_endpoint)
+
+    def iter_agents(self, page_size: int = DEFAULT_PAGE_SIZE, filter: dict = None, sort: str = None, limit: int = None) -> AsyncIterator[dict]:
+        return self._iter_pages(self.base_endpoint, page_size=page_size, filter=filter, sort=sort, limit=limit)
+
+    async def update(self, agent_id: str, data: dict) -> dict:
+        return await self._patch(f"{self.base_endpoint}/{agent_id}", data=data)
+
+    async def delete(self, agent_id: str) -> dict:
+        return await self._delete(f"{self.base_endpoint}/{agent_id}")
+
+    async def get_draft_by_name(self, agent_name: str) -> List[dict]:
+        return await self.get_drafts_by_names([agent_name])
+
+    async def get_drafts_by_names(self, agent_names: List[str]) -> List[dict]:
+        return await self._get_chunked(self.base_endpoint, "names", agent_names)
+
+    async def get_draft_by_id(self, agent_id: str) -> List[dict]:
+        if agent_id is None:
+            return ""
+        else:
+            try:
+                agent = await self._get(f"{self.base_endpoint}/{agent_id}")
+                return agent
+            except ClientAPIException as e:
+                if e.response.status_code == 404 and "not found with the given name" in e.response.text:
+                    return ""
+                raise(e)
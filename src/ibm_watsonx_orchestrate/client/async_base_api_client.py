@@ -0,0 +1,321 @@
+import asyncio
+import importlib.util
+import random
+import time
+import weakref
+from abc import abstractmethod
+from typing import AsyncIterator, List
+
+import httpx
+from ibm_cloud_sdk_core.authenticators import MCSPAuthenticator
+
+from ibm_watsonx_orchestrate.client.batch_loader import chunk_query_values
+from ibm_watsonx_orchestrate.client.pagination import Paginator, DEFAULT_PAGE_SIZE
+from ibm_watsonx_orchestrate.client.rate_limiter import get_rate_limiter, get_retry_after, THROTTLE_STATUS_CODE
+from ibm_watsonx_orchestrate.client import metrics
+from ibm_watsonx_orchestrate.utils import json_codec
+from ibm_watsonx_orchestrate.client.compression import (
+    COMPRESSIBLE_METHODS,
+    DEFAULT_MIN_COMPRESS_SIZE,
+    compress,
+    get_encoding_negotiator,
+    is_compression_enabled,
+    is_encoding_rejected
+)
+from ibm_watsonx_orchestrate.client.base_api_client import (
+    ClientAPIException,
+    DEFAULT_CONNECT_TIMEOUT,
+    DEFAULT_READ_TIMEOUT,
+    DEFAULT_MAX_RETRIES,
+    DEFAULT_BACKOFF_FACTOR,
+    DEFAULT_BACKOFF_JITTER,
+    RETRY_STATUS_CODES,
+    IDEMPOTENT_METHODS
+)
+
+DEFAULT_MAX_CONNECTIONS = 100
+DEFAULT_MAX_KEEPALIVE_CONNECTIONS = 20
+DEFAULT_BACKOFF_MAX = 120
+
+# HTTP/2 needs the optional `h2` package (pip install "ibm-watsonx-orchestrate[http2]")
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+# httpx.AsyncClient connections are bound to the event loop that opened them, so the shared
+# pools are kept per running loop and dropped together with it.
+_ASYNC_CLIENTS: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, dict[str, httpx.AsyncClient]]" = weakref.WeakKeyDictionary()
+
+
+def get_async_session(base_url: str) -> httpx.AsyncClient:
+    """
+    Returns the httpx.AsyncClient shared by every async client talking to base_url on the running event loop
+    """
+    loop = asyncio.get_running_loop()
+    sessions = _ASYNC_CLIENTS.setdefault(loop, {})
+    session = sessions.get(base_url)
+    if session is None or session.is_closed:
+        session = httpx.AsyncClient(
+            http2=HTTP2_AVAILABLE,
+            limits=httpx.Limits(
+                max_connections=DEFAULT_MAX_CONNECTIONS,
+                max_keepalive_connections=DEFAULT_MAX_KEEPALIVE_CONNECTIONS
+            )
+        )
+        sessions[base_url] = session
+    return session
+
+
+async def aclose_sessions() -> None:
+    """
+    Closes every pooled connection opened on the running event loop
+    """
+    loop = asyncio.get_running_loop()
+    sessions = _ASYNC_CLIENTS.pop(loop, {})
+    for session in sessions.values():
+        await session.aclose()
+
+
+def _get_backoff(attempt: int, backoff_factor: float) -> float:
+    backoff = backoff_factor * (2 ** attempt) + random.uniform(0, DEFAULT_BACKOFF_JITTER)
+    return min(backoff, DEFAULT_BACKOFF_MAX)
+
+
+class AsyncBaseAPIClient:
+    """
+    asyncio counterpart of BaseAPIClient built on a shared httpx.AsyncClient
+    """
+
+    def __init__(
+            self,
+            base_url: str,
+            api_key: str = None,
+            is_local: bool = False,
+            authenticator: MCSPAuthenticator = None,
+            connect_timeout: float = DEFAULT_CONNECT_TIMEOUT,
+            read_timeout: float = DEFAULT_READ_TIMEOUT,
+            max_retries: int = DEFAULT_MAX_RETRIES,
+            backoff_factor: float = DEFAULT_BACKOFF_FACTOR,
+            compress_requests: bool = None
+    ):
+        self.base_url = base_url.rstrip("/")  # remove trailing slash
+        self.api_key = api_key
+        self.authenticator = authenticator
+        self.timeout = httpx.Timeout(read_timeout, connect=connect_timeout)
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        # Opt-in, defaults to the WXO_CLIENT_COMPRESS_REQUESTS environment variable
+        self.compress_requests = is_compression_enabled() if compress_requests is None else compress_requests
+
+        # api path can be re-written by api proxy when deployed
+        # TO-DO: re-visit this when shipping to production
+        self.is_local = is_local
+
+        if not self.is_local:
+            self.base_url = f"{self.base_url}/v1/orchestrate"
+
+    @property
+    def session(self) -> httpx.AsyncClient:
+        return get_async_session(self.base_url)
+
+    async def _get_headers(self) -> dict:
+        headers = {}
+        if self.api_key:
+            headers["Authorization"] = f"Bearer {self.api_key}"
+        elif self.authenticator:
+            # The token manager requests a new token over blocking http once the current one expires
+            token = await asyncio.to_thread(self.authenticator.token_manager.get_token)
+            headers["Authorization"] = f"Bearer {token}"
+        return headers
+
+    def _emit_metrics(self, method: str, path: str, response: httpx.Response | None, elapsed: float) -> None:
+        if not metrics.has_request_hooks():
+            return
+        bytes_sent = 0
+        if response is not None:
+            try:
+                bytes_sent = len(response.request.content)
+            except (RuntimeError, httpx.RequestNotRead):
+                pass
+        metrics.emit_request_metrics(metrics.RequestMetrics(
+            client=type(self).__name__,
+            method=method,
+            path_template=metrics.get_path_template(path),
+            status=response.status_code if response is not None else None,
+            bytes_sent=bytes_sent,
+            bytes_received=len(response.content) if response is not None else None,
+            elapsed=elapsed
+        ))
+
+    async def _request(self, method: str, path: str, **kwargs) -> httpx.Response:
+        headers = await self._get_headers()
+        self._encode_json_body(headers, kwargs)
+        encoding = self._get_request_encoding(method, kwargs)
+        if encoding is None:
+            response = await self._send(method, path, headers, **kwargs)
+        else:
+            response = await self._send_compressed(method, path, headers, encoding, **kwargs)
+
+        self._check_response(response)
+        return response
+
+    @staticmethod
+    def _encode_json_body(headers: dict, kwargs: dict) -> None:
+        """
+        Serialises a json body once with the configured codec (orjson when installed) instead of leaving it to httpx
+        """
+        if kwargs.get("json") is None or kwargs.get("files") or kwargs.get("data"):
+            return
+        kwargs["content"] = json_codec.dumps(kwargs.pop("json"))
+        headers["Content-Type"] = "application/json"
+
+    @staticmethod
+    def _decode_body(response: httpx.Response):
+        return json_codec.loads(response.content) if response.content else {}
+
+    def _get_request_encoding(self, method: str, kwargs: dict) -> str | None:
+        if not self.compress_requests or method not in COMPRESSIBLE_METHODS:
+            return None
+        if kwargs.get("json") is None and not kwargs.get("content") and not kwargs.get("data") and not kwargs.get("files"):
+            return None
+        return get_encoding_negotiator().get_encoding(self.base_url)
+
+    async def _send_compressed(self, method: str, path: str, headers: dict, encoding: str, **kwargs) -> httpx.Response:
+        # Encode the json / form / multipart body up front so that it can be compressed, and resent if needed
+        request = httpx.Request(
+            method,
+            f"{self.base_url}{path}",
+            content=kwargs.pop("content", None),
+            json=kwargs.pop("json", None),
+            data=kwargs.pop("data", None),
+            files=kwargs.pop("files", None)
+        )
+        body = request.read()
+        if "Content-Type" in request.headers:
+            headers = {**headers, "Content-Type": request.headers["Content-Type"]}
+        if len(body) < DEFAULT_MIN_COMPRESS_SIZE:
+            return await self._send(method, path, headers, content=body, **kwargs)
+
+        response = await self._send(method, path, {**headers, "Content-Encoding": encoding}, content=compress(body, encoding), **kwargs)
+        if not is_encoding_rejected(response.status_code, response.text):
+            return response
+
+        # The server cannot decode the body, drop the encoding for this environment and resend it uncompressed
+        get_encoding_negotiator().reject(self.base_url, encoding, response.headers.get("Accept-Encoding"))
+        return await self._send(method, path, headers, content=body, **kwargs)
+
+    async def _send(self, method: str, path: str, headers: dict, **kwargs) -> httpx.Response:
+        url = f"{self.base_url}{path}"
+        limiter = get_rate_limiter(self.base_url)
+        # Only idempotent requests are resent, running a POST twice could duplicate what it creates
+        retries = self.max_retries if method in IDEMPOTENT_METHODS else 0
+        endpoint = f"{method} {metrics.get_path_template(path)}"
+
+        attempt = 0
+        while True:
+            await limiter.acquire_async()
+            started = time.monotonic()
+            try:
+                response = await self.session.request(method, url, headers=headers, timeout=self.timeout, **kwargs)
+            except (httpx.ConnectError, httpx.ConnectTimeout, httpx.ReadTimeout, httpx.RemoteProtocolError):
+                self._emit_metrics(method, path, None, time.monotonic() - started)
+                if attempt >= retries:
+                    raise
+                await asyncio.sleep(_get_backoff(attempt, self.backoff_factor))
+                attempt += 1
+                continue
+            finally:
+                limiter.release()
+
+            elapsed = time.monotonic() - started
+            retry_after = get_retry_after(response.headers)
+            limiter.record(response.status_code, elapsed, retry_after, endpoint=endpoint)
+            self._emit_metrics(method, path, response, elapsed)
+
+            if response.status_code == THROTTLE_STATUS_CODE and attempt < retries:
+                # the limiter holds every request to this environment back until Retry-After has elapsed
+                attempt += 1
+                continue
+
+            if response.status_code in RETRY_STATUS_CODES and attempt < retries:
+                await asyncio.sleep(retry_after if retry_after is not None else _get_backoff(attempt, self.backoff_factor))
+                attempt += 1
+                continue
+
+            return response
+
+    async def _get(self, path: str, params: dict = None, data=None) -> dict:
+        response = await self._request("GET", path, params=params, data=data)
+        return json_codec.loads(response.content)
+
+    async def _get_chunked(self, path: str, param: str, values: List[str]) -> list:
+        """
+        GET path with a repeated query parameter (?param=a&param=b...) of arbitrary length.
+        The values are split into url length safe chunks that are requested concurrently and the list
+        responses concatenated
+        """
+        separator = "&" if "?" in path else "?"
+        queries = chunk_query_values(f"{self.base_url}{path}", param, values)
+        responses = await asyncio.gather(*[self._get(f"{path}{separator}{query}") for query in queries])
+        return [item for response in responses for item in response]
+
+    async def _iter_pages(
+            self,
+            path: str,
+            page_size: int = DEFAULT_PAGE_SIZE,
+            filter: dict = None,
+            sort: str = None,
+            limit: int = None,
+            key: str = None
+    ) -> AsyncIterator:
+        """
+        Iterate a list endpoint page by page (limit/offset query parameters)
+        """
+        paginator = Paginator(page_size=page_size, filter=filter, sort=sort, limit=limit)
+        while (params := paginator.next_params()) is not None:
+            response = await self._get(path, params=params)
+            for item in paginator.consume(response.get(key, []) if key else response):
+                yield item
+
+    async def _post(self, path: str, data: dict = None, files: dict = None) -> dict:
+        response = await self._request("POST", path, json=data, files=files)
+        return self._decode_body(response)
+
+    async def _post_form_data(self, path: str, data: dict = None, files: dict = None) -> dict:
+        # Use data argument instead of json so data is encoded as application/x-www-form-urlencoded
+        response = await self._request("POST", path, data=data, files=files)
+        return self._decode_body(response)
+
+    async def _put(self, path: str, data: dict = None) -> dict:
+        response = await self._request("PUT", path, json=data)
+        return self._decode_body(response)
+
+    async def _patch(self, path: str, data: dict = None) -> dict:
+        response = await self._request("PATCH", path, json=data)
+        return self._decode_body(response)
+
+    async def _patch_form_data(self, path: str, data: dict = None, files = None) -> dict:
+        response = await self._request("PATCH", path, data=data, files=files)
+        return self._decode_body(response)
+
+    async def _delete(self, path: str, data=None) -> dict:
+        response = await self._request("DELETE", path, json=data)
+        return self._decode_body(response)
+
+    def _check_response(self, response: httpx.Response):
+        if response.is_error:
+            raise ClientAPIException(request=response.request, response=response)
+
+    @abstractmethod
+    async def create(self, *args, **kwargs):
+        raise NotImplementedError("create method of the client must be implemented")
+
+    @abstractmethod
+    async def delete(self, *args, **kwargs):
+        raise NotImplementedError("delete method of the client must be implemented")
+
+    @abstractmethod
+    async def update(self, *args, **kwargs):
+        raise NotImplementedError("update method of the client must be implemented")
+
+    @abstractmethod
+    async def get(self, *args, **kwargs):
+        raise NotImplementedError("get method of the client must be implemented")
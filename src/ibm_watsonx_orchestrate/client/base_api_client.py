@@ -1,9 +1,122 @@
 import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterator, List
 
 import requests
 from abc import ABC, abstractmethod
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from ibm_cloud_sdk_core.authenticators import MCSPAuthenticator
 
+from ibm_watsonx_orchestrate.client.batch_loader import chunk_query_values, DEFAULT_MAX_PARALLEL_CHUNKS
+from ibm_watsonx_orchestrate.client.json_stream import iter_json_array, DEFAULT_STREAM_CHUNK_SIZE
+from ibm_watsonx_orchestrate.client.pagination import Paginator, DEFAULT_PAGE_SIZE
+from ibm_watsonx_orchestrate.client.rate_limiter import get_rate_limiter, get_retry_after, THROTTLE_STATUS_CODE
+from ibm_watsonx_orchestrate.client import metrics
+from ibm_watsonx_orchestrate.utils import json_codec
+from ibm_watsonx_orchestrate.client.compression import (
+    COMPRESSIBLE_METHODS,
+    DEFAULT_MIN_COMPRESS_SIZE,
+    compress,
+    get_encoding_negotiator,
+    is_compression_enabled,
+    is_encoding_rejected
+)
+from ibm_watsonx_orchestrate.client.response_cache import (
+    CacheEntry,
+    InMemoryResponseCache,
+    RequestCoalescer,
+    ResponseCache,
+    get_cache_key
+)
+
+DEFAULT_CONNECT_TIMEOUT = 10
+DEFAULT_READ_TIMEOUT = 120
+DEFAULT_MAX_RETRIES = 3
+DEFAULT_BACKOFF_FACTOR = 0.5
+DEFAULT_BACKOFF_JITTER = 0.5
+DEFAULT_POOL_MAXSIZE = 32
+RETRY_STATUS_CODES = frozenset([429, 502, 503])
+IDEMPOTENT_METHODS = frozenset(["GET", "HEAD", "OPTIONS", "PUT", "DELETE"])
+SAFE_METHODS = frozenset(["GET", "HEAD", "OPTIONS"])
+
+# One connection pool (HTTPAdapter) is shared by every client talking to the same base url.
+# urllib3 pools are thread-safe, requests.Session is not, so each thread gets its own Session
+# mounted on the shared adapter.
+_ADAPTERS: dict[tuple, HTTPAdapter] = {}
+_ADAPTERS_LOCK = threading.Lock()
+_THREAD_SESSIONS = threading.local()
+
+
+def _get_adapter(base_url: str, max_retries: int, backoff_factor: float) -> HTTPAdapter:
+    key = (base_url, max_retries, backoff_factor)
+    with _ADAPTERS_LOCK:
+        adapter = _ADAPTERS.get(key)
+        if adapter is None:
+            retry = Retry(
+                total=max_retries,
+                connect=max_retries,
+                read=max_retries,
+                status=max_retries,
+                backoff_factor=backoff_factor,
+                backoff_jitter=DEFAULT_BACKOFF_JITTER,
+                # 429s are retried by BaseAPIClient._request so that the shared rate limiter sees them
+                status_forcelist=RETRY_STATUS_CODES - {THROTTLE_STATUS_CODE},
+                allowed_methods=IDEMPOTENT_METHODS,
+                respect_retry_after_header=True,
+                raise_on_status=False,
+            )
+            adapter = HTTPAdapter(pool_connections=1, pool_maxsize=DEFAULT_POOL_MAXSIZE, max_retries=retry)
+            _ADAPTERS[key] = adapter
+        return adapter
+
+
+def get_session(base_url: str, max_retries: int = DEFAULT_MAX_RETRIES, backoff_factor: float = DEFAULT_BACKOFF_FACTOR) -> requests.Session:
+    """
+    Returns a keep-alive session for the current thread backed by the connection pool shared for base_url
+    """
+    adapter = _get_adapter(base_url, max_retries, backoff_factor)
+    sessions = getattr(_THREAD_SESSIONS, "sessions", None)
+    if sessions is None:
+        sessions = _THREAD_SESSIONS.sessions = {}
+
+    session = sessions.get(adapter)
+    if session is None:
+        session = requests.Session()
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        sessions[adapter] = session
+    return session
+
+
+_RESPONSE_CACHE: ResponseCache | None = InMemoryResponseCache()
+_REQUEST_COALESCER = RequestCoalescer()
+
+
+def get_response_cache() -> ResponseCache | None:
+    return _RESPONSE_CACHE
+
+
+def set_response_cache(cache: ResponseCache | None) -> None:
+    """
+    Replaces the conditional GET cache shared by every client. Pass None to disable response caching
+    """
+    global _RESPONSE_CACHE
+    _RESPONSE_CACHE = cache
+
+
+def close_sessions() -> None:
+    """
+    Closes every pooled connection. Sessions are transparently re-created on next use
+    """
+    with _ADAPTERS_LOCK:
+        for adapter in _ADAPTERS.values():
+            adapter.close()
+        _ADAPTERS.clear()
+    _THREAD_SESSIONS.sessions = {}
+
 
 class ClientAPIException(requests.HTTPError):
 
@@ -25,10 +138,28 @@ class ClientAPIException(requests.HTTPError):
 
 class BaseAPIClient:
 
-    def __init__(self, base_url: str, api_key: str = None, is_local: bool = False, authenticator: MCSPAuthenticator = None):
+    def __init__(
+            self,
+            base_url: str,
+            api_key: str = None,
+            is_local: bool = False,
+            authenticator: MCSPAuthenticator = None,
+            connect_timeout: float = DEFAULT_CONNECT_TIMEOUT,
+            read_timeout: float = DEFAULT_READ_TIMEOUT,
+            max_retries: int = DEFAULT_MAX_RETRIES,
+            backoff_factor: float = DEFAULT_BACKOFF_FACTOR,
+            use_response_cache: bool = True,
+            compress_requests: bool = None
+    ):
         self.base_url = base_url.rstrip("/")  # remove trailing slash
         self.api_key = api_key
         self.authenticator = authenticator
+        self.timeout = (connect_timeout, read_timeout)
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self.use_response_cache = use_response_cache
+        # Opt-in, defaults to the WXO_CLIENT_COMPRESS_REQUESTS environment variable
+        self.compress_requests = is_compression_enabled() if compress_requests is None else compress_requests
 
         # api path can be re-written by api proxy when deployed
         # TO-DO: re-visit this when shipping to production
@@ -37,6 +168,10 @@ class BaseAPIClient:
         if not self.is_local:
             self.base_url = f"{self.base_url}/v1/orchestrate"
 
+    @property
+    def session(self) -> requests.Session:
+        return get_session(self.base_url, max_retries=self.max_retries, backoff_factor=self.backoff_factor)
+
     def _get_headers(self) -> dict:
         headers = {}
         if self.api_key:
@@ -45,50 +180,218 @@ class BaseAPIClient:
             headers["Authorization"] = f"Bearer {self.authenticator.token_manager.get_token()}"
         return headers
 
-    def _get(self, path: str, params: dict = None, data=None) -> dict:
+    @staticmethod
+    def add_request_hook(hook: metrics.RequestHook) -> None:
+        """
+        Registers hook to be called with the RequestMetrics (method, path template, status, bytes, elapsed time)
+        of every request sent by any client
+        """
+        metrics.add_request_hook(hook)
+
+    @staticmethod
+    def remove_request_hook(hook: metrics.RequestHook) -> None:
+        metrics.remove_request_hook(hook)
+
+    def _emit_metrics(self, method: str, path: str, response: requests.Response | None, elapsed: float, stream: bool = False) -> None:
+        if not metrics.has_request_hooks():
+            return
+        bytes_sent = 0
+        bytes_received = None
+        if response is not None:
+            if response.request is not None:
+                bytes_sent = metrics.get_body_size(response.request.body)
+            content_length = response.headers.get("Content-Length")
+            if content_length and content_length.isdigit():
+                bytes_received = int(content_length)
+            elif not stream:
+                bytes_received = len(response.content or b"")
+        metrics.emit_request_metrics(metrics.RequestMetrics(
+            client=type(self).__name__,
+            method=method,
+            path_template=metrics.get_path_template(path),
+            status=response.status_code if response is not None else None,
+            bytes_sent=bytes_sent,
+            bytes_received=bytes_received,
+            elapsed=elapsed
+        ))
+
+    def _request(self, method: str, path: str, headers: dict = None, **kwargs) -> requests.Response:
+        headers = {**self._get_headers(), **(headers or {})}
+        self._encode_json_body(headers, kwargs)
+        encoding = self._get_request_encoding(method, kwargs)
+        if encoding is None:
+            response = self._send(method, path, headers, **kwargs)
+        else:
+            response = self._send_compressed(method, path, headers, encoding, **kwargs)
 
-        url = f"{self.base_url}{path}"
-        response = requests.get(url, headers=self._get_headers(), params=params, data=data)
         self._check_response(response)
-        return response.json()
 
-    def _post(self, path: str, data: dict = None, files: dict = None) -> dict:
+        cache = get_response_cache()
+        if cache is not None and method not in SAFE_METHODS:
+            cache.invalidate(self.base_url, path)
+        return response
+
+    @staticmethod
+    def _encode_json_body(headers: dict, kwargs: dict) -> None:
+        """
+        Serialises a json body once with the configured codec (orjson when installed) instead of leaving it to requests
+        """
+        if kwargs.get("json") is None or kwargs.get("files") or kwargs.get("data"):
+            return
+        kwargs["data"] = json_codec.dumps(kwargs.pop("json"))
+        headers["Content-Type"] = "application/json"
+
+    @staticmethod
+    def _decode_body(response: requests.Response):
+        return json_codec.loads(response.content) if response.content else {}
+
+    def _get_request_encoding(self, method: str, kwargs: dict) -> str | None:
+        if not self.compress_requests or method not in COMPRESSIBLE_METHODS:
+            return None
+        if kwargs.get("json") is None and not kwargs.get("data") and not kwargs.get("files"):
+            return None
+        return get_encoding_negotiator().get_encoding(self.base_url)
+
+    def _send_compressed(self, method: str, path: str, headers: dict, encoding: str, **kwargs) -> requests.Response:
+        # Encode the json / form / multipart body up front so that it can be compressed, and resent if needed
+        request = requests.Request(
+            method,
+            f"{self.base_url}{path}",
+            json=kwargs.pop("json", None),
+            data=kwargs.pop("data", None),
+            files=kwargs.pop("files", None)
+        ).prepare()
+        body = request.body.encode() if isinstance(request.body, str) else request.body
+        if "Content-Type" in request.headers:
+            headers = {**headers, "Content-Type": request.headers["Content-Type"]}
+        if not isinstance(body, bytes) or len(body) < DEFAULT_MIN_COMPRESS_SIZE:
+            return self._send(method, path, headers, data=body, **kwargs)
+
+        response = self._send(method, path, {**headers, "Content-Encoding": encoding}, data=compress(body, encoding), **kwargs)
+        if not is_encoding_rejected(response.status_code, response.text):
+            return response
+
+        # The server cannot decode the body, drop the encoding for this environment and resend it uncompressed
+        get_encoding_negotiator().reject(self.base_url, encoding, response.headers.get("Accept-Encoding"))
+        return self._send(method, path, headers, data=body, **kwargs)
+
+    def _send(self, method: str, path: str, headers: dict, **kwargs) -> requests.Response:
         url = f"{self.base_url}{path}"
-        response = requests.post(url, headers=self._get_headers(), json=data, files=files)
-        self._check_response(response)
-        return response.json() if response.text else {}
+        limiter = get_rate_limiter(self.base_url)
+        # Only idempotent requests are resent when throttled, running a POST twice could duplicate what it creates
+        retries = self.max_retries if method in IDEMPOTENT_METHODS else 0
+        endpoint = f"{method} {metrics.get_path_template(path)}"
+
+        attempt = 0
+        while True:
+            with limiter.slot():
+                started = time.monotonic()
+                try:
+                    response = self.session.request(method, url, headers=headers, timeout=self.timeout, **kwargs)
+                except requests.RequestException:
+                    self._emit_metrics(method, path, None, time.monotonic() - started)
+                    raise
+            elapsed = time.monotonic() - started
+            limiter.record(response.status_code, elapsed, get_retry_after(response.headers), endpoint=endpoint)
+            self._emit_metrics(method, path, response, elapsed, stream=kwargs.get("stream", False))
+
+            if response.status_code != THROTTLE_STATUS_CODE or attempt >= retries:
+                break
+            # the next slot waits for the Retry-After recorded above
+            response.close()
+            attempt += 1
+
+        return response
+
+    def _get(self, path: str, params: dict = None, data=None) -> dict:
+        cache = get_response_cache()
+        if not self.use_response_cache or cache is None or data is not None:
+            response = self._request("GET", path, params=params, data=data)
+            return json_codec.loads(response.content)
+
+        key = get_cache_key(self.base_url, path, params, self._get_headers().get("Authorization"))
+        content = _REQUEST_COALESCER.run(key, lambda: self._conditional_get(cache, key, path, params))
+        return json_codec.loads(content)
+
+    def _get_stream(self, path: str, params: dict = None, key: str = None) -> Iterator:
+        """
+        GET a list endpoint and yield its elements one at a time while the body is still being received,
+        so that memory stays bounded by the largest element rather than the whole response.
+        key selects the array member of an object response ({"applications": [...]})
+        """
+        response = self._request("GET", path, params=params, stream=True)
+        try:
+            yield from iter_json_array(response.iter_content(chunk_size=DEFAULT_STREAM_CHUNK_SIZE), key=key)
+        finally:
+            response.close()
+
+    def _iter_pages(
+            self,
+            path: str,
+            page_size: int = DEFAULT_PAGE_SIZE,
+            filter: dict = None,
+            sort: str = None,
+            limit: int = None,
+            key: str = None
+    ) -> Iterator:
+        """
+        Iterate a list endpoint page by page (limit/offset query parameters), streaming each page
+        """
+        paginator = Paginator(page_size=page_size, filter=filter, sort=sort, limit=limit)
+        while (params := paginator.next_params()) is not None:
+            yield from paginator.consume(self._get_stream(path, params=params, key=key))
+
+    def _conditional_get(self, cache: ResponseCache, key: tuple, path: str, params: dict = None) -> bytes:
+        entry = cache.get(key)
+        response = self._request("GET", path, params=params, headers=entry.get_validator_headers() if entry else None)
+        if response.status_code == 304 and entry is not None:
+            return entry.content
+
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if etag or last_modified:
+            cache.set(key, CacheEntry(content=response.content, etag=etag, last_modified=last_modified))
+        return response.content
+
+    def _get_chunked(self, path: str, param: str, values: List[str]) -> list:
+        """
+        GET path with a repeated query parameter (?param=a&param=b...) of arbitrary length.
+        The values are split into url length safe chunks that are requested in parallel and the list
+        responses concatenated
+        """
+        separator = "&" if "?" in path else "?"
+        queries = chunk_query_values(f"{self.base_url}{path}", param, values)
+        if len(queries) <= 1:
+            return [] if not queries else self._get(f"{path}{separator}{queries[0]}")
+
+        with ThreadPoolExecutor(max_workers=min(len(queries), DEFAULT_MAX_PARALLEL_CHUNKS)) as executor:
+            responses = executor.map(lambda query: self._get(f"{path}{separator}{query}"), queries)
+            return [item for response in responses for item in response]
+
+    def _post(self, path: str, data: dict = None, files: dict = None) -> dict:
+        response = self._request("POST", path, json=data, files=files)
+        return self._decode_body(response)
     
     def _post_form_data(self, path: str, data: dict = None, files: dict = None) -> dict:
-        url = f"{self.base_url}{path}"
         # Use data argument instead of json so data is encoded as application/x-www-form-urlencoded
-        response = requests.post(url, headers=self._get_headers(), data=data, files=files)
-        self._check_response(response)
-        return response.json() if response.text else {}
+        response = self._request("POST", path, data=data, files=files)
+        return self._decode_body(response)
 
     def _put(self, path: str, data: dict = None) -> dict:
-
-        url = f"{self.base_url}{path}"
-        response = requests.put(url, headers=self._get_headers(), json=data)
-        self._check_response(response)
-        return response.json() if response.text else {}
+        response = self._request("PUT", path, json=data)
+        return self._decode_body(response)
 
     def _patch(self, path: str, data: dict = None) -> dict:
-        url = f"{self.base_url}{path}"
-        response = requests.patch(url, headers=self._get_headers(), json=data)
-        self._check_response(response)
-        return response.json() if response.text else {}
+        response = self._request("PATCH", path, json=data)
+        return self._decode_body(response)
     
     def _patch_form_data(self, path: str, data: dict = None, files = None) -> dict:
-        url = f"{self.base_url}{path}"
-        response = requests.patch(url, headers=self._get_headers(), data=data, files=files)
-        self._check_response(response)
-        return response.json() if response.text else {}
+        response = self._request("PATCH", path, data=data, files=files)
+        return self._decode_body(response)
 
     def _delete(self, path: str, data=None) -> dict:
-        url = f"{self.base_url}{path}"
-        response = requests.delete(url, headers=self._get_headers(), json=data)
-        self._check_response(response)
-        return response.json() if response.text else {}
+        response = self._request("DELETE", path, json=data)
+        return self._decode_body(response)
 
     def _check_response(self, response: requests.Response):
         try:
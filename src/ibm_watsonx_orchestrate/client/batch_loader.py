@@ -0,0 +1,172 @@
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Hashable, Iterable, List
+from urllib.parse import quote
+
+DEFAULT_MAX_URL_LENGTH = 2048
+DEFAULT_MAX_CHUNK_SIZE = 100
+DEFAULT_MAX_PARALLEL_CHUNKS = 8
+DEFAULT_BATCH_WINDOW = 0.002
+DEFAULT_MAX_BATCH_SIZE = 500
+
+
+def chunk_query_values(
+        url: str,
+        param: str,
+        values: Iterable[str],
+        max_url_length: int = DEFAULT_MAX_URL_LENGTH,
+        max_chunk_size: int = DEFAULT_MAX_CHUNK_SIZE
+) -> List[str]:
+    """
+    Splits the values of a repeated query parameter (?names=a&names=b...) into url-encoded query strings
+    so that url plus each query string stays within max_url_length and holds at most max_chunk_size values.
+    A single value that is too long on its own is still sent in a chunk of its own.
+    """
+    # +1 for the '?' or '&' joining the query to the url
+    budget = max_url_length - len(url) - 1
+    chunks = []
+    current = []
+    current_length = 0
+    for value in dict.fromkeys(values):
+        pair = f"{param}={quote(str(value), safe='')}"
+        pair_length = len(pair) + (1 if current else 0)
+        if current and (current_length + pair_length > budget or len(current) >= max_chunk_size):
+            chunks.append("&".join(current))
+            current = []
+            current_length = 0
+            pair_length = len(pair)
+        current.append(pair)
+        current_length += pair_length
+    if current:
+        chunks.append("&".join(current))
+    return chunks
+
+
+def fetch_each(
+        fetch: Callable[[Hashable], Any],
+        keys: Iterable[Hashable],
+        max_workers: int = DEFAULT_MAX_PARALLEL_CHUNKS
+) -> Dict[Hashable, Any]:
+    """
+    Calls fetch once for every distinct key, such as a GET by id, with up to max_workers calls in parallel.
+    A key whose call raised maps to None, one failed lookup does not fail the others
+    """
+    def fetch_or_none(key: Hashable) -> Any:
+        try:
+            return fetch(key)
+        except Exception:
+            return None
+
+    keys = list(dict.fromkeys(keys))
+    if len(keys) <= 1:
+        return {key: fetch_or_none(key) for key in keys}
+    with ThreadPoolExecutor(max_workers=min(len(keys), max_workers)) as executor:
+        return dict(zip(keys, executor.map(fetch_or_none, keys)))
+
+
+class _Batch:
+    def __init__(self):
+        self.opened_at = time.monotonic()
+        self.futures: Dict[Hashable, "_LoaderFuture"] = {}
+        self.loading_threads = set()
+        self.dispatched = False
+
+
+class _LoaderFuture(Future):
+    def __init__(self, loader: "BatchLoader", batch: _Batch):
+        super().__init__()
+        self._loader = loader
+        self._batch = batch
+
+    def result(self, timeout: float | None = None) -> Any:
+        if not self.done():
+            self._loader._dispatch_when_due(self._batch)
+        return super().result(timeout)
+
+
+class BatchLoader:
+    """
+    DataLoader style batching of lookups by key (names, ids...).
+
+    Keys passed to load() are collected into a batch until a caller asks for a result, the batch window
+    has elapsed or max_batch_size keys are pending. The whole batch is then resolved by a single call to
+    batch_fn and every caller receives the items whose key_fn matches its own key.
+
+    The batch window is only waited for when other threads may still add keys. A batch holding a single key,
+    or only keys loaded by the thread asking for a result, is dispatched at once.
+
+    Lookups issued concurrently from several threads, or loaded up front before resolving any of them,
+    therefore share a single round trip.
+    """
+
+    def __init__(
+            self,
+            batch_fn: Callable[[List[Hashable]], List[dict]],
+            key_fn: Callable[[dict], Hashable],
+            batch_window: float = DEFAULT_BATCH_WINDOW,
+            max_batch_size: int = DEFAULT_MAX_BATCH_SIZE
+    ):
+        self.batch_fn = batch_fn
+        self.key_fn = key_fn
+        self.batch_window = batch_window
+        self.max_batch_size = max_batch_size
+        self._lock = threading.Lock()
+        self._batch: _Batch | None = None
+
+    def load(self, key: Hashable) -> Future:
+        with self._lock:
+            if self._batch is None:
+                self._batch = _Batch()
+            batch = self._batch
+            future = batch.futures.get(key)
+            if future is None:
+                future = batch.futures[key] = _LoaderFuture(self, batch)
+            batch.loading_threads.add(threading.get_ident())
+            is_full = len(batch.futures) >= self.max_batch_size
+
+        if is_full:
+            self._dispatch(batch)
+        return future
+
+    def load_many(self, keys: Iterable[Hashable]) -> List[List[dict]]:
+        futures = [self.load(key) for key in keys]
+        return [future.result() for future in futures]
+
+    def _dispatch_when_due(self, batch: _Batch) -> None:
+        with self._lock:
+            # The caller is blocked on this result, so waiting only helps when another thread can still add keys
+            can_grow = len(batch.futures) > 1 and batch.loading_threads != {threading.get_ident()}
+        remaining = batch.opened_at + self.batch_window - time.monotonic()
+        if can_grow and remaining > 0:
+            time.sleep(remaining)
+        self._dispatch(batch)
+
+    def _dispatch(self, batch: _Batch) -> None:
+        with self._lock:
+            if batch.dispatched:
+                return
+            batch.dispatched = True
+            if self._batch is batch:
+                self._batch = None
+
+        keys = list(batch.futures.keys())
+        try:
+            results = self.batch_fn(keys)
+        except BaseException as e:
+            for future in batch.futures.values():
+                future.set_exception(e)
+            return
+
+        if len(keys) == 1:
+            # Nothing to split, hand back the server response untouched
+            grouped = {keys[0]: results}
+        else:
+            grouped = {key: [] for key in keys}
+            for item in results:
+                key = self.key_fn(item)
+                if key in grouped:
+                    grouped[key].append(item)
+
+        for key, future in batch.futures.items():
+            future.set_result(grouped[key])
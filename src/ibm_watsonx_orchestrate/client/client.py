@@ -1,13 +1,22 @@
 import copy
 import logging
-from typing import Any, cast
+import threading
+import weakref
+from typing import TYPE_CHECKING, Any, Callable, TypeVar, cast
 
 from ibm_watsonx_orchestrate.client.client_errors import NoCredentialsProvided, ClientError
 from ibm_watsonx_orchestrate.client.credentials import Credentials
 from ibm_watsonx_orchestrate.client.service_instance import ServiceInstance
-from ibm_watsonx_orchestrate.client.local_service_instance import LocalServiceInstance
 from ibm_watsonx_orchestrate.client.utils import is_local_dev
 
+if TYPE_CHECKING:
+    from ibm_watsonx_orchestrate.client.local_service_instance import LocalServiceInstance
+    from ibm_watsonx_orchestrate.client.base_api_client import BaseAPIClient
+    from ibm_watsonx_orchestrate.client.async_base_api_client import AsyncBaseAPIClient
+
+logger = logging.getLogger(__name__)
+T = TypeVar("T", bound="BaseAPIClient | AsyncBaseAPIClient")
+
 
 class Client:
     """The main class of ibm_watsonx_orchestrate. The very heart of the module. Client contains objects that manage the service reasources.
@@ -22,6 +31,13 @@ class Client:
     :param credentials: credentials used to connect with the service
     :type credentials: Credentials
 
+    :param refresh_token_in_background: renew the token ahead of its expiry from a background thread, defaults to False
+    :type refresh_token_in_background: bool, optional
+
+    :param shared_token_cache: reuse tokens fetched by other processes with the same credentials, defaults to the
+        WXO_CLIENT_SHARED_TOKEN_CACHE environment variable
+    :type shared_token_cache: bool, optional
+
     **Example**
 
     .. code-block:: python
@@ -33,7 +49,9 @@ class Client:
             api_key = "<api_key>"
         )
 
-        client = Client(credentials, space_id="<space_id>")
+        client = Client(credentials, space_id="<space_id>", refresh_token_in_background=True)
+
+        agent_client = client.get_client(AgentClient)
 
         client.models.list()
         client.deployments.get_details()
@@ -55,6 +73,9 @@ class Client:
         self.credentials = copy.deepcopy(credentials)
 
         self.token: str | None = None
+        self._token_listeners: list[Callable[[str], None]] = []
+        self._api_clients = weakref.WeakSet()
+        self._token_lock = threading.Lock()
         if credentials is None:
             raise NoCredentialsProvided()
         if self.credentials.url is None:
@@ -66,6 +87,63 @@ class Client:
             self.credentials.url = self.credentials.url.rstrip("/")
 
         if not is_local_dev(self.credentials.url):
-            self.service_instance: ServiceInstance = ServiceInstance(self)
+            self.service_instance: ServiceInstance = ServiceInstance(
+                self,
+                refresh_in_background=kwargs.get("refresh_token_in_background", False),
+                shared_token_cache=kwargs.get("shared_token_cache")
+            )
         else:
-            self.service_instance: LocalServiceInstance = LocalServiceInstance(self)
+            # Talks to the developer edition through requests, only imported when a local environment is used
+            from ibm_watsonx_orchestrate.client.local_service_instance import LocalServiceInstance
+
+            self.service_instance: "LocalServiceInstance" = LocalServiceInstance(self)
+
+    def get_client(self, client_class: type[T], **kwargs: Any) -> T:
+        """Creates an API client (AgentClient, ToolClient, ...) authenticated with the token of this Client.
+        The client is kept up to date when the token is refreshed.
+
+        :param client_class: class of the API client to create
+        :type client_class: type[BaseAPIClient | AsyncBaseAPIClient]
+
+        :return: the API client
+        """
+        kwargs.setdefault("is_local", is_local_dev(self.credentials.url))
+        with self._token_lock:
+            api_client = client_class(base_url=self.credentials.url, api_key=self.token, **kwargs)
+            self._api_clients.add(api_client)
+        return api_client
+
+    def add_token_listener(self, listener: Callable[[str], None]) -> None:
+        """Registers a callback called with the new token every time it is refreshed.
+
+        :param listener: callback taking the new token
+        :type listener: Callable[[str], None]
+        """
+        self._token_listeners.append(listener)
+
+    def remove_token_listener(self, listener: Callable[[str], None]) -> None:
+        if listener in self._token_listeners:
+            self._token_listeners.remove(listener)
+
+    def set_token(self, token: str) -> None:
+        """Replaces the bearer token used by this Client and every API client created through get_client.
+        Requests already sent keep the token they were sent with.
+
+        :param token: new bearer token
+        :type token: str
+        """
+        with self._token_lock:
+            self.token = token
+            api_clients = list(self._api_clients)
+        for api_client in api_clients:
+            api_client.api_key = token
+        for listener in list(self._token_listeners):
+            try:
+                listener(token)
+            except Exception as e:
+                logger.warning(f"Token listener failed: {e}")
+
+    def close(self) -> None:
+        """Stops the background token refresh, if any."""
+        if isinstance(self.service_instance, ServiceInstance):
+            self.service_instance.stop_token_refresh()
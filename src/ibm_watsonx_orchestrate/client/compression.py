@@ -0,0 +1,91 @@
+import gzip
+import importlib.util
+import os
+import re
+import threading
+from typing import Dict, List
+
+# zstd needs the optional `zstandard` package, gzip is always available
+ZSTD_AVAILABLE = importlib.util.find_spec("zstandard") is not None
+
+COMPRESS_REQUESTS_ENV_VAR = "WXO_CLIENT_COMPRESS_REQUESTS"
+# Bodies smaller than this are sent as is, compressing them costs more than it saves
+DEFAULT_MIN_COMPRESS_SIZE = 1024
+DEFAULT_GZIP_LEVEL = 6
+DEFAULT_ZSTD_LEVEL = 3
+UNSUPPORTED_MEDIA_TYPE_STATUS_CODE = 415
+BAD_REQUEST_STATUS_CODE = 400
+COMPRESSIBLE_METHODS = frozenset(["POST", "PUT", "PATCH"])
+
+# What a 400 answer has to mention to be blamed on the Content-Encoding rather than on the body itself
+_ENCODING_ERROR_PATTERN = re.compile(r"encoding|compress|gzip|zstd", re.IGNORECASE)
+
+
+def is_compression_enabled() -> bool:
+    return os.environ.get(COMPRESS_REQUESTS_ENV_VAR, "").lower() in ("1", "true", "yes")
+
+
+def get_supported_encodings() -> List[str]:
+    """
+    Request encodings in order of preference
+    """
+    return ["zstd", "gzip"] if ZSTD_AVAILABLE else ["gzip"]
+
+
+def is_encoding_rejected(status_code: int, body: str) -> bool:
+    """
+    Whether the server answered a compressed request because it could not decode the body, in which case the
+    request is resent uncompressed. Any other error is the request's own and resending it would only repeat it
+    """
+    if status_code == UNSUPPORTED_MEDIA_TYPE_STATUS_CODE:
+        return True
+    return status_code == BAD_REQUEST_STATUS_CODE and bool(_ENCODING_ERROR_PATTERN.search(body or ""))
+
+
+def compress(body: bytes, encoding: str) -> bytes:
+    if encoding == "gzip":
+        return gzip.compress(body, compresslevel=DEFAULT_GZIP_LEVEL)
+    if encoding == "zstd":
+        import zstandard
+        return zstandard.ZstdCompressor(level=DEFAULT_ZSTD_LEVEL).compress(body)
+    raise ValueError(f"Unsupported content encoding '{encoding}'")
+
+
+class EncodingNegotiator:
+    """
+    Tracks which request Content-Encoding each environment accepts.
+
+    The first compressed request to an environment acts as the capability probe: it is sent with the
+    preferred encoding and, when the server rejects it, the encoding is dropped for that environment and
+    the request resent uncompressed. A server listing the encodings it accepts in an Accept-Encoding response
+    header (RFC 7694) narrows the candidates directly.
+    """
+
+    def __init__(self):
+        self._candidates: Dict[str, List[str]] = {}
+        self._lock = threading.Lock()
+
+    def get_encoding(self, base_url: str) -> str | None:
+        with self._lock:
+            candidates = self._candidates.setdefault(base_url, get_supported_encodings())
+            return candidates[0] if candidates else None
+
+    def reject(self, base_url: str, encoding: str, accepted: str | None = None) -> None:
+        with self._lock:
+            candidates = self._candidates.setdefault(base_url, get_supported_encodings())
+            if accepted is not None:
+                accepted_encodings = {value.split(";", 1)[0].strip().lower() for value in accepted.split(",")}
+                candidates[:] = [candidate for candidate in candidates if candidate in accepted_encodings]
+            if encoding in candidates:
+                candidates.remove(encoding)
+
+    def reset(self) -> None:
+        with self._lock:
+            self._candidates.clear()
+
+
+_NEGOTIATOR = EncodingNegotiator()
+
+
+def get_encoding_negotiator() -> EncodingNegotiator:
+    return _NEGOTIATOR
@@ -6,5 +6,6 @@ from .connections_client import (
 
 from .utils import (
     get_connections_client,
+    get_async_connections_client,
     get_connection_type
 )
\ No newline at end of file
@@ -1,9 +1,12 @@
-from typing import List
+import asyncio
+from typing import AsyncIterator, Iterator, List
 
 from pydantic import BaseModel, ValidationError
 from typing import Optional
 
 from ibm_watsonx_orchestrate.client.base_api_client import BaseAPIClient, ClientAPIException
+from ibm_watsonx_orchestrate.client.async_base_api_client import AsyncBaseAPIClient
+from ibm_watsonx_orchestrate.client.pagination import DEFAULT_PAGE_SIZE
 from ibm_watsonx_orchestrate.agent_builder.connections.types import ConnectionEnvironment, ConnectionPreference, ConnectionAuthType, ConnectionSecurityScheme, IdpConfigData, AppConfigData, ConnectionType
 
 import logging
@@ -75,6 +78,19 @@ class ConnectionsClient(BaseAPIClient):
                 return []
             raise e
 
+    # GET api/v1/connections/applications
+    def iter_connections(self, page_size: int = DEFAULT_PAGE_SIZE, filter: dict = None, sort: str = None, limit: int = None) -> Iterator[ListConfigsResponse]:
+        try:
+            for conn in self._iter_pages(f"/connections/applications", key="applications", page_size=page_size, filter=filter, sort=sort, limit=limit):
+                yield ListConfigsResponse.model_validate(conn)
+        except ValidationError as e:
+            logger.error("Recieved unexpected response from server")
+            raise e
+        except ClientAPIException as e:
+            if e.response.status_code == 404:
+                return
+            raise e
+
 
     # POST /api/v1/connections/applications/{app_id}/configurations
     def create_config(self, app_id: str, payload: dict) -> None:
@@ -160,3 +176,132 @@ class ConnectionsClient(BaseAPIClient):
             logger.warning(f"Connection with ID {conn_id} not found. Returning connection ID.")
             return conn_id
         return app_id
+
+
+class AsyncConnectionsClient(AsyncBaseAPIClient):
+    """
+    Async client to handle CRUD operations for Connections endpoint
+    """
+    # POST api/v1/connections/applications
+    async def create(self, payload: dict) -> None:
+        await self._post("/connections/applications", data=payload)
+
+    # DELETE api/v1/connections/applications/{app_id}
+    async def delete(self, app_id: str) -> dict:
+        return await self._delete(f"/connections/applications/{app_id}")
+
+    # GET /api/v1/connections/applications/{app_id}
+    async def get(self, app_id: str) -> GetConnectionResponse:
+        try:
+            return GetConnectionResponse.model_validate(await self._get(f"/connections/applications/{app_id}"))
+        except ClientAPIException as e:
+            if e.response.status_code == 404:
+                return None
+            raise e
+
+    # GET api/v1/connections/applications
+    async def list(self) -> List[ListConfigsResponse]:
+        try:
+            res = await self._get(f"/connections/applications")
+            return [ListConfigsResponse.model_validate(conn) for conn in res.get("applications", [])]
+        except ValidationError as e:
+            logger.error("Recieved unexpected response from server")
+            raise e
+        except ClientAPIException as e:
+            if e.response.status_code == 404:
+                return []
+            raise e
+
+    # GET api/v1/connections/applications
+    async def iter_connections(self, page_size: int = DEFAULT_PAGE_SIZE, filter: dict = None, sort: str = None, limit: int = None) -> AsyncIterator[ListConfigsResponse]:
+        try:
+            async for conn in self._iter_pages(f"/connections/applications", key="applications", page_size=page_size, filter=filter, sort=sort, limit=limit):
+                yield ListConfigsResponse.model_validate(conn)
+        except ValidationError as e:
+            logger.error("Recieved unexpected response from server")
+            raise e
+        except ClientAPIException as e:
+            if e.response.status_code == 404:
+                return
+            raise e
+
+    # POST /api/v1/connections/applications/{app_id}/configurations
+    async def create_config(self, app_id: str, payload: dict) -> None:
+        await self._post(f"/connections/applications/{app_id}/configurations", data=payload)
+
+    # PATCH /api/v1/connections/applications/{app_id}/configurations/{env}
+    async def update_config(self, app_id: str, env: ConnectionEnvironment, payload: dict) -> None:
+        await self._patch(f"/connections/applications/{app_id}/configurations/{env}", data=payload)
+
+    # `GET /api/v1/connections/applications/{app_id}/configurations/{env}'
+    async def get_config(self, app_id: str, env: ConnectionEnvironment) -> GetConfigResponse:
+        try:
+            res = await self._get(f"/connections/applications/{app_id}/configurations/{env}")
+            return GetConfigResponse.model_validate(res)
+        except ClientAPIException as e:
+            if e.response.status_code == 404:
+                return None
+            raise e
+
+    # POST /api/v1/connections/applications/{app_id}/configs/{env}/credentials
+    # POST /api/v1/connections/applications/{app_id}/configs/{env}/runtime_credentials
+    async def create_credentials(self, app_id: str, env: ConnectionEnvironment, payload: dict, use_sso: bool) -> None:
+        if use_sso:
+            await self._post(f"/connections/applications/{app_id}/configs/{env}/credentials", data=payload)
+        else:
+            await self._post(f"/connections/applications/{app_id}/configs/{env}/runtime_credentials", data=payload)
+
+    # PATCH /api/v1/connections/applications/{app_id}/configs/{env}/credentials
+    # PATCH /api/v1/connections/applications/{app_id}/configs/{env}/runtime_credentials
+    async def update_credentials(self, app_id: str, env: ConnectionEnvironment, payload: dict, use_sso: bool) -> None:
+        if use_sso:
+            await self._patch(f"/connections/applications/{app_id}/configs/{env}/credentials", data=payload)
+        else:
+            await self._patch(f"/connections/applications/{app_id}/configs/{env}/runtime_credentials", data=payload)
+
+    # GET /api/v1/connections/applications/{app_id}/configs/credentials?env={env}
+    # GET /api/v1/connections/applications/{app_id}/configs/runtime_credentials?env={env}
+    async def get_credentials(self, app_id: str, env: ConnectionEnvironment, use_sso: bool) -> dict:
+        try:
+            if use_sso:
+                return await self._get(f"/connections/applications/{app_id}/credentials?env={env}")
+            else:
+                return await self._get(f"/connections/applications/{app_id}/configs/runtime_credentials?env={env}")
+        except ClientAPIException as e:
+            if e.response.status_code == 404:
+                return None
+            raise e
+
+    # DELETE /api/v1/connections/applications/{app_id}/configs/{env}/credentials
+    # DELETE /api/v1/connections/applications/{app_id}/configs/{env}/runtime_credentials
+    async def delete_credentials(self, app_id: str, env: ConnectionEnvironment, use_sso: bool) -> None:
+        if use_sso:
+            await self._delete(f"/connections/applications/{app_id}/configs/{env}/credentials")
+        else:
+            await self._delete(f"/connections/applications/{app_id}/configs/{env}/runtime_credentials")
+
+    async def get_draft_by_app_id(self, app_id: str) -> GetConnectionResponse:
+        return await self.get(app_id=app_id)
+
+    async def get_draft_by_app_ids(self, app_ids: List[str]) -> List[GetConnectionResponse]:
+        connections = await asyncio.gather(*[self.get_draft_by_app_id(app_id) for app_id in app_ids])
+        return [connection for connection in connections if connection]
+
+    async def get_draft_by_id(self, conn_id) -> str:
+        """Retrieve the app ID for a given connection ID."""
+        if conn_id is None:
+            return ""
+        try:
+            connections = await self.list()
+        except ClientAPIException as e:
+            if e.response.status_code == 404:
+                logger.warning(f"Connections not found. Returning connection ID: {conn_id}")
+                return conn_id
+            raise
+
+        app_id = next((conn.app_id for conn in connections if conn.connection_id == conn_id), None)
+
+        if app_id is None:
+            logger.warning(f"Connection with ID {conn_id} not found. Returning connection ID.")
+            return conn_id
+        return app_id
@@ -0,0 +1,167 @@
+import codecs
+import json
+import re
+from typing import Any, Iterable, Iterator
+
+DEFAULT_STREAM_CHUNK_SIZE = 64 * 1024
+
+_WHITESPACE = " \t\n\r"
+# Characters ending a number, true, false or null
+_SCALAR_END = frozenset(_WHITESPACE + ",:]}")
+_STRUCTURAL_PATTERN = re.compile(r'["\[\]{}]')
+_STRING_SPECIAL_PATTERN = re.compile(r'["\\]')
+# Drop consumed text once this much of the buffer has been decoded
+_COMPACT_THRESHOLD = 1024 * 1024
+
+
+class _Reader:
+    """
+    Text buffer over a byte stream that hands out complete JSON values as soon as they have been received.
+
+    The value being received is scanned once, resuming where the previous chunk ended, to find where it ends, and
+    only decoded then, so a value spread over many chunks still decodes in linear time.
+    """
+
+    def __init__(self, chunks: Iterable[bytes]):
+        self._chunks = iter(chunks)
+        self._utf8 = codecs.getincrementaldecoder("utf-8")()
+        self._decoder = json.JSONDecoder()
+        self._buffer = ""
+        self._pos = 0
+        self._eof = False
+        # Scan state of the value starting at _pos: chars scanned so far, nesting depth and whether inside a string
+        self._scanned = 0
+        self._depth = 0
+        self._in_string = False
+
+    def _fill(self) -> bool:
+        if self._eof:
+            return False
+        if self._pos >= _COMPACT_THRESHOLD:
+            self._buffer = self._buffer[self._pos:]
+            self._pos = 0
+        for chunk in self._chunks:
+            text = self._utf8.decode(chunk)
+            if text:
+                self._buffer += text
+                return True
+        self._buffer += self._utf8.decode(b"", final=True)
+        self._eof = True
+        return False
+
+    def peek(self) -> str:
+        """
+        Returns the next non whitespace character without consuming it, "" at the end of the stream
+        """
+        while True:
+            while self._pos < len(self._buffer) and self._buffer[self._pos] in _WHITESPACE:
+                self._pos += 1
+            if self._pos < len(self._buffer):
+                return self._buffer[self._pos]
+            if not self._fill():
+                return ""
+
+    def expect(self, char: str) -> None:
+        found = self.peek()
+        if found != char:
+            raise json.JSONDecodeError(f"Expecting '{char}'", self._buffer, self._pos)
+        self._pos += 1
+
+    def _scan(self) -> bool:
+        """
+        Scans the newly received text of the value at _pos, returns whether the whole value has been received
+        """
+        buffer, start = self._buffer, self._pos
+        if start >= len(buffer):
+            return self._eof
+        i = start + self._scanned
+        if buffer[start] not in '"[{':
+            # A number running into the end of the buffer may still continue in the next chunk
+            while i < len(buffer) and buffer[i] not in _SCALAR_END:
+                i += 1
+            self._scanned = i - start
+            return i < len(buffer) or self._eof
+
+        complete = False
+        while not complete:
+            match = (_STRING_SPECIAL_PATTERN if self._in_string else _STRUCTURAL_PATTERN).search(buffer, i)
+            if match is None:
+                i = len(buffer)
+                break
+            char, i = match.group(), match.end()
+            if char == "\\":
+                if i >= len(buffer):
+                    # The escaped character is still to come, scan the backslash again with it
+                    i -= 1
+                    break
+                i += 1
+            elif char == '"':
+                self._in_string = not self._in_string
+                complete = not self._in_string and self._depth == 0
+            elif char in "[{":
+                self._depth += 1
+            else:
+                self._depth -= 1
+                complete = self._depth == 0
+        self._scanned = i - start
+        return complete or self._eof
+
+    def value(self) -> Any:
+        self.peek()
+        while not self._scan():
+            self._fill()
+        value, self._pos = self._decoder.raw_decode(self._buffer, self._pos)
+        self._scanned, self._depth, self._in_string = 0, 0, False
+        return value
+
+
+def _iter_array(reader: _Reader) -> Iterator[Any]:
+    reader.expect("[")
+    if reader.peek() == "]":
+        reader.expect("]")
+        return
+    while True:
+        yield reader.value()
+        if reader.peek() == ",":
+            reader.expect(",")
+            continue
+        reader.expect("]")
+        return
+
+
+def iter_json_array(chunks: Iterable[bytes], key: str | None = None) -> Iterator[Any]:
+    """
+    Incrementally decodes a JSON array from an iterable of UTF-8 byte chunks (e.g. response.iter_content()),
+    yielding each element as soon as it has been fully received. Only the element being decoded is held in memory.
+
+    When key is given the document is expected to be an object and the elements of its key member are yielded,
+    a missing key yields nothing. A document that is not an array is decoded whole, a list is then yielded
+    element by element and any other value is yielded as is.
+    """
+    reader = _Reader(chunks)
+
+    if key is None:
+        if reader.peek() == "[":
+            yield from _iter_array(reader)
+        else:
+            document = reader.value()
+            yield from document if isinstance(document, list) else [document]
+        return
+
+    reader.expect("{")
+    if reader.peek() == "}":
+        return
+    while True:
+        member = reader.value()
+        reader.expect(":")
+        if member == key and reader.peek() == "[":
+            yield from _iter_array(reader)
+            return
+        value = reader.value()
+        if member == key:
+            yield from value if isinstance(value, list) else [value]
+            return
+        if reader.peek() != ",":
+            reader.expect("}")
+            return
+        reader.expect(",")
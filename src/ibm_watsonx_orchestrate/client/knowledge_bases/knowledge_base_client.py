@@ -1,6 +1,10 @@
 from ibm_watsonx_orchestrate.client.base_api_client import BaseAPIClient
-import json
-from typing_extensions import List
+from ibm_watsonx_orchestrate.client.async_base_api_client import AsyncBaseAPIClient
+from ibm_watsonx_orchestrate.utils import json_codec
+from typing_extensions import AsyncIterator, Iterator, List
+from functools import cached_property
+from ibm_watsonx_orchestrate.client.batch_loader import BatchLoader
+from ibm_watsonx_orchestrate.client.pagination import DEFAULT_PAGE_SIZE
 from ibm_watsonx_orchestrate.client.utils import is_local_dev
 
 
@@ -14,38 +18,84 @@ class KnowledgeBaseClient(BaseAPIClient):
         super().__init__(*args, **kwargs)
         self.base_endpoint = "/orchestrate/knowledge-bases" if is_local_dev(self.base_url) else "/knowledge-bases"
 
+    @cached_property
+    def name_loader(self) -> BatchLoader:
+        return BatchLoader(self.get_by_names, key_fn=lambda kb: kb.get("name"))
+
     def create(self, payload: dict) -> dict:
-        return self._post_form_data(f"{self.base_endpoint}/documents", data={ "knowledge_base" : json.dumps(payload) })
+        return self._post_form_data(f"{self.base_endpoint}/documents", data={ "knowledge_base" : json_codec.dumps(payload).decode() })
     
     def create_built_in(self, payload: dict, files: list) -> dict:
-        return self._post_form_data(f"{self.base_endpoint}/documents", data={ "knowledge_base" : json.dumps(payload) }, files=files)
+        return self._post_form_data(f"{self.base_endpoint}/documents", data={ "knowledge_base" : json_codec.dumps(payload).decode() }, files=files)
 
     def get(self) -> dict:
         return self._get(self.base_endpoint)
+
+    def iter_knowledge_bases(self, page_size: int = DEFAULT_PAGE_SIZE, filter: dict = None, sort: str = None, limit: int = None) -> Iterator[dict]:
+        return self._iter_pages(self.base_endpoint, page_size=page_size, filter=filter, sort=sort, limit=limit)
     
     def get_by_name(self, name: str) -> List[dict]:
-        kbs = self.get_by_names([name])
+        kbs = self.name_loader.load(name).result()
         return None if len(kbs) == 0 else kbs[0]
     
     def get_by_id(self, knowledge_base_id: str) -> dict:
         return self._get(f"{self.base_endpoint}/{knowledge_base_id}")
 
     def get_by_names(self, name: List[str]) -> List[dict]:
-        formatted_names = [f"names={x}" for x in name]
-        return self._get(f"{self.base_endpoint}?{'&'.join(formatted_names)}")
+        return self._get_chunked(self.base_endpoint, "names", name)
     
     def status(self, knowledge_base_id: str) -> dict:
         return self._get(f"{self.base_endpoint}/{knowledge_base_id}/status")
 
     def update(self, knowledge_base_id: str, payload: dict) -> dict:
-        return self._patch_form_data(f"{self.base_endpoint}/{knowledge_base_id}/documents", data={ "knowledge_base" : json.dumps(payload) })
+        return self._patch_form_data(f"{self.base_endpoint}/{knowledge_base_id}/documents", data={ "knowledge_base" : json_codec.dumps(payload).decode() })
     
     def update_with_documents(self, knowledge_base_id: str, payload: dict, files: list) -> dict:
-        return self._patch_form_data(f"{self.base_endpoint}/{knowledge_base_id}/documents", data={ "knowledge_base" : json.dumps(payload) }, files=files)
+        return self._patch_form_data(f"{self.base_endpoint}/{knowledge_base_id}/documents", data={ "knowledge_base" : json_codec.dumps(payload).decode() }, files=files)
 
     def delete(self, knowledge_base_id: str,) -> dict:
         return self._delete(f"{self.base_endpoint}/{knowledge_base_id}")
-        
-    
 
-    
+
+class AsyncKnowledgeBaseClient(AsyncBaseAPIClient):
+    """
+    Async client to handle CRUD operations for Native Knowledge Base endpoint
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.base_endpoint = "/orchestrate/knowledge-bases" if is_local_dev(self.base_url) else "/knowledge-bases"
+
+    async def create(self, payload: dict) -> dict:
+        return await self._post_form_data(f"{self.base_endpoint}/documents", data={ "knowledge_base" : json_codec.dumps(payload).decode() })
+
+    async def create_built_in(self, payload: dict, files: list) -> dict:
+        return await self._post_form_data(f"{self.base_endpoint}/documents", data={ "knowledge_base" : json_codec.dumps(payload).decode() }, files=files)
+
+    async def get(self) -> dict:
+        return await self._get(self.base_endpoint)
+
+    def iter_knowledge_bases(self, page_size: int = DEFAULT_PAGE_SIZE, filter: dict = None, sort: str = None, limit: int = None) -> AsyncIterator[dict]:
+        return self._iter_pages(self.base_endpoint, page_size=page_size, filter=filter, sort=sort, limit=limit)
+
+    async def get_by_name(self, name: str) -> List[dict]:
+        kbs = await self.get_by_names([name])
+        return None if len(kbs) == 0 else kbs[0]
+
+    async def get_by_id(self, knowledge_base_id: str) -> dict:
+        return await self._get(f"{self.base_endpoint}/{knowledge_base_id}")
+
+    async def get_by_names(self, name: List[str]) -> List[dict]:
+        return await self._get_chunked(self.base_endpoint, "names", name)
+
+    async def status(self, knowledge_base_id: str) -> dict:
+        return await self._get(f"{self.base_endpoint}/{knowledge_base_id}/status")
+
+    async def update(self, knowledge_base_id: str, payload: dict) -> dict:
+        return await self._patch_form_data(f"{self.base_endpoint}/{knowledge_base_id}/documents", data={ "knowledge_base" : json_codec.dumps(payload).decode() })
+
+    async def update_with_documents(self, knowledge_base_id: str, payload: dict, files: list) -> dict:
+        return await self._patch_form_data(f"{self.base_endpoint}/{knowledge_base_id}/documents", data={ "knowledge_base" : json_codec.dumps(payload).decode() }, files=files)
+
+    async def delete(self, knowledge_base_id: str,) -> dict:
+        return await self._delete(f"{self.base_endpoint}/{knowledge_base_id}")
@@ -1,7 +1,13 @@
 from ibm_watsonx_orchestrate.client.base_service_instance import BaseServiceInstance
+import json
 import logging
+import os
+import subprocess
 import requests
+from ibm_watsonx_orchestrate.cli.config import AUTH_CONFIG_FILE_FOLDER
 from ibm_watsonx_orchestrate.client.credentials import Credentials
+from ibm_watsonx_orchestrate.client.utils import check_token_validity
+from ibm_watsonx_orchestrate.utils.file_lock import atomic_write, file_lock
 
 logger = logging.getLogger(__name__)
 
@@ -17,6 +23,107 @@ DEFAULT_LOCAL_AUTH_ENDPOINT = f"{DEFAULT_LOCAL_SERVICE_URL}/api/v1/auth/token"
 DEFAULT_LOCAL_TENANT_URL = f"{DEFAULT_LOCAL_SERVICE_URL}/tenants"
 DEFAULT_LOCAL_TENANT_AUTH_ENDPOINT = "{}/api/v1/auth/token?tenant_id={}"
 
+# The tenant lives in the database volume of the developer edition, cached tenants are only reused while
+# that volume is the one they were created in
+LOCAL_DB_VOLUME = "wxo-server-db"
+LOCAL_TENANT_CACHE_FILE = "local_tenant_cache.json"
+DOCKER_COMMAND_TIMEOUT = 10
+
+# The volume only changes on `orchestrate server reset`, which clears this, so once found docker is not asked again
+# for the life of the process
+_local_db_volume_id: str | None = None
+
+
+def get_local_db_volume_id() -> str | None:
+    """
+    Identifies the database volume of the developer edition by name and creation time, so that a volume
+    recreated by `orchestrate server reset` gets a new identity. None when docker is not available
+    """
+    global _local_db_volume_id
+    if _local_db_volume_id is None:
+        _local_db_volume_id = _inspect_local_db_volume()
+    return _local_db_volume_id
+
+
+def _inspect_local_db_volume() -> str | None:
+    try:
+        names = subprocess.run(
+            ["docker", "volume", "ls", "-q", "--filter", f"label=com.docker.compose.volume={LOCAL_DB_VOLUME}"],
+            capture_output=True, text=True, timeout=DOCKER_COMMAND_TIMEOUT, check=True
+        ).stdout.split()
+        if not names:
+            return None
+        volumes = subprocess.run(
+            ["docker", "volume", "inspect", "--format", "{{.Name}}@{{.CreatedAt}}", *names],
+            capture_output=True, text=True, timeout=DOCKER_COMMAND_TIMEOUT, check=True
+        ).stdout.split("\n")
+    except (OSError, subprocess.SubprocessError):
+        return None
+    return ",".join(sorted(volume.strip() for volume in volumes if volume.strip())) or None
+
+
+def _get_local_tenant_cache_path() -> str:
+    return os.path.join(AUTH_CONFIG_FILE_FOLDER, LOCAL_TENANT_CACHE_FILE)
+
+
+def _read_local_tenant_cache() -> dict:
+    try:
+        with open(_get_local_tenant_cache_path(), "r") as f:
+            cache = json.load(f)
+        return cache if isinstance(cache, dict) else {}
+    except (FileNotFoundError, ValueError):
+        return {}
+
+
+def get_cached_local_tenant(url: str, volume_id: str | None) -> dict | None:
+    if volume_id is None:
+        return None
+    entry = _read_local_tenant_cache().get(url)
+    if not isinstance(entry, dict) or entry.get("volume_id") != volume_id:
+        return None
+    if not entry.get("tenant_id") or not check_token_validity(entry.get("tenant_token")) \
+            or not check_token_validity(entry.get("global_token")):
+        return None
+    return entry
+
+
+def save_local_tenant(url: str, volume_id: str, tenant_id: str, global_token: str, tenant_token: str) -> None:
+    path = _get_local_tenant_cache_path()
+    try:
+        with file_lock(f"{path}.lock"):
+            cache = _read_local_tenant_cache()
+            cache[url] = {
+                "volume_id": volume_id,
+                "tenant_id": tenant_id,
+                "global_token": global_token,
+                "tenant_token": tenant_token
+            }
+            atomic_write(path, json.dumps(cache), mode=0o600)
+    except OSError as e:
+        logger.debug(f"Failed to write local tenant cache '{path}': {e}")
+
+
+def drop_cached_local_tenant(url: str) -> None:
+    path = _get_local_tenant_cache_path()
+    try:
+        with file_lock(f"{path}.lock"):
+            cache = _read_local_tenant_cache()
+            if cache.pop(url, None) is not None:
+                atomic_write(path, json.dumps(cache), mode=0o600)
+    except OSError as e:
+        logger.debug(f"Failed to write local tenant cache '{path}': {e}")
+
+
+def clear_local_tenant_cache() -> None:
+    global _local_db_volume_id
+    _local_db_volume_id = None
+    path = _get_local_tenant_cache_path()
+    with file_lock(f"{path}.lock"):
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+
 
 class LocalServiceInstance(BaseServiceInstance):
     """lite service instance for local development"""
@@ -26,14 +133,42 @@ class LocalServiceInstance(BaseServiceInstance):
         self._logger = logging.getLogger(__name__)
         self._client = client
         self._credentials: Credentials = client.credentials
-        self._credentials.local_global_token = self._get_user_auth_token()
 
-        self.tenant_id = self._create_default_tenant_if_not_exist()
-        self.tenant_access_token = self._get_tenant_token(self.tenant_id)
+        volume_id = get_local_db_volume_id()
+        cached_tenant = get_cached_local_tenant(self._credentials.url, volume_id)
+        if cached_tenant and not self._is_cached_tenant_accepted(cached_tenant):
+            # Local tokens never expire, the server rejecting them is the only sign they are stale
+            drop_cached_local_tenant(self._credentials.url)
+            cached_tenant = None
+        if cached_tenant:
+            self._credentials.local_global_token = cached_tenant["global_token"]
+            self.tenant_id = cached_tenant["tenant_id"]
+            self.tenant_access_token = cached_tenant["tenant_token"]
+        else:
+            self._credentials.local_global_token = self._get_user_auth_token()
+            self.tenant_id = self._create_default_tenant_if_not_exist()
+            self.tenant_access_token = self._get_tenant_token(self.tenant_id)
+            if volume_id is not None:
+                save_local_tenant(
+                    self._credentials.url,
+                    volume_id,
+                    self.tenant_id,
+                    self._credentials.local_global_token,
+                    self.tenant_access_token
+                )
         # the local token does not have exp claim.
         self._client.token = self.tenant_access_token
         super().__init__()
 
+    def _is_cached_tenant_accepted(self, cached_tenant: dict) -> bool:
+        try:
+            tenant = self.get_default_tenant(cached_tenant["global_token"])
+        except requests.HTTPError as e:
+            if e.response is not None and e.response.status_code == 401:
+                return False
+            raise
+        return bool(tenant) and tenant.get("id") == cached_tenant["tenant_id"]
+
     @staticmethod
     def get_default_tenant(apikey):
         headers = {"Authorization": f"Bearer {apikey}",
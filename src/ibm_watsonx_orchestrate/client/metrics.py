@@ -0,0 +1,193 @@
+import math
+import re
+import threading
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Tuple
+
+# Latencies are recorded in microseconds with 2**7 sub-buckets per power of two, i.e. within ~0.8%
+DEFAULT_SUB_BUCKET_BITS = 7
+DEFAULT_PERCENTILES = (50, 95, 99)
+
+_ID_SEGMENT_PATTERN = re.compile(
+    r"^("
+    r"[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}"  # uuid
+    r"|[0-9a-fA-F]{16,}"  # hex ids / hashes
+    r"|\d+"
+    r")$"
+)
+
+
+@dataclass
+class RequestMetrics:
+    client: str
+    method: str
+    path_template: str
+    status: int | None
+    bytes_sent: int
+    bytes_received: int | None
+    elapsed: float
+
+
+RequestHook = Callable[[RequestMetrics], None]
+
+
+def get_path_template(path: str) -> str:
+    """
+    Drops the query string and replaces id-like path segments with {id} so that requests to different
+    resources of the same endpoint are grouped together
+    """
+    path = path.split("?", 1)[0]
+    return "/".join("{id}" if _ID_SEGMENT_PATTERN.match(segment) else segment for segment in path.split("/"))
+
+
+class LatencyHistogram:
+    """
+    HDR-style histogram: log-linear buckets giving a bounded relative error at every magnitude in constant
+    memory, so percentiles can be computed over any number of samples
+    """
+
+    def __init__(self, sub_bucket_bits: int = DEFAULT_SUB_BUCKET_BITS):
+        self.sub_bucket_bits = sub_bucket_bits
+        self.count = 0
+        self.total = 0.0
+        self.min = math.inf
+        self.max = 0.0
+        self._buckets: Dict[int, int] = {}
+        self._lock = threading.Lock()
+
+    def _get_index(self, microseconds: int) -> int:
+        if microseconds < (1 << self.sub_bucket_bits):
+            return microseconds
+        shift = microseconds.bit_length() - self.sub_bucket_bits
+        return (shift << self.sub_bucket_bits) + (microseconds >> shift)
+
+    def _get_value(self, index: int) -> float:
+        """
+        Upper bound, in seconds, of the values held by bucket index
+        """
+        shift = index >> self.sub_bucket_bits
+        if shift == 0:
+            return index / 1e6
+        mantissa = index - (shift << self.sub_bucket_bits)
+        return (((mantissa + 1) << shift) - 1) / 1e6
+
+    def record(self, seconds: float) -> None:
+        index = self._get_index(max(0, int(seconds * 1e6)))
+        with self._lock:
+            self._buckets[index] = self._buckets.get(index, 0) + 1
+            self.count += 1
+            self.total += seconds
+            self.min = min(self.min, seconds)
+            self.max = max(self.max, seconds)
+
+    def percentile(self, percentile: float) -> float:
+        with self._lock:
+            if not self.count:
+                return 0.0
+            rank = max(1, math.ceil(self.count * percentile / 100))
+            seen = 0
+            for index in sorted(self._buckets):
+                seen += self._buckets[index]
+                if seen >= rank:
+                    return min(self._get_value(index), self.max)
+            return self.max
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+
+class MetricsRecorder:
+    """
+    Request hook aggregating latencies per endpoint (client, method, path template) and per client
+    """
+
+    def __init__(self):
+        self.endpoints: Dict[Tuple[str, str, str], LatencyHistogram] = {}
+        self.clients: Dict[str, LatencyHistogram] = {}
+        self.errors: Dict[Tuple[str, str, str], int] = {}
+        self.bytes_sent: Dict[str, int] = {}
+        self.bytes_received: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def __call__(self, metrics: RequestMetrics) -> None:
+        key = (metrics.client, metrics.method, metrics.path_template)
+        with self._lock:
+            endpoint = self.endpoints.setdefault(key, LatencyHistogram())
+            client = self.clients.setdefault(metrics.client, LatencyHistogram())
+            if metrics.status is None or metrics.status >= 400:
+                self.errors[key] = self.errors.get(key, 0) + 1
+            self.bytes_sent[metrics.client] = self.bytes_sent.get(metrics.client, 0) + metrics.bytes_sent
+            self.bytes_received[metrics.client] = self.bytes_received.get(metrics.client, 0) + (metrics.bytes_received or 0)
+        endpoint.record(metrics.elapsed)
+        client.record(metrics.elapsed)
+
+    def print_summary(self) -> None:
+        if not self.endpoints:
+            return
+        import rich
+        import rich.table
+
+        def add_percentiles(row: list, histogram: LatencyHistogram) -> list:
+            return row + [f"{histogram.percentile(p) * 1000:.1f}" for p in DEFAULT_PERCENTILES] + [f"{histogram.max * 1000:.1f}"]
+
+        percentile_columns = [f"p{p} (ms)" for p in DEFAULT_PERCENTILES] + ["max (ms)"]
+
+        endpoints_table = rich.table.Table(show_header=True, header_style="bold white", title="Request timings by endpoint")
+        for column in ["Client", "Method", "Endpoint", "Requests", "Errors", *percentile_columns]:
+            endpoints_table.add_column(column)
+        for (client, method, path), histogram in sorted(self.endpoints.items(), key=lambda item: -item[1].total):
+            endpoints_table.add_row(*add_percentiles(
+                [client, method, path, str(histogram.count), str(self.errors.get((client, method, path), 0))],
+                histogram
+            ))
+
+        clients_table = rich.table.Table(show_header=True, header_style="bold white", title="Request timings by client")
+        for column in ["Client", "Requests", "Total (s)", "Sent (KB)", "Received (KB)", *percentile_columns]:
+            clients_table.add_column(column)
+        for client, histogram in sorted(self.clients.items(), key=lambda item: -item[1].total):
+            clients_table.add_row(*add_percentiles(
+                [
+                    client,
+                    str(histogram.count),
+                    f"{histogram.total:.2f}",
+                    f"{self.bytes_sent.get(client, 0) / 1024:.1f}",
+                    f"{self.bytes_received.get(client, 0) / 1024:.1f}",
+                ],
+                histogram
+            ))
+
+        rich.print(endpoints_table)
+        rich.print(clients_table)
+
+
+_REQUEST_HOOKS: List[RequestHook] = []
+_REQUEST_HOOKS_LOCK = threading.Lock()
+
+
+def add_request_hook(hook: RequestHook) -> None:
+    with _REQUEST_HOOKS_LOCK:
+        _REQUEST_HOOKS.append(hook)
+
+
+def remove_request_hook(hook: RequestHook) -> None:
+    with _REQUEST_HOOKS_LOCK:
+        if hook in _REQUEST_HOOKS:
+            _REQUEST_HOOKS.remove(hook)
+
+
+def emit_request_metrics(metrics: RequestMetrics) -> None:
+    for hook in list(_REQUEST_HOOKS):
+        hook(metrics)
+
+
+def has_request_hooks() -> bool:
+    return bool(_REQUEST_HOOKS)
+
+
+def get_body_size(body) -> int:
+    if isinstance(body, (bytes, bytearray)):
+        return len(body)
+    if isinstance(body, str):
+        return len(body.encode())
+    return 0
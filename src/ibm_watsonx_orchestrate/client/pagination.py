@@ -0,0 +1,144 @@
+import json
+from typing import Any, Hashable, Iterable, Iterator, List
+
+DEFAULT_PAGE_SIZE = 100
+
+
+def _item_key(item: Any) -> Hashable:
+    if isinstance(item, dict) and item.get("id") is not None:
+        return item["id"]
+    # Items without an id are only expected on small endpoints, compare their whole content
+    return json.dumps(item, sort_keys=True, default=str)
+
+
+def matches_filter(item: Any, filter: dict | None) -> bool:
+    """
+    Case-insensitive exact match of every filter key against the item's field, list fields match if any element does
+    """
+    if not filter:
+        return True
+    if not isinstance(item, dict):
+        return False
+    for field, expected in filter.items():
+        actual = item.get(field)
+        values = actual if isinstance(actual, list) else [actual]
+        if str(expected).lower() not in [str(value).lower() for value in values]:
+            return False
+    return True
+
+
+def _sort_key(item: Any, field: str) -> str:
+    return str(item.get(field, "") if isinstance(item, dict) else "")
+
+
+def sort_items(items: List[Any], sort: str) -> List[Any]:
+    """
+    Sorts dict items by a field name, prefix the field with '-' for descending order
+    """
+    field = sort.lstrip("-+")
+    return sorted(items, key=lambda item: _sort_key(item, field), reverse=sort.startswith("-"))
+
+
+def is_sorted(items: List[Any], sort: str) -> bool:
+    """
+    Whether the items are already in the order sort_items() would put them in
+    """
+    field = sort.lstrip("-+")
+    keys = [_sort_key(item, field) for item in items]
+    if sort.startswith("-"):
+        keys.reverse()
+    return all(a <= b for a, b in zip(keys, keys[1:]))
+
+
+def parse_filters(filters: List[str] | None) -> dict | None:
+    """
+    Turns repeated key=value strings into a filter dict
+    """
+    if not filters:
+        return None
+    parsed = {}
+    for filter in filters:
+        field, separator, value = filter.partition("=")
+        if not separator or not field.strip():
+            raise ValueError(f"Invalid filter '{filter}', expected the format key=value")
+        parsed[field.strip()] = value.strip()
+    return parsed
+
+
+class Paginator:
+    """
+    Tracks limit/offset pagination of a list endpoint.
+
+    Every page is requested with the filter fields, sort, limit and offset as query parameters. Filters are
+    re-applied to the returned items so results stay correct on endpoints that ignore them. When the first page
+    is not in the requested order the endpoint ignores sort, so every page is collected and sorted locally before
+    anything is returned. Iteration stops on a page shorter or longer than asked for, once limit items were
+    returned, or when a page repeats item ids already returned.
+    """
+
+    def __init__(self, page_size: int = DEFAULT_PAGE_SIZE, filter: dict | None = None, sort: str | None = None, limit: int | None = None):
+        if page_size < 1:
+            raise ValueError("page_size must be at least 1")
+        self.page_size = page_size
+        self.filter = filter or {}
+        self.sort = sort
+        self.limit = limit
+        self.offset = 0
+        self.returned = 0
+        self.done = limit is not None and limit <= 0
+        self._requested_size = page_size
+        self._seen_keys = set()
+        # Items of every page when the endpoint ignores sort, None while its order can be trusted
+        self._unsorted = None
+
+    def next_params(self) -> dict | None:
+        if self.done:
+            return None
+        remaining = None if self.limit is None or self._unsorted is not None else self.limit - self.returned
+        self._requested_size = self.page_size if remaining is None else min(self.page_size, remaining)
+        params = {**self.filter, "limit": self._requested_size, "offset": self.offset}
+        if self.sort:
+            params["sort"] = self.sort
+        return params
+
+    def consume(self, items: Iterable[Any]) -> Iterator[Any]:
+        """
+        Yields the items of the page that was requested with next_params() as they are read from items. Only a
+        page that has to be checked for its order is read whole first
+        """
+        self.done = True
+        if self.sort:
+            items = list(items)
+            if self.offset == 0 and not is_sorted(items, self.sort):
+                self._unsorted = []
+
+        count = 0
+        for item in items:
+            # The endpoint ignored the offset and served a page we already returned
+            key = _item_key(item)
+            if key in self._seen_keys:
+                break
+            self._seen_keys.add(key)
+            count += 1
+
+            if not matches_filter(item, self.filter):
+                continue
+            if self._unsorted is not None:
+                self._unsorted.append(item)
+                continue
+            yield item
+            self.returned += 1
+            if self.limit is not None and self.returned >= self.limit:
+                return
+        else:
+            if count == self._requested_size:
+                self.done = False
+                self.offset += count
+                return
+
+        if self._unsorted is not None:
+            for item in sort_items(self._unsorted, self.sort):
+                yield item
+                self.returned += 1
+                if self.limit is not None and self.returned >= self.limit:
+                    return
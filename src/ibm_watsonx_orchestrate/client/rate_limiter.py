@@ -0,0 +1,233 @@
+import asyncio
+import os
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Dict, Mapping
+
+# Client side cap on the request rate, off unless set: the server's 429s and Retry-After pace requests otherwise
+REQUESTS_PER_SECOND_ENV_VAR = "WXO_CLIENT_REQUESTS_PER_SECOND"
+DEFAULT_BURST = 100
+DEFAULT_INITIAL_CONCURRENCY = 16
+DEFAULT_MIN_CONCURRENCY = 1
+DEFAULT_MAX_CONCURRENCY = 64
+# Multiplicative decrease applied to the concurrency limit when throttled, at most once per cooldown
+DEFAULT_DECREASE_FACTOR = 0.5
+DEFAULT_DECREASE_COOLDOWN = 1.0
+# A request slower than this multiple of the average latency counts as a congestion signal
+DEFAULT_LATENCY_THRESHOLD_FACTOR = 3.0
+DEFAULT_LATENCY_WARMUP_SAMPLES = 10
+DEFAULT_LATENCY_SMOOTHING = 0.1
+# Pause used on a 429 that does not say how long to wait
+DEFAULT_THROTTLE_PAUSE = 1.0
+DEFAULT_MAX_RETRY_AFTER = 120
+
+THROTTLE_STATUS_CODE = 429
+OVERLOAD_STATUS_CODES = frozenset([THROTTLE_STATUS_CODE, 503])
+
+
+def get_default_requests_per_second() -> float | None:
+    try:
+        requests_per_second = float(os.environ.get(REQUESTS_PER_SECOND_ENV_VAR, ""))
+    except ValueError:
+        return None
+    return requests_per_second if requests_per_second > 0 else None
+
+
+def get_retry_after(headers: Mapping[str, str]) -> float | None:
+    """
+    Seconds to wait according to a Retry-After header given either as seconds or as an HTTP date
+    """
+    retry_after = headers.get("Retry-After")
+    if not retry_after:
+        return None
+    try:
+        return min(max(0.0, float(retry_after)), DEFAULT_MAX_RETRY_AFTER)
+    except ValueError:
+        pass
+    try:
+        delay = (parsedate_to_datetime(retry_after) - datetime.now(timezone.utc)).total_seconds()
+        return min(max(0.0, delay), DEFAULT_MAX_RETRY_AFTER)
+    except (TypeError, ValueError):
+        return None
+
+
+class RateLimiter:
+    """
+    Request budget shared by every client talking to the same environment.
+
+    Each request takes a slot out of an adaptive concurrency limit. The limit grows additively while
+    requests succeed quickly and is halved (AIMD) on 429 / 503 responses or on latency spikes, latency
+    being compared to the average of the same endpoint. A Retry-After received by one client holds back
+    every request of the environment until it has elapsed. When requests_per_second is set, each request
+    also takes a token from a bucket refilled at that rate (up to burst tokens).
+    """
+
+    def __init__(
+            self,
+            requests_per_second: float | None = None,
+            burst: int = DEFAULT_BURST,
+            initial_concurrency: int = DEFAULT_INITIAL_CONCURRENCY,
+            min_concurrency: int = DEFAULT_MIN_CONCURRENCY,
+            max_concurrency: int = DEFAULT_MAX_CONCURRENCY
+    ):
+        self.requests_per_second = requests_per_second
+        self.burst = burst
+        self.min_concurrency = min_concurrency
+        self.max_concurrency = max_concurrency
+        self._concurrency_limit = float(min(max(initial_concurrency, min_concurrency), max_concurrency))
+        self._in_flight = 0
+        self._tokens = float(burst)
+        self._refilled_at = time.monotonic()
+        self._paused_until = 0.0
+        self._decreased_at = float("-inf")
+        # endpoint -> [average latency, samples]
+        self._latencies: Dict[str, list] = {}
+        self._condition = threading.Condition()
+        self._async_waiters: deque = deque()
+
+    @property
+    def concurrency_limit(self) -> int:
+        return int(self._concurrency_limit)
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    def _reserve_token(self) -> float:
+        """
+        Takes a token, possibly ahead of time, and returns how long the caller has to wait before using it
+        """
+        now = time.monotonic()
+        if not self.requests_per_second:
+            return max(0.0, self._paused_until - now)
+        self._tokens = min(self.burst, self._tokens + (now - self._refilled_at) * self.requests_per_second)
+        self._refilled_at = now
+        self._tokens -= 1
+        delay = 0.0 if self._tokens >= 0 else -self._tokens / self.requests_per_second
+        return max(delay, self._paused_until - now)
+
+    def _notify_waiters(self) -> None:
+        # Called with the lock held. Async waiters are woken in their own event loop and check the limit again
+        self._condition.notify_all()
+        while self._async_waiters:
+            loop, waiter = self._async_waiters.popleft()
+            try:
+                loop.call_soon_threadsafe(_wake_waiter, waiter)
+            except RuntimeError:
+                # the loop of a cancelled waiter may be closed already
+                pass
+
+    def acquire(self) -> None:
+        with self._condition:
+            while self._in_flight >= self.concurrency_limit:
+                self._condition.wait()
+            self._in_flight += 1
+            delay = self._reserve_token()
+        if delay > 0:
+            time.sleep(delay)
+
+    async def acquire_async(self) -> None:
+        while True:
+            with self._condition:
+                if self._in_flight < self.concurrency_limit:
+                    self._in_flight += 1
+                    delay = self._reserve_token()
+                    break
+                loop = asyncio.get_running_loop()
+                waiter = loop.create_future()
+                self._async_waiters.append((loop, waiter))
+            await waiter
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    def release(self) -> None:
+        with self._condition:
+            self._in_flight -= 1
+            self._notify_waiters()
+
+    @contextmanager
+    def slot(self):
+        self.acquire()
+        try:
+            yield
+        finally:
+            self.release()
+
+    def record(self, status_code: int | None, elapsed: float, retry_after: float | None = None, endpoint: str = "") -> None:
+        """
+        Feeds the outcome of a request back into the limiter. endpoint groups the requests whose latencies
+        are comparable, such as the method and path template
+        """
+        with self._condition:
+            now = time.monotonic()
+            if status_code == THROTTLE_STATUS_CODE:
+                pause = retry_after if retry_after is not None else DEFAULT_THROTTLE_PAUSE
+                self._paused_until = max(self._paused_until, now + pause)
+                self._decrease(now)
+                return
+            if status_code in OVERLOAD_STATUS_CODES:
+                if retry_after is not None:
+                    self._paused_until = max(self._paused_until, now + retry_after)
+                self._decrease(now)
+                return
+
+            latency = self._latencies.get(endpoint)
+            if latency is None:
+                latency = self._latencies[endpoint] = [elapsed, 0]
+            is_slow = (
+                latency[1] >= DEFAULT_LATENCY_WARMUP_SAMPLES
+                and elapsed > latency[0] * DEFAULT_LATENCY_THRESHOLD_FACTOR
+            )
+            latency[0] += (elapsed - latency[0]) * DEFAULT_LATENCY_SMOOTHING
+            latency[1] += 1
+
+            if is_slow:
+                self._decrease(now)
+            else:
+                self._concurrency_limit = min(self.max_concurrency, self._concurrency_limit + 1 / self._concurrency_limit)
+                self._notify_waiters()
+
+    def _decrease(self, now: float) -> None:
+        if now - self._decreased_at < DEFAULT_DECREASE_COOLDOWN:
+            return
+        self._decreased_at = now
+        self._concurrency_limit = max(self.min_concurrency, self._concurrency_limit * DEFAULT_DECREASE_FACTOR)
+
+
+def _wake_waiter(waiter: asyncio.Future) -> None:
+    if not waiter.done():
+        waiter.set_result(None)
+
+
+_RATE_LIMITERS: Dict[str, RateLimiter] = {}
+_RATE_LIMITERS_LOCK = threading.Lock()
+
+
+def get_rate_limiter(base_url: str) -> RateLimiter:
+    """
+    Returns the limiter shared by every client, sync or async, talking to base_url
+    """
+    with _RATE_LIMITERS_LOCK:
+        limiter = _RATE_LIMITERS.get(base_url)
+        if limiter is None:
+            limiter = _RATE_LIMITERS[base_url] = RateLimiter(requests_per_second=get_default_requests_per_second())
+        return limiter
+
+
+def configure_rate_limiter(base_url: str, **kwargs) -> RateLimiter:
+    """
+    Replaces the limiter of base_url, kwargs are passed to RateLimiter (requests_per_second, burst, ...)
+    """
+    limiter = RateLimiter(**kwargs)
+    with _RATE_LIMITERS_LOCK:
+        _RATE_LIMITERS[base_url] = limiter
+    return limiter
+
+
+def reset_rate_limiters() -> None:
+    with _RATE_LIMITERS_LOCK:
+        _RATE_LIMITERS.clear()
@@ -0,0 +1,141 @@
+import hashlib
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future
+from dataclasses import dataclass
+from typing import Callable, Dict, Hashable, Tuple
+from urllib.parse import urlencode
+
+DEFAULT_MAX_ENTRIES = 256
+DEFAULT_MAX_ENTRY_SIZE = 64 * 1024 * 1024
+
+
+@dataclass
+class CacheEntry:
+    content: bytes
+    etag: str | None = None
+    last_modified: str | None = None
+
+    def get_validator_headers(self) -> dict:
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+def get_cache_key(base_url: str, path: str, params: dict | None = None, authorization: str | None = None) -> Tuple[str, str, str]:
+    """
+    Cache keys are scoped by base url (one per environment) and by the bearer token so that responses are
+    never shared between identities
+    """
+    url = path
+    if params:
+        url = f"{path}{'&' if '?' in path else '?'}{urlencode(sorted(params.items()), doseq=True)}"
+    identity = hashlib.sha256(authorization.encode()).hexdigest() if authorization else ""
+    return (base_url, identity, url)
+
+
+def _is_same_resource(cached_path: str, mutated_path: str) -> bool:
+    cached_path = cached_path.split("?", 1)[0].rstrip("/")
+    mutated_path = mutated_path.split("?", 1)[0].rstrip("/")
+    return (
+        cached_path == mutated_path
+        or mutated_path.startswith(f"{cached_path}/")
+        or cached_path.startswith(f"{mutated_path}/")
+    )
+
+
+class ResponseCache:
+    """
+    Interface of the conditional GET cache used by BaseAPIClient.
+
+    Entries hold the raw body of a GET together with its ETag / Last-Modified validators, every hit is
+    revalidated with the server. Implementations must be thread-safe.
+    """
+
+    def get(self, key: Hashable) -> CacheEntry | None:
+        raise NotImplementedError("get method of the response cache must be implemented")
+
+    def set(self, key: Hashable, entry: CacheEntry) -> None:
+        raise NotImplementedError("set method of the response cache must be implemented")
+
+    def invalidate(self, base_url: str, path: str) -> None:
+        """
+        Drops every entry of base_url for path, its parent collections and its sub-resources
+        """
+        raise NotImplementedError("invalidate method of the response cache must be implemented")
+
+    def clear(self) -> None:
+        raise NotImplementedError("clear method of the response cache must be implemented")
+
+
+class InMemoryResponseCache(ResponseCache):
+    """
+    Process wide LRU response cache
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES, max_entry_size: int = DEFAULT_MAX_ENTRY_SIZE):
+        self.max_entries = max_entries
+        self.max_entry_size = max_entry_size
+        self._entries: "OrderedDict[Hashable, CacheEntry]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> CacheEntry | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def set(self, key: Hashable, entry: CacheEntry) -> None:
+        if len(entry.content) > self.max_entry_size:
+            return
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, base_url: str, path: str) -> None:
+        with self._lock:
+            for key in [k for k in self._entries if k[0] == base_url and _is_same_resource(k[2], path)]:
+                del self._entries[key]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+class RequestCoalescer:
+    """
+    Merges identical requests that are in flight at the same time: the first caller runs the request and
+    every concurrent caller with the same key waits for and shares its result
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._in_flight: Dict[Hashable, Future] = {}
+
+    def run(self, key: Hashable, fn: Callable):
+        with self._lock:
+            future = self._in_flight.get(key)
+            is_owner = future is None
+            if is_owner:
+                future = self._in_flight[key] = Future()
+
+        if not is_owner:
+            return future.result()
+
+        try:
+            result = fn()
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                del self._in_flight[key]
@@ -5,26 +5,118 @@
 
 from __future__ import annotations
 
-from ibm_cloud_sdk_core.authenticators import MCSPAuthenticator 
-from ibm_cloud_sdk_core.authenticators import IAMAuthenticator
+import logging
+import random
+import threading
+import time
+import weakref
 
-from ibm_watsonx_orchestrate.client.utils import check_token_validity
+from ibm_watsonx_orchestrate.client.utils import check_token_validity, get_token_expiry, get_token_lifetime
 from ibm_watsonx_orchestrate.client.base_service_instance import BaseServiceInstance
+from ibm_watsonx_orchestrate.client.token_cache import SharedTokenCache, get_token_cache_key, is_shared_token_cache_enabled
 from ibm_watsonx_orchestrate.cli.commands.environment.types import EnvironmentAuthType
 
 from ibm_watsonx_orchestrate.client.client_errors import (
     ClientError,
 )
 
+logger = logging.getLogger(__name__)
+
+# Background refresh renews the token this many seconds before it expires, well ahead of the 10 minute
+# margin used by check_token_validity, minus a random jitter so processes sharing credentials spread out.
+# Tokens living less than twice as long are renewed halfway through their lifetime instead
+DEFAULT_TOKEN_REFRESH_LEAD = 900
+DEFAULT_TOKEN_REFRESH_JITTER = 120
+DEFAULT_TOKEN_REFRESH_RETRY_INTERVAL = 30
+
 
 class ServiceInstance(BaseServiceInstance):
     """Connect, get details, and check usage of a Watson Machine Learning service instance."""
 
-    def __init__(self, client) -> None:
+    def __init__(self, client, refresh_in_background: bool = False, shared_token_cache: bool | None = None) -> None:
         super().__init__()
         self._client = client
         self._credentials = client.credentials
+        # Opt-in, defaults to the WXO_CLIENT_SHARED_TOKEN_CACHE environment variable
+        if shared_token_cache is None:
+            shared_token_cache = is_shared_token_cache_enabled()
+        self._token_cache = SharedTokenCache() if shared_token_cache else None
         self._client.token = self._get_token()
+        self._refresh_thread: threading.Thread | None = None
+        self._refresh_stopped = threading.Event()
+        if refresh_in_background:
+            self.start_token_refresh()
+
+    def start_token_refresh(self) -> None:
+        """
+        Starts a daemon thread renewing the token ahead of its expiry. Requests in flight keep the token they
+        were sent with, the client is handed the new one through Client.set_token
+        """
+        if not self._is_token_refresh_possible():
+            logger.debug("Background token refresh needs an api key, skipping")
+            return
+        if self._refresh_thread is not None and self._refresh_thread.is_alive():
+            return
+        self._refresh_stopped.clear()
+        # The thread only holds a weak reference so that a discarded client and its instance can be collected
+        self._refresh_thread = threading.Thread(
+            target=ServiceInstance._refresh_loop,
+            args=(weakref.ref(self), self._refresh_stopped),
+            name="wxo-token-refresh",
+            daemon=True
+        )
+        self._refresh_thread.start()
+
+    def stop_token_refresh(self) -> None:
+        self._refresh_stopped.set()
+        thread = self._refresh_thread
+        self._refresh_thread = None
+        if thread is not None and thread is not threading.current_thread():
+            thread.join()
+
+    def get_refresh_delay(self) -> float | None:
+        """
+        Seconds to wait before renewing the current token, None when it does not expire
+        """
+        token = self._client.token
+        expiry = get_token_expiry(token)
+        if not expiry:
+            return None
+        now = time.time()
+        # Without an iat claim the token is taken to have been issued just now, it was received moments ago
+        lifetime = get_token_lifetime(token) or expiry - now
+        lead = min(DEFAULT_TOKEN_REFRESH_LEAD, lifetime / 2)
+        refresh_at = expiry - lead - random.uniform(0, min(DEFAULT_TOKEN_REFRESH_JITTER, lead / 4))
+        return max(0.0, refresh_at - now)
+
+    @staticmethod
+    def _refresh_loop(instance_ref: weakref.ref, stopped: threading.Event) -> None:
+        refreshed = False
+        while not stopped.is_set():
+            instance = instance_ref()
+            if instance is None:
+                return
+            delay = instance.get_refresh_delay()
+            if delay is None:
+                return
+            # The token server handed back a token just as close to expiry, do not spin on it
+            if refreshed and delay == 0:
+                delay = DEFAULT_TOKEN_REFRESH_RETRY_INTERVAL
+            del instance
+            if stopped.wait(delay):
+                return
+
+            instance = instance_ref()
+            if instance is None:
+                return
+            try:
+                instance._client.set_token(instance._create_token())
+                refreshed = True
+            except Exception as e:
+                logger.warning(f"Background token refresh failed, retrying in {DEFAULT_TOKEN_REFRESH_RETRY_INTERVAL}s: {e}")
+                del instance
+                if stopped.wait(DEFAULT_TOKEN_REFRESH_RETRY_INTERVAL):
+                    return
 
     def _get_token(self) -> str:
         # If no token is set
@@ -40,14 +132,23 @@ class ServiceInstance(BaseServiceInstance):
     def _create_token(self) -> str:
         if not self._credentials.auth_type:
             if ".cloud.ibm.com" in self._credentials.url:
-                return self._authenticate(EnvironmentAuthType.IBM_CLOUD_IAM)
+                auth_type = EnvironmentAuthType.IBM_CLOUD_IAM
             else:
-                return self._authenticate(EnvironmentAuthType.MCSP)
+                auth_type = EnvironmentAuthType.MCSP
         else:
-            return self._authenticate(self._credentials.auth_type)
+            auth_type = self._credentials.auth_type
+
+        if self._token_cache is None or not self._credentials.api_key:
+            return self._authenticate(auth_type)
+
+        key = get_token_cache_key(str(auth_type), self._credentials.iam_url, self._credentials.api_key)
+        return self._token_cache.get_or_create(key, lambda: self._authenticate(auth_type))
 
     def _authenticate(self, auth_type: str) -> str:
         """Handles authentication based on the auth_type."""
+        # ibm_cloud_sdk_core is slow to import and only needed when a token has to be fetched
+        from ibm_cloud_sdk_core.authenticators import MCSPAuthenticator, IAMAuthenticator
+
         try:
             match auth_type:
                 case EnvironmentAuthType.MCSP:
@@ -0,0 +1,90 @@
+import hashlib
+import json
+import logging
+import os
+import time
+from typing import Callable
+
+from ibm_watsonx_orchestrate.cli.config import AUTH_CONFIG_FILE_FOLDER
+from ibm_watsonx_orchestrate.client.utils import get_token_expiry
+from ibm_watsonx_orchestrate.utils.file_lock import atomic_write, file_lock
+
+logger = logging.getLogger(__name__)
+
+SHARED_TOKEN_CACHE_ENV_VAR = "WXO_CLIENT_SHARED_TOKEN_CACHE"
+DEFAULT_TOKEN_CACHE_FILE = "token_cache.json"
+# A cached token is only handed out while it stays valid for at least this long
+DEFAULT_MIN_TOKEN_VALIDITY = 1200
+
+
+def is_shared_token_cache_enabled() -> bool:
+    return os.environ.get(SHARED_TOKEN_CACHE_ENV_VAR, "").lower() in ("1", "true", "yes")
+
+
+def get_token_cache_key(*parts: str | None) -> str:
+    """
+    Hashes the values identifying a token (auth type, token url, api key) so no secret is written to disk
+    """
+    return hashlib.sha256("\0".join(part or "" for part in parts).encode()).hexdigest()
+
+
+class SharedTokenCache:
+    """
+    Token cache shared by every process of the user, stored next to the credentials file.
+
+    Reads take no lock. When no usable token is cached the process takes an advisory lock on the cache,
+    checks again and only then fetches a token, so of many processes starting together one talks to the
+    token server while the others wait for the lock and reuse its token.
+    """
+
+    def __init__(self, cache_dir: str | None = None, min_validity: float = DEFAULT_MIN_TOKEN_VALIDITY):
+        cache_dir = cache_dir or AUTH_CONFIG_FILE_FOLDER
+        self.path = os.path.join(cache_dir, DEFAULT_TOKEN_CACHE_FILE)
+        self.lock_path = f"{self.path}.lock"
+        self.min_validity = min_validity
+
+    def _read(self) -> dict:
+        try:
+            with open(self.path, "r") as f:
+                entries = json.load(f)
+            return entries if isinstance(entries, dict) else {}
+        except (FileNotFoundError, ValueError):
+            return {}
+
+    def _is_usable(self, token: str | None) -> bool:
+        expiry = get_token_expiry(token)
+        return bool(expiry) and expiry - time.time() >= self.min_validity
+
+    def get(self, key: str) -> str | None:
+        token = self._read().get(key)
+        return token if self._is_usable(token) else None
+
+    def get_or_create(self, key: str, create_token: Callable[[], str]) -> str:
+        token = self.get(key)
+        if token is not None:
+            return token
+
+        with file_lock(self.lock_path):
+            entries = self._read()
+            token = entries.get(key)
+            if self._is_usable(token):
+                return token
+
+            token = create_token()
+            if not get_token_expiry(token):
+                return token
+
+            now = time.time()
+            entries = {k: v for k, v in entries.items() if (get_token_expiry(v) or 0) > now}
+            entries[key] = token
+            try:
+                atomic_write(self.path, json.dumps(entries), mode=0o600)
+            except OSError as e:
+                logger.debug(f"Failed to write token cache '{self.path}': {e}")
+            return token
+
+    def invalidate(self, key: str) -> None:
+        with file_lock(self.lock_path):
+            entries = self._read()
+            if entries.pop(key, None) is not None:
+                atomic_write(self.path, json.dumps(entries), mode=0o600)
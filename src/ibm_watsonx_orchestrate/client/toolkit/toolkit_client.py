@@ -1,9 +1,18 @@
 from ibm_watsonx_orchestrate.client.base_api_client import BaseAPIClient, ClientAPIException
+from ibm_watsonx_orchestrate.client.async_base_api_client import AsyncBaseAPIClient
 from typing_extensions import List
+from functools import cached_property
+from ibm_watsonx_orchestrate.client.batch_loader import BatchLoader
 import os
 import json
 
 class ToolKitClient(BaseAPIClient):
+
+    @cached_property
+    def name_loader(self) -> BatchLoader:
+        return BatchLoader(self.get_drafts_by_names, key_fn=lambda toolkit: toolkit.get("name"))
+
+
     # POST /toolkits/prepare/list-tools
     def list_tools(self, zip_file_path: str, command: str, args: List[str]) -> List[str]:
         """
@@ -61,11 +70,10 @@ class ToolKitClient(BaseAPIClient):
         return self._delete(f"/orchestrate/toolkits/{toolkit_id}")
 
     def get_draft_by_name(self, toolkit_name: str) -> List[dict]:
-        return self.get_drafts_by_names([toolkit_name])
+        return self.name_loader.load(toolkit_name).result()
 
     def get_drafts_by_names(self, toolkit_names: List[str]) -> List[dict]:
-        formatted_toolkit_names = [f"names={x}" for x in toolkit_names]
-        return self._get(f"/orchestrate/toolkits?{'&'.join(formatted_toolkit_names)}")
+        return self._get_chunked("/orchestrate/toolkits", "names", toolkit_names)
     
     def get_draft_by_id(self, toolkit_id: str) -> dict:
         if toolkit_id is None:
@@ -79,3 +87,69 @@ class ToolKitClient(BaseAPIClient):
                     return ""
                 raise(e)
 
+
+class AsyncToolKitClient(AsyncBaseAPIClient):
+    # POST /toolkits/prepare/list-tools
+    async def list_tools(self, zip_file_path: str, command: str, args: List[str]) -> List[str]:
+        """
+        List the available tools inside the MCP server
+        """
+
+        filename = os.path.basename(zip_file_path)
+
+        list_toolkit_obj = {
+            "source": "files",
+            "command": command,
+            "args": args,
+        }
+
+        with open(zip_file_path, "rb") as f:
+            files = {
+                "list_toolkit_obj": (None, json.dumps(list_toolkit_obj), "application/json"),
+                "file": (filename, f, "application/zip"),
+            }
+
+            response = await self._post("/orchestrate/toolkits/prepare/list-tools", files=files)
+
+        return response.get("tools", [])
+
+    # POST /api/v1/orchestrate/toolkits
+    async def create_toolkit(self, payload) -> dict:
+        """
+        Creates new toolkit metadata
+        """
+        return await self._post("/orchestrate/toolkits", data=payload)
+
+    # POST /toolkits/{toolkit-id}/upload
+    async def upload(self, toolkit_id: str, zip_file_path: str) -> dict:
+        """
+        Upload zip file to the toolkit.
+        """
+        filename = os.path.basename(zip_file_path)
+        with open(zip_file_path, "rb") as f:
+            files = {
+                "file": (filename, f, "application/zip", {"Expires": "0"})
+            }
+            return await self._post(f"/orchestrate/toolkits/{toolkit_id}/upload", files=files)
+
+    # DELETE /toolkits/{toolkit-id}
+    async def delete(self, toolkit_id: str) -> dict:
+        return await self._delete(f"/orchestrate/toolkits/{toolkit_id}")
+
+    async def get_draft_by_name(self, toolkit_name: str) -> List[dict]:
+        return await self.get_drafts_by_names([toolkit_name])
+
+    async def get_drafts_by_names(self, toolkit_names: List[str]) -> List[dict]:
+        return await self._get_chunked("/orchestrate/toolkits", "names", toolkit_names)
+
+    async def get_draft_by_id(self, toolkit_id: str) -> dict:
+        if toolkit_id is None:
+            return ""
+        else:
+            try:
+                toolkit = await self._get(f"/orchestrate/toolkits/{toolkit_id}")
+                return toolkit
+            except ClientAPIException as e:
+                if e.response.status_code == 404 and "not found with the given name" in e.response.text:
+                    return ""
+                raise(e)
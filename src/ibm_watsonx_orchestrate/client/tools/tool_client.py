@@ -1,17 +1,28 @@
 from ibm_watsonx_orchestrate.client.base_api_client import BaseAPIClient, ClientAPIException
-from typing_extensions import List
+from ibm_watsonx_orchestrate.client.async_base_api_client import AsyncBaseAPIClient
+from typing_extensions import AsyncIterator, Iterator, List
+from functools import cached_property
+from ibm_watsonx_orchestrate.client.batch_loader import BatchLoader
+from ibm_watsonx_orchestrate.client.pagination import DEFAULT_PAGE_SIZE
 
 class ToolClient(BaseAPIClient):
     """
     Client to handle CRUD operations for Tool endpoint
     """
 
+    @cached_property
+    def name_loader(self) -> BatchLoader:
+        return BatchLoader(self.get_drafts_by_names, key_fn=lambda tool: tool.get("name"))
+
     def create(self, payload: dict) -> dict:
         return self._post("/tools", data=payload)
 
     def get(self) -> dict:
         return self._get("/tools")
 
+    def iter_tools(self, page_size: int = DEFAULT_PAGE_SIZE, filter: dict = None, sort: str = None, limit: int = None) -> Iterator[dict]:
+        return self._iter_pages("/tools", page_size=page_size, filter=filter, sort=sort, limit=limit)
+
     def update(self, agent_id: str, data: dict) -> dict:
         return self._put(f"/tools/{agent_id}", data=data)
 
@@ -22,11 +33,10 @@ class ToolClient(BaseAPIClient):
         return self._post(f"/tools/{tool_id}/upload", files={"file": (f"{tool_id}.zip", open(file_path, "rb"), "application/zip", {"Expires": "0"})})
     
     def get_draft_by_name(self, tool_name: str) -> List[dict]:
-        return self.get_drafts_by_names([tool_name])
+        return self.name_loader.load(tool_name).result()
 
     def get_drafts_by_names(self, tool_names: List[str]) -> List[dict]:
-        formatted_tool_names = [f"names={x}" for x in tool_names]
-        return self._get(f"/tools?{'&'.join(formatted_tool_names)}")
+        return self._get_chunked("/tools", "names", tool_names)
     
     def get_draft_by_id(self, tool_id: str) -> List[dict]:
         if tool_id is None:
@@ -39,3 +49,46 @@ class ToolClient(BaseAPIClient):
                 if e.response.status_code == 404 and "not found with the given name" in e.response.text:
                     return ""
                 raise(e)
+
+
+class AsyncToolClient(AsyncBaseAPIClient):
+    """
+    Async client to handle CRUD operations for Tool endpoint
+    """
+
+    async def create(self, payload: dict) -> dict:
+        return await self._post("/tools", data=payload)
+
+    async def get(self) -> dict:
+        return await self._get("/tools")
+
+    def iter_tools(self, page_size: int = DEFAULT_PAGE_SIZE, filter: dict = None, sort: str = None, limit: int = None) -> AsyncIterator[dict]:
+        return self._iter_pages("/tools", page_size=page_size, filter=filter, sort=sort, limit=limit)
+
+    async def update(self, agent_id: str, data: dict) -> dict:
+        return await self._put(f"/tools/{agent_id}", data=data)
+
+    async def delete(self, tool_id: str) -> dict:
+        return await self._delete(f"/tools/{tool_id}")
+
+    async def upload_tools_artifact(self, tool_id: str, file_path: str) -> dict:
+        with open(file_path, "rb") as f:
+            return await self._post(f"/tools/{tool_id}/upload", files={"file": (f"{tool_id}.zip", f, "application/zip", {"Expires": "0"})})
+
+    async def get_draft_by_name(self, tool_name: str) -> List[dict]:
+        return await self.get_drafts_by_names([tool_name])
+
+    async def get_drafts_by_names(self, tool_names: List[str]) -> List[dict]:
+        return await self._get_chunked("/tools", "names", tool_names)
+
+    async def get_draft_by_id(self, tool_id: str) -> List[dict]:
+        if tool_id is None:
+            return ""
+        else:
+            try:
+                tool = await self._get(f"/tools/{tool_id}")
+                return tool
+            except ClientAPIException as e:
+                if e.response.status_code == 404 and "not found with the given name" in e.response.text:
+                    return ""
+                raise(e)
@@ -11,25 +11,88 @@ from ibm_watsonx_orchestrate.cli.config import (
     ENVIRONMENTS_SECTION_HEADER,
     ENV_WXO_URL_OPT
 )
-from threading import Lock
-from ibm_watsonx_orchestrate.client.base_api_client import BaseAPIClient
-from ibm_watsonx_orchestrate.utils.utils import yaml_safe_load
+from ibm_watsonx_orchestrate.utils import yaml_codec
 import logging
-from typing import TypeVar
+import threading
+from functools import lru_cache
+from typing import TYPE_CHECKING, TypeVar
 import os
-import jwt
 import time
 
+if TYPE_CHECKING:
+    # Only used in annotations, importing the API clients (requests, httpx) costs every CLI command that reads the config
+    from ibm_watsonx_orchestrate.client.base_api_client import BaseAPIClient
+    from ibm_watsonx_orchestrate.client.async_base_api_client import AsyncBaseAPIClient
+
 logger = logging.getLogger(__name__)
-LOCK = Lock()
-T = TypeVar("T", bound=BaseAPIClient)
+T = TypeVar("T", bound="BaseAPIClient | AsyncBaseAPIClient")
+
+# Parsed yaml files keyed by path, together with the (mtime, size, inode) they were parsed at.
+# Entries are replaced whole, never mutated, so readers need no lock.
+_FILE_SNAPSHOTS: dict[str, tuple[tuple, dict]] = {}
+
+# Clients handed out by instantiate_client, keyed by (client class, active_env, url). A new token for the
+# environment updates api_key on the existing client instead of creating another one
+_CLIENT_REGISTRY: dict[tuple, "BaseAPIClient | AsyncBaseAPIClient"] = {}
+_CLIENT_REGISTRY_LOCK = threading.Lock()
+
+
+def _load_yaml_snapshot(path: str) -> dict:
+    """
+    Returns the parsed content of a yaml file, re-parsing it only when it changed on disk since the last call.
+    The returned dict is shared and must not be modified
+    """
+    stat = os.stat(path)
+    version = (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+    cached = _FILE_SNAPSHOTS.get(path)
+    if cached is not None and cached[0] == version:
+        return cached[1]
+
+    with open(path, "r") as f:
+        content = yaml_codec.safe_load(f) or {}
+    _FILE_SNAPSHOTS[path] = (version, content)
+    return content
+
+
+def clear_config_snapshot() -> None:
+    """
+    Drops the cached config, credentials and token claims, the next read goes to disk
+    """
+    _FILE_SNAPSHOTS.clear()
+    _decode_token_claims.cache_clear()
+
+
+def get_config_snapshot() -> dict:
+    return _load_yaml_snapshot(os.path.join(DEFAULT_CONFIG_FILE_FOLDER, DEFAULT_CONFIG_FILE))
+
+
+def get_auth_config_snapshot() -> dict:
+    return _load_yaml_snapshot(os.path.join(AUTH_CONFIG_FILE_FOLDER, AUTH_CONFIG_FILE))
+
+
+@lru_cache(maxsize=32)
+def _decode_token_claims(token: str) -> dict | None:
+    # jwt pulls in cryptography, which is slow to import and not needed by commands that do not authenticate
+    import jwt
+
+    try:
+        return jwt.decode(token, options={"verify_signature": False})
+    except Exception:
+        return None
 
 
 def is_local_dev(url: str | None = None) -> bool:
     if url is None:
-        cfg = Config()
-        active_env = cfg.read(CONTEXT_SECTION_HEADER, CONTEXT_ACTIVE_ENV_OPT)
-        url = cfg.get(ENVIRONMENTS_SECTION_HEADER, active_env, ENV_WXO_URL_OPT)
+        try:
+            config = get_config_snapshot()
+        except FileNotFoundError:
+            # First command run on this machine, Config() writes the default config
+            Config(DEFAULT_CONFIG_FILE_FOLDER, DEFAULT_CONFIG_FILE)
+            config = get_config_snapshot()
+        active_env = config.get(CONTEXT_SECTION_HEADER, {}).get(CONTEXT_ACTIVE_ENV_OPT)
+        url = config.get(ENVIRONMENTS_SECTION_HEADER, {}).get(active_env, {}).get(ENV_WXO_URL_OPT)
+        if url is None:
+            raise KeyError(f"Failed to get data from config. No url for environment '{active_env}'")
 
     if url.startswith("http://localhost"):
         return True
@@ -45,51 +108,95 @@ def is_local_dev(url: str | None = None) -> bool:
 
     return False
 
-def check_token_validity(token: str) -> bool:
-    try:
-        token_claimset = jwt.decode(token, options={"verify_signature": False})
-        expiry = token_claimset.get('exp')
+def get_token_expiry(token: str) -> int | None:
+    """
+    Returns the exp claim of a JWT, None for tokens that cannot be decoded or never expire
+    """
+    if not isinstance(token, str):
+        return None
+    token_claimset = _decode_token_claims(token)
+    if token_claimset is None:
+        return None
+    return token_claimset.get('exp')
+
+
+def get_token_lifetime(token: str) -> int | None:
+    """
+    Returns how many seconds a JWT is valid for from its iat and exp claims, None when either is missing
+    """
+    if not isinstance(token, str):
+        return None
+    token_claimset = _decode_token_claims(token)
+    if token_claimset is None or not token_claimset.get('exp') or not token_claimset.get('iat'):
+        return None
+    return token_claimset['exp'] - token_claimset['iat']
+
 
-        current_timestamp = int(time.time())
-        # Check if the token is not expired (or will not be expired in 10 minutes)
-        if not expiry or current_timestamp < expiry - 600:
-            return True
+def check_token_validity(token: str) -> bool:
+    if not isinstance(token, str):
         return False
-    except:
+    token_claimset = _decode_token_claims(token)
+    if token_claimset is None:
         return False
+    expiry = token_claimset.get('exp')
+
+    current_timestamp = int(time.time())
+    # Check if the token is not expired (or will not be expired in 10 minutes)
+    if not expiry or current_timestamp < expiry - 600:
+        return True
+    return False
+
+
+def clear_client_registry() -> None:
+    """
+    Drops the shared clients, the next instantiate_client call builds new ones. Called when the active environment changes
+    """
+    with _CLIENT_REGISTRY_LOCK:
+        _CLIENT_REGISTRY.clear()
 
 
-def instantiate_client(client: type[T] , url: str | None=None) -> T:
+def instantiate_client(client: type[T] , url: str | None=None, shared: bool = True) -> T:
+    """
+    Returns a client for the active environment. Unless shared is False the same client is returned for every call
+    with the same client class, environment and url for the life of the process, it is handed the current token
+    """
     try:
-        with LOCK:
-            with open(os.path.join(DEFAULT_CONFIG_FILE_FOLDER, DEFAULT_CONFIG_FILE), "r") as f:
-                config = yaml_safe_load(f)
-            active_env = config.get(CONTEXT_SECTION_HEADER, {}).get(CONTEXT_ACTIVE_ENV_OPT)
-
-            if not url:
-                url = config.get(ENVIRONMENTS_SECTION_HEADER, {}).get(active_env, {}).get(ENV_WXO_URL_OPT)
-
-            with open(os.path.join(AUTH_CONFIG_FILE_FOLDER, AUTH_CONFIG_FILE), "r") as f:
-                auth_config = yaml_safe_load(f)
-            auth_settings = auth_config.get(AUTH_SECTION_HEADER, {}).get(active_env, {})
-
-            if not active_env:
-                logger.error("No active environment set. Use `orchestrate env activate` to activate an environment")
-                exit(1)
-            if not url:
-                logger.error(f"No URL found for environment '{active_env}'. Use `orchestrate env list` to view existing environments and `orchesrtate env add` to reset the URL")
-                exit(1)
-            if not auth_settings:
-                logger.error(f"No credentials found for active env '{active_env}'. Use `orchestrate env activate {active_env}` to refresh your credentials")
-                exit(1)
-            token = auth_settings.get(AUTH_MCSP_TOKEN_OPT)
-            if not check_token_validity(token):
-                logger.error(f"The token found for environment '{active_env}' is missing or expired. Use `orchestrate env activate {active_env}` to fetch a new one")
-                exit(1)
-            client_instance = client(base_url=url, api_key=token, is_local=is_local_dev(url))
-
-        return client_instance
+        config = get_config_snapshot()
+        active_env = config.get(CONTEXT_SECTION_HEADER, {}).get(CONTEXT_ACTIVE_ENV_OPT)
+
+        if not url:
+            url = config.get(ENVIRONMENTS_SECTION_HEADER, {}).get(active_env, {}).get(ENV_WXO_URL_OPT)
+
+        auth_config = get_auth_config_snapshot()
+        auth_settings = auth_config.get(AUTH_SECTION_HEADER, {}).get(active_env, {})
+
+        if not active_env:
+            logger.error("No active environment set. Use `orchestrate env activate` to activate an environment")
+            exit(1)
+        if not url:
+            logger.error(f"No URL found for environment '{active_env}'. Use `orchestrate env list` to view existing environments and `orchesrtate env add` to reset the URL")
+            exit(1)
+        if not auth_settings:
+            logger.error(f"No credentials found for active env '{active_env}'. Use `orchestrate env activate {active_env}` to refresh your credentials")
+            exit(1)
+        token = auth_settings.get(AUTH_MCSP_TOKEN_OPT)
+        if not check_token_validity(token):
+            logger.error(f"The token found for environment '{active_env}' is missing or expired. Use `orchestrate env activate {active_env}` to fetch a new one")
+            exit(1)
+
+        if not shared:
+            return client(base_url=url, api_key=token, is_local=is_local_dev(url))
+
+        key = (client, active_env, url)
+        with _CLIENT_REGISTRY_LOCK:
+            instance = _CLIENT_REGISTRY.get(key)
+            if instance is None:
+                instance = _CLIENT_REGISTRY[key] = client(base_url=url, api_key=token, is_local=is_local_dev(url))
+            elif instance.api_key != token:
+                # The token was refreshed, requests already sent keep the token they were sent with
+                instance.api_key = token
+            return instance
     except FileNotFoundError as e:
         message = "No active environment found. Please run `orchestrate env activate` to activate an environment"
         logger.error(message)
-        raise FileNotFoundError(message)
\ No newline at end of file
+        raise FileNotFoundError(message)
@@ -0,0 +1,95 @@
+import os
+import tempfile
+import threading
+from contextlib import contextmanager
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+# Serialises threads of this process, the advisory lock only serialises processes
+_THREAD_LOCKS: dict[str, threading.RLock] = {}
+_THREAD_LOCKS_LOCK = threading.Lock()
+# Nesting depth of each path locked by this process, only the outermost block takes the advisory lock
+_LOCK_DEPTHS: dict[str, int] = {}
+
+
+def _get_thread_lock(path: str) -> threading.RLock:
+    with _THREAD_LOCKS_LOCK:
+        lock = _THREAD_LOCKS.get(path)
+        if lock is None:
+            lock = _THREAD_LOCKS[path] = threading.RLock()
+        return lock
+
+
+@contextmanager
+def _advisory_lock(path: str):
+    fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o600)
+    try:
+        if fcntl is not None:
+            fcntl.flock(fd, fcntl.LOCK_EX)
+        else:
+            msvcrt.locking(fd, msvcrt.LK_LOCK, 1)
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(fd, fcntl.LOCK_UN)
+            else:
+                os.lseek(fd, 0, os.SEEK_SET)
+                msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+    finally:
+        os.close(fd)
+
+
+@contextmanager
+def file_lock(path: str):
+    """
+    Holds an exclusive advisory lock on path (created if missing) for the duration of the block, blocking
+    until every other thread and process holding it has released it. Blocks can be nested within a thread
+    """
+    path = os.path.abspath(path)
+    with _get_thread_lock(path):
+        depth = _LOCK_DEPTHS.get(path, 0)
+        _LOCK_DEPTHS[path] = depth + 1
+        try:
+            if depth:
+                yield
+            else:
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                with _advisory_lock(path):
+                    yield
+        finally:
+            _LOCK_DEPTHS[path] = depth
+
+
+def atomic_write(path: str, content: str | bytes, mode: int | None = None) -> None:
+    """
+    Replaces the content of path so that readers see either the old or the new file, never a partial write.
+    The permissions of an existing file are kept unless mode is given, new files are only accessible by their owner
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    if mode is None:
+        try:
+            mode = os.stat(path).st_mode & 0o777
+        except FileNotFoundError:
+            mode = None
+
+    fd, temp_path = tempfile.mkstemp(dir=directory, prefix=f".{os.path.basename(path)}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb" if isinstance(content, bytes) else "w") as temp_file:
+            temp_file.write(content)
+            temp_file.flush()
+            os.fsync(temp_file.fileno())
+        if mode is not None:
+            os.chmod(temp_path, mode)
+        os.replace(temp_path, path)
+    except BaseException:
+        try:
+            os.unlink(temp_path)
+        except FileNotFoundError:
+            pass
+        raise
@@ -0,0 +1,93 @@
+import importlib.util
+import json
+import os
+import sys
+from typing import Any, Protocol
+
+ORJSON_AVAILABLE = importlib.util.find_spec("orjson") is not None
+
+# Set to "json" to force the standard library codec even when orjson is installed
+JSON_CODEC_ENV_VAR = "WXO_JSON_CODEC"
+
+
+class JsonCodec(Protocol):
+    name: str
+
+    def dumps(self, obj: Any, indent: bool = False) -> bytes:
+        ...
+
+    def loads(self, data: bytes | str) -> Any:
+        ...
+
+
+class StdlibJsonCodec:
+    name = "json"
+
+    def dumps(self, obj: Any, indent: bool = False) -> bytes:
+        if indent:
+            return json.dumps(obj, indent=2, ensure_ascii=False).encode()
+        return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode()
+
+    def loads(self, data: bytes | str) -> Any:
+        return json.loads(data)
+
+
+class OrjsonCodec:
+    name = "orjson"
+
+    def __init__(self):
+        import orjson
+        self._orjson = orjson
+
+    def dumps(self, obj: Any, indent: bool = False) -> bytes:
+        option = self._orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= self._orjson.OPT_INDENT_2
+        return self._orjson.dumps(obj, option=option)
+
+    def loads(self, data: bytes | str) -> Any:
+        return self._orjson.loads(data)
+
+
+def _get_default_codec() -> JsonCodec:
+    if ORJSON_AVAILABLE and os.environ.get(JSON_CODEC_ENV_VAR, "").lower() != "json":
+        return OrjsonCodec()
+    return StdlibJsonCodec()
+
+
+_CODEC: JsonCodec = _get_default_codec()
+
+
+def get_json_codec() -> JsonCodec:
+    return _CODEC
+
+
+def set_json_codec(codec: JsonCodec | None) -> None:
+    """
+    Replaces the codec used for request and response bodies, None restores the default
+    """
+    global _CODEC
+    _CODEC = codec if codec is not None else _get_default_codec()
+
+
+def dumps(obj: Any, indent: bool = False) -> bytes:
+    return _CODEC.dumps(obj, indent=indent)
+
+
+def loads(data: bytes | str) -> Any:
+    return _CODEC.loads(data)
+
+
+def print_json(obj: Any) -> None:
+    """
+    Prints obj as indented JSON. A terminal gets rich's highlighting, redirected output gets the encoded bytes as is
+    """
+    if sys.stdout.isatty():
+        import rich
+        import rich.json
+        rich.print(rich.json.JSON.from_data(obj, indent=2))
+        return
+
+    sys.stdout.flush()
+    sys.stdout.buffer.write(dumps(obj, indent=True) + b"\n")
+    sys.stdout.buffer.flush()
@@ -1,9 +1,9 @@
 import logging
-import logging.config
-from importlib import resources
-import yaml
+import threading
 from enum import Enum
 
+PACKAGE_LOGGER_NAME = "ibm_watsonx_orchestrate"
+
 class LogColors(str, Enum):
     INFO = "\033[0;36m" #cyan
     DEBUG = "\033[0;35m" #magenta
@@ -12,15 +12,63 @@ class LogColors(str, Enum):
     RESET = "\033[0;0m"
 
 
+def add_level_colors():
+    # The names are spelled out so that adding them again does not wrap the colored names once more
+    for level, color in ((logging.INFO, LogColors.INFO), (logging.DEBUG, LogColors.DEBUG),
+                         (logging.WARNING, LogColors.WARNING), (logging.ERROR, LogColors.ERROR)):
+        logging.addLevelName(level, color + f"[{color.name}]" + LogColors.RESET)
+
+
 def setup_logging():
+    import logging.config
+    from importlib import resources
+    from ibm_watsonx_orchestrate.utils import yaml_codec
+
     config_file = str(resources.files("ibm_watsonx_orchestrate.utils.logging").joinpath("logging.yaml"))
     with open(config_file, "r") as f:
-        config = yaml.safe_load(f)
+        config = yaml_codec.safe_load(f)
     
     logging.config.dictConfig(config)
 
     # Add log colors
-    logging.addLevelName( logging.INFO, LogColors.INFO + f"[{logging.getLevelName(logging.INFO)}]" + LogColors.RESET)
-    logging.addLevelName( logging.DEBUG, LogColors.DEBUG + f"[{logging.getLevelName(logging.DEBUG)}]" + LogColors.RESET)
-    logging.addLevelName( logging.WARNING, LogColors.WARNING + f"[{logging.getLevelName(logging.WARNING)}]" + LogColors.RESET)
-    logging.addLevelName( logging.ERROR, LogColors.ERROR + f"[{logging.getLevelName(logging.ERROR)}]" + LogColors.RESET)
\ No newline at end of file
+    add_level_colors()
+
+
+class _LazySetupHandler(logging.Handler):
+    """
+    Placeholder handler of the package logger that runs setup_logging when the first record is logged,
+    then hands that record to the handlers it configured
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._setup_lock = threading.Lock()
+
+    def handle(self, record: logging.LogRecord) -> bool:
+        logger = logging.getLogger(PACKAGE_LOGGER_NAME)
+        with self._setup_lock:
+            if self in logger.handlers:
+                setup_logging()
+                logger.removeHandler(self)
+        if not logger.isEnabledFor(record.levelno):
+            return False
+        for handler in logger.handlers:
+            if record.levelno >= handler.level:
+                handler.handle(record)
+        return True
+
+    def emit(self, record: logging.LogRecord) -> None:
+        pass
+
+
+def setup_logging_lazily():
+    """
+    Defers setup_logging, and the parsing of its config file, until the package first logs something
+    """
+    # Records take their level name when they are created, before the placeholder handler sees the first one
+    add_level_colors()
+    logger = logging.getLogger(PACKAGE_LOGGER_NAME)
+    if not logger.handlers:
+        # Let records of every level reach the placeholder, as they will reach the configured handlers
+        logger.setLevel(logging.DEBUG)
+        logger.addHandler(_LazySetupHandler())
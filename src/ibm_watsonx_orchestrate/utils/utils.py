@@ -1,15 +1,71 @@
+import copy
 import re
+from itertools import islice
 
-import yaml
-from typing import BinaryIO
+from typing import Any, Iterable, Iterator, List
 
-# disables the automatic conversion of date-time objects to datetime objects and leaves them as strings
-yaml.constructor.SafeConstructor.yaml_constructors[u'tag:yaml.org,2002:timestamp'] = \
-    yaml.constructor.SafeConstructor.yaml_constructors[u'tag:yaml.org,2002:str']
-
-def yaml_safe_load(file : BinaryIO) -> dict:
-    return yaml.safe_load(file)
+# Rows of a listing printed together, later blocks keep the column widths of the first one
+DEFAULT_TABLE_BLOCK_SIZE = 100
 
 def sanatize_app_id(app_id: str) -> str:
     sanatize_pattern = re.compile(r"[^a-zA-Z0-9]+")
-    return re.sub(sanatize_pattern,'_', app_id) 
\ No newline at end of file
+    return re.sub(sanatize_pattern,'_', app_id) 
+
+def batched(iterable: Iterable, size: int) -> Iterator[List]:
+    iterator = iter(iterable)
+    while batch := list(islice(iterator, size)):
+        yield batch
+
+
+class TablePrinter:
+    """
+    Prints the rows added to a rich table in blocks of block_size rows, so a long listing starts showing while its
+    rows are still being received. The first block carries the table's title and header, later blocks continue it
+    with the column widths of the first block, wrapping longer values.
+    """
+
+    def __init__(self, table: Any, block_size: int = DEFAULT_TABLE_BLOCK_SIZE):
+        # The table is expected to have its columns but no rows yet
+        self._continuation = copy.deepcopy(table)
+        self._continuation.show_header = False
+        self._continuation.title = None
+        if table.box is not None:
+            # Without a header the heavy top border of the default box would look like one
+            self._continuation.box = table.box.get_plain_headed_box()
+        self._table = table
+        self._block_size = block_size
+        self._rows = 0
+        self._printed = False
+
+    def add_row(self, *values: Any) -> None:
+        self._table.add_row(*values)
+        self._rows += 1
+        if self._rows >= self._block_size:
+            self.flush()
+
+    def flush(self) -> None:
+        """
+        Prints the rows added since the last flush, an empty table is still printed if nothing was printed yet
+        """
+        import rich
+
+        if self._rows == 0 and self._printed:
+            return
+        if not self._printed:
+            self._fix_column_widths()
+        rich.print(self._table)
+        self._table = copy.deepcopy(self._continuation)
+        self._rows = 0
+        self._printed = True
+
+    def _fix_column_widths(self) -> None:
+        from rich import get_console
+        from rich.measure import Measurement
+
+        console = get_console()
+        for column, continued in zip(self._table.columns, self._continuation.columns):
+            if column.width is None:
+                cells = [column.header, *column.cells]
+                column.width = continued.width = max(
+                    Measurement.get(console, console.options, cell).maximum for cell in cells
+                )
@@ -0,0 +1,40 @@
+from typing import Any, IO, Iterator
+
+import yaml
+import yaml.constructor
+
+# libyaml's C parser and emitter are much faster than the pure Python ones on large specs
+LIBYAML_AVAILABLE = getattr(yaml, "__with_libyaml__", False)
+
+_BaseSafeLoader = yaml.CSafeLoader if LIBYAML_AVAILABLE else yaml.SafeLoader
+SafeDumper = yaml.CSafeDumper if LIBYAML_AVAILABLE else yaml.SafeDumper
+Dumper = yaml.CDumper if LIBYAML_AVAILABLE else yaml.Dumper
+
+
+class SafeLoader(_BaseSafeLoader):
+    pass
+
+
+# disables the automatic conversion of date-time objects to datetime objects and leaves them as strings
+SafeLoader.add_constructor(u'tag:yaml.org,2002:timestamp', yaml.constructor.SafeConstructor.construct_yaml_str)
+
+
+def safe_load(stream: str | bytes | IO) -> Any:
+    return yaml.load(stream, Loader=SafeLoader)
+
+
+def parse(stream: str | bytes | IO) -> Iterator[yaml.Event]:
+    """
+    The parser events of stream, without composing the document, for reading large documents in constant memory
+    """
+    return yaml.parse(stream, Loader=SafeLoader)
+
+
+def dump(data: Any, stream: IO | None = None, **kwargs) -> str | None:
+    kwargs.setdefault("Dumper", Dumper)
+    return yaml.dump(data, stream, **kwargs)
+
+
+def safe_dump(data: Any, stream: IO | None = None, **kwargs) -> str | None:
+    kwargs.setdefault("Dumper", SafeDumper)
+    return yaml.dump(data, stream, **kwargs)
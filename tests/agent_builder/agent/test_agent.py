@@ -130,7 +130,7 @@ class TestAgentString:
 
 class TestAgentFromSpec:
     def test_native_agent_from_spec_yaml(self, valid_native_agent_sample):
-        with patch("ibm_watsonx_orchestrate.agent_builder.agents.agent.yaml_safe_load") as mock_loader, \
+        with patch("ibm_watsonx_orchestrate.agent_builder.agents.agent.yaml_codec.safe_load") as mock_loader, \
             patch("builtins.open", mock_open()) as mock_file:
             native_spec_definition = valid_native_agent_sample
             mock_loader.return_value = native_spec_definition
@@ -179,7 +179,7 @@ class TestAgentFromSpec:
                 assert "file must end in .json, .yaml, or .yml" in str(e)
 
     def test_native_agent_from_spec_no_spec_version(self, valid_native_agent_sample):
-        with patch("ibm_watsonx_orchestrate.agent_builder.agents.agent.yaml_safe_load") as mock_loader, \
+        with patch("ibm_watsonx_orchestrate.agent_builder.agents.agent.yaml_codec.safe_load") as mock_loader, \
             patch("builtins.open", mock_open()) as mock_file:
             native_spec_definition = valid_native_agent_sample
             native_spec_definition.pop("spec_version", None)
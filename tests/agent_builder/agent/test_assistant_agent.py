@@ -127,7 +127,7 @@
 
 # class TestExternalAgentFromSpec:
 #     def test_assistant_agent_from_spec_yaml(self, valid_assistant_agent_sample):
-#         with patch("ibm_watsonx_orchestrate.agent_builder.agents.assistant_agent.yaml_safe_load") as mock_loader, \
+#         with patch("ibm_watsonx_orchestrate.agent_builder.agents.assistant_agent.yaml_codec.safe_load") as mock_loader, \
 #             patch("builtins.open", mock_open()) as mock_file:
 #             assistant_spec_definition = valid_assistant_agent_sample
 #             mock_loader.return_value = assistant_spec_definition
@@ -176,7 +176,7 @@
 #                 assert "file must end in .json, .yaml, or .yml" in str(e)
 
 #     def test_assistant_agent_from_spec_no_spec_version(self, valid_assistant_agent_sample):
-#         with patch("ibm_watsonx_orchestrate.agent_builder.agents.assistant_agent.yaml_safe_load") as mock_loader, \
+#         with patch("ibm_watsonx_orchestrate.agent_builder.agents.assistant_agent.yaml_codec.safe_load") as mock_loader, \
 #             patch("builtins.open", mock_open()) as mock_file:
 #             assistant_spec_definition = valid_assistant_agent_sample
 #             assistant_spec_definition.pop("spec_version", None)
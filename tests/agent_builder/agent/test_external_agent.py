@@ -134,7 +134,7 @@
 
 # class TestExternalAgentFromSpec:
 #     def test_external_agent_from_spec_yaml(self, valid_external_agent_sample):
-#         with patch("ibm_watsonx_orchestrate.agent_builder.agents.external_agent.yaml_safe_load") as mock_loader, \
+#         with patch("ibm_watsonx_orchestrate.agent_builder.agents.external_agent.yaml_codec.safe_load") as mock_loader, \
 #             patch("builtins.open", mock_open()) as mock_file:
 #             external_spec_definition = valid_external_agent_sample
 #             mock_loader.return_value = external_spec_definition
@@ -187,7 +187,7 @@
 #                 assert "file must end in .json, .yaml, or .yml" in str(e)
 
 #     def test_external_agent_from_spec_no_spec_version(self, valid_external_agent_sample):
-#         with patch("ibm_watsonx_orchestrate.agent_builder.agents.external_agent.yaml_safe_load") as mock_loader, \
+#         with patch("ibm_watsonx_orchestrate.agent_builder.agents.external_agent.yaml_codec.safe_load") as mock_loader, \
 #             patch("builtins.open", mock_open()) as mock_file:
 #             external_spec_definition = valid_external_agent_sample
 #             external_spec_definition.pop("spec_version", None)
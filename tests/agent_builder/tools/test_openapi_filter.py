@@ -0,0 +1,74 @@
+import pytest
+
+from ibm_watsonx_orchestrate.agent_builder.tools.openapi_filter import OpenAPIOperationFilter
+
+OPERATION = {'operationId': 'listPets', 'tags': ['pets', 'public']}
+
+
+def test_from_options():
+    operation_filter = OpenAPIOperationFilter.from_options(
+        include=['tag=pets', 'path=/pets/*', 'Method=GET'],
+        exclude=['operation-id= ^delete ', 'tag=admin']
+    )
+
+    assert operation_filter == OpenAPIOperationFilter(
+        include_tags=['pets'],
+        include_paths=['/pets/*'],
+        include_methods=['GET'],
+        exclude_operation_ids=['^delete'],
+        exclude_tags=['admin']
+    )
+
+
+def test_from_options_without_options():
+    assert OpenAPIOperationFilter.from_options() is None
+    assert OpenAPIOperationFilter.from_options(include=[], exclude=[]) is None
+
+
+@pytest.mark.parametrize('option', ['pets', 'label=pets', 'tag=', '=pets'])
+def test_from_options_invalid(option):
+    with pytest.raises(ValueError) as e:
+        OpenAPIOperationFilter.from_options(include=[option])
+
+    assert f"Invalid include filter '{option}'" in str(e.value)
+
+
+def test_invalid_operation_id_pattern():
+    with pytest.raises(ValueError) as e:
+        OpenAPIOperationFilter(include_operation_ids=['list('])
+
+    assert "Invalid operation id pattern 'list('" in str(e.value)
+
+
+@pytest.mark.parametrize(
+    ('operation_filter', 'expected'),
+    [
+        (OpenAPIOperationFilter(), True),
+        (OpenAPIOperationFilter(include_tags=['admin', 'pets']), True),
+        (OpenAPIOperationFilter(include_tags=['admin']), False),
+        (OpenAPIOperationFilter(exclude_tags=['public']), False),
+        (OpenAPIOperationFilter(include_paths=['/pets/*']), True),
+        (OpenAPIOperationFilter(include_paths=['/pets']), False),
+        (OpenAPIOperationFilter(exclude_paths=['/pets/{id}/*']), False),
+        (OpenAPIOperationFilter(include_operation_ids=['^list']), True),
+        (OpenAPIOperationFilter(include_operation_ids=['^Pets']), False),
+        (OpenAPIOperationFilter(exclude_operation_ids=['Pets$']), False),
+        (OpenAPIOperationFilter(include_methods=['post', 'GET']), True),
+        (OpenAPIOperationFilter(exclude_methods=['Get']), False),
+        (OpenAPIOperationFilter(include_tags=['pets'], include_methods=['post']), False),
+    ]
+)
+def test_matches(operation_filter, expected):
+    assert operation_filter.matches('/pets/{id}/toys', 'get', OPERATION) == expected
+
+
+def test_matches_operation_without_tags_or_operation_id():
+    assert not OpenAPIOperationFilter(include_tags=['pets']).matches('/pets', 'get', {})
+    assert not OpenAPIOperationFilter(include_operation_ids=['.*']).matches('/pets', 'get', None)
+    assert OpenAPIOperationFilter(exclude_tags=['pets']).matches('/pets', 'get', {})
+
+
+def test_needs_operation():
+    assert not OpenAPIOperationFilter(include_paths=['/pets'], exclude_methods=['delete']).needs_operation
+    assert OpenAPIOperationFilter(exclude_tags=['admin']).needs_operation
+    assert OpenAPIOperationFilter(include_operation_ids=['^list']).needs_operation
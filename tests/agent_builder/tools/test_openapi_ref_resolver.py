@@ -0,0 +1,212 @@
+import json
+
+import pytest
+
+from ibm_watsonx_orchestrate.agent_builder.tools import create_openapi_json_tool, create_openapi_json_tools
+from ibm_watsonx_orchestrate.agent_builder.tools.openapi_ref_resolver import OpenAPIRefResolver, SchemaRefInliner, \
+    get_json_pointer
+
+
+def get_spec(schemas: dict, schema_name: str, parameters: list = None) -> dict:
+    return {
+        'openapi': '3.0.3',
+        'info': {},
+        'servers': [{'url': 'https://example.com'}],
+        'components': {
+            'schemas': schemas,
+            'parameters': {'Id': {'name': 'id', 'in': 'path', 'required': True, 'schema': {'type': 'string'}}}
+        },
+        'paths': {
+            '/things/{id}': {
+                'put': {
+                    'operationId': 'updateThing',
+                    'description': 'Updates a thing',
+                    'parameters': parameters or [{'$ref': '#/components/parameters/Id'}],
+                    'requestBody': {'content': {'application/json': {
+                        'schema': {'$ref': f'#/components/schemas/{schema_name}'}}}},
+                    'responses': {'200': {'description': 'The thing', 'content': {'application/json': {
+                        'schema': {'$ref': f'#/components/schemas/{schema_name}'}}}}}
+                }
+            }
+        }
+    }
+
+
+def get_tool_spec(spec: dict, **kwargs) -> dict:
+    tool = create_openapi_json_tool(spec, http_path='/things/{id}', http_method='PUT', **kwargs)
+    return json.loads(tool.dumps_spec())
+
+
+def test_recursive_schema():
+    spec = get_spec({
+        'Node': {
+            'type': 'object',
+            'properties': {
+                'name': {'type': 'string'},
+                'children': {'type': 'array', 'items': {'$ref': '#/components/schemas/Node'}}
+            }
+        }
+    }, 'Node')
+
+    tool_spec = get_tool_spec(spec)
+
+    request_body = tool_spec['input_schema']['properties']['__requestBody__']
+    assert request_body['properties']['children']['items'] == {'$ref': '#/$defs/Node'}
+    assert tool_spec['input_schema']['$defs']['Node']['properties']['children']['items'] == {'$ref': '#/$defs/Node'}
+    assert tool_spec['output_schema']['properties']['children']['items'] == {'$ref': '#/$defs/Node'}
+    assert list(tool_spec['output_schema']['$defs']) == ['Node']
+
+
+def test_mutually_recursive_schemas():
+    spec = get_spec({
+        'Employee': {'type': 'object', 'properties': {'manager': {'$ref': '#/components/schemas/Manager'}}},
+        'Manager': {'type': 'object', 'properties': {'reports': {
+            'type': 'array', 'items': {'$ref': '#/components/schemas/Employee'}}}},
+    }, 'Employee')
+
+    tool_spec = get_tool_spec(spec)
+
+    output_schema = tool_spec['output_schema']
+    assert output_schema['properties']['manager']['properties']['reports']['items'] == {'$ref': '#/$defs/Employee'}
+    assert output_schema['$defs']['Employee']['properties']['manager']['properties']['reports']['items'] == \
+        {'$ref': '#/$defs/Employee'}
+
+
+def test_acyclic_schemas_are_inlined():
+    spec = get_spec({
+        'Thing': {'type': 'object', 'properties': {'owner': {'$ref': '#/components/schemas/Owner'}}},
+        'Owner': {'type': 'object', 'properties': {'name': {'type': 'string'}}},
+    }, 'Thing')
+
+    tool_spec = get_tool_spec(spec)
+
+    assert tool_spec['output_schema']['properties']['owner'] == {
+        'type': 'object', 'properties': {'name': {'type': 'string'}}}
+    assert '$defs' not in tool_spec['input_schema']
+    assert '$defs' not in tool_spec['output_schema']
+
+
+def test_inlines_up_to_max_inline_depth():
+    spec = get_spec({
+        'A': {'type': 'object', 'properties': {'b': {'$ref': '#/components/schemas/B'}}},
+        'B': {'type': 'object', 'properties': {'c': {'$ref': '#/components/schemas/C'}}},
+        'C': {'type': 'object', 'properties': {'value': {'type': 'string'}}},
+    }, 'A')
+
+    tool_spec = get_tool_spec(spec, max_inline_depth=2)
+
+    output_schema = tool_spec['output_schema']
+    assert output_schema['properties']['b']['properties']['c'] == {'$ref': '#/$defs/C'}
+    assert output_schema['$defs'] == {'C': {'type': 'object', 'properties': {'value': {'type': 'string'}}}}
+
+
+def test_max_inline_depth_of_zero_keeps_every_schema_ref():
+    spec = get_spec({'Thing': {'type': 'object', 'properties': {'id': {'type': 'string'}}}}, 'Thing')
+
+    tool_spec = get_tool_spec(spec, max_inline_depth=0)
+
+    assert tool_spec['output_schema']['$ref'] == '#/$defs/Thing'
+    assert tool_spec['output_schema']['$defs'] == {'Thing': {'type': 'object', 'properties': {'id': {'type': 'string'}}}}
+
+
+def test_wide_recursive_schemas_convert_in_bounded_size():
+    # Every schema refers to the next 3, fully inlining them would take 3^40 copies
+    schemas = {
+        f'S{i}': {'type': 'object', 'properties': {
+            f'p{j}': {'$ref': f'#/components/schemas/S{(i + j) % 40}'} for j in range(1, 4)}}
+        for i in range(40)
+    }
+    spec = get_spec(schemas, 'S0')
+
+    tools = create_openapi_json_tools(spec, max_workers=1, max_inline_depth=3)
+
+    assert len(tools[0].dumps_spec()) < 5_000_000
+    assert len(json.loads(tools[0].dumps_spec())['output_schema']['$defs']) == 40
+
+
+def test_widely_shared_schemas_convert_in_bounded_size():
+    # Every level refers to the next one 10 times, inlining each use would take 10^6 copies of the last level
+    schemas = {
+        f'L{i}': {'type': 'object', 'properties': {
+            f'p{j}': {'$ref': f'#/components/schemas/L{i + 1}'} for j in range(10)}}
+        for i in range(6)
+    }
+    schemas['L6'] = {'type': 'object', 'properties': {'value': {'type': 'string'}}}
+    spec = get_spec(schemas, 'L0')
+
+    tool_spec = get_tool_spec(spec, max_inline_depth=10)
+
+    output_schema = tool_spec['output_schema']
+    assert len(json.dumps(tool_spec)) < 1_000_000
+    assert output_schema['properties']['p0']['properties']['p0']['type'] == 'object'
+    assert output_schema['$defs']
+
+
+def test_shared_scalar_parameter_schemas_stay_inline():
+    spec = get_spec({'Id': {'type': 'string'}, 'Thing': {'type': 'object'}}, 'Thing', parameters=[
+        {'name': 'p1', 'in': 'query', 'schema': {'$ref': '#/components/schemas/Id'}},
+        {'name': 'p2', 'in': 'query', 'schema': {'$ref': '#/components/schemas/Id'}},
+    ])
+
+    tool_spec = get_tool_spec(spec)
+
+    input_schema = tool_spec['input_schema']
+    for name in ('p1', 'p2'):
+        assert input_schema['properties'][f'query_{name}']['type'] == 'string'
+        assert input_schema['properties'][f'query_{name}']['title'] == name
+        assert '$ref' not in input_schema['properties'][f'query_{name}']
+    assert '$defs' not in input_schema
+
+
+def test_resolve_document_keeps_schema_refs():
+    schemas = {'Thing': {'type': 'object', 'properties': {'self': {'$ref': '#/components/schemas/Thing'}}}}
+    spec = get_spec(schemas, 'Thing')
+
+    resolved = OpenAPIRefResolver(spec).resolve_document()
+
+    operation = resolved['paths']['/things/{id}']['put']
+    assert operation['parameters'] == [spec['components']['parameters']['Id']]
+    assert operation['responses']['200']['content']['application/json']['schema'] == \
+        {'$ref': '#/components/schemas/Thing'}
+    assert resolved['components']['schemas'] == schemas
+
+
+def test_resolve_document_rejects_circular_non_schema_refs():
+    spec = get_spec({}, 'Thing', parameters=[{'$ref': '#/components/parameters/Loop'}])
+    spec['components']['parameters']['Loop'] = {'$ref': '#/components/parameters/Loop'}
+
+    with pytest.raises(ValueError) as e:
+        OpenAPIRefResolver(spec).resolve_document()
+
+    assert '#/components/parameters/Loop' in str(e.value)
+
+
+def test_def_names_are_unique():
+    document = {'a': {'Thing': {'type': 'string'}}, 'b': {'Thing': {'type': 'integer'}}}
+    inliner = SchemaRefInliner(document, max_inline_depth=0)
+
+    schema = inliner.inline({'anyOf': [{'$ref': '#/a/Thing'}, {'$ref': '#/b/Thing'}]})
+
+    assert schema == {'anyOf': [{'$ref': '#/$defs/Thing'}, {'$ref': '#/$defs/Thing_2'}]}
+    assert inliner.get_defs() == {'Thing': {'type': 'string'}, 'Thing_2': {'type': 'integer'}}
+
+
+@pytest.mark.parametrize(
+    ('ref', 'expected'),
+    [
+        ('#/paths/~1things~1{id}/get', 'operation'),
+        ('#/paths/%7E1things%7E1%7Bid%7D/get', 'operation'),
+        ('#/tags/0', 'tag'),
+    ]
+)
+def test_get_json_pointer(ref, expected):
+    document = {'paths': {'/things/{id}': {'get': 'operation'}}, 'tags': ['tag']}
+
+    assert get_json_pointer(document, ref) == expected
+
+
+def test_get_json_pointer_invalid_ref():
+    with pytest.raises(ValueError) as e:
+        get_json_pointer({'components': {}}, '#/components/schemas/Missing')
+
+    assert 'could not resolve $ref #/components/schemas/Missing' in str(e.value)
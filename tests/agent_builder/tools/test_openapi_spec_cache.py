@@ -0,0 +1,187 @@
+import asyncio
+import json
+import os
+
+import httpx
+import pytest
+
+from ibm_watsonx_orchestrate.agent_builder.tools import openapi_tool
+from ibm_watsonx_orchestrate.agent_builder.tools.openapi_ref_resolver import OpenAPIRefResolver
+from ibm_watsonx_orchestrate.agent_builder.tools.openapi_spec_cache import OpenAPISpecCache, get_content_hash, \
+    get_max_age, OPENAPI_SPEC_CACHE_ENV_VAR
+
+SPEC_URL = "https://example.com/openapi.json"
+
+SPEC = {
+    "openapi": "3.0.3",
+    "info": {"title": "Things", "version": "1.0.0"},
+    "servers": [{"url": "https://example.com"}],
+    "components": {"schemas": {"Thing": {"type": "object", "properties": {"id": {"type": "string"}}}}},
+    "paths": {
+        "/things": {
+            "get": {
+                "operationId": "listThings",
+                "description": "Lists things",
+                "responses": {"200": {"description": "Things", "content": {
+                    "application/json": {"schema": {"$ref": "#/components/schemas/Thing"}}}}}
+            }
+        }
+    }
+}
+
+
+class MockServer:
+    def __init__(self, spec: dict = SPEC, headers: dict = None):
+        self.content = json.dumps(spec).encode()
+        self.headers = {"ETag": '"v1"', **(headers or {})}
+        self.requests = []
+        self.offline = False
+
+    def handle(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        if self.offline:
+            raise httpx.ConnectError("Connection refused", request=request)
+        if request.headers.get("If-None-Match") == self.headers.get("ETag"):
+            return httpx.Response(304, headers=self.headers)
+        return httpx.Response(200, content=self.content, headers=self.headers)
+
+
+@pytest.fixture
+def cache(tmp_path, mocker):
+    cache = OpenAPISpecCache(str(tmp_path))
+    mocker.patch.object(openapi_tool, "_get_openapi_spec_cache", return_value=cache)
+    return cache
+
+
+@pytest.fixture
+def server(mocker):
+    server = MockServer()
+    async_client = httpx.AsyncClient
+    client_kwargs = []
+
+    def get_client(**kwargs):
+        client_kwargs.append(kwargs)
+        return async_client(transport=httpx.MockTransport(server.handle), **kwargs)
+
+    mocker.patch("httpx.AsyncClient", side_effect=get_client)
+    server.client_kwargs = client_kwargs
+    return server
+
+
+def import_tools(uri: str = SPEC_URL):
+    tools = asyncio.run(openapi_tool.create_openapi_json_tools_from_uri(uri))
+    return [json.loads(tool.dumps_spec()) for tool in tools]
+
+
+class TestOpenAPISpecCache:
+
+    def test_fetch_stores_spec_with_validators(self, cache, server):
+        tools = import_tools()
+
+        entry = cache.get_entry(SPEC_URL)
+        assert [tool["name"] for tool in tools] == ["listThings"]
+        assert entry.etag == '"v1"'
+        assert cache.get_content(entry.content_hash) == server.content
+        assert cache.get_resolved(entry.content_hash) is not None
+        assert server.client_kwargs[0]["timeout"] == openapi_tool.DEFAULT_SPEC_FETCH_TIMEOUT
+
+    def test_reimport_revalidates_and_reuses_resolved_spec(self, cache, server, mocker):
+        first = import_tools()
+        resolve_document = mocker.patch.object(OpenAPIRefResolver, "resolve_document")
+
+        second = import_tools()
+
+        assert second == first
+        assert server.requests[-1].headers["If-None-Match"] == '"v1"'
+        resolve_document.assert_not_called()
+
+    def test_fresh_spec_is_not_requested(self, cache, server):
+        server.headers["Cache-Control"] = "max-age=3600"
+        import_tools()
+
+        import_tools()
+
+        assert len(server.requests) == 1
+
+    def test_offline_uses_cached_spec(self, cache, server):
+        first = import_tools()
+        server.offline = True
+
+        assert import_tools() == first
+
+    def test_offline_without_cached_spec(self, cache, server):
+        server.offline = True
+
+        with pytest.raises(ValueError) as e:
+            import_tools()
+
+        assert "Failed to fetch an openapi spec" in str(e.value)
+
+    def test_changed_spec_replaces_cached_one(self, cache, server):
+        import_tools()
+        previous = cache.get_entry(SPEC_URL)
+        spec = json.loads(server.content)
+        spec["paths"]["/things"]["get"]["description"] = "Lists all things"
+        server.content = json.dumps(spec).encode()
+        server.headers["ETag"] = '"v2"'
+
+        tools = import_tools()
+
+        entry = cache.get_entry(SPEC_URL)
+        assert tools[0]["description"] == "Lists all things"
+        assert entry.etag == '"v2"'
+        assert cache.get_content(previous.content_hash) is None
+        assert cache.get_resolved(previous.content_hash) is None
+
+    def test_no_store_is_not_cached(self, cache, server):
+        server.headers["Cache-Control"] = "no-store"
+
+        import_tools()
+
+        assert cache.get_entry(SPEC_URL) is None
+
+    def test_file_reuses_resolved_spec(self, cache, tmp_path, mocker):
+        path = tmp_path / "openapi.json"
+        path.write_text(json.dumps(SPEC))
+        first = import_tools(str(path))
+        resolve_document = mocker.patch.object(OpenAPIRefResolver, "resolve_document")
+
+        assert import_tools(f"file://{path}") == first
+        resolve_document.assert_not_called()
+
+    def test_changed_file_replaces_resolved_spec(self, cache, tmp_path):
+        path = tmp_path / "openapi.json"
+        path.write_text(json.dumps(SPEC))
+        import_tools(str(path))
+        spec = {**SPEC, "info": {"title": "Things", "version": "2.0.0"}}
+        path.write_text(json.dumps(spec))
+
+        import_tools(str(path))
+
+        resolved = [name for name in os.listdir(cache.directory) if ".resolved." in name]
+        assert len(resolved) == 1
+        assert cache.get_resolved(get_content_hash(json.dumps(spec).encode()))["info"]["version"] == "2.0.0"
+
+    def test_cache_can_be_disabled(self, tmp_path, server, monkeypatch):
+        monkeypatch.setenv(OPENAPI_SPEC_CACHE_ENV_VAR, "0")
+        monkeypatch.setattr("ibm_watsonx_orchestrate.cli.config.AUTH_CONFIG_FILE_FOLDER", str(tmp_path))
+
+        import_tools()
+        import_tools()
+
+        assert "If-None-Match" not in server.requests[-1].headers
+        assert os.listdir(tmp_path) == []
+
+
+@pytest.mark.parametrize(
+    ("cache_control", "expected"),
+    [
+        (None, None),
+        ("max-age=60", 60),
+        ("public, max-age=3600", 3600),
+        ("no-cache, max-age=60", None),
+        ("no-store", None),
+    ]
+)
+def test_get_max_age(cache_control, expected):
+    assert get_max_age(cache_control) == expected
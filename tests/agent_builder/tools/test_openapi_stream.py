@@ -0,0 +1,151 @@
+import asyncio
+import codecs
+import json
+from os import path
+
+import pytest
+import yaml
+
+from ibm_watsonx_orchestrate.agent_builder.tools import openapi_tool
+from ibm_watsonx_orchestrate.agent_builder.tools.openapi_filter import OpenAPIOperationFilter
+from ibm_watsonx_orchestrate.agent_builder.tools.openapi_stream import OpenAPIDocumentIndex, LazyOpenAPIDocument
+from ibm_watsonx_orchestrate.agent_builder.tools.openapi_tool import StreamingOpenAPIToolCompiler, \
+    create_openapi_json_tools_from_uri
+
+FIXTURE = path.join(path.dirname(path.realpath(__file__)), '../fixtures/testitall.openapi.json')
+
+
+@pytest.fixture(scope='module')
+def testitall():
+    with open(FIXTURE, 'r') as fp:
+        spec = json.load(fp)
+    # non ascii content moves the byte offsets of everything after it away from the character offsets
+    spec['info']['description'] = 'Ünïcödé — spec ✓'
+    return spec
+
+
+@pytest.fixture(autouse=True)
+def no_spec_cache(monkeypatch):
+    monkeypatch.setattr(openapi_tool, '_get_openapi_spec_cache', lambda: None)
+
+
+@pytest.fixture(params=['json', 'json_compact', 'yaml', 'yaml_bom'])
+def spec_file(request, tmp_path, testitall):
+    if request.param == 'json':
+        content = json.dumps(testitall, indent=2, ensure_ascii=False).encode()
+    elif request.param == 'json_compact':
+        content = json.dumps(testitall, separators=(',', ':')).encode()
+    else:
+        content = yaml.safe_dump(testitall, allow_unicode=True, sort_keys=False).encode()
+        if request.param == 'yaml_bom':
+            content = codecs.BOM_UTF8 + content
+    file = tmp_path / f"openapi.{request.param.split('_')[0]}"
+    file.write_bytes(content)
+    return str(file)
+
+
+def import_tools(file: str, streaming: bool) -> list:
+    tools = asyncio.run(create_openapi_json_tools_from_uri(file, connection_id='connectionId', streaming=streaming))
+    return [json.loads(tool.dumps_spec()) for tool in tools]
+
+
+class TestOpenAPIDocumentIndex:
+
+    def test_indexes_sections_paths_and_components(self, spec_file, testitall):
+        index = OpenAPIDocumentIndex.build(spec_file)
+
+        assert list(index.sections) == [key for key in testitall if key not in ('paths', 'components')]
+        assert list(index.path_items) == list(testitall['paths'])
+        assert index.methods == {p: list(methods) for p, methods in testitall['paths'].items()}
+        assert {t: list(c) for t, c in index.components.items()} == \
+            {t: list(c) for t, c in testitall['components'].items()}
+
+    def test_loads_each_part_alone(self, spec_file, testitall):
+        index = OpenAPIDocumentIndex.build(spec_file)
+
+        for key, span in index.sections.items():
+            assert index.load(span) == testitall[key]
+        for path_name, span in index.path_items.items():
+            assert index.load(span) == testitall['paths'][path_name]
+        for component_type, components in index.components.items():
+            for name, span in components.items():
+                assert index.load(span) == testitall['components'][component_type][name]
+
+    def test_yaml_anchors_are_rejected(self, tmp_path):
+        file = tmp_path / 'openapi.yaml'
+        file.write_text('paths:\n  /a: &item\n    get: {}\n  /b: *item\n')
+
+        with pytest.raises(ValueError) as e:
+            OpenAPIDocumentIndex.build(str(file))
+
+        assert 'anchors' in str(e.value)
+
+    def test_unexpected_extension(self, tmp_path):
+        with pytest.raises(ValueError):
+            OpenAPIDocumentIndex.build(str(tmp_path / 'openapi.txt'))
+
+
+class TestLazyOpenAPIDocument:
+
+    def test_mapping(self, spec_file, testitall):
+        document = LazyOpenAPIDocument(OpenAPIDocumentIndex.build(spec_file))
+
+        assert set(document) == set(testitall)
+        assert document['servers'] == testitall['servers']
+        assert dict(document['components']['securitySchemes']) == testitall['components']['securitySchemes']
+        assert 'missing' not in document
+
+    def test_component_cache_is_bounded(self, spec_file):
+        document = LazyOpenAPIDocument(OpenAPIDocumentIndex.build(spec_file), component_cache_size=1)
+
+        for name in document['components']['securitySchemes']:
+            document['components']['securitySchemes'][name]
+
+        assert len(document._components) == 1
+
+
+class TestStreamingImport:
+
+    def test_same_tools_as_loading_whole_spec(self, spec_file):
+        assert import_tools(spec_file, streaming=True) == import_tools(spec_file, streaming=False)
+
+    def test_large_files_are_streamed(self, spec_file, mocker):
+        mocker.patch.object(openapi_tool, 'DEFAULT_STREAMING_THRESHOLD', 0)
+
+        compiler = asyncio.run(openapi_tool._get_openapi_compiler_from_uri(spec_file))
+
+        assert isinstance(compiler, StreamingOpenAPIToolCompiler)
+
+    def test_small_files_are_loaded_whole(self, spec_file):
+        compiler = asyncio.run(openapi_tool._get_openapi_compiler_from_uri(spec_file))
+
+        assert not isinstance(compiler, StreamingOpenAPIToolCompiler)
+
+    def test_falls_back_to_loading_whole_spec(self, tmp_path, testitall, mocker):
+        mocker.patch.object(openapi_tool, 'DEFAULT_STREAMING_THRESHOLD', 0)
+        file = tmp_path / 'openapi.yaml'
+        file.write_text(yaml.safe_dump(testitall, sort_keys=False) + 'x-anchored: &anchor {}\nx-alias: *anchor\n')
+
+        assert len(import_tools(str(file), streaming=None)) == len(import_tools(str(file), streaming=False))
+        with pytest.raises(ValueError):
+            import_tools(str(file), streaming=True)
+
+    def test_filters_operations(self, spec_file):
+        operation_filter = OpenAPIOperationFilter(include_methods=['post'], exclude_operation_ids=['^testEventStream'])
+
+        streamed = asyncio.run(create_openapi_json_tools_from_uri(spec_file, streaming=True, operation_filter=operation_filter))
+        loaded = asyncio.run(create_openapi_json_tools_from_uri(spec_file, streaming=False, operation_filter=operation_filter))
+
+        assert [tool.__tool_spec__.name for tool in streamed] == [tool.__tool_spec__.name for tool in loaded]
+        assert 'testPost' in [tool.__tool_spec__.name for tool in streamed]
+        assert not any(tool.__tool_spec__.name.startswith('testEventStream') for tool in streamed)
+
+    def test_filters_by_path_and_method_without_loading_path_items(self, spec_file, mocker):
+        compiler = StreamingOpenAPIToolCompiler(
+            OpenAPIDocumentIndex.build(spec_file),
+            operation_filter=OpenAPIOperationFilter(include_paths=['/test/*'], exclude_methods=['post'])
+        )
+        load = mocker.spy(compiler.index, 'load')
+
+        assert compiler.get_operations() == []
+        load.assert_not_called()
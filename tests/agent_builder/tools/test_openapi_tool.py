@@ -1,8 +1,10 @@
 # Baseline testitall tests
 # testitall is the assistant builder extension testing framework found here:
 # https://github.com/watson-developer-cloud/assistant-toolkit/tree/master/integrations/extensions/starter-kits/testitall
+import concurrent.futures
 import json
 from os import path
+
 import pytest
 from pydantic import BaseModel, Field
 
@@ -11,7 +13,10 @@ try:
     from mocks.mock_httpx import get_mock_async_client, MockResponse
 except:
     from tests.mocks.mock_httpx import get_mock_async_client, MockResponse
-from ibm_watsonx_orchestrate.agent_builder.tools import create_openapi_json_tool
+from ibm_watsonx_orchestrate.agent_builder.tools import create_openapi_json_tool, create_openapi_json_tools, \
+    OpenAPITool, OpenAPIToolCompiler, OpenAPIOperationFilter
+from ibm_watsonx_orchestrate.agent_builder.tools import openapi_tool
+from ibm_watsonx_orchestrate.agent_builder.tools.openapi_ref_resolver import OpenAPIRefResolver
 
 
 @pytest.fixture(scope='module')
@@ -710,3 +715,145 @@ async def test_http_put_with_json_request_body(mocker, snapshot, testitall):
         assert False, 'should have thrown'
     except RuntimeError as e:
         assert 'only available when deployed' in str(e), 'should show runtime message if called'
+
+
+##################################################################
+##  Compiling every operation of a spec
+##################################################################
+def test_compiler_matches_single_operation_tools(testitall):
+    tools = create_openapi_json_tools(testitall, connection_id='connectionId', max_workers=1)
+
+    operations = OpenAPIToolCompiler(testitall).get_operations()
+    assert len(tools) == len(operations)
+    for tool, (path, method) in zip(tools, operations):
+        binding = tool.__tool_spec__.binding.openapi
+        assert (binding.http_path, binding.http_method) == (path, method.upper())
+        assert binding.connection_id == 'connectionId'
+
+
+def test_compiler_resolves_refs_once(mocker, testitall):
+    resolve_document = mocker.patch.object(OpenAPIRefResolver, 'resolve_document', autospec=True,
+                                           side_effect=OpenAPIRefResolver.resolve_document)
+
+    create_openapi_json_tools(testitall, max_workers=1)
+
+    assert resolve_document.call_count == 1
+
+
+def test_compiler_does_not_modify_shared_components():
+    shared = {'type': 'object', 'properties': {'id': {'type': 'string'}}, 'required': ['id']}
+    spec = {
+        'openapi': '3.0.3',
+        'info': {},
+        'servers': [{'url': 'https://example.com'}],
+        'components': {
+            'schemas': {'Thing': shared},
+            'parameters': {'Id': {'name': 'id', 'in': 'path', 'required': True, 'schema': {'type': 'string'}}}
+        },
+        'paths': {
+            f'/things{i}/{{id}}': {
+                'get': {
+                    'operationId': f'getThing{i}',
+                    'description': 'Gets a thing',
+                    'parameters': [{'$ref': '#/components/parameters/Id'}],
+                    'responses': {'200': {'description': 'A thing', 'content': {
+                        'application/json': {'schema': {'$ref': '#/components/schemas/Thing'}}}}}
+                }
+            } for i in range(3)
+        }
+    }
+
+    compiler = OpenAPIToolCompiler(spec)
+    tools = compiler.compile(max_workers=1)
+
+    assert [t.__tool_spec__.name for t in tools] == ['getThing0', 'getThing1', 'getThing2']
+    assert compiler.openapi_contents['components']['schemas']['Thing']['required'] == ['id']
+    assert 'title' not in compiler.openapi_contents['components']['parameters']['Id']['schema']
+    for tool in tools:
+        assert tool.__tool_spec__.input_schema.required == ['path_id']
+
+
+def test_compiler_skips_head(openapispec_for_all_http_methods):
+    _, spec = openapispec_for_all_http_methods
+    spec['paths']['/test']['head'] = spec['paths']['/test'][next(iter(spec['paths']['/test']))]
+
+    compiler = OpenAPIToolCompiler(spec)
+
+    assert all(method.lower() != 'head' for _, method in compiler.get_operations())
+
+
+def test_compiler_in_worker_processes_matches_serial(testitall):
+    serial = create_openapi_json_tools(testitall, max_workers=1)
+
+    compiler = OpenAPIToolCompiler(testitall)
+    operations = compiler.get_operations()
+    chunks = [operations[:len(operations) // 2], operations[len(operations) // 2:]]
+    with concurrent.futures.ProcessPoolExecutor(max_workers=2, initializer=openapi_tool._init_compiler_worker,
+                                                initargs=(testitall,)) as executor:
+        specs = [spec for chunk in executor.map(openapi_tool._compile_in_worker, chunks, [None, None]) for spec in chunk]
+
+    assert [json.loads(t.dumps_spec()) for t in serial] == [json.loads(OpenAPITool(spec=s).dumps_spec()) for s in specs]
+
+
+##################################################################
+##  Selecting the operations to compile
+##################################################################
+def get_things_spec(parameter_ref: str = '#/components/parameters/Tenant') -> dict:
+    return {
+        'openapi': '3.0.3',
+        'info': {},
+        'servers': [{'url': 'https://example.com'}],
+        'components': {'parameters': {'Tenant': {'name': 'tenant', 'in': 'query', 'schema': {'type': 'string'}}}},
+        'paths': {
+            '/things': {
+                'summary': 'Things',
+                'parameters': [{'name': 'tenant', 'in': 'query', 'schema': {'type': 'string'}}],
+                'get': {
+                    'operationId': 'listThings',
+                    'tags': ['things'],
+                    'description': 'Lists things',
+                    'responses': {'200': {'description': 'Things'}}
+                },
+                'post': {
+                    'operationId': 'createThing',
+                    'tags': ['things', 'admin'],
+                    'description': 'Creates a thing',
+                    'parameters': [{'$ref': parameter_ref}],
+                    'responses': {'201': {'description': 'A thing'}}
+                }
+            },
+            '/others': {'$ref': '#/paths/~1things'}
+        }
+    }
+
+
+def test_compiler_only_lists_operations():
+    compiler = OpenAPIToolCompiler(get_things_spec(), operation_filter=OpenAPIOperationFilter(exclude_methods=['post']))
+
+    assert compiler.get_operations() == [('/things', 'get'), ('/others', 'get')]
+
+
+@pytest.mark.parametrize(
+    ('operation_filter', 'expected'),
+    [
+        (OpenAPIOperationFilter(include_tags=['admin']), [('/things', 'post'), ('/others', 'post')]),
+        (OpenAPIOperationFilter(exclude_tags=['admin']), [('/things', 'get'), ('/others', 'get')]),
+        (OpenAPIOperationFilter(include_paths=['/oth*']), [('/others', 'get'), ('/others', 'post')]),
+        (OpenAPIOperationFilter(include_operation_ids=['^list']), [('/things', 'get'), ('/others', 'get')]),
+        (OpenAPIOperationFilter(include_methods=['GET'], exclude_paths=['/things']), [('/others', 'get')]),
+    ]
+)
+def test_compiler_filters_operations(operation_filter, expected):
+    assert OpenAPIToolCompiler(get_things_spec(), operation_filter=operation_filter).get_operations() == expected
+
+
+def test_compiler_does_not_resolve_filtered_out_operations():
+    operation_filter = OpenAPIOperationFilter(include_operation_ids=['^listThings$'])
+
+    spec = get_things_spec(parameter_ref='#/components/parameters/Missing')
+
+    tools = create_openapi_json_tools(spec, max_workers=1, operation_filter=operation_filter)
+
+    assert [tool.__tool_spec__.name for tool in tools] == ['listThings', 'listThings']
+    with pytest.raises(ValueError):
+        create_openapi_json_tools(spec, max_workers=1)
@@ -80,7 +80,10 @@ class TestAgentList:
 
             mock.assert_called_once_with(
                 kind=None,
-                verbose=False
+                verbose=False,
+                limit=None,
+                filter=None,
+                sort=None
             )
 
     def test_agent_list_agents_verbose(self):
@@ -91,7 +94,24 @@ class TestAgentList:
 
             mock.assert_called_once_with(
                 kind=None,
-                verbose=True
+                verbose=True,
+                limit=None,
+                filter=None,
+                sort=None
+            )
+
+    def test_agent_list_agents_with_query(self):
+        with patch(
+            "ibm_watsonx_orchestrate.cli.commands.agents.agents_controller.AgentsController.list_agents"
+        ) as mock:
+            agents_command.list_agents(limit=5, filter={"name": "test"}, sort="-name")
+
+            mock.assert_called_once_with(
+                kind=None,
+                verbose=False,
+                limit=5,
+                filter={"name": "test"},
+                sort="-name"
             )
 
 class TestAgentDelete:
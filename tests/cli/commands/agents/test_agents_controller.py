@@ -7,6 +7,7 @@ from ibm_watsonx_orchestrate.cli.commands.agents.agents_controller import (
     parse_create_external_args
     )
 from ibm_watsonx_orchestrate.agent_builder.agents import AgentKind, AgentStyle, SpecVersion, Agent, ExternalAgent, AssistantAgent
+from ibm_watsonx_orchestrate.client.batch_loader import BatchLoader
 import json
 from unittest.mock import patch, mock_open, MagicMock
 import pytest
@@ -18,6 +19,10 @@ import sys
 agents_controller = AgentsController()
 
 
+def mock_drafts_client(drafts: list) -> MagicMock:
+    return MagicMock(name_loader=BatchLoader(lambda names: drafts, key_fn=lambda agent: agent.get("name")))
+
+
 @pytest.fixture
 def native_agent_content() -> dict:
     return {
@@ -120,6 +125,10 @@ class MockAgent:
                 ids.append({"name": agent, "id": uuid.uuid4()})
         return ids
 
+    @property
+    def name_loader(self):
+        return BatchLoader(lambda names: [draft for name in names for draft in self.get_draft_by_name(name)], key_fn=lambda agent: agent.get("name"))
+
     def get_draft_by_name(self, agent):
         if self.already_existing:
             return [{"name": agent, "id": uuid.uuid4()}]
@@ -200,7 +209,7 @@ class TestParseFile:
     def test_parse_file_yaml(self, native_agent_content):
         with patch("ibm_watsonx_orchestrate.cli.commands.agents.agents_controller.Agent.from_spec") as from_spec_mock, \
              patch("builtins.open", mock_open()) as mock_file, \
-             patch("ibm_watsonx_orchestrate.cli.commands.agents.agents_controller.yaml.load") as mock_loader:
+             patch("ibm_watsonx_orchestrate.cli.commands.agents.agents_controller.yaml_codec.safe_load") as mock_loader:
             
             mock_loader.return_value = native_agent_content
 
@@ -226,7 +235,7 @@ class TestParseFile:
     def test_parse_file_yaml_external(self, external_agent_content):
         with patch("ibm_watsonx_orchestrate.cli.commands.agents.agents_controller.ExternalAgent.from_spec") as from_spec_mock, \
              patch("builtins.open", mock_open()) as mock_file, \
-             patch("ibm_watsonx_orchestrate.cli.commands.agents.agents_controller.yaml.load") as mock_loader:
+             patch("ibm_watsonx_orchestrate.cli.commands.agents.agents_controller.yaml_codec.safe_load") as mock_loader:
             
             mock_loader.return_value = external_agent_content
 
@@ -388,14 +397,14 @@ class TestAgentsControllerPublishOrUpdateAgents:
             patch("ibm_watsonx_orchestrate.cli.commands.agents.agents_controller.AgentsController.get_tool_client") as tool_client_mock, \
             patch("ibm_watsonx_orchestrate.cli.commands.agents.agents_controller.AgentsController.update_agent") as update_mock:
         
-            native_client_mock.return_value = MagicMock(get_draft_by_name=MagicMock(return_value=[{
+            native_client_mock.return_value = mock_drafts_client([{
                 "name": "test_native_agent",
                 "id": "62562f01-5046-4e8f-b5b9-e91cdc17b5ce",
                 "description": "Test Object for native agent",
-            }]))
+            }])
         
-            external_client_mock.return_value = MagicMock(get_draft_by_name=MagicMock(return_value=[]))
-            assistant_client_mock.return_value = MagicMock(get_draft_by_name=MagicMock(return_value=[]))  
+            external_client_mock.return_value = mock_drafts_client([])
+            assistant_client_mock.return_value = mock_drafts_client([])  
             tool_client_mock.return_value = MockAgent()
 
             agent = Agent(**native_agent_content)
@@ -421,9 +430,9 @@ class TestAgentsControllerPublishOrUpdateAgents:
             # Mock get_conn_id_from_app_id to return a valid connection_id
             mock_get_conn_id.return_value = "mock-connection-id"
 
-            native_client_mock.return_value = MagicMock(get_draft_by_name=MagicMock(return_value=[]))
-            external_client_mock.return_value = MagicMock(get_draft_by_name=MagicMock(return_value=[]))
-            assistant_client_mock.return_value = MagicMock(get_draft_by_name=MagicMock(return_value=[]))
+            native_client_mock.return_value = mock_drafts_client([])
+            external_client_mock.return_value = mock_drafts_client([])
+            assistant_client_mock.return_value = mock_drafts_client([])
             tool_client_mock.return_value = MockAgent()
 
             agent = ExternalAgent(**external_agent_content)
@@ -445,16 +454,16 @@ class TestAgentsControllerPublishOrUpdateAgents:
             # Mock get_conn_id_from_app_id to return a valid connection_id
             mock_get_conn_id.return_value = "mock-connection-id"
 
-            native_client_mock.return_value = MagicMock(get_draft_by_name=MagicMock(return_value=[]))
-            assistant_client_mock.return_value = MagicMock(get_draft_by_name=MagicMock(return_value=[]))
-            external_client_mock.return_value = MagicMock(get_draft_by_name=MagicMock(return_value=[{
+            native_client_mock.return_value = mock_drafts_client([])
+            assistant_client_mock.return_value = mock_drafts_client([])
+            external_client_mock.return_value = mock_drafts_client([{
                 "name": "test_external_agent",
                 "id": "52101bd5-3395-47c8-adc8-506f4bd383ea",
                 "type": "EXTERNAL",
                 "description": "Mock description",
                 "title": "Mock title",
                 "api_url": "https://mock-api.com"
-            }]))
+            }])
             tool_client_mock.return_value = MockAgent()
 
             agent = ExternalAgent(**external_agent_content)
@@ -471,8 +480,8 @@ class TestAgentsControllerPublishOrUpdateAgents:
              patch("ibm_watsonx_orchestrate.cli.commands.agents.agents_controller.AgentsController.get_external_client") as external_client_mock, \
              patch("ibm_watsonx_orchestrate.cli.commands.agents.agents_controller.AgentsController.publish_agent") as publish_mock:
             
-            native_client_mock.return_value = MagicMock(get_draft_by_name=MagicMock(return_value=[]))
-            external_client_mock.return_value = MagicMock(get_draft_by_name=MagicMock(return_value=[]))
+            native_client_mock.return_value = mock_drafts_client([])
+            external_client_mock.return_value = mock_drafts_client([])
             assistant_client_mock.return_value = MockAgent()
 
             agent = AssistantAgent(**assistant_agent_content)
@@ -495,16 +504,16 @@ class TestAgentsControllerPublishOrUpdateAgents:
             # Mock get_conn_id_from_app_id to return a valid connection_id
             mock_get_conn_id.return_value = "mock-connection-id"
             
-            native_client_mock.return_value = MagicMock(get_draft_by_name=MagicMock(return_value=[]))
-            external_client_mock.return_value = MagicMock(get_draft_by_name=MagicMock(return_value=[]))
-            assistant_client_mock.return_value = MagicMock(get_draft_by_name=MagicMock(return_value=[{
+            native_client_mock.return_value = mock_drafts_client([])
+            external_client_mock.return_value = mock_drafts_client([])
+            assistant_client_mock.return_value = mock_drafts_client([{
                 "name": "test_assistant_agent",
                 "id": "52101bd5-3395-47c8-adc8-506f4bd383ea",
                 "type": "ASSISTANT",
                 "description": "Mock description",
                 "title": "Mock title",
                 "api_url": "https://mock-api.com"
-            }]))
+            }])
             tool_client_mock.return_value = MockAgent()
 
             agent = AssistantAgent(**assistant_agent_content)
@@ -619,7 +628,8 @@ class TestListAgents:
     @mock.patch('ibm_watsonx_orchestrate.cli.commands.agents.agents_controller.AgentsController.get_agent_tool_names')
     @mock.patch('ibm_watsonx_orchestrate.cli.commands.agents.agents_controller.get_connections_client')
     @mock.patch('ibm_watsonx_orchestrate.cli.commands.agents.agents_controller.AgentsController.get_agent_knowledge_base_names')
-    def test_list_agents(self, get_agent_knowledge_base_names, mock_get_connections_client, mock_get_agent_tool_names, mock_get_agent_collaborator_names, mock_get_external_client, mock_get_native_client, mock_get_knowledge_base_client, mock_get_tool_client):
+    @mock.patch('ibm_watsonx_orchestrate.cli.commands.agents.agents_controller.AgentsController.resolve_agent_names')
+    def test_list_agents(self, mock_resolve_agent_names, get_agent_knowledge_base_names, mock_get_connections_client, mock_get_agent_tool_names, mock_get_agent_collaborator_names, mock_get_external_client, mock_get_native_client, mock_get_knowledge_base_client, mock_get_tool_client):
         mock_get_connections_client.return_value = MockConnectionClient()
         
         # Mock responses for collaborator and tool names
@@ -628,13 +638,13 @@ class TestListAgents:
         get_agent_knowledge_base_names.return_value = ['Test Knowledge Base']
         
         # Mock native client response (Native agents)
-        mock_get_native_client.return_value.get.side_effect = [
+        mock_get_native_client.return_value.iter_agents.side_effect = [
             [{'id': 'agent1', 'name': 'Agent 1', 'description': 'Test agent 1', 'llm': 'llm_model_1', 'style': 'default', 'collaborators': ['collab_id_1'], 'tools': ['tool_id_1'], 'knowledge_base': ['knowledge_base_id_1']}],
             [{'id': 'collab_id_1', 'name': 'Collaborator 1'}]
         ]
         
         # Mock external client response (External agents)
-        mock_get_external_client.return_value.get.side_effect = [
+        mock_get_external_client.return_value.iter_agents.side_effect = [
             [{
                 'id': 'external_agent1',
                 'name': 'Agent 1',
@@ -675,6 +685,75 @@ class TestListAgents:
         assert mock_get_agent_tool_names.return_value == ['Test Tool'], "Tool names list should be mocked correctly"
         assert get_agent_knowledge_base_names.return_value == ['Test Knowledge Base'], "Knowledge Base names list should be mocked correctly"
 
+    @mock.patch('ibm_watsonx_orchestrate.cli.commands.agents.agents_controller.AgentsController.get_assistant_client')
+    @mock.patch('ibm_watsonx_orchestrate.cli.commands.agents.agents_controller.AgentsController.get_external_client')
+    @mock.patch('ibm_watsonx_orchestrate.cli.commands.agents.agents_controller.AgentsController.get_native_client')
+    def test_list_all_kinds_shares_limit(self, mock_get_native_client, mock_get_external_client, mock_get_assistant_client):
+        native_agents = [{'id': f'agent{i}', 'name': f'Agent {i}', 'description': 'Test agent'} for i in range(2)]
+        external_agent = {'id': 'external_agent1', 'name': 'External', 'title': 'Title', 'api_url': 'http://example.com/api', 'description': 'Test agent'}
+        mock_get_native_client.return_value.iter_agents.return_value = native_agents
+        mock_get_external_client.return_value.iter_agents.return_value = [external_agent]
+
+        AgentsController().list_agents(verbose=True, limit=3)
+
+        mock_get_native_client.return_value.iter_agents.assert_called_once_with(limit=3, filter=None, sort=None)
+        mock_get_external_client.return_value.iter_agents.assert_called_once_with(limit=1, filter=None, sort=None)
+        mock_get_assistant_client.assert_not_called()
+
+
+class TestAgentNames:
+    @staticmethod
+    def get_draft_by_id(items: dict, calls: list):
+        def get(id):
+            calls.append(id)
+            if id == "broken":
+                raise Exception("Internal Server Error")
+            return items.get(id, "")
+        return get
+
+    def test_ids_shared_by_agents_are_requested_once(self):
+        calls = []
+        agents_controller = AgentsController()
+        agents_controller.tool_client = mock.Mock(get_draft_by_id=self.get_draft_by_id(
+            {"t1": {"name": "Tool 1"}, "t2": {"name": "Tool 2"}}, calls))
+        agents = [
+            Agent(name="a1", description="a1", llm="llm", tools=["t1", "t2"]),
+            Agent(name="a2", description="a2", llm="llm", tools=["t2", "t1"]),
+        ]
+
+        agents_controller.resolve_agent_names(agents)
+
+        assert sorted(calls) == ["t1", "t2"]
+        assert agents_controller.get_agent_tool_names(["t2", "t1"]) == ["Tool 2", "Tool 1"]
+        assert sorted(calls) == ["t1", "t2"]
+
+    def test_failed_lookup_only_affects_its_id(self, caplog):
+        agents_controller = AgentsController()
+        agents_controller.knowledge_base_client = mock.Mock(get_by_id=self.get_draft_by_id(
+            {"kb1": {"name": "Knowledge Base 1"}}, []))
+
+        names = agents_controller.get_agent_knowledge_base_names(["kb1", "broken", "missing"])
+
+        assert names == ["Knowledge Base 1", "broken", "missing"]
+        assert "Knowledge base with ID broken not found" in caplog.text
+
+    def test_collaborators_are_looked_up_in_every_agent_kind(self):
+        native_calls, external_calls, assistant_calls = [], [], []
+        agents_controller = AgentsController()
+        agents_controller.native_client = mock.Mock(get_draft_by_id=self.get_draft_by_id(
+            {"n1": {"name": "Native"}}, native_calls))
+        agents_controller.external_client = mock.Mock(get_draft_by_id=self.get_draft_by_id(
+            {"e1": {"name": "External"}}, external_calls))
+        agents_controller.assistant_client = mock.Mock(get_draft_by_id=self.get_draft_by_id(
+            {"a1": {"name": "Assistant"}}, assistant_calls))
+
+        names = agents_controller.get_agent_collaborator_names(["n1", "e1", "a1"])
+
+        assert names == ["Native", "External", "Assistant"]
+        assert sorted(native_calls) == ["a1", "e1", "n1"]
+        assert sorted(external_calls) == ["a1", "e1"]
+        assert assistant_calls == ["a1"]
+
 
 class TestRemoveAgent:
     def test_remove_native_agent(self, caplog):
@@ -59,7 +59,10 @@ class TestConnectionsRemove:
 class TestConnectionsList:
     base_params = {
         "environment": "draft",
-        "verbose": False
+        "verbose": False,
+        "limit": 10,
+        "filter": {"app_id": "test"},
+        "sort": "app_id"
     }
 
     def test_list_connection_command(self):
@@ -72,6 +75,9 @@ class TestConnectionsList:
         [
             ("environment", None),
             ("verbose", None),
+            ("limit", None),
+            ("filter", None),
+            ("sort", None),
         ]
     )
     def test_list_connection_command_missing_optional_parms(self, missing_param, default_value):
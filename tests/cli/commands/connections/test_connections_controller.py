@@ -113,6 +113,9 @@ class MockConnectionClient:
     def list(self):
         return self.list_response
 
+    def iter_connections(self, **kwargs):
+        return iter(self.list_response)
+
 def _throw_mock_reponse(error):
     raise error        
 
@@ -201,7 +204,7 @@ class TestParseFile:
     def test_parse_file_yaml(self, connections_spec_content):
         with patch("builtins.open", mock_open()) as mock_file, \
             patch ("ibm_watsonx_orchestrate.cli.commands.connections.connections_controller._create_connection_from_spec") as mock_from_spec, \
-            patch("ibm_watsonx_orchestrate.cli.commands.connections.connections_controller.yaml.load") as mock_loader:
+            patch("ibm_watsonx_orchestrate.cli.commands.connections.connections_controller.yaml_codec.safe_load") as mock_loader:
             
             mock_loader.return_value = connections_spec_content
 
@@ -937,7 +940,7 @@ class TestImportConnection:
     def test_import_connection_yaml(self, connections_spec_content):
         with patch("builtins.open", mock_open()) as mock_file, \
             patch ("ibm_watsonx_orchestrate.cli.commands.connections.connections_controller._create_connection_from_spec") as mock_from_spec, \
-            patch("ibm_watsonx_orchestrate.cli.commands.connections.connections_controller.yaml.load") as mock_loader:
+            patch("ibm_watsonx_orchestrate.cli.commands.connections.connections_controller.yaml_codec.safe_load") as mock_loader:
             
             mock_loader.return_value = connections_spec_content
 
@@ -1,3 +1,4 @@
+from contextlib import nullcontext
 from unittest.mock import patch
 import re
 import pytest
@@ -36,6 +37,12 @@ class MockConfig():
     def delete(self, *args, **kwargs):
         pass
 
+    def lock(self):
+        return nullcontext()
+
+    def transaction(self):
+        return nullcontext(self)
+
 class MockConfig2():
     def __init__(self):
         self.config = {}
@@ -60,8 +67,14 @@ class MockConfig2():
     def delete(self, *args, **kwargs):
         pass
 
+    def lock(self):
+        return nullcontext()
+
+    def transaction(self):
+        return nullcontext(self)
+
 class MockClient:
-    def __init__(self, credentials):
+    def __init__(self, credentials, **kwargs):
         self.token = tokens["valid_token_w_expiry"]
 
 class MockCredentials:
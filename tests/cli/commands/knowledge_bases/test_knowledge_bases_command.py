@@ -29,7 +29,7 @@ class TestKnowledgeBaseList:
         ) as mock:
             knowledge_bases_command.list_knowledge_bases()
 
-            mock.assert_called_once_with(verbose=False )
+            mock.assert_called_once_with(verbose=False, limit=None, filter=None, sort=None)
 
     def test_knowledge_base_list_knowledge_bases_verbose(self):
         with patch(
@@ -37,7 +37,7 @@ class TestKnowledgeBaseList:
         ) as mock:
             knowledge_bases_command.list_knowledge_bases(verbose=True)
 
-            mock.assert_called_once_with(verbose=True)
+            mock.assert_called_once_with(verbose=True, limit=None, filter=None, sort=None)
 
 class TestKnowledgeBaseStatus:
     def test_knowledge_base_status(self):
@@ -86,6 +86,9 @@ class MockClient:
     
     def get(self):
         return [self.fake_knowledge_base]
+
+    def iter_knowledge_bases(self, **kwargs):
+        return iter(self.get())
     
     def status(self, knowledge_base_id):
         assert knowledge_base_id == self.expected_id
@@ -119,7 +122,7 @@ class MockConnection:
 class TestParseFile:
     def test_parse_file_yaml(self, built_in_knowledge_base_content):
         with patch("builtins.open", mock_open()) as mock_file, \
-             patch("ibm_watsonx_orchestrate.agent_builder.knowledge_bases.knowledge_base.yaml_safe_load") as mock_loader:
+             patch("ibm_watsonx_orchestrate.agent_builder.knowledge_bases.knowledge_base.yaml_codec.safe_load") as mock_loader:
             
             mock_loader.return_value = built_in_knowledge_base_content
 
@@ -243,15 +246,15 @@ class TestListKnowledgeBases:
             richTableMock.assert_called_once()
             richPrintMock.assert_called_once()
             
-    def test_list_knowledge_bases_verbose(self, external_knowledge_base_content):    
-        with patch("ibm_watsonx_orchestrate.cli.commands.knowledge_bases.knowledge_bases_controller.KnowledgeBaseController.get_client") as client_mock, \
-             patch("rich.json.JSON") as richJsonMock, patch("rich.print") as richPrintMock:
+    def test_list_knowledge_bases_verbose(self, external_knowledge_base_content, capsys):    
+        with patch("ibm_watsonx_orchestrate.cli.commands.knowledge_bases.knowledge_bases_controller.KnowledgeBaseController.get_client") as client_mock:
             client_mock.return_value = MockClient(fake_knowledge_base=KnowledgeBase(**external_knowledge_base_content))
 
             knowledge_base_controller.list_knowledge_bases(verbose=True)
 
-            richJsonMock.assert_called_once()
-            richPrintMock.assert_called_once()
+            knowledge_bases = json.loads(capsys.readouterr().out)
+            assert len(knowledge_bases) == 1
+            assert knowledge_bases[0]["name"] == "test_external_knowledge_base"
         
       
 class TestKnowledgeBaseControllerRemoveKnowledgeBase:
@@ -12,7 +12,9 @@ def test_tool_import_call_no_params():
             file=None,
             app_id=None,
             requirements_file=None,
-            package_root=None
+            package_root=None,
+            include=None,
+            exclude=None
         )
 
 
@@ -24,7 +26,9 @@ def test_tool_import_call_python():
             file="test_file",
             app_id=None,
             requirements_file="tests/cli/resources/python_samples/requirements.txt",
-            package_root=None
+            package_root=None,
+            include=None,
+            exclude=None
         )
 
 def test_tool_import_call_openapi():
@@ -35,7 +39,9 @@ def test_tool_import_call_openapi():
             file="test_file",
             app_id=None,
             requirements_file=None,
-            package_root=None
+            package_root=None,
+            include=None,
+            exclude=None
         )
 
 
@@ -76,7 +82,10 @@ def test_list_tools_non_verbose():
         tools_command.list_tools()
 
         mock.assert_called_once_with(
-            verbose=False
+            verbose=False,
+            limit=None,
+            filter=None,
+            sort=None
         )
 
 def testlist_tools_verbose():
@@ -86,7 +95,23 @@ def testlist_tools_verbose():
         tools_command.list_tools(verbose=True)
 
         mock.assert_called_once_with(
-            verbose=True
+            verbose=True,
+            limit=None,
+            filter=None,
+            sort=None
+        )
+
+def test_tool_import_call_openapi_with_filters():
+    with patch("ibm_watsonx_orchestrate.cli.commands.tools.tools_command.ToolsController.import_tool") as mock:
+        tools_command.tool_import(kind="openapi", file="test_file", include=["tag=pets"], exclude=["method=delete"])
+        mock.assert_called_once_with(
+            kind="openapi",
+            file="test_file",
+            app_id=None,
+            requirements_file=None,
+            package_root=None,
+            include=["tag=pets"],
+            exclude=["method=delete"]
         )
 
 def test_tool_import_call_python_with_package_root():
@@ -100,7 +125,9 @@ def test_tool_import_call_python_with_package_root():
             file="test_file",
             app_id=None,
             requirements_file="tests/cli/resources/python_samples/requirements.txt",
-            package_root="tests/cli/resources/python_samples"
+            package_root="tests/cli/resources/python_samples",
+            include=None,
+            exclude=None
         )
 
 def test_tool_import_call_python_with_package_root_as_empty_string():
@@ -114,7 +141,9 @@ def test_tool_import_call_python_with_package_root_as_empty_string():
             file="test_file",
             app_id=None,
             requirements_file="tests/cli/resources/python_samples/requirements.txt",
-            package_root=""
+            package_root="",
+            include=None,
+            exclude=None
         )
 
 def test_tool_import_call_python_with_package_root_as_whitespace():
@@ -128,7 +157,9 @@ def test_tool_import_call_python_with_package_root_as_whitespace():
             file="test_file",
             app_id=None,
             requirements_file="tests/cli/resources/python_samples/requirements.txt",
-            package_root="    "
+            package_root="    ",
+            include=None,
+            exclude=None
         )
 
 def test_tool_import_call_python_with_package_root_includes_whitespace_at_start_and_end():
@@ -142,5 +173,7 @@ def test_tool_import_call_python_with_package_root_includes_whitespace_at_start_
             file="test_file",
             app_id=None,
             requirements_file="tests/cli/resources/python_samples/requirements.txt",
-            package_root="  tests/cli/resources/python_samples  "
+            package_root="  tests/cli/resources/python_samples  ",
+            include=None,
+            exclude=None
         )
@@ -1,3 +1,4 @@
+import copy
 import re
 from unittest import mock
 from unittest.mock import call
@@ -6,9 +7,11 @@ from ibm_watsonx_orchestrate.agent_builder.tools.python_tool import PythonTool
 from ibm_watsonx_orchestrate.cli.commands.tools.tools_controller import ToolsController, ToolKind
 from ibm_watsonx_orchestrate.agent_builder.tools.types import ToolPermission, ToolSpec
 from ibm_watsonx_orchestrate.agent_builder.tools.openapi_tool import OpenAPITool
+from ibm_watsonx_orchestrate.agent_builder.tools.openapi_filter import OpenAPIOperationFilter
 from ibm_watsonx_orchestrate.cli.commands.tools.types import RegistryType
 from ibm_watsonx_orchestrate.cli.config import DEFAULT_CONFIG_FILE_CONTENT, PYTHON_REGISTRY_HEADER, \
     PYTHON_REGISTRY_TYPE_OPT
+from ibm_watsonx_orchestrate.client.batch_loader import BatchLoader
 from ibm_watsonx_orchestrate.client.tools.tool_client import ToolClient
 from ibm_watsonx_orchestrate.client.connections.connections_client import ListConfigsResponse
 from typer import BadParameter
@@ -59,7 +62,8 @@ class MockConfig2():
         self.config[section][option] = value
 
     def save(self, data):
-        self.config.update(data)
+        # Copied so that write() does not modify the caller's dict, such as DEFAULT_CONFIG_FILE_CONTENT
+        self.config.update(copy.deepcopy(data))
 
     def delete(self, *args, **kwargs):
         pass
@@ -90,6 +94,9 @@ class MockToolClient:
     def get(self):
         return self.get_response
 
+    def iter_tools(self, **kwargs):
+        return iter(self.get_response)
+
     def update(self, name, spec):
         for key in self.expected:
             assert spec[key] == self.expected[key]
@@ -108,6 +115,10 @@ class MockToolClient:
         self.published_file_path = file_path
         assert file_path.endswith(self.file_path)
 
+    @property
+    def name_loader(self):
+        return BatchLoader(lambda names: [draft for name in names for draft in self.get_draft_by_name(name)], key_fn=lambda tool: tool.get("name"))
+
     def get_draft_by_name(self, tool_name):
         if self.already_existing:
             return [{"name": tool_name, "id": uuid.uuid4()}]
@@ -180,7 +191,7 @@ def test_openapi_params_valid():
         assert calls == [
             (
                 ('../resources/yaml_samples/tool.yaml', 'connectionId'),
-                {}
+                {'operation_filter': None}
             )
         ]
 
@@ -209,10 +220,56 @@ def test_openapi_no_app_id():
         assert calls == [
             (
                 ('tests/cli/resources/yaml_samples/tool.yaml', None),
-                {}
+                {'operation_filter': None}
             )
         ]
 
+def test_openapi_with_filters():
+    calls = []
+
+    async def create_openapi_json_tools_from_uri(*args, **kwargs):
+        calls.append((args, kwargs))
+        return []
+
+    with mock.patch(
+            'ibm_watsonx_orchestrate.cli.commands.tools.tools_controller.create_openapi_json_tools_from_uri',
+            create_openapi_json_tools_from_uri
+    ), \
+        mock.patch(
+            'ibm_watsonx_orchestrate.cli.commands.tools.tools_controller.get_connections_client'
+        ) as mock_conn_client:
+
+        mock_conn_client.return_value = MockConnectionClient()
+
+        tools_controller = ToolsController()
+        tools = tools_controller.import_tool(ToolKind.openapi, file="tests/cli/resources/yaml_samples/tool.yaml",
+                                             app_id=None, include=["tag=pets", "method=get"], exclude=["path=/pets/*"])
+        list(tools)
+        assert calls == [
+            (
+                ('tests/cli/resources/yaml_samples/tool.yaml', None),
+                {'operation_filter': OpenAPIOperationFilter(
+                    include_tags=['pets'],
+                    include_methods=['get'],
+                    exclude_paths=['/pets/*']
+                )}
+            )
+        ]
+
+def test_openapi_invalid_filter():
+    with pytest.raises(BadParameter) as e:
+        tools_controller = ToolsController()
+        tools = tools_controller.import_tool(ToolKind.openapi, file="tests/cli/resources/yaml_samples/tool.yaml", include=["pets"])
+        list(tools)
+    assert "Invalid include filter 'pets'" in str(e)
+
+def test_python_with_filters():
+    with pytest.raises(BadParameter) as e:
+        tools_controller = ToolsController()
+        tools = tools_controller.import_tool(ToolKind.python, file="tests/cli/resources/python_samples/tool_w_metadata.py", exclude=["tag=pets"])
+        list(tools)
+    assert "--include and --exclude can only be used when kind is set to openapi" in str(e)
+
 def test_openapi_multiple_app_ids():
     with pytest.raises(BadParameter) as e:
         tools_controller = ToolsController()
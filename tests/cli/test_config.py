@@ -1,7 +1,12 @@
+from ibm_watsonx_orchestrate.cli import config
 from ibm_watsonx_orchestrate.cli.config import Config
 import os
+import multiprocessing
 import shutil
+import subprocess
+import sys
 import pytest
+from unittest.mock import patch
 
 TEST_CONFIG_FILE_FOLDER = os.path.join(os.path.dirname(__file__), "./resources/configs/temp")
 TEST_CONFIG_FILE_NAME = "test_config.yaml"
@@ -170,3 +175,90 @@ def test_config_save_existing_section(get_test_config):
     ]
     assert cfg.read("test_save_section2", "test_save_option_dict") == {"key": "value"}
     assert cfg.read("test_save_section2", "test_save_option_bool") == False
+
+
+def test_config_transaction_writes_once(get_test_config):
+    cfg = get_test_config
+
+    with patch.object(config.yaml_codec, "dump", wraps=config.yaml_codec.dump) as mock_dump:
+        with cfg.transaction():
+            cfg.write("test_section", "test_option", "test_value")
+            cfg.write("test_section", "test_option2", "test_value2")
+            cfg.delete("test_section", "test_option")
+
+            assert cfg.read("test_section", "test_option2") == "test_value2"
+            mock_dump.assert_not_called()
+
+    mock_dump.assert_called_once()
+    new_cfg = Config(config_file_folder=TEST_CONFIG_FILE_FOLDER, config_file=TEST_CONFIG_FILE_NAME)
+    assert new_cfg.get("test_section") == {"test_option2": "test_value2"}
+
+
+def test_config_transaction_discarded_on_error(get_test_config):
+    cfg = get_test_config
+    cfg.write("test_section", "test_option", "test_value")
+
+    with pytest.raises(RuntimeError):
+        with cfg.transaction():
+            cfg.write("test_section", "test_option", "changed")
+            raise RuntimeError("boom")
+
+    assert cfg.read("test_section", "test_option") == "test_value"
+    with open(TEST_FILE_PATH, "r") as f:
+        assert "changed" not in f.read()
+
+
+def test_config_read_cached(get_test_config):
+    cfg = get_test_config
+    cfg.write("test_section", "test_option", {"key": "value"})
+
+    with patch.object(config.yaml_codec, "safe_load") as mock_load:
+        value = cfg.read("test_section", "test_option")
+        value["key"] = "modified"
+
+        assert cfg.read("test_section", "test_option") == {"key": "value"}
+        mock_load.assert_not_called()
+
+
+def test_config_cache_invalidated_on_change(get_test_config):
+    cfg = get_test_config
+    cfg.write("test_section", "test_option", "test_value")
+
+    with open(TEST_FILE_PATH, "a") as f:
+        f.write("other_section:\n  other_option: other_value\n")
+
+    assert cfg.read("other_section", "other_option") == "other_value"
+
+
+def write_options_in_process(prefix: str, count: int) -> None:
+    cfg = Config(config_file_folder=TEST_CONFIG_FILE_FOLDER, config_file=TEST_CONFIG_FILE_NAME)
+    for i in range(count):
+        cfg.write("test_section", f"{prefix}_{i}", i)
+
+
+def test_config_concurrent_writes_not_lost(get_test_config):
+    processes = [
+        multiprocessing.Process(target=write_options_in_process, args=(f"process{n}", 10))
+        for n in range(4)
+    ]
+    for process in processes:
+        process.start()
+    for process in processes:
+        process.join(timeout=60)
+
+    new_cfg = Config(config_file_folder=TEST_CONFIG_FILE_FOLDER, config_file=TEST_CONFIG_FILE_NAME)
+    assert len(new_cfg.get("test_section")) == 40
+    assert not [f for f in os.listdir(TEST_CONFIG_FILE_FOLDER) if f.endswith(".tmp")]
+
+
+def test_config_dirs_from_environment(tmp_path):
+    code = "from ibm_watsonx_orchestrate.cli import config; print(config.DEFAULT_CONFIG_FILE_FOLDER); print(config.AUTH_CONFIG_FILE_FOLDER)"
+    env = {
+        **os.environ,
+        config.CONFIG_DIR_ENV_VAR: str(tmp_path / "config"),
+        config.CACHE_DIR_ENV_VAR: str(tmp_path / "cache"),
+    }
+
+    output = subprocess.run([sys.executable, "-c", code], env=env, capture_output=True, text=True, check=True).stdout
+
+    assert output.splitlines() == [str(tmp_path / "config"), str(tmp_path / "cache")]
@@ -0,0 +1,95 @@
+import json
+import os
+import subprocess
+import sys
+
+from typer.testing import CliRunner
+
+from ibm_watsonx_orchestrate.cli.main import app, OrchestrateGroup
+
+# Dependencies of individual commands that must not be imported when starting the CLI
+HEAVY_MODULES = ["langchain_core", "ibm_cloud_sdk_core", "httpx", "docker", "requests", "jwt"]
+
+runner = CliRunner()
+
+
+def run_python(code: str, tmp_path) -> str:
+    env = {"ORCHESTRATE_CONFIG_DIR": str(tmp_path / "config"), "ORCHESTRATE_CACHE_DIR": str(tmp_path / "cache")}
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True,
+                            env={**os.environ, **env})
+    return result.stdout
+
+
+def get_loaded_modules(code: str, tmp_path) -> list[str]:
+    output = run_python(
+        code + f"\nimport json, sys; print(json.dumps([m for m in {HEAVY_MODULES!r} if m in sys.modules]))",
+        tmp_path
+    )
+    return json.loads(output.splitlines()[-1])
+
+
+class TestLazySubcommands:
+
+    def test_import_does_not_load_subcommands(self, tmp_path):
+        loaded = get_loaded_modules("import ibm_watsonx_orchestrate.cli.main", tmp_path)
+
+        assert loaded == []
+
+    def test_help_does_not_load_subcommands(self, tmp_path):
+        code = "\n".join([
+            "from typer.testing import CliRunner",
+            "from ibm_watsonx_orchestrate.cli.main import app",
+            "result = CliRunner().invoke(app, ['--help'])",
+            "assert result.exit_code == 0, result.output",
+        ])
+
+        assert get_loaded_modules(code, tmp_path) == []
+
+    def test_env_list_only_loads_what_it_needs(self, tmp_path):
+        code = "\n".join([
+            "from typer.testing import CliRunner",
+            "from ibm_watsonx_orchestrate.cli.main import app",
+            "result = CliRunner().invoke(app, ['env', 'list'])",
+            "assert result.exit_code == 0, result.output",
+        ])
+
+        assert get_loaded_modules(code, tmp_path) == []
+
+    def test_help_lists_every_subcommand(self):
+        result = runner.invoke(app, ["--help"])
+
+        assert result.exit_code == 0
+        for name in OrchestrateGroup.lazy_subcommands:
+            assert name in result.output
+
+    def test_subcommand_loaded_when_invoked(self):
+        result = runner.invoke(app, ["env", "--help"])
+
+        assert result.exit_code == 0
+        assert "activate" in result.output
+        assert "list" in result.output
+
+    def test_unknown_subcommand(self):
+        result = runner.invoke(app, ["unknown"])
+
+        assert result.exit_code != 0
+
+
+class TestLazyLogging:
+
+    def test_logging_configured_on_first_record(self, tmp_path):
+        code = "\n".join([
+            "import logging, sys",
+            "import ibm_watsonx_orchestrate",
+            "assert 'logging.config' not in sys.modules",
+            "logging.getLogger('ibm_watsonx_orchestrate.test').info('first message')",
+            "logging.getLogger('ibm_watsonx_orchestrate.test').debug('second message')",
+            "assert 'logging.config' in sys.modules",
+        ])
+
+        output = run_python(code, tmp_path)
+
+        assert "first message" in output
+        assert "second message" in output
+        assert output.count("first message") == 1
+
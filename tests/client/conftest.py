@@ -0,0 +1,21 @@
+import time
+
+import jwt
+import pytest
+
+
+def _make_token(expires_in: float | None, subject: str = "user", issued_ago: float | None = None) -> str:
+    claims = {"sub": subject}
+    if expires_in is not None:
+        claims["exp"] = int(time.time() + expires_in)
+    if issued_ago is not None:
+        claims["iat"] = int(time.time() - issued_ago)
+    return jwt.encode(claims, "test-secret-used-only-to-sign-test-tokens", algorithm="HS256")
+
+
+@pytest.fixture
+def make_token():
+    """
+    Signs test JWTs expiring in expires_in seconds, or never when it is None, issued issued_ago seconds ago
+    """
+    return _make_token
@@ -0,0 +1,156 @@
+import asyncio
+import json
+import threading
+import httpx
+import pytest
+from unittest.mock import patch, AsyncMock, MagicMock
+
+from ibm_watsonx_orchestrate.client import async_base_api_client
+from ibm_watsonx_orchestrate.client.async_base_api_client import get_async_session, aclose_sessions
+from ibm_watsonx_orchestrate.client.base_api_client import ClientAPIException
+from ibm_watsonx_orchestrate.client.rate_limiter import reset_rate_limiters
+from ibm_watsonx_orchestrate.client.agents.agent_client import AsyncAgentClient
+from ibm_watsonx_orchestrate.client.tools.tool_client import AsyncToolClient
+from ibm_watsonx_orchestrate.client.connections.connections_client import AsyncConnectionsClient
+
+
+def make_response(method, url, status_code=200, json=None, headers=None):
+    return httpx.Response(status_code, json=json, headers=headers, request=httpx.Request(method, url))
+
+
+@pytest.fixture(autouse=True)
+def no_sleep():
+    reset_rate_limiters()
+    with patch("ibm_watsonx_orchestrate.client.async_base_api_client.asyncio.sleep", new_callable=AsyncMock) as mock_sleep:
+        yield mock_sleep
+
+
+class TestAsyncSessions:
+    @pytest.mark.asyncio
+    async def test_session_shared_per_base_url(self):
+        client_a = AsyncToolClient(base_url="http://localhost:4321", is_local=True)
+        client_b = AsyncAgentClient(base_url="http://localhost:4321", is_local=True)
+        client_c = AsyncToolClient(base_url="http://localhost:4322", is_local=True)
+
+        assert client_a.session is client_b.session
+        assert client_a.session is not client_c.session
+        await aclose_sessions()
+
+    def test_session_per_event_loop(self):
+        async def get_session():
+            session = get_async_session("http://localhost:4321")
+            await aclose_sessions()
+            return session
+
+        assert asyncio.run(get_session()) is not asyncio.run(get_session())
+
+
+class TestAsyncRequests:
+    @pytest.mark.asyncio
+    async def test_get(self):
+        client = AsyncToolClient(base_url="http://localhost:4321", api_key="123", is_local=True)
+        response = make_response("GET", "http://localhost:4321/tools", json=[{"name": "test"}])
+        with patch.object(httpx.AsyncClient, "request", new_callable=AsyncMock, return_value=response) as mock_request:
+            result = await client.get()
+
+        assert result == [{"name": "test"}]
+        assert mock_request.call_args.args == ("GET", "http://localhost:4321/tools")
+        assert mock_request.call_args.kwargs["headers"] == {"Authorization": "Bearer 123"}
+        await aclose_sessions()
+
+    @pytest.mark.asyncio
+    async def test_authenticator_token_fetched_off_the_event_loop(self):
+        token_threads = []
+
+        def get_token():
+            token_threads.append(threading.current_thread())
+            return "from-authenticator"
+
+        authenticator = MagicMock()
+        authenticator.token_manager.get_token.side_effect = get_token
+        client = AsyncToolClient(base_url="http://localhost:4321", authenticator=authenticator, is_local=True)
+
+        assert await client._get_headers() == {"Authorization": "Bearer from-authenticator"}
+        assert token_threads and token_threads[0] is not threading.current_thread()
+
+    @pytest.mark.asyncio
+    async def test_retries_idempotent_requests(self, no_sleep):
+        client = AsyncToolClient(base_url="http://localhost:4321", is_local=True)
+        responses = [
+            make_response("GET", "http://localhost:4321/tools", status_code=429, headers={"Retry-After": "2"}),
+            make_response("GET", "http://localhost:4321/tools", status_code=503),
+            make_response("GET", "http://localhost:4321/tools", json=[]),
+        ]
+        with patch.object(httpx.AsyncClient, "request", new_callable=AsyncMock, side_effect=responses) as mock_request:
+            result = await client.get()
+
+        assert result == []
+        assert mock_request.call_count == 3
+        assert no_sleep.await_args_list[0].args[0] == pytest.approx(2.0, abs=0.1)
+        await aclose_sessions()
+
+    @pytest.mark.asyncio
+    async def test_does_not_retry_post(self):
+        client = AsyncToolClient(base_url="http://localhost:4321", is_local=True)
+        response = make_response("POST", "http://localhost:4321/tools", status_code=503)
+        with patch.object(httpx.AsyncClient, "request", new_callable=AsyncMock, return_value=response) as mock_request:
+            with pytest.raises(ClientAPIException) as e:
+                await client.create({"name": "test"})
+
+        assert mock_request.call_count == 1
+        assert e.value.response.status_code == 503
+        await aclose_sessions()
+
+    @pytest.mark.asyncio
+    async def test_json_body_encoded_by_codec(self):
+        client = AsyncToolClient(base_url="http://localhost:4321", is_local=True)
+        response = make_response("POST", "http://localhost:4321/tools", json={"id": "1"})
+        with patch.object(httpx.AsyncClient, "request", new_callable=AsyncMock, return_value=response) as mock_request:
+            assert await client.create({"name": "test"}) == {"id": "1"}
+
+        kwargs = mock_request.call_args.kwargs
+        assert "json" not in kwargs
+        assert json.loads(kwargs["content"]) == {"name": "test"}
+        assert kwargs["headers"]["Content-Type"] == "application/json"
+        await aclose_sessions()
+
+    @pytest.mark.asyncio
+    async def test_not_found_handling(self):
+        client = AsyncConnectionsClient(base_url="http://localhost:4321", is_local=True)
+        response = make_response("GET", "http://localhost:4321/connections/applications/test", status_code=404)
+        with patch.object(httpx.AsyncClient, "request", new_callable=AsyncMock, return_value=response):
+            result = await client.get(app_id="test")
+
+        assert result is None
+        await aclose_sessions()
+
+    @pytest.mark.asyncio
+    async def test_get_draft_by_app_ids_fans_out(self):
+        client = AsyncConnectionsClient(base_url="http://localhost:4321", is_local=True)
+
+        async def respond(method, url, **kwargs):
+            app_id = url.rsplit("/", 1)[-1]
+            if app_id == "missing":
+                return make_response(method, url, status_code=404)
+            return make_response(method, url, json={"app_id": app_id, "connection_id": f"{app_id}-id"})
+
+        with patch.object(httpx.AsyncClient, "request", new_callable=AsyncMock, side_effect=respond):
+            result = await client.get_draft_by_app_ids(["a", "missing", "b"])
+
+        assert [conn.connection_id for conn in result] == ["a-id", "b-id"]
+        await aclose_sessions()
+
+    @pytest.mark.asyncio
+    async def test_iter_tools_pages(self):
+        client = AsyncToolClient(base_url="http://localhost:4321", is_local=True)
+
+        async def respond(method, url, params=None, **kwargs):
+            offset, limit = params["offset"], params["limit"]
+            return make_response(method, url, json=[{"id": i} for i in range(3)][offset:offset + limit])
+
+        with patch.object(httpx.AsyncClient, "request", new_callable=AsyncMock, side_effect=respond) as mock_request:
+            result = [tool async for tool in client.iter_tools(page_size=2)]
+
+        assert result == [{"id": 0}, {"id": 1}, {"id": 2}]
+        assert mock_request.call_count == 2
+        await aclose_sessions()
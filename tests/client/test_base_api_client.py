@@ -0,0 +1,474 @@
+import gzip
+import json
+import threading
+import pytest
+import requests
+from unittest.mock import patch, MagicMock
+
+from ibm_watsonx_orchestrate.client import base_api_client
+from ibm_watsonx_orchestrate.client.response_cache import InMemoryResponseCache
+from ibm_watsonx_orchestrate.client.rate_limiter import reset_rate_limiters
+from ibm_watsonx_orchestrate.client.compression import get_encoding_negotiator
+from ibm_watsonx_orchestrate.client.base_api_client import (
+    BaseAPIClient,
+    ClientAPIException,
+    get_session,
+    close_sessions,
+    get_response_cache,
+    set_response_cache,
+    RETRY_STATUS_CODES,
+    DEFAULT_CONNECT_TIMEOUT,
+    DEFAULT_READ_TIMEOUT
+)
+
+
+class MockClient(BaseAPIClient):
+    def create(self, payload):
+        return self._post("/things", data=payload)
+
+    def get(self):
+        return self._get("/things")
+
+    def update(self, thing_id, payload):
+        return self._put(f"/things/{thing_id}", data=payload)
+
+    def delete(self, thing_id):
+        return self._delete(f"/things/{thing_id}")
+
+
+def mock_response(status_code=200, json_data=None, text="{}", headers=None):
+    response = requests.Response()
+    response.status_code = status_code
+    response._content = (json.dumps(json_data) if json_data is not None else text).encode()
+    response._content_consumed = True
+    response.headers.update(headers or {})
+    return response
+
+
+@pytest.fixture(autouse=True)
+def reset_sessions():
+    close_sessions()
+    reset_rate_limiters()
+    get_encoding_negotiator().reset()
+    previous_cache = get_response_cache()
+    set_response_cache(InMemoryResponseCache())
+    yield
+    set_response_cache(previous_cache)
+    close_sessions()
+
+
+class TestSessionPool:
+    def test_clients_share_session_per_base_url(self):
+        client_a = MockClient(base_url="http://localhost:4321", is_local=True)
+        client_b = MockClient(base_url="http://localhost:4321/", is_local=True)
+        client_c = MockClient(base_url="http://localhost:4322", is_local=True)
+
+        assert client_a.session is client_b.session
+        assert client_a.session is not client_c.session
+
+    def test_threads_get_own_session_on_shared_pool(self):
+        main_session = get_session("http://localhost:4321")
+        thread_sessions = []
+
+        thread = threading.Thread(target=lambda: thread_sessions.append(get_session("http://localhost:4321")))
+        thread.start()
+        thread.join()
+
+        assert thread_sessions[0] is not main_session
+        assert thread_sessions[0].get_adapter("http://localhost:4321") is main_session.get_adapter("http://localhost:4321")
+
+    def test_retry_configuration(self):
+        session = get_session("http://localhost:4321", max_retries=5, backoff_factor=2)
+        retry = session.get_adapter("http://localhost:4321").max_retries
+
+        assert retry.total == 5
+        assert retry.backoff_factor == 2
+        assert retry.backoff_jitter > 0
+        assert set(retry.status_forcelist) == set(RETRY_STATUS_CODES) - {429}
+        assert "POST" not in retry.allowed_methods
+        assert "PATCH" not in retry.allowed_methods
+        assert "GET" in retry.allowed_methods
+        assert retry.respect_retry_after_header
+
+    def test_close_sessions(self):
+        session = get_session("http://localhost:4321")
+        close_sessions()
+        assert get_session("http://localhost:4321") is not session
+        assert base_api_client._ADAPTERS
+
+
+class TestRequests:
+    def test_get_uses_pooled_session_and_timeout(self):
+        client = MockClient(base_url="http://localhost:4321", api_key="123", is_local=True)
+        with patch("requests.Session.request", return_value=mock_response(json_data=[{"name": "a"}])) as mock_request:
+            result = client.get()
+
+        assert result == [{"name": "a"}]
+        mock_request.assert_called_once_with(
+            "GET",
+            "http://localhost:4321/things",
+            headers={"Authorization": "Bearer 123"},
+            timeout=(DEFAULT_CONNECT_TIMEOUT, DEFAULT_READ_TIMEOUT),
+            params=None
+        )
+
+    def test_custom_timeout(self):
+        client = MockClient(base_url="http://localhost:4321", is_local=True, connect_timeout=1, read_timeout=2)
+        with patch("requests.Session.request", return_value=mock_response(text="")) as mock_request:
+            result = client.delete("1")
+
+        assert result == {}
+        assert mock_request.call_args.kwargs["timeout"] == (1, 2)
+
+    def test_remote_url_prefix(self):
+        client = MockClient(base_url="https://api.example.com", api_key="123")
+        with patch("requests.Session.request", return_value=mock_response()) as mock_request:
+            client.create({"name": "a"})
+
+        assert mock_request.call_args.args == ("POST", "https://api.example.com/v1/orchestrate/things")
+        assert json.loads(mock_request.call_args.kwargs["data"]) == {"name": "a"}
+        assert mock_request.call_args.kwargs["headers"]["Content-Type"] == "application/json"
+
+    def test_json_body_encoded_once(self):
+        client = MockClient(base_url="http://localhost:4321", is_local=True)
+        with patch("ibm_watsonx_orchestrate.client.base_api_client.json_codec.dumps", wraps=base_api_client.json_codec.dumps) as mock_dumps, \
+             patch("requests.Session.request", return_value=mock_response()) as mock_request:
+            client.create({"name": "a"})
+
+        mock_dumps.assert_called_once_with({"name": "a"})
+        assert "json" not in mock_request.call_args.kwargs
+        assert isinstance(mock_request.call_args.kwargs["data"], bytes)
+
+    def test_json_body_with_files_left_to_requests(self):
+        client = MockClient(base_url="http://localhost:4321", is_local=True)
+        with patch("requests.Session.request", return_value=mock_response()) as mock_request:
+            client._post("/things", data={"name": "a"}, files={"file": ("a.txt", b"content")})
+
+        assert mock_request.call_args.kwargs["json"] == {"name": "a"}
+        assert "data" not in mock_request.call_args.kwargs
+
+    def test_empty_response_body(self):
+        client = MockClient(base_url="http://localhost:4321", is_local=True)
+        with patch("requests.Session.request", return_value=mock_response(text="")):
+            assert client._delete("/things/1") == {}
+
+    def test_error_raises_client_api_exception(self):
+        client = MockClient(base_url="http://localhost:4321", is_local=True)
+        response = mock_response(status_code=503)
+        with patch("requests.Session.request", return_value=response):
+            with pytest.raises(ClientAPIException):
+                client.get()
+
+
+class TestThrottling:
+    def test_throttled_request_is_retried_after_retry_after(self):
+        client = MockClient(base_url="http://localhost:4321", is_local=True)
+        responses = [
+            mock_response(status_code=429, headers={"Retry-After": "3"}),
+            mock_response(json_data={"id": "1"}),
+        ]
+        with patch("requests.Session.request", side_effect=responses) as mock_request, \
+             patch("ibm_watsonx_orchestrate.client.rate_limiter.time.sleep") as mock_sleep:
+            result = client.update("1", {"name": "a"})
+
+        assert result == {"id": "1"}
+        assert mock_request.call_count == 2
+        assert mock_sleep.call_args.args[0] == pytest.approx(3, abs=0.1)
+
+    def test_throttled_post_is_not_resent(self):
+        client = MockClient(base_url="http://localhost:4321", is_local=True)
+        with patch("requests.Session.request", return_value=mock_response(status_code=429)) as mock_request:
+            with pytest.raises(ClientAPIException):
+                client.create({"name": "a"})
+
+        assert mock_request.call_count == 1
+
+    def test_gives_up_after_max_retries(self):
+        client = MockClient(base_url="http://localhost:4321", is_local=True, max_retries=1)
+        with patch("requests.Session.request", return_value=mock_response(status_code=429)) as mock_request, \
+             patch("ibm_watsonx_orchestrate.client.rate_limiter.time.sleep"):
+            with pytest.raises(ClientAPIException) as e:
+                client.get()
+
+        assert mock_request.call_count == 2
+        assert e.value.response.status_code == 429
+
+    def test_file_uploads_are_not_resent(self):
+        client = MockClient(base_url="http://localhost:4321", is_local=True)
+        with patch("requests.Session.request", return_value=mock_response(status_code=429)) as mock_request:
+            with pytest.raises(ClientAPIException):
+                client._post("/things", files={"file": b"content"})
+
+        assert mock_request.call_count == 1
+
+
+class TestRequestCompression:
+    payload = {"description": "a long description " * 200}
+
+    def test_disabled_by_default(self, monkeypatch):
+        monkeypatch.delenv("WXO_CLIENT_COMPRESS_REQUESTS", raising=False)
+        client = MockClient(base_url="http://localhost:4321", is_local=True)
+        with patch("requests.Session.request", return_value=mock_response()) as mock_request:
+            client.create(self.payload)
+
+        assert json.loads(mock_request.call_args.kwargs["data"]) == self.payload
+        assert "Content-Encoding" not in mock_request.call_args.kwargs["headers"]
+
+    def test_json_body_is_gzipped(self):
+        client = MockClient(base_url="http://localhost:4321", is_local=True, compress_requests=True)
+        with patch("ibm_watsonx_orchestrate.client.compression.ZSTD_AVAILABLE", False), \
+             patch("requests.Session.request", return_value=mock_response()) as mock_request:
+            client.create(self.payload)
+
+        headers = mock_request.call_args.kwargs["headers"]
+        assert headers["Content-Encoding"] == "gzip"
+        assert headers["Content-Type"] == "application/json"
+        assert json.loads(gzip.decompress(mock_request.call_args.kwargs["data"])) == self.payload
+
+    def test_small_body_not_compressed(self):
+        client = MockClient(base_url="http://localhost:4321", is_local=True, compress_requests=True)
+        with patch("requests.Session.request", return_value=mock_response()) as mock_request:
+            client.create({"name": "a"})
+
+        assert "Content-Encoding" not in mock_request.call_args.kwargs["headers"]
+        assert json.loads(mock_request.call_args.kwargs["data"]) == {"name": "a"}
+
+    def test_multipart_body_is_compressed(self):
+        client = MockClient(base_url="http://localhost:4321", is_local=True, compress_requests=True)
+        with patch("requests.Session.request", return_value=mock_response()) as mock_request:
+            client._post("/things/1/upload", files={"file": ("tool.zip", b"0" * 4096, "application/zip")})
+
+        headers = mock_request.call_args.kwargs["headers"]
+        assert headers["Content-Type"].startswith("multipart/form-data")
+        assert "Content-Encoding" in headers
+        assert len(mock_request.call_args.kwargs["data"]) < 4096
+
+    def test_falls_back_when_rejected(self):
+        client = MockClient(base_url="http://localhost:4321", is_local=True, compress_requests=True)
+        responses = [mock_response(status_code=415), mock_response(), mock_response()]
+        with patch("requests.Session.request", side_effect=responses) as mock_request:
+            client.create(self.payload)
+            client.create(self.payload)
+
+        calls = mock_request.call_args_list
+        assert "Content-Encoding" in calls[0].kwargs["headers"]
+        assert json.loads(calls[1].kwargs["data"]) == self.payload
+        assert calls[2].kwargs["headers"].get("Content-Encoding") != calls[0].kwargs["headers"]["Content-Encoding"]
+
+    def test_validation_errors_do_not_disable_compression(self):
+        client = MockClient(base_url="http://localhost:4321", is_local=True, compress_requests=True)
+        with patch("requests.Session.request", return_value=mock_response(status_code=422)) as mock_request:
+            with pytest.raises(ClientAPIException):
+                client.create(self.payload)
+
+        assert mock_request.call_count == 1
+        assert get_encoding_negotiator().get_encoding(client.base_url) == mock_request.call_args_list[0].kwargs["headers"]["Content-Encoding"]
+
+    def test_bad_request_about_encoding_falls_back(self):
+        client = MockClient(base_url="http://localhost:4321", is_local=True, compress_requests=True)
+        responses = [mock_response(status_code=400, text='{"detail": "Unsupported Content-Encoding"}'), mock_response()]
+        with patch("requests.Session.request", side_effect=responses) as mock_request:
+            client.create(self.payload)
+
+        assert mock_request.call_count == 2
+        assert "Content-Encoding" not in mock_request.call_args_list[1].kwargs["headers"]
+        assert get_encoding_negotiator().get_encoding(client.base_url) != mock_request.call_args_list[0].kwargs["headers"]["Content-Encoding"]
+
+    def test_accept_encoding_header(self):
+        client = MockClient(base_url="http://localhost:4321", is_local=True)
+        assert "gzip" in client.session.headers["Accept-Encoding"]
+
+
+class TestChunkedGet:
+    def test_single_chunk(self):
+        client = MockClient(base_url="http://localhost:4321", is_local=True)
+        with patch("requests.Session.request", return_value=mock_response(json_data=[{"name": "a b"}])) as mock_request:
+            result = client._get_chunked("/things", "names", ["a b", "c&d"])
+
+        assert result == [{"name": "a b"}]
+        assert mock_request.call_args.args == ("GET", "http://localhost:4321/things?names=a%20b&names=c%26d")
+
+    def test_empty_values_skip_request(self):
+        client = MockClient(base_url="http://localhost:4321", is_local=True)
+        with patch("requests.Session.request") as mock_request:
+            assert client._get_chunked("/things", "names", []) == []
+        mock_request.assert_not_called()
+
+    def test_many_values_are_chunked(self):
+        client = MockClient(base_url="http://localhost:4321", is_local=True)
+        names = [f"name_{i}" for i in range(250)]
+
+        def respond(method, url, **kwargs):
+            return mock_response(json_data=[{"name": q.split("=")[1]} for q in url.split("?")[1].split("&")])
+
+        with patch("requests.Session.request", side_effect=respond) as mock_request:
+            result = client._get_chunked("/things?include_hidden=true", "names", names)
+
+        assert mock_request.call_count == 3
+        for call in mock_request.call_args_list:
+            assert call.args[1].startswith("http://localhost:4321/things?include_hidden=true&names=")
+        assert sorted(r["name"] for r in result if r["name"] != "true") == sorted(names)
+
+
+class TestResponseCache:
+    def test_revalidates_with_etag(self):
+        client = MockClient(base_url="http://localhost:4321", is_local=True)
+        responses = [
+            mock_response(json_data=[{"name": "a"}], headers={"ETag": '"v1"'}),
+            mock_response(status_code=304, text=""),
+        ]
+        with patch("requests.Session.request", side_effect=responses) as mock_request:
+            first = client.get()
+            first.append({"name": "mutated"})
+            second = client.get()
+
+        assert second == [{"name": "a"}]
+        assert "If-None-Match" not in mock_request.call_args_list[0].kwargs["headers"]
+        assert mock_request.call_args_list[1].kwargs["headers"]["If-None-Match"] == '"v1"'
+
+    def test_revalidates_with_last_modified(self):
+        client = MockClient(base_url="http://localhost:4321", is_local=True)
+        last_modified = "Wed, 21 Oct 2015 07:28:00 GMT"
+        responses = [
+            mock_response(json_data=[], headers={"Last-Modified": last_modified}),
+            mock_response(status_code=304, text=""),
+        ]
+        with patch("requests.Session.request", side_effect=responses) as mock_request:
+            client.get()
+            client.get()
+
+        assert mock_request.call_args_list[1].kwargs["headers"]["If-Modified-Since"] == last_modified
+
+    def test_responses_without_validators_not_cached(self):
+        client = MockClient(base_url="http://localhost:4321", is_local=True)
+        with patch("requests.Session.request", return_value=mock_response(json_data=[])) as mock_request:
+            client.get()
+            client.get()
+
+        assert "If-None-Match" not in mock_request.call_args_list[1].kwargs["headers"]
+
+    def test_cache_scoped_by_token(self):
+        client_a = MockClient(base_url="http://localhost:4321", api_key="a", is_local=True)
+        client_b = MockClient(base_url="http://localhost:4321", api_key="b", is_local=True)
+        with patch("requests.Session.request", return_value=mock_response(json_data=[], headers={"ETag": '"v1"'})) as mock_request:
+            client_a.get()
+            client_b.get()
+
+        assert "If-None-Match" not in mock_request.call_args_list[1].kwargs["headers"]
+
+    def test_mutation_invalidates_resource(self):
+        client = MockClient(base_url="http://localhost:4321", is_local=True)
+        with patch("requests.Session.request", return_value=mock_response(json_data=[], headers={"ETag": '"v1"'})) as mock_request:
+            client.get()
+            client.update("1", {"name": "b"})
+            client.get()
+
+        assert "If-None-Match" not in mock_request.call_args_list[2].kwargs["headers"]
+
+    def test_cache_can_be_disabled(self):
+        set_response_cache(None)
+        client = MockClient(base_url="http://localhost:4321", is_local=True)
+        with patch("requests.Session.request", return_value=mock_response(json_data=[], headers={"ETag": '"v1"'})) as mock_request:
+            client.get()
+            client.get()
+
+        assert "If-None-Match" not in mock_request.call_args_list[1].kwargs["headers"]
+
+    def test_concurrent_identical_gets_are_merged(self):
+        client = MockClient(base_url="http://localhost:4321", is_local=True)
+        release = threading.Event()
+        started = threading.Event()
+
+        def respond(method, url, **kwargs):
+            started.set()
+            release.wait(5)
+            return mock_response(json_data=[{"name": "a"}])
+
+        results = []
+        with patch("requests.Session.request", side_effect=respond) as mock_request:
+            threads = [threading.Thread(target=lambda: results.append(client.get())) for _ in range(4)]
+            threads[0].start()
+            started.wait(5)
+            for thread in threads[1:]:
+                thread.start()
+            # give the followers time to join the in flight request
+            threading.Event().wait(0.1)
+            release.set()
+            for thread in threads:
+                thread.join()
+
+        assert mock_request.call_count == 1
+        assert results == [[{"name": "a"}]] * 4
+
+
+class TestStreamingGet:
+    def test_yields_elements(self):
+        client = MockClient(base_url="http://localhost:4321", is_local=True)
+        response = mock_response(json_data=[{"name": "a"}, {"name": "b"}])
+        with patch("requests.Session.request", return_value=response) as mock_request:
+            result = list(client._get_stream("/things"))
+
+        assert result == [{"name": "a"}, {"name": "b"}]
+        assert mock_request.call_args.kwargs["stream"] is True
+
+    def test_yields_elements_of_key(self):
+        client = MockClient(base_url="http://localhost:4321", is_local=True)
+        response = mock_response(json_data={"applications": [{"app_id": "a"}]})
+        with patch("requests.Session.request", return_value=response):
+            assert list(client._get_stream("/things", key="applications")) == [{"app_id": "a"}]
+
+    def test_error_raised_on_iteration(self):
+        client = MockClient(base_url="http://localhost:4321", is_local=True)
+        with patch("requests.Session.request", return_value=mock_response(status_code=404)):
+            with pytest.raises(ClientAPIException):
+                list(client._get_stream("/things"))
+
+
+class TestPaginatedGet:
+    def test_iterates_pages(self):
+        client = MockClient(base_url="http://localhost:4321", is_local=True)
+
+        def respond(method, url, params=None, **kwargs):
+            offset, limit = params["offset"], params["limit"]
+            return mock_response(json_data=[{"id": i} for i in range(5)][offset:offset + limit])
+
+        with patch("requests.Session.request", side_effect=respond) as mock_request:
+            result = list(client._iter_pages("/things", page_size=2, sort="id"))
+
+        assert result == [{"id": i} for i in range(5)]
+        assert [call.kwargs["params"]["offset"] for call in mock_request.call_args_list] == [0, 2, 4]
+        assert all(call.kwargs["params"]["sort"] == "id" for call in mock_request.call_args_list)
+
+
+class TestRequestHooks:
+    def test_hook_receives_metrics(self):
+        client = MockClient(base_url="http://localhost:4321", is_local=True)
+        received = []
+        BaseAPIClient.add_request_hook(received.append)
+        try:
+            with patch("requests.Session.request", return_value=mock_response(json_data={"id": "1"})):
+                client.update("3fa85f64-5717-4562-b3fc-2c963f66afa6", {"name": "a"})
+        finally:
+            BaseAPIClient.remove_request_hook(received.append)
+
+        assert len(received) == 1
+        metrics = received[0]
+        assert metrics.client == "MockClient"
+        assert metrics.method == "PUT"
+        assert metrics.path_template == "/things/{id}"
+        assert metrics.status == 200
+        assert metrics.bytes_received == len(b'{"id": "1"}')
+        assert metrics.elapsed >= 0
+
+    def test_hook_receives_failed_requests(self):
+        client = MockClient(base_url="http://localhost:4321", is_local=True)
+        received = []
+        BaseAPIClient.add_request_hook(received.append)
+        try:
+            with patch("requests.Session.request", side_effect=requests.ConnectionError()):
+                with pytest.raises(requests.ConnectionError):
+                    client.get()
+        finally:
+            BaseAPIClient.remove_request_hook(received.append)
+
+        assert received[0].status is None
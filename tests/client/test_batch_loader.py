@@ -0,0 +1,142 @@
+import threading
+from unittest.mock import patch
+
+import pytest
+
+from ibm_watsonx_orchestrate.client.batch_loader import BatchLoader, chunk_query_values, fetch_each
+
+
+class TestChunkQueryValues:
+    def test_single_chunk(self):
+        assert chunk_query_values("http://test/tools", "names", ["a", "b"]) == ["names=a&names=b"]
+
+    def test_values_are_encoded_and_deduplicated(self):
+        assert chunk_query_values("http://test/tools", "names", ["a b", "a b", "x/y"]) == ["names=a%20b&names=x%2Fy"]
+
+    def test_respects_max_chunk_size(self):
+        chunks = chunk_query_values("http://test/tools", "ids", [str(i) for i in range(5)], max_chunk_size=2)
+        assert chunks == ["ids=0&ids=1", "ids=2&ids=3", "ids=4"]
+
+    def test_respects_max_url_length(self):
+        url = "http://test/tools"
+        values = [f"value_{i:03}" for i in range(100)]
+        chunks = chunk_query_values(url, "names", values, max_url_length=200)
+
+        assert len(chunks) > 1
+        for chunk in chunks:
+            assert len(url) + 1 + len(chunk) <= 200
+        assert [pair.split("=")[1] for chunk in chunks for pair in chunk.split("&")] == values
+
+    def test_oversized_value_gets_own_chunk(self):
+        chunks = chunk_query_values("http://test/tools", "names", ["a", "b" * 100, "c"], max_url_length=50)
+        assert chunks == ["names=a", f"names={'b' * 100}", "names=c"]
+
+
+class TestFetchEach:
+    def test_fetches_each_distinct_key_once(self):
+        calls = []
+
+        def fetch(key):
+            calls.append(key)
+            return {"id": key}
+
+        assert fetch_each(fetch, ["a", "b", "a"]) == {"a": {"id": "a"}, "b": {"id": "b"}}
+        assert sorted(calls) == ["a", "b"]
+
+    def test_failed_fetch_maps_to_none(self):
+        def fetch(key):
+            if key == "b":
+                raise ValueError("failed")
+            return key
+
+        assert fetch_each(fetch, ["a", "b", "c"]) == {"a": "a", "b": None, "c": "c"}
+
+
+class TestBatchLoader:
+    def test_load_many_uses_single_batch(self):
+        calls = []
+
+        def batch_fn(names):
+            calls.append(names)
+            return [{"name": name, "id": f"{name}-id"} for name in names if name != "missing"]
+
+        loader = BatchLoader(batch_fn, key_fn=lambda x: x.get("name"))
+        results = loader.load_many(["a", "b", "missing", "a"])
+
+        assert calls == [["a", "b", "missing"]]
+        assert results == [[{"name": "a", "id": "a-id"}], [{"name": "b", "id": "b-id"}], [], [{"name": "a", "id": "a-id"}]]
+
+    def test_single_key_returns_response_as_is(self):
+        loader = BatchLoader(lambda names: [{"name": "A"}], key_fn=lambda x: x.get("name"))
+        assert loader.load("a").result() == [{"name": "A"}]
+
+    def test_sequential_loads_issue_separate_batches(self):
+        calls = []
+        loader = BatchLoader(lambda names: calls.append(names) or [], key_fn=lambda x: x.get("name"))
+
+        loader.load("a").result()
+        loader.load("b").result()
+
+        assert calls == [["a"], ["b"]]
+
+    def test_sequential_loads_do_not_wait_for_batch_window(self):
+        calls = []
+        loader = BatchLoader(lambda names: calls.append(names) or [], key_fn=lambda x: x.get("name"), batch_window=60)
+
+        with patch("ibm_watsonx_orchestrate.client.batch_loader.time.sleep") as mock_sleep:
+            for name in ["a", "b", "c"]:
+                loader.load(name).result()
+            futures = [loader.load(name) for name in ["d", "e"]]
+            for future in futures:
+                future.result()
+
+        mock_sleep.assert_not_called()
+        assert calls == [["a"], ["b"], ["c"], ["d", "e"]]
+
+    def test_max_batch_size(self):
+        calls = []
+        loader = BatchLoader(lambda names: calls.append(names) or [], key_fn=lambda x: x.get("name"), max_batch_size=2)
+
+        loader.load_many(["a", "b", "c"])
+
+        assert calls == [["a", "b"], ["c"]]
+
+    def test_concurrent_loads_are_batched(self):
+        calls = []
+        barrier = threading.Barrier(5)
+        loaded = threading.Barrier(5)
+
+        def batch_fn(names):
+            calls.append(names)
+            return [{"name": name} for name in names]
+
+        loader = BatchLoader(batch_fn, key_fn=lambda x: x.get("name"), batch_window=0.5)
+        results = {}
+
+        def worker(name):
+            barrier.wait()
+            future = loader.load(name)
+            loaded.wait()
+            results[name] = future.result()
+
+        threads = [threading.Thread(target=worker, args=(f"name_{i}",)) for i in range(5)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(calls) == 1
+        assert sorted(calls[0]) == sorted(results.keys())
+        for name, result in results.items():
+            assert result == [{"name": name}]
+
+    def test_errors_are_propagated_to_every_caller(self):
+        def batch_fn(names):
+            raise ValueError("boom")
+
+        loader = BatchLoader(batch_fn, key_fn=lambda x: x.get("name"))
+        futures = [loader.load("a"), loader.load("b")]
+
+        for future in futures:
+            with pytest.raises(ValueError):
+                future.result()
@@ -0,0 +1,63 @@
+import gzip
+import pytest
+
+from ibm_watsonx_orchestrate.client.compression import (
+    EncodingNegotiator,
+    compress,
+    get_supported_encodings,
+    is_compression_enabled,
+    is_encoding_rejected,
+    ZSTD_AVAILABLE
+)
+
+
+class TestCompress:
+    def test_gzip_roundtrip(self):
+        assert gzip.decompress(compress(b"payload" * 100, "gzip")) == b"payload" * 100
+
+    @pytest.mark.skipif(not ZSTD_AVAILABLE, reason="zstandard is not installed")
+    def test_zstd_roundtrip(self):
+        import zstandard
+        assert zstandard.ZstdDecompressor().decompress(compress(b"payload" * 100, "zstd")) == b"payload" * 100
+
+    def test_unknown_encoding(self):
+        with pytest.raises(ValueError):
+            compress(b"", "br")
+
+
+class TestEncodingNegotiator:
+    def test_prefers_first_supported(self):
+        assert EncodingNegotiator().get_encoding("http://a") == get_supported_encodings()[0]
+
+    def test_falls_back_per_environment(self):
+        negotiator = EncodingNegotiator()
+        for encoding in get_supported_encodings():
+            negotiator.reject("http://a", encoding)
+
+        assert negotiator.get_encoding("http://a") is None
+        assert negotiator.get_encoding("http://b") is not None
+
+    def test_accept_encoding_header_narrows_candidates(self):
+        negotiator = EncodingNegotiator()
+        negotiator.reject("http://a", "zstd", accepted="gzip;q=1.0, identity")
+        assert negotiator.get_encoding("http://a") == "gzip"
+
+        negotiator.reject("http://b", "zstd", accepted="identity")
+        assert negotiator.get_encoding("http://b") is None
+
+
+@pytest.mark.parametrize(("value", "expected"), [("true", True), ("1", True), ("false", False), ("", False)])
+def test_is_compression_enabled(monkeypatch, value, expected):
+    monkeypatch.setenv("WXO_CLIENT_COMPRESS_REQUESTS", value)
+    assert is_compression_enabled() == expected
+
+
+@pytest.mark.parametrize(("status_code", "body", "expected"), [
+    (415, "", True),
+    (400, '{"detail": "unsupported content encoding zstd"}', True),
+    (400, '{"detail": "name is required"}', False),
+    (422, '{"detail": "invalid gzip"}', False),
+    (500, "", False),
+])
+def test_is_encoding_rejected(status_code, body, expected):
+    assert is_encoding_rejected(status_code, body) == expected
@@ -0,0 +1,67 @@
+import json
+from unittest.mock import patch
+
+import pytest
+
+from ibm_watsonx_orchestrate.client.json_stream import iter_json_array
+
+
+def split_bytes(document: str, size: int):
+    data = document.encode()
+    return [data[i:i + size] for i in range(0, len(data), size)]
+
+
+ITEMS = [
+    {"name": "tool_1", "description": "ünïcödé ✅", "tags": ["a", "b"]},
+    {"name": "tool_2", "value": 12345.678, "nested": {"list": [1, 2, {"x": None}]}},
+    "a string with \"escaped\" quotes, commas and ] brackets",
+    {"path": "C:\\dir\\", "brackets": "}{[", "empty": []},
+    -42,
+    True,
+    None,
+]
+
+
+class TestIterJsonArray:
+    @pytest.mark.parametrize("chunk_size", [1, 2, 7, 1024])
+    def test_array(self, chunk_size):
+        document = json.dumps(ITEMS, ensure_ascii=False, indent=2)
+        assert list(iter_json_array(split_bytes(document, chunk_size))) == ITEMS
+
+    @pytest.mark.parametrize("document", ["[]", "  [ ]  "])
+    def test_empty(self, document):
+        assert list(iter_json_array(split_bytes(document, 1))) == []
+
+    def test_number_split_across_chunks(self):
+        assert list(iter_json_array([b"[12", b"34]"])) == [1234]
+
+    def test_yields_before_end_of_stream(self):
+        def chunks():
+            yield b'[{"name": "first"},'
+            raise AssertionError("read past the first element")
+
+        assert next(iter_json_array(chunks())) == {"name": "first"}
+
+    def test_element_spread_over_many_chunks_is_decoded_once(self):
+        document = json.dumps([{"values": list(range(2000))}, {"name": "next"}])
+        raw_decode = json.JSONDecoder.raw_decode
+        with patch.object(json.JSONDecoder, "raw_decode", autospec=True, side_effect=raw_decode) as mock_raw_decode:
+            items = list(iter_json_array(split_bytes(document, 16)))
+
+        assert items == json.loads(document)
+        assert mock_raw_decode.call_count == 2
+
+    @pytest.mark.parametrize("chunk_size", [1, 5, 1024])
+    def test_key(self, chunk_size):
+        document = json.dumps({"total": 2, "meta": {"applications": "no"}, "applications": ITEMS, "after": [1]})
+        assert list(iter_json_array(split_bytes(document, chunk_size), key="applications")) == ITEMS
+
+    def test_missing_key(self):
+        assert list(iter_json_array([b'{"total": 0}'], key="applications")) == []
+
+    def test_non_array_document(self):
+        assert list(iter_json_array([b'{"name": "a"}'])) == [{"name": "a"}]
+
+    def test_invalid_document(self):
+        with pytest.raises(json.JSONDecodeError):
+            list(iter_json_array([b'[{"name": "a"}, {"name": ']))
@@ -1,8 +1,24 @@
+import json
+import os
+import subprocess
+
+import jwt
+import pytest
+import requests
+
+from ibm_watsonx_orchestrate.client import local_service_instance
 from ibm_watsonx_orchestrate.client.local_service_instance import LocalServiceInstance
 from ibm_watsonx_orchestrate.client.credentials import Credentials
 from ibm_watsonx_orchestrate.client.client import Client
 from unittest.mock import patch
 
+
+@pytest.fixture(autouse=True)
+def forget_local_db_volume():
+    with patch("ibm_watsonx_orchestrate.client.local_service_instance._local_db_volume_id", None):
+        yield
+
+
 @patch("ibm_watsonx_orchestrate.client.local_service_instance.LocalServiceInstance._get_user_auth_token",
                return_value="111")
 @patch("ibm_watsonx_orchestrate.client.local_service_instance.LocalServiceInstance.get_default_tenant",
@@ -15,3 +31,122 @@ def test(mock1, mock2, mock3):
     service_instance = LocalServiceInstance(client)
     assert  True
 
+
+
+GLOBAL_TOKEN = jwt.encode({"sub": "wxo.archer@ibm.com"}, "test-secret-used-only-to-sign-test-tokens", algorithm="HS256")
+TENANT_TOKEN = jwt.encode({"woTenantId": "tenant-x"}, "test-secret-used-only-to-sign-test-tokens", algorithm="HS256")
+
+
+class TestLocalTenantCache:
+
+    @pytest.fixture(autouse=True)
+    def cache_dir(self, tmp_path):
+        with patch("ibm_watsonx_orchestrate.client.local_service_instance.AUTH_CONFIG_FILE_FOLDER", str(tmp_path)):
+            yield tmp_path
+
+    @pytest.fixture
+    def auth_calls(self):
+        with patch.object(LocalServiceInstance, "_get_user_auth_token", return_value=GLOBAL_TOKEN) as user_token, \
+                patch.object(LocalServiceInstance, "get_default_tenant", return_value={"id": "tenant-x"}) as tenant, \
+                patch.object(LocalServiceInstance, "_get_tenant_token", return_value=TENANT_TOKEN) as tenant_token:
+            yield user_token, tenant, tenant_token
+
+    def make_client(self, volume_id):
+        with patch("ibm_watsonx_orchestrate.client.local_service_instance.get_local_db_volume_id", return_value=volume_id):
+            return Client(Credentials(url="http://localhost:4321", api_key="2"))
+
+    def test_tenant_reused_for_same_volume(self, auth_calls):
+        user_token, tenant, tenant_token = auth_calls
+
+        first = self.make_client("docker_wxo-server-db@2025-01-01")
+        second = self.make_client("docker_wxo-server-db@2025-01-01")
+
+        assert user_token.call_count == 1
+        # The second client only checks the cached tenant is still accepted
+        assert tenant.call_count == 2
+        assert tenant_token.call_count == 1
+        assert second.token == first.token == TENANT_TOKEN
+        assert second.service_instance.tenant_id == "tenant-x"
+        assert second.credentials.local_global_token == GLOBAL_TOKEN
+
+    def test_tenant_fetched_again_for_new_volume(self, auth_calls):
+        user_token, _, _ = auth_calls
+
+        self.make_client("docker_wxo-server-db@2025-01-01")
+        self.make_client("docker_wxo-server-db@2025-02-01")
+
+        assert user_token.call_count == 2
+
+    def test_not_cached_without_docker(self, auth_calls, cache_dir):
+        user_token, _, _ = auth_calls
+
+        self.make_client(None)
+        self.make_client(None)
+
+        assert user_token.call_count == 2
+        assert not os.path.exists(cache_dir / local_service_instance.LOCAL_TENANT_CACHE_FILE)
+
+    def test_clear_local_tenant_cache(self, auth_calls):
+        user_token, _, _ = auth_calls
+
+        self.make_client("docker_wxo-server-db@2025-01-01")
+        local_service_instance.clear_local_tenant_cache()
+        self.make_client("docker_wxo-server-db@2025-01-01")
+
+        assert user_token.call_count == 2
+
+    def test_rejected_cached_token_dropped(self, auth_calls, cache_dir):
+        user_token, tenant, _ = auth_calls
+        self.make_client("docker_wxo-server-db@2025-01-01")
+
+        unauthorized = requests.Response()
+        unauthorized.status_code = 401
+        tenant.side_effect = [requests.HTTPError(response=unauthorized), {"id": "tenant-x"}]
+        with patch.object(local_service_instance, "save_local_tenant") as save:
+            self.make_client("docker_wxo-server-db@2025-01-01")
+
+        assert user_token.call_count == 2
+        save.assert_called_once()
+        assert "http://localhost:4321" not in json.loads((cache_dir / local_service_instance.LOCAL_TENANT_CACHE_FILE).read_text())
+
+    def test_invalid_cached_token_ignored(self, auth_calls):
+        user_token, _, _ = auth_calls
+        local_service_instance.save_local_tenant(
+            "http://localhost:4321", "docker_wxo-server-db@2025-01-01", "tenant-x", GLOBAL_TOKEN, "not a token"
+        )
+
+        self.make_client("docker_wxo-server-db@2025-01-01")
+
+        # The cached tenant token is not a JWT, the entry is not trusted
+        assert user_token.call_count == 1
+
+
+class TestGetLocalDbVolumeId:
+
+    def test_volume_identity(self):
+        results = [
+            subprocess.CompletedProcess([], 0, stdout="docker_wxo-server-db\n"),
+            subprocess.CompletedProcess([], 0, stdout="docker_wxo-server-db@2025-01-01T00:00:00Z\n"),
+        ]
+        with patch("ibm_watsonx_orchestrate.client.local_service_instance.subprocess.run", side_effect=results):
+            assert local_service_instance.get_local_db_volume_id() == "docker_wxo-server-db@2025-01-01T00:00:00Z"
+
+    def test_volume_identity_memoised(self):
+        results = [
+            subprocess.CompletedProcess([], 0, stdout="docker_wxo-server-db\n"),
+            subprocess.CompletedProcess([], 0, stdout="docker_wxo-server-db@2025-01-01T00:00:00Z\n"),
+        ]
+        with patch("ibm_watsonx_orchestrate.client.local_service_instance.subprocess.run", side_effect=results) as run:
+            local_service_instance.get_local_db_volume_id()
+            assert local_service_instance.get_local_db_volume_id() == "docker_wxo-server-db@2025-01-01T00:00:00Z"
+
+        assert run.call_count == 2
+
+    def test_no_volume(self):
+        with patch("ibm_watsonx_orchestrate.client.local_service_instance.subprocess.run",
+                   return_value=subprocess.CompletedProcess([], 0, stdout="")):
+            assert local_service_instance.get_local_db_volume_id() is None
+
+    def test_docker_not_installed(self):
+        with patch("ibm_watsonx_orchestrate.client.local_service_instance.subprocess.run", side_effect=FileNotFoundError):
+            assert local_service_instance.get_local_db_volume_id() is None
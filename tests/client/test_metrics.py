@@ -0,0 +1,86 @@
+import subprocess
+import sys
+
+import pytest
+
+from ibm_watsonx_orchestrate.client.metrics import (
+    LatencyHistogram,
+    MetricsRecorder,
+    RequestMetrics,
+    get_path_template
+)
+
+
+class TestGetPathTemplate:
+    @pytest.mark.parametrize(
+        ("path", "expected"),
+        [
+            ("/tools", "/tools"),
+            ("/tools/3fa85f64-5717-4562-b3fc-2c963f66afa6", "/tools/{id}"),
+            ("/tools/3fa85f64-5717-4562-b3fc-2c963f66afa6/upload", "/tools/{id}/upload"),
+            ("/orchestrate/toolkits/42", "/orchestrate/toolkits/{id}"),
+            ("/tools?names=a&names=b", "/tools"),
+            ("/connections/applications/my_app", "/connections/applications/my_app"),
+        ]
+    )
+    def test_templates(self, path, expected):
+        assert get_path_template(path) == expected
+
+
+class TestLatencyHistogram:
+    def test_percentiles_within_error_bound(self):
+        histogram = LatencyHistogram()
+        for ms in range(1, 1001):
+            histogram.record(ms / 1000)
+
+        assert histogram.count == 1000
+        assert histogram.percentile(50) == pytest.approx(0.5, rel=0.01)
+        assert histogram.percentile(95) == pytest.approx(0.95, rel=0.01)
+        assert histogram.percentile(99) == pytest.approx(0.99, rel=0.01)
+        assert histogram.percentile(100) == pytest.approx(1.0)
+        assert histogram.min == pytest.approx(0.001)
+        assert histogram.mean == pytest.approx(0.5005)
+
+    def test_wide_range(self):
+        histogram = LatencyHistogram()
+        histogram.record(0.00001)
+        histogram.record(100)
+        assert histogram.percentile(50) == pytest.approx(0.00001, abs=1e-6)
+        assert histogram.percentile(99) == pytest.approx(100, rel=0.01)
+
+    def test_empty(self):
+        assert LatencyHistogram().percentile(99) == 0
+
+
+class TestMetricsRecorder:
+    def test_aggregates_per_endpoint_and_client(self):
+        recorder = MetricsRecorder()
+        recorder(RequestMetrics("ToolClient", "GET", "/tools", 200, 0, 100, 0.1))
+        recorder(RequestMetrics("ToolClient", "GET", "/tools", 500, 0, 10, 0.3))
+        recorder(RequestMetrics("ToolClient", "POST", "/tools", 200, 50, 20, 0.2))
+        recorder(RequestMetrics("AgentClient", "GET", "/agents", None, 0, None, 1.0))
+
+        assert recorder.endpoints[("ToolClient", "GET", "/tools")].count == 2
+        assert recorder.clients["ToolClient"].count == 3
+        assert recorder.errors == {("ToolClient", "GET", "/tools"): 1, ("AgentClient", "GET", "/agents"): 1}
+        assert recorder.bytes_sent["ToolClient"] == 50
+        assert recorder.bytes_received["ToolClient"] == 130
+
+    def test_print_summary(self, capsys):
+        recorder = MetricsRecorder()
+        recorder(RequestMetrics("ToolClient", "GET", "/tools/{id}", 200, 0, 100, 0.1))
+        recorder.print_summary()
+
+        captured = capsys.readouterr()
+        assert "Request timings by endpoint" in captured.out
+        assert "Request timings by client" in captured.out
+
+    def test_print_summary_without_requests(self, capsys):
+        MetricsRecorder().print_summary()
+        assert capsys.readouterr().out == ""
+
+
+def test_rich_loaded_only_to_print_summary():
+    code = "import sys, ibm_watsonx_orchestrate.client.metrics; print('rich' in sys.modules)"
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    assert result.stdout.strip() == "False"
@@ -0,0 +1,106 @@
+import pytest
+
+from ibm_watsonx_orchestrate.client.pagination import Paginator, is_sorted, matches_filter, parse_filters, sort_items
+
+
+def paginate(items, paginator, obeys_pagination=True):
+    """
+    Runs a paginator against an in memory endpoint, returns the yielded items and the params of each request
+    """
+    requests = []
+    results = []
+    while (params := paginator.next_params()) is not None:
+        requests.append(params)
+        page = items[params["offset"]:params["offset"] + params["limit"]] if obeys_pagination else items
+        results.extend(paginator.consume(iter(page)))
+    return results, requests
+
+
+ITEMS = [{"id": str(i), "name": f"item_{i:02d}", "tags": ["even" if i % 2 == 0 else "odd"]} for i in range(25)]
+
+
+class TestPaginator:
+    def test_pages_through_everything(self):
+        results, requests = paginate(ITEMS, Paginator(page_size=10))
+        assert results == ITEMS
+        assert [(r["limit"], r["offset"]) for r in requests] == [(10, 0), (10, 10), (10, 20)]
+
+    def test_exact_multiple_of_page_size(self):
+        results, requests = paginate(ITEMS[:20], Paginator(page_size=10))
+        assert results == ITEMS[:20]
+        assert len(requests) == 3
+
+    def test_limit(self):
+        results, requests = paginate(ITEMS, Paginator(page_size=10, limit=12))
+        assert results == ITEMS[:12]
+        assert [(r["limit"], r["offset"]) for r in requests] == [(10, 0), (2, 10)]
+
+    def test_filter_and_sort_sent_to_server(self):
+        _, requests = paginate([], Paginator(page_size=10, filter={"name": "a"}, sort="-name"))
+        assert requests == [{"name": "a", "sort": "-name", "limit": 10, "offset": 0}]
+
+    def test_endpoint_ignoring_pagination(self):
+        results, requests = paginate(ITEMS, Paginator(page_size=10, filter={"tags": "even"}, sort="-name", limit=3), obeys_pagination=False)
+        assert [item["id"] for item in results] == ["24", "22", "20"]
+        assert len(requests) == 1
+
+    def test_endpoint_ignoring_sort_is_sorted_locally(self):
+        results, requests = paginate(ITEMS, Paginator(page_size=10, sort="-name", limit=3))
+        assert [item["id"] for item in results] == ["24", "23", "22"]
+        # Once the first page shows the order is ignored the limit only applies after sorting every page
+        assert [(r["limit"], r["offset"]) for r in requests] == [(3, 0), (10, 3), (10, 13), (10, 23)]
+
+    def test_sorted_full_page_is_trusted(self):
+        results, requests = paginate(ITEMS, Paginator(page_size=10, sort="name", limit=12))
+        assert results == ITEMS[:12]
+        assert [(r["limit"], r["offset"]) for r in requests] == [(10, 0), (2, 10)]
+
+    def test_repeated_ids_end_iteration(self):
+        items = ITEMS[:10] + [{**item, "name": "renamed"} for item in ITEMS[:10]]
+        results, requests = paginate(items, Paginator(page_size=10))
+        assert results == ITEMS[:10]
+        assert len(requests) == 2
+
+    def test_items_yielded_as_they_stream_in(self):
+        def stream():
+            yield ITEMS[0]
+            raise AssertionError("read past the first item")
+
+        paginator = Paginator(page_size=10)
+        paginator.next_params()
+        assert next(paginator.consume(stream())) == ITEMS[0]
+
+    def test_endpoint_ignoring_offset_stops(self):
+        results, requests = paginate(ITEMS[:10], Paginator(page_size=10), obeys_pagination=False)
+        assert results == ITEMS[:10]
+        assert len(requests) == 2
+
+    def test_invalid_page_size(self):
+        with pytest.raises(ValueError):
+            Paginator(page_size=0)
+
+
+class TestHelpers:
+    def test_matches_filter(self):
+        assert matches_filter({"name": "Test"}, {"name": "test"})
+        assert matches_filter({"hidden": True}, {"hidden": "true"})
+        assert not matches_filter({"name": "other"}, {"name": "test"})
+        assert matches_filter({"name": "a"}, None)
+
+    def test_sort_items(self):
+        assert sort_items([{"name": "b"}, {"name": "a"}, {}], "name") == [{}, {"name": "a"}, {"name": "b"}]
+        assert sort_items([{"name": "a"}, {"name": "b"}], "-name") == [{"name": "b"}, {"name": "a"}]
+
+    def test_is_sorted(self):
+        assert is_sorted([{"name": "a"}, {"name": "b"}], "name")
+        assert not is_sorted([{"name": "a"}, {"name": "b"}], "-name")
+        assert is_sorted([], "name")
+
+    def test_parse_filters(self):
+        assert parse_filters(["name=test", "kind = native", "description=a=b"]) == {"name": "test", "kind": "native", "description": "a=b"}
+        assert parse_filters([]) is None
+
+    @pytest.mark.parametrize("filter", ["name", "=test"])
+    def test_parse_invalid_filters(self, filter):
+        with pytest.raises(ValueError):
+            parse_filters([filter])
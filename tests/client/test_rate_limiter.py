@@ -0,0 +1,185 @@
+import asyncio
+import threading
+import pytest
+from unittest.mock import patch
+
+from ibm_watsonx_orchestrate.client.rate_limiter import (
+    RateLimiter,
+    get_rate_limiter,
+    get_retry_after,
+    configure_rate_limiter,
+    reset_rate_limiters,
+    DEFAULT_THROTTLE_PAUSE,
+    REQUESTS_PER_SECOND_ENV_VAR
+)
+
+
+@pytest.fixture(autouse=True)
+def clock():
+    reset_rate_limiters()
+    now = [1000.0]
+    with patch("ibm_watsonx_orchestrate.client.rate_limiter.time.monotonic", side_effect=lambda: now[0]), \
+         patch("ibm_watsonx_orchestrate.client.rate_limiter.time.sleep") as mock_sleep:
+        yield now, mock_sleep
+    reset_rate_limiters()
+
+
+class TestGetRetryAfter:
+    def test_seconds(self):
+        assert get_retry_after({"Retry-After": "5"}) == 5
+
+    def test_http_date_in_past(self):
+        assert get_retry_after({"Retry-After": "Wed, 21 Oct 2015 07:28:00 GMT"}) == 0
+
+    def test_missing_or_invalid(self):
+        assert get_retry_after({}) is None
+        assert get_retry_after({"Retry-After": "soon"}) is None
+
+
+class TestTokenBucket:
+    def test_burst_then_rate(self, clock):
+        now, mock_sleep = clock
+        limiter = RateLimiter(requests_per_second=10, burst=2)
+        for _ in range(3):
+            with limiter.slot():
+                pass
+
+        assert mock_sleep.call_count == 1
+        assert mock_sleep.call_args.args[0] == pytest.approx(0.1)
+
+    def test_refills_over_time(self, clock):
+        now, mock_sleep = clock
+        limiter = RateLimiter(requests_per_second=10, burst=1)
+        with limiter.slot():
+            pass
+        now[0] += 1
+        with limiter.slot():
+            pass
+
+        mock_sleep.assert_not_called()
+
+    def test_no_rate_cap_by_default(self, clock):
+        now, mock_sleep = clock
+        limiter = get_rate_limiter("http://a")
+        for _ in range(500):
+            with limiter.slot():
+                pass
+
+        assert limiter.requests_per_second is None
+        mock_sleep.assert_not_called()
+
+    def test_rate_cap_from_env(self, monkeypatch):
+        monkeypatch.setenv(REQUESTS_PER_SECOND_ENV_VAR, "20")
+        assert get_rate_limiter("http://a").requests_per_second == 20
+
+    def test_retry_after_pauses_every_request(self, clock):
+        now, mock_sleep = clock
+        limiter = RateLimiter()
+        limiter.record(429, 0.1, retry_after=4)
+        with limiter.slot():
+            pass
+
+        assert mock_sleep.call_args.args[0] == pytest.approx(4)
+
+    def test_throttle_without_retry_after(self, clock):
+        now, mock_sleep = clock
+        limiter = RateLimiter()
+        limiter.record(429, 0.1)
+        with limiter.slot():
+            pass
+
+        assert mock_sleep.call_args.args[0] == pytest.approx(DEFAULT_THROTTLE_PAUSE)
+
+
+class TestAdaptiveConcurrency:
+    def test_additive_increase(self):
+        limiter = RateLimiter(initial_concurrency=4, max_concurrency=5)
+        limiter.record(200, 0.1)
+        assert limiter.concurrency_limit == 4
+        for _ in range(4):
+            limiter.record(200, 0.1)
+        assert limiter.concurrency_limit == 5
+        for _ in range(20):
+            limiter.record(200, 0.1)
+        assert limiter.concurrency_limit == 5
+
+    def test_multiplicative_decrease_once_per_cooldown(self, clock):
+        now, _ = clock
+        limiter = RateLimiter(initial_concurrency=16)
+        limiter.record(429, 0.1, retry_after=0)
+        limiter.record(429, 0.1, retry_after=0)
+        assert limiter.concurrency_limit == 8
+
+        now[0] += 2
+        limiter.record(503, 0.1)
+        assert limiter.concurrency_limit == 4
+
+    def test_never_below_minimum(self, clock):
+        now, _ = clock
+        limiter = RateLimiter(initial_concurrency=2, min_concurrency=1)
+        for _ in range(5):
+            now[0] += 2
+            limiter.record(429, 0.1, retry_after=0)
+        assert limiter.concurrency_limit == 1
+
+    def test_latency_spike_decreases(self, clock):
+        limiter = RateLimiter(initial_concurrency=16, max_concurrency=16)
+        for _ in range(10):
+            limiter.record(200, 0.1)
+        limiter.record(200, 5)
+        assert limiter.concurrency_limit == 8
+
+    def test_latency_is_compared_per_endpoint(self, clock):
+        limiter = RateLimiter(initial_concurrency=16, max_concurrency=16)
+        for _ in range(10):
+            limiter.record(200, 0.1, endpoint="GET /tools")
+        for _ in range(10):
+            limiter.record(200, 5, endpoint="POST /tools/{id}/upload")
+        assert limiter.concurrency_limit == 16
+
+        limiter.record(200, 5, endpoint="GET /tools")
+        assert limiter.concurrency_limit == 8
+
+    def test_async_waiter_is_woken_by_release(self):
+        limiter = RateLimiter(initial_concurrency=1)
+
+        async def run():
+            await limiter.acquire_async()
+            waiter = asyncio.create_task(limiter.acquire_async())
+            await asyncio.sleep(0)
+            assert not waiter.done()
+            limiter.release()
+            await asyncio.wait_for(waiter, 5)
+            limiter.release()
+
+        asyncio.run(run())
+        assert limiter.in_flight == 0
+
+    def test_waits_for_free_slot(self):
+        limiter = RateLimiter(initial_concurrency=1)
+        limiter.acquire()
+        acquired = threading.Event()
+
+        def worker():
+            limiter.acquire()
+            acquired.set()
+            limiter.release()
+
+        thread = threading.Thread(target=worker)
+        thread.start()
+        assert not acquired.wait(0.05)
+        limiter.release()
+        assert acquired.wait(5)
+        thread.join()
+        assert limiter.in_flight == 0
+
+
+class TestRegistry:
+    def test_shared_per_base_url(self):
+        assert get_rate_limiter("http://a") is get_rate_limiter("http://a")
+        assert get_rate_limiter("http://a") is not get_rate_limiter("http://b")
+
+    def test_configure(self):
+        limiter = configure_rate_limiter("http://a", requests_per_second=1)
+        assert get_rate_limiter("http://a") is limiter
+        assert limiter.requests_per_second == 1
@@ -0,0 +1,55 @@
+from ibm_watsonx_orchestrate.client.response_cache import (
+    CacheEntry,
+    InMemoryResponseCache,
+    get_cache_key
+)
+
+
+class TestGetCacheKey:
+    def test_params_are_order_independent(self):
+        assert get_cache_key("http://a", "/x", {"b": 1, "a": 2}) == get_cache_key("http://a", "/x", {"a": 2, "b": 1})
+
+    def test_scoped_by_authorization(self):
+        assert get_cache_key("http://a", "/x", authorization="Bearer 1") != get_cache_key("http://a", "/x", authorization="Bearer 2")
+        assert "Bearer 1" not in get_cache_key("http://a", "/x", authorization="Bearer 1")[1]
+
+
+class TestInMemoryResponseCache:
+    def test_lru_eviction(self):
+        cache = InMemoryResponseCache(max_entries=2)
+        cache.set("a", CacheEntry(content=b"a", etag="1"))
+        cache.set("b", CacheEntry(content=b"b", etag="1"))
+        cache.get("a")
+        cache.set("c", CacheEntry(content=b"c", etag="1"))
+
+        assert cache.get("a") is not None
+        assert cache.get("b") is None
+        assert cache.get("c") is not None
+
+    def test_large_entries_not_cached(self):
+        cache = InMemoryResponseCache(max_entry_size=1)
+        cache.set("a", CacheEntry(content=b"ab", etag="1"))
+        assert cache.get("a") is None
+
+    def test_invalidate_related_paths(self):
+        cache = InMemoryResponseCache()
+        keys = {
+            path: get_cache_key("http://a", path)
+            for path in ["/tools", "/tools/1", "/tools/1/upload", "/tools/2", "/agents"]
+        }
+        other_env = get_cache_key("http://b", "/tools")
+        for key in [*keys.values(), other_env]:
+            cache.set(key, CacheEntry(content=b"{}", etag="1"))
+
+        cache.invalidate("http://a", "/tools/1")
+
+        assert cache.get(keys["/tools"]) is None
+        assert cache.get(keys["/tools/1"]) is None
+        assert cache.get(keys["/tools/1/upload"]) is None
+        assert cache.get(keys["/tools/2"]) is not None
+        assert cache.get(keys["/agents"]) is not None
+        assert cache.get(other_env) is not None
+
+    def test_validator_headers(self):
+        entry = CacheEntry(content=b"", etag='"1"', last_modified="yesterday")
+        assert entry.get_validator_headers() == {"If-None-Match": '"1"', "If-Modified-Since": "yesterday"}
@@ -0,0 +1,183 @@
+import os
+import threading
+import time
+
+import jwt
+import pytest
+from unittest.mock import patch
+
+from ibm_watsonx_orchestrate.client import service_instance
+from ibm_watsonx_orchestrate.client.agents.agent_client import AgentClient
+from ibm_watsonx_orchestrate.client.client import Client
+from ibm_watsonx_orchestrate.client.credentials import Credentials
+from ibm_watsonx_orchestrate.client.service_instance import ServiceInstance
+from ibm_watsonx_orchestrate.client.tools.tool_client import ToolClient
+
+
+@pytest.fixture
+def credentials():
+    return Credentials(url="https://testing.com", api_key="api-key")
+
+
+class TestRefreshDelay:
+
+    def test_delay_ahead_of_expiry(self, credentials, make_token):
+        with patch.object(ServiceInstance, "_create_token", return_value=make_token(3600)):
+            client = Client(credentials)
+
+        delay = client.service_instance.get_refresh_delay()
+        upper = 3600 - service_instance.DEFAULT_TOKEN_REFRESH_LEAD
+        lower = upper - service_instance.DEFAULT_TOKEN_REFRESH_JITTER
+        assert lower - 2 <= delay <= upper
+
+    def test_no_delay_for_token_close_to_expiry(self, credentials, make_token):
+        with patch.object(ServiceInstance, "_create_token", return_value=make_token(60, issued_ago=3540)):
+            client = Client(credentials)
+
+        assert client.service_instance.get_refresh_delay() == 0
+
+    @pytest.mark.parametrize("issued_ago", [None, 0])
+    def test_short_lived_token_renewed_halfway(self, credentials, issued_ago, make_token):
+        with patch.object(ServiceInstance, "_create_token", return_value=make_token(600, issued_ago=issued_ago)):
+            client = Client(credentials)
+
+        delay = client.service_instance.get_refresh_delay()
+        assert 300 - 75 - 2 <= delay <= 300
+
+    def test_token_without_expiry(self, credentials, make_token):
+        with patch.object(ServiceInstance, "_create_token", return_value=make_token(None)):
+            client = Client(credentials)
+
+        assert client.service_instance.get_refresh_delay() is None
+
+
+class TestSetToken:
+
+    def test_api_clients_pick_up_new_token(self, credentials):
+        with patch.object(ServiceInstance, "_create_token", return_value="first"):
+            client = Client(credentials)
+
+        agent_client = client.get_client(AgentClient)
+        tool_client = client.get_client(ToolClient)
+        assert agent_client.api_key == "first"
+        assert agent_client.base_url == "https://testing.com/v1/orchestrate"
+
+        client.set_token("second")
+
+        assert client.token == "second"
+        assert agent_client.api_key == "second"
+        assert tool_client._get_headers()["Authorization"] == "Bearer second"
+
+    def test_listeners_called(self, credentials):
+        with patch.object(ServiceInstance, "_create_token", return_value="first"):
+            client = Client(credentials)
+        received = []
+        client.add_token_listener(received.append)
+
+        client.set_token("second")
+        client.remove_token_listener(received.append)
+        client.set_token("third")
+
+        assert received == ["second"]
+
+    def test_failing_listener_does_not_stop_update(self, credentials):
+        with patch.object(ServiceInstance, "_create_token", return_value="first"):
+            client = Client(credentials)
+        agent_client = client.get_client(AgentClient)
+
+        def failing_listener(token):
+            raise RuntimeError("boom")
+
+        client.add_token_listener(failing_listener)
+        client.set_token("second")
+
+        assert agent_client.api_key == "second"
+
+
+class TestBackgroundRefresh:
+
+    def test_token_refreshed_before_expiry(self, credentials, make_token):
+        refreshed = threading.Event()
+        tokens = [make_token(60, "first", issued_ago=3540), make_token(3600, "second")]
+
+        def create_token(self):
+            token = tokens.pop(0)
+            if not tokens:
+                refreshed.set()
+            return token
+
+        with patch.object(ServiceInstance, "_create_token", create_token):
+            client = Client(credentials, refresh_token_in_background=True)
+            agent_client = client.get_client(AgentClient)
+            assert refreshed.wait(5)
+
+            deadline = time.time() + 5
+            while agent_client.api_key != client.token and time.time() < deadline:
+                time.sleep(0.01)
+            client.close()
+
+        assert jwt.decode(client.token, options={"verify_signature": False})["sub"] == "second"
+        assert agent_client.api_key == client.token
+        assert client.service_instance._refresh_thread is None
+
+    def test_refresh_failure_retried(self, credentials, make_token):
+        attempts = []
+
+        def create_token(self):
+            attempts.append(1)
+            if len(attempts) == 1:
+                return make_token(60, issued_ago=3540)
+            raise RuntimeError("token server down")
+
+        with patch.object(ServiceInstance, "_create_token", create_token), \
+                patch.object(service_instance, "DEFAULT_TOKEN_REFRESH_RETRY_INTERVAL", 0.01):
+            client = Client(credentials, refresh_token_in_background=True)
+            deadline = time.time() + 5
+            while len(attempts) < 3 and time.time() < deadline:
+                time.sleep(0.01)
+            client.close()
+
+        assert len(attempts) >= 3
+
+    def test_not_started_without_api_key(self, make_token):
+        token = make_token(60)
+        credentials = Credentials(url="https://testing.com", token=token)
+
+        with patch.object(ServiceInstance, "_create_token", return_value=token):
+            client = Client(credentials, refresh_token_in_background=True)
+
+        assert client.token == token
+        assert client.service_instance._refresh_thread is None
+
+
+class TestSharedTokenCache:
+
+    def test_clients_share_token(self, credentials, tmp_path, make_token):
+        calls = []
+
+        def authenticate(self, auth_type):
+            calls.append(auth_type)
+            return make_token(3600)
+
+        with patch.object(ServiceInstance, "_authenticate", authenticate), \
+                patch("ibm_watsonx_orchestrate.client.token_cache.AUTH_CONFIG_FILE_FOLDER", str(tmp_path)):
+            first = Client(credentials, shared_token_cache=True)
+            second = Client(credentials, shared_token_cache=True)
+
+        assert first.token == second.token
+        assert len(calls) == 1
+
+    def test_disabled_by_default(self, credentials, tmp_path, make_token):
+        calls = []
+
+        def authenticate(self, auth_type):
+            calls.append(auth_type)
+            return make_token(3600)
+
+        with patch.object(ServiceInstance, "_authenticate", authenticate), \
+                patch("ibm_watsonx_orchestrate.client.token_cache.AUTH_CONFIG_FILE_FOLDER", str(tmp_path)):
+            Client(credentials)
+            Client(credentials)
+
+        assert len(calls) == 2
+        assert not os.listdir(tmp_path)
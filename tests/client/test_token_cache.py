@@ -0,0 +1,148 @@
+import json
+import multiprocessing
+import os
+import stat
+import time
+
+import jwt
+import pytest
+
+from ibm_watsonx_orchestrate.client import token_cache
+from ibm_watsonx_orchestrate.client.token_cache import SharedTokenCache, get_token_cache_key
+from ibm_watsonx_orchestrate.utils.file_lock import atomic_write, file_lock
+
+
+def fetch_token_in_process(cache_dir: str, calls_file: str, results: multiprocessing.Queue, token: str) -> None:
+    def create_token():
+        with open(calls_file, "a") as f:
+            f.write("call\n")
+        time.sleep(0.2)
+        return token
+
+    results.put(SharedTokenCache(cache_dir).get_or_create("key", create_token))
+
+
+class TestSharedTokenCache:
+
+    def test_token_created_once(self, tmp_path, make_token):
+        cache = SharedTokenCache(str(tmp_path))
+        created = []
+
+        def create_token():
+            created.append(1)
+            return make_token(3600)
+
+        first = cache.get_or_create("key", create_token)
+        second = cache.get_or_create("key", create_token)
+
+        assert first == second
+        assert len(created) == 1
+        assert SharedTokenCache(str(tmp_path)).get("key") == first
+
+    def test_token_close_to_expiry_not_reused(self, tmp_path, make_token):
+        cache = SharedTokenCache(str(tmp_path))
+        cache.get_or_create("key", lambda: make_token(token_cache.DEFAULT_MIN_TOKEN_VALIDITY - 60, "old"))
+
+        token = cache.get_or_create("key", lambda: make_token(3600, "new"))
+
+        assert jwt.decode(token, options={"verify_signature": False})["sub"] == "new"
+
+    def test_token_without_expiry_not_cached(self, tmp_path, make_token):
+        cache = SharedTokenCache(str(tmp_path))
+        token = cache.get_or_create("key", lambda: make_token(None))
+
+        assert token
+        assert cache.get("key") is None
+
+    def test_keys_are_independent(self, tmp_path, make_token):
+        cache = SharedTokenCache(str(tmp_path))
+        first = cache.get_or_create("first", lambda: make_token(3600, "first"))
+        second = cache.get_or_create("second", lambda: make_token(3600, "second"))
+
+        assert cache.get("first") == first
+        assert cache.get("second") == second
+
+    def test_invalidate(self, tmp_path, make_token):
+        cache = SharedTokenCache(str(tmp_path))
+        cache.get_or_create("key", lambda: make_token(3600))
+
+        cache.invalidate("key")
+
+        assert cache.get("key") is None
+
+    def test_corrupted_cache_ignored(self, tmp_path, make_token):
+        cache = SharedTokenCache(str(tmp_path))
+        with open(cache.path, "w") as f:
+            f.write("{not json")
+
+        token = cache.get_or_create("key", lambda: make_token(3600))
+
+        assert cache.get("key") == token
+
+    def test_cache_file_only_readable_by_owner(self, tmp_path, make_token):
+        cache = SharedTokenCache(str(tmp_path))
+        cache.get_or_create("key", lambda: make_token(3600))
+
+        assert stat.S_IMODE(os.stat(cache.path).st_mode) == 0o600
+        with open(cache.path) as f:
+            assert set(json.load(f)) == {"key"}
+
+    def test_concurrent_processes_fetch_once(self, tmp_path, make_token):
+        calls_file = str(tmp_path / "calls")
+        results = multiprocessing.Queue()
+        processes = [
+            multiprocessing.Process(
+                target=fetch_token_in_process,
+                args=(str(tmp_path), calls_file, results, make_token(3600, subject=f"process-{i}"))
+            )
+            for i in range(4)
+        ]
+        for process in processes:
+            process.start()
+        for process in processes:
+            process.join(timeout=30)
+
+        tokens = {results.get(timeout=5) for _ in processes}
+        with open(calls_file) as f:
+            calls = f.readlines()
+
+        assert len(calls) == 1
+        assert len(tokens) == 1
+
+
+class TestGetTokenCacheKey:
+
+    def test_key_does_not_contain_secret(self):
+        key = get_token_cache_key("mcsp", None, "my-secret-api-key")
+        assert "my-secret-api-key" not in key
+
+    def test_key_depends_on_every_part(self):
+        assert get_token_cache_key("mcsp", None, "key") != get_token_cache_key("ibm_iam", None, "key")
+        assert get_token_cache_key("mcsp", "https://iam", "key") != get_token_cache_key("mcsp", None, "key")
+
+
+class TestFileLock:
+
+    def test_reentrant_within_thread(self, tmp_path):
+        path = str(tmp_path / "file.lock")
+        with file_lock(path):
+            with file_lock(path):
+                pass
+
+    def test_atomic_write_keeps_mode(self, tmp_path):
+        path = tmp_path / "config.yaml"
+        path.write_text("old")
+        os.chmod(path, 0o640)
+
+        atomic_write(str(path), "new")
+
+        assert path.read_text() == "new"
+        assert stat.S_IMODE(os.stat(path).st_mode) == 0o640
+        assert os.listdir(tmp_path) == ["config.yaml"]
+
+    def test_atomic_write_cleans_up_on_failure(self, tmp_path):
+        path = tmp_path / "config.yaml"
+        with pytest.raises(TypeError):
+            atomic_write(str(path), None)
+
+        assert os.listdir(tmp_path) == []
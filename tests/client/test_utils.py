@@ -1,3 +1,5 @@
+import os
+import jwt
 import pytest
 from unittest.mock import patch
 from ibm_watsonx_orchestrate.client import utils
@@ -8,6 +10,15 @@ from ibm_watsonx_orchestrate.client.agents.agent_client import AgentClient
 from ibm_watsonx_orchestrate.client.tools.tool_client import ToolClient
 from ibm_watsonx_orchestrate.client.connections.connections_client import ConnectionsClient
 
+@pytest.fixture(autouse=True)
+def clear_snapshot():
+    utils.clear_config_snapshot()
+    utils.clear_client_registry()
+    yield
+    utils.clear_config_snapshot()
+    utils.clear_client_registry()
+
+
 class TestIsLocalDev:
     @pytest.mark.parametrize(
         "url",
@@ -32,6 +43,17 @@ class TestIsLocalDev:
     def test_remote_urls(self, url):
         assert not is_local_dev(url)
 
+    def test_default_config_created_when_missing(self, tmp_path):
+        with patch("ibm_watsonx_orchestrate.client.utils.DEFAULT_CONFIG_FILE_FOLDER", str(tmp_path)), \
+                patch("ibm_watsonx_orchestrate.cli.config.DEFAULT_CONFIG_FILE_FOLDER", str(tmp_path)):
+            # The default config has no active environment yet
+            with pytest.raises(KeyError):
+                is_local_dev()
+
+            config = utils.get_config_snapshot()
+
+        assert config["environments"]["local"]["wxo_url"] == "http://localhost:4321"
+
 class TestCheckTokenValidity:
 
     tokens = {
@@ -135,7 +157,7 @@ class TestInstantiateClient:
         ],
     )
     def test_no_active_environment(self, client, caplog):
-        with patch("ibm_watsonx_orchestrate.client.utils.yaml_safe_load") as mock:
+        with patch("ibm_watsonx_orchestrate.client.utils.yaml_codec.safe_load") as mock:
             mock.side_effect = self.mock_yaml_safe_loader_no_active_env
             with pytest.raises(SystemExit) as e:
                 instantiate_client(client)
@@ -156,7 +178,7 @@ class TestInstantiateClient:
         ],
     )
     def test_no_url_in_environment(self, client, caplog):
-        with patch("ibm_watsonx_orchestrate.client.utils.yaml_safe_load") as mock:
+        with patch("ibm_watsonx_orchestrate.client.utils.yaml_codec.safe_load") as mock:
             mock.side_effect = self.mock_yaml_safe_loader_no_url
             with pytest.raises(SystemExit) as e:
                 instantiate_client(client)
@@ -178,7 +200,7 @@ class TestInstantiateClient:
         ],
     )
     def test_missing_token(self, client, caplog):
-        with patch("ibm_watsonx_orchestrate.client.utils.yaml_safe_load") as mock:
+        with patch("ibm_watsonx_orchestrate.client.utils.yaml_codec.safe_load") as mock:
             mock.side_effect = self.mock_yaml_safe_loader_missing_token
             with pytest.raises(SystemExit) as e:
                 instantiate_client(client)
@@ -199,7 +221,7 @@ class TestInstantiateClient:
         ],
     )
     def test_invalid_token(self, client, caplog):
-        with patch("ibm_watsonx_orchestrate.client.utils.yaml_safe_load") as mock:
+        with patch("ibm_watsonx_orchestrate.client.utils.yaml_codec.safe_load") as mock:
             mock.side_effect = self.mock_yaml_safe_loader_invalid_token
             with pytest.raises(SystemExit) as e:
                 instantiate_client(client)
@@ -208,3 +230,87 @@ class TestInstantiateClient:
 
             captured = caplog.text
             assert "The token found for environment 'testing' is missing or expired" in captured
+
+
+class TestConfigSnapshot:
+
+    def test_snapshot_reused_while_file_unchanged(self, tmp_path):
+        path = tmp_path / "config.yaml"
+        path.write_text("context:\n  active_environment: testing\n")
+
+        with patch("ibm_watsonx_orchestrate.client.utils.yaml_codec.safe_load", wraps=utils.yaml_codec.safe_load) as mock:
+            first = utils._load_yaml_snapshot(str(path))
+            second = utils._load_yaml_snapshot(str(path))
+
+        assert first == {"context": {"active_environment": "testing"}}
+        assert second is first
+        mock.assert_called_once()
+
+    def test_snapshot_reloaded_when_file_changes(self, tmp_path):
+        path = tmp_path / "config.yaml"
+        path.write_text("context:\n  active_environment: testing\n")
+        utils._load_yaml_snapshot(str(path))
+
+        path.write_text("context:\n  active_environment: production\n")
+        stat = os.stat(path)
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        assert utils._load_yaml_snapshot(str(path)) == {"context": {"active_environment": "production"}}
+
+    def test_empty_file(self, tmp_path):
+        path = tmp_path / "config.yaml"
+        path.write_text("")
+        assert utils._load_yaml_snapshot(str(path)) == {}
+
+    def test_missing_file(self, tmp_path):
+        with pytest.raises(FileNotFoundError):
+            utils._load_yaml_snapshot(str(tmp_path / "missing.yaml"))
+
+    def test_token_claims_cached(self):
+        token = TestCheckTokenValidity.tokens["valid_token_w_expiry"]
+        with patch("jwt.decode", wraps=jwt.decode) as mock:
+            assert check_token_validity(token)
+            assert check_token_validity(token)
+        mock.assert_called_once()
+
+    def test_token_expiry_checked_on_every_call(self):
+        token = TestCheckTokenValidity.tokens["valid_token_w_expiry"]
+        assert check_token_validity(token)
+        with patch("ibm_watsonx_orchestrate.client.utils.time.time", return_value=9999999999):
+            assert not check_token_validity(token)
+
+
+class TestClientRegistry:
+
+    def test_same_client_returned(self):
+        assert instantiate_client(AgentClient) is instantiate_client(AgentClient)
+
+    def test_client_per_class_and_url(self):
+        agent_client = instantiate_client(AgentClient)
+
+        assert instantiate_client(ToolClient) is not agent_client
+        assert instantiate_client(AgentClient, url="http://localhost:3001/api/v1") is not agent_client
+
+    def test_not_shared(self):
+        assert instantiate_client(AgentClient, shared=False) is not instantiate_client(AgentClient, shared=False)
+
+    def test_clear_client_registry(self):
+        agent_client = instantiate_client(AgentClient)
+        utils.clear_client_registry()
+
+        assert instantiate_client(AgentClient) is not agent_client
+
+    def test_new_token_handed_to_shared_client(self):
+        agent_client = instantiate_client(AgentClient)
+        original_auth_config = utils.get_auth_config_snapshot()
+        active_env = utils.get_config_snapshot()["context"]["active_environment"]
+        new_token = TestCheckTokenValidity.tokens["valid_token_w_expiry"]
+        auth_config = {"auth": {active_env: {"wxo_mcsp_token": new_token}}}
+
+        with patch("ibm_watsonx_orchestrate.client.utils.get_auth_config_snapshot", return_value=auth_config):
+            new_client = instantiate_client(AgentClient)
+
+        assert new_client is agent_client
+        assert new_client.api_key == new_token
+        assert len(utils._CLIENT_REGISTRY) == 1
+        assert original_auth_config["auth"][active_env]["wxo_mcsp_token"] != new_token
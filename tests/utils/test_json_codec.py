@@ -0,0 +1,87 @@
+import io
+import json
+import sys
+
+import pytest
+from unittest.mock import patch
+
+from ibm_watsonx_orchestrate.utils import json_codec
+from ibm_watsonx_orchestrate.utils.json_codec import OrjsonCodec, StdlibJsonCodec
+
+
+@pytest.fixture(autouse=True)
+def restore_codec():
+    yield
+    json_codec.set_json_codec(None)
+
+
+CODECS = [StdlibJsonCodec()] + ([OrjsonCodec()] if json_codec.ORJSON_AVAILABLE else [])
+
+
+class TestCodecs:
+
+    @pytest.mark.parametrize("codec", CODECS, ids=lambda codec: codec.name)
+    def test_round_trip(self, codec):
+        data = {"name": "agent", "tags": ["a", "ü"], "count": 3, "ratio": 0.5, "enabled": True, "extra": None}
+        encoded = codec.dumps(data)
+
+        assert isinstance(encoded, bytes)
+        assert json.loads(encoded) == data
+        assert codec.loads(encoded) == data
+        assert codec.loads(encoded.decode()) == data
+
+    @pytest.mark.parametrize("codec", CODECS, ids=lambda codec: codec.name)
+    def test_indent(self, codec):
+        encoded = codec.dumps({"name": "agent"}, indent=True)
+        assert encoded == b'{\n  "name": "agent"\n}'
+
+    @pytest.mark.parametrize("codec", CODECS, ids=lambda codec: codec.name)
+    def test_non_string_keys(self, codec):
+        assert json.loads(codec.dumps({1: "a"})) == {"1": "a"}
+
+    @pytest.mark.parametrize("codec", CODECS, ids=lambda codec: codec.name)
+    def test_invalid_json(self, codec):
+        with pytest.raises(ValueError):
+            codec.loads(b"{not json")
+
+
+class TestDefaultCodec:
+
+    def test_orjson_used_when_installed(self, monkeypatch):
+        monkeypatch.delenv(json_codec.JSON_CODEC_ENV_VAR, raising=False)
+        json_codec.set_json_codec(None)
+        expected = "orjson" if json_codec.ORJSON_AVAILABLE else "json"
+        assert json_codec.get_json_codec().name == expected
+
+    def test_stdlib_forced_by_env_var(self, monkeypatch):
+        monkeypatch.setenv(json_codec.JSON_CODEC_ENV_VAR, "json")
+        json_codec.set_json_codec(None)
+        assert json_codec.get_json_codec().name == "json"
+
+    def test_stdlib_without_orjson(self, monkeypatch):
+        monkeypatch.delenv(json_codec.JSON_CODEC_ENV_VAR, raising=False)
+        with patch.object(json_codec, "ORJSON_AVAILABLE", False):
+            json_codec.set_json_codec(None)
+        assert json_codec.get_json_codec().name == "json"
+
+    def test_custom_codec(self):
+        json_codec.set_json_codec(StdlibJsonCodec())
+        assert json_codec.dumps({"a": 1}) == b'{"a":1}'
+        assert json_codec.loads(b'{"a":1}') == {"a": 1}
+
+
+class TestPrintJson:
+
+    def test_redirected_output_written_as_bytes(self, capsys):
+        json_codec.print_json([{"name": "tool"}])
+        assert json.loads(capsys.readouterr().out) == [{"name": "tool"}]
+
+    def test_terminal_output_highlighted(self):
+        class Terminal(io.StringIO):
+            def isatty(self):
+                return True
+
+        with patch.object(sys, "stdout", Terminal()), patch("rich.print") as mock_print:
+            json_codec.print_json([{"name": "tool"}])
+
+        mock_print.assert_called_once()
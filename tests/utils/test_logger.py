@@ -0,0 +1,32 @@
+import subprocess
+import sys
+
+from ibm_watsonx_orchestrate.utils.logging.logger import LogColors
+
+
+def run_logging(code: str) -> str:
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    return result.stdout
+
+
+def test_first_record_has_colored_level():
+    output = run_logging(
+        "import logging, ibm_watsonx_orchestrate\n"
+        "logger = logging.getLogger('ibm_watsonx_orchestrate.test')\n"
+        "logger.error('first')\n"
+        "logger.error('second')\n"
+    )
+
+    marker = LogColors.ERROR + "[ERROR]" + LogColors.RESET
+    assert output.splitlines() == [f"{marker} - first", f"{marker} - second"]
+
+
+def test_level_colors_are_not_added_twice():
+    output = run_logging(
+        "import logging, ibm_watsonx_orchestrate\n"
+        "from ibm_watsonx_orchestrate.utils.logging.logger import setup_logging\n"
+        "setup_logging()\n"
+        "logging.getLogger('ibm_watsonx_orchestrate.test').info('message')\n"
+    )
+
+    assert output == LogColors.INFO + "[INFO]" + LogColors.RESET + " - message\n"
@@ -0,0 +1,58 @@
+from unittest.mock import patch
+
+import rich.table
+
+from ibm_watsonx_orchestrate.utils.utils import TablePrinter, batched
+
+
+def make_table() -> rich.table.Table:
+    table = rich.table.Table(show_header=True, title="Things")
+    table.add_column("Name")
+    return table
+
+
+def test_batched():
+    assert list(batched(range(5), 2)) == [[0, 1], [2, 3], [4]]
+
+
+class TestTablePrinter:
+    def test_prints_blocks_as_rows_are_added(self):
+        printer = TablePrinter(make_table(), block_size=2)
+        with patch("rich.print") as mock_print:
+            printer.add_row("a")
+            assert mock_print.call_count == 0
+            printer.add_row("b")
+            assert mock_print.call_count == 1
+            printer.add_row("c")
+            printer.flush()
+
+        first, second = (call.args[0] for call in mock_print.call_args_list)
+        assert (first.row_count, first.show_header, first.title) == (2, True, "Things")
+        assert (second.row_count, second.show_header, second.title) == (1, False, None)
+
+    def test_blocks_share_column_widths(self):
+        printer = TablePrinter(make_table(), block_size=2)
+        with patch("rich.print") as mock_print:
+            printer.add_row("a")
+            printer.add_row("abcdef")
+            printer.add_row("a much longer name")
+            printer.flush()
+
+        first, second = (call.args[0] for call in mock_print.call_args_list)
+        assert first.columns[0].width == second.columns[0].width == len("abcdef")
+
+    def test_empty_table_is_printed_once(self):
+        printer = TablePrinter(make_table(), block_size=2)
+        with patch("rich.print") as mock_print:
+            printer.flush()
+            printer.flush()
+
+        assert mock_print.call_count == 1
+
+    def test_full_last_block_is_not_followed_by_an_empty_one(self):
+        printer = TablePrinter(make_table(), block_size=1)
+        with patch("rich.print") as mock_print:
+            printer.add_row("a")
+            printer.flush()
+
+        assert mock_print.call_count == 1
@@ -0,0 +1,62 @@
+import datetime
+
+import yaml
+
+from ibm_watsonx_orchestrate.utils import yaml_codec
+
+
+class TestSafeLoad:
+
+    def test_timestamps_left_as_strings(self):
+        content = yaml_codec.safe_load("created: 2024-01-02T03:04:05Z\nday: 2024-01-02\n")
+
+        assert content == {"created": "2024-01-02T03:04:05Z", "day": "2024-01-02"}
+
+    def test_global_safe_loader_not_modified(self):
+        assert isinstance(yaml.safe_load("day: 2024-01-02")["day"], datetime.date)
+
+    def test_python_tags_rejected(self):
+        try:
+            yaml_codec.safe_load("value: !!python/object/apply:os.system ['true']")
+        except yaml.YAMLError:
+            pass
+        else:
+            assert False, "expected a YAMLError"
+
+    def test_libyaml_used_when_available(self):
+        if yaml_codec.LIBYAML_AVAILABLE:
+            assert issubclass(yaml_codec.SafeLoader, yaml.CSafeLoader)
+            assert yaml_codec.Dumper is yaml.CDumper
+        else:
+            assert issubclass(yaml_codec.SafeLoader, yaml.SafeLoader)
+
+
+class TestDump:
+
+    def test_round_trip(self):
+        data = {"name": "tool", "tags": ["a", "b"], "nested": {"unicode": "héllo", "count": 3}}
+
+        assert yaml_codec.safe_load(yaml_codec.dump(data, allow_unicode=True)) == data
+        assert yaml_codec.safe_load(yaml_codec.safe_dump(data, sort_keys=False)) == data
+
+    def test_output_matches_pure_python_dumper(self):
+        data = {"b": [1, {"c": None}], "a": "text: with colon", "d": True}
+
+        assert yaml_codec.dump(data) == yaml.dump(data, Dumper=yaml.Dumper)
+        assert yaml_codec.safe_dump(data, sort_keys=False) == yaml.dump(data, Dumper=yaml.SafeDumper, sort_keys=False)
+
+    def test_dump_to_stream(self, tmp_path):
+        path = tmp_path / "spec.yaml"
+        with open(path, "w") as f:
+            assert yaml_codec.dump({"key": "value"}, f) is None
+
+        assert path.read_text() == "key: value\n"
+
+
+class TestParse:
+
+    def test_events_without_composing(self):
+        events = list(yaml_codec.parse("a: 1\nb: [x, y]\n"))
+
+        assert [event.value for event in events if isinstance(event, yaml.ScalarEvent)] == ["a", "1", "b", "x", "y"]
+        assert isinstance(events[-1], yaml.StreamEndEvent)